@@ -0,0 +1,109 @@
+"""Benchmark NumPy vs pure-Python usage analytics.
+
+Generates synthetic one-sample-per-minute histories for several accounts
+and times each analytics kernel on both backends.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_analytics.py --days 90 --accounts 24
+"""
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from backend.core import usage_analytics as ua
+from backend.core.usage_history import RECORD, UsageHistory
+
+WINDOW_SECONDS = 5 * 3600
+
+
+def _generate(path: Path, days: int, seed: int) -> UsageHistory:
+    """Write a synthetic history with random bursts inside each window."""
+    rng = random.Random(seed)
+    records = bytearray()
+    util = 0.0
+    resets_at = float(WINDOW_SECONDS)
+    for minute in range(days * 24 * 60):
+        ts = minute * 60.0
+        if ts >= resets_at:
+            resets_at += WINDOW_SECONDS
+            util = 0.0
+        util = min(100.0, util + max(0.0, rng.gauss(0.05, 0.2)))
+        records += RECORD.pack(ts, util, resets_at, math.nan)
+    path.write_bytes(records)
+    return UsageHistory(path)
+
+
+def _time(fn: Callable[[], Any], repeat: int) -> float:
+    """Best wall time of `repeat` runs, in milliseconds."""
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def _run_all(histories: list[UsageHistory], use_numpy: bool) -> None:
+    for history in histories:
+        cols = ua.load_columns(history, use_numpy=use_numpy)
+        ua.rollup(cols)
+        ua.percentiles(cols.five_hour, [50, 90, 99])
+        ua.window_stats(cols)
+        ua.forecast(cols)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--accounts", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        histories = [
+            _generate(Path(tmp) / f"acct{i}.bin", args.days, seed=i) for i in range(args.accounts)
+        ]
+        samples = sum(len(h) for h in histories)
+        print(f"{args.accounts} accounts x {args.days} days = {samples:,} samples")
+
+        first = histories[0]
+        kernels: dict[str, Callable[[ua.HistoryColumns], Any]] = {
+            "consumption": ua.consumption,
+            "rollup (1h)": ua.rollup,
+            "percentiles": lambda c: ua.percentiles(c.five_hour, [50, 90, 99]),
+            "window_stats": ua.window_stats,
+            "forecast": ua.forecast,
+        }
+        backends = [False] + ([True] if ua.HAS_NUMPY else [])
+
+        print(f"\n{'kernel (1 account)':<22}{'python ms':>12}{'numpy ms':>12}{'speedup':>10}")
+        timings: dict[bool, dict[str, float]] = {}
+        for use_numpy in backends:
+            cols = ua.load_columns(first, use_numpy=use_numpy)
+            timings[use_numpy] = {"load_columns": _time(lambda u=use_numpy: ua.load_columns(first, use_numpy=u), args.repeat)}
+            for name, kernel in kernels.items():
+                timings[use_numpy][name] = _time(lambda k=kernel, c=cols: k(c), args.repeat)
+
+        for name in timings[False]:
+            py_ms = timings[False][name]
+            if True in timings:
+                np_ms = timings[True][name]
+                print(f"{name:<22}{py_ms:>12.2f}{np_ms:>12.2f}{py_ms / max(np_ms, 1e-6):>9.1f}x")
+            else:
+                print(f"{name:<22}{py_ms:>12.2f}{'n/a':>12}{'':>10}")
+
+        print(f"\n{'all kernels, all accounts':<22}")
+        for use_numpy in backends:
+            label = "numpy" if use_numpy else "python"
+            print(f"  {label:<20}{_time(lambda u=use_numpy: _run_all(histories, u), 1):>12.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
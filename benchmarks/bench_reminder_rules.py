@@ -0,0 +1,84 @@
+"""Benchmark evaluating compiled reminder rules against one sample.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_reminder_rules.py --rules 500
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from backend.core.config_manager import ReminderRule
+from backend.scheduler.reminder_rules import RuleSet
+
+_TEMPLATES = (
+    "utilization > {a}",
+    "utilization > {a} and minutes_to_reset > {b}",
+    "seven_day_opus > {a} or seven_day > {a}",
+    "not (utilization < {a}) and extra_usage >= {c}",
+    "utilization / minutes_to_reset * 60 > {c}",
+)
+
+
+def _rules(count: int, seed: int) -> list[ReminderRule]:
+    rng = random.Random(seed)
+    return [
+        ReminderRule(
+            name=f"rule{i}",
+            when=rng.choice(_TEMPLATES).format(
+                a=rng.randint(1, 100), b=rng.randint(1, 300), c=rng.randint(1, 50),
+            ),
+        )
+        for i in range(count)
+    ]
+
+
+def _samples(count: int, seed: int) -> list[dict[str, float]]:
+    """Slowly drifting samples, like consecutive polls."""
+    rng = random.Random(seed)
+    drifting = ("utilization", "seven_day", "seven_day_opus", "extra_usage")
+    values = {name: rng.uniform(0, 100) for name in drifting}
+    values["minutes_to_reset"] = 300.0
+    samples = []
+    for _ in range(count):
+        for name in drifting:
+            values[name] = min(100.0, max(0.0, values[name] + rng.gauss(0, 1)))
+        values["minutes_to_reset"] = (values["minutes_to_reset"] - 1) % 300
+        samples.append(dict(values))
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rules", type=int, default=500)
+    parser.add_argument("--samples", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rules = _rules(args.rules, args.seed)
+    start = time.perf_counter()
+    rule_set = RuleSet(rules)
+    compile_ms = (time.perf_counter() - start) * 1000
+
+    samples = _samples(args.samples, args.seed)
+    active: set[str] = set()
+
+    start = time.perf_counter()
+    for values in samples:
+        rule_set.evaluate(values)
+    evaluate_us = (time.perf_counter() - start) / args.samples * 1e6
+
+    start = time.perf_counter()
+    for values in samples:
+        rule_set.rising(values, active)
+    rising_us = (time.perf_counter() - start) / args.samples * 1e6
+
+    print(f"{len(rule_set.rules):,} rules, {args.samples:,} samples")
+    print(f"compile:           {compile_ms:8.1f} ms")
+    print(f"evaluate / sample: {evaluate_us:8.1f} us")
+    print(f"rising / sample:   {rising_us:8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Benchmark first and steady-state scans of the transcript tailer.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_transcript_tailer.py --projects 50 --files 60
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from backend.core.transcript_tailer import TranscriptTailer
+
+
+def _write_transcripts(root: Path, projects: int, files: int, lines: int) -> None:
+    for p in range(projects):
+        project = root / f"-home-user-project{p}"
+        project.mkdir(parents=True)
+        for s in range(files):
+            rows = []
+            for i in range(lines):
+                rows.append(json.dumps({
+                    "type": "assistant",
+                    "timestamp": "2026-01-17T10:00:00Z",
+                    "requestId": f"req_{p}_{s}_{i}",
+                    "message": {
+                        "id": f"msg_{p}_{s}_{i}",
+                        "model": "claude-sonnet",
+                        "usage": {"input_tokens": 5, "output_tokens": 50},
+                    },
+                }))
+                rows.append(json.dumps({"type": "user", "message": {"content": "x" * 200}}))
+            (project / f"session{s}.jsonl").write_text("\n".join(rows) + "\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--projects", type=int, default=50)
+    parser.add_argument("--files", type=int, default=60)
+    parser.add_argument("--lines", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        _write_transcripts(root, args.projects, args.files, args.lines)
+        tailer = TranscriptTailer(root)
+
+        start = time.perf_counter()
+        events = tailer.poll()
+        first_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        tailer.poll()
+        warm_ms = (time.perf_counter() - start) * 1000
+
+        print(f"{args.projects * args.files:,} files, {len(events):,} events")
+        print(f"first scan:  {first_ms:8.1f} ms")
+        print(f"warm scan:   {warm_ms:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
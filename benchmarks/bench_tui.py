@@ -0,0 +1,268 @@
+"""Headless benchmark of the TUI under hours of simulated usage.
+
+Drives ClaudiminderApp with Textual's pilot against a fake UsageAPI at
+accelerated time: every simulated second ticks the reset countdown and
+lets the app repaint, and every poll interval records a sample and
+delivers a new usage response through the daemon and event bus, as in
+the real app. Reports renders per update, CPU time per tick and peak
+memory, and compares them with the stored baseline so regressions in
+ResetCountdown, UsageDisplay and the other panels get flagged.
+
+tracemalloc slows everything down, so CPU time is measured over the
+first half of the ticks and peak traced memory over the second half.
+CPU time is compared relative to a fixed pure-Python calibration loop
+timed on the same machine, so a baseline recorded elsewhere still
+applies; the absolute figure is only reported.
+
+Runs against a throwaway home directory with reminders disabled and
+goals enabled, so no real config, history or notifications are touched.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_tui.py --hours 1
+    PYTHONPATH=src python benchmarks/bench_tui.py --check            # exit 1 on regression
+    PYTHONPATH=src python benchmarks/bench_tui.py --update-baseline
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import Counter
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+BASELINE_PATH = Path(__file__).parent / "baselines" / "tui.json"
+
+WINDOW = timedelta(hours=5)
+
+# Allowed growth over the baseline before a metric is flagged. Render
+# counts are deterministic; CPU time and memory vary between machines.
+TOLERANCES = {
+    "renders_per_update": 0.10,
+    "countdown_renders_per_tick": 0.10,
+    "cpu_per_tick_calibrated": 0.50,
+    "peak_memory_kib": 0.25,
+}
+
+
+# Iterations of the calibration loop, and how often it is timed
+CALIBRATION_ITERATIONS = 200_000
+CALIBRATION_ROUNDS = 5
+
+
+def _calibrate() -> float:
+    """Best CPU time of a fixed pure-Python loop, in microseconds."""
+    best = math.inf
+    for _ in range(CALIBRATION_ROUNDS):
+        start = time.process_time_ns()
+        total = 0
+        for i in range(CALIBRATION_ITERATIONS):
+            total += i * i % 7
+        best = min(best, time.process_time_ns() - start)
+    return best / 1000
+
+
+class _Clock:
+    """Simulated wall clock."""
+
+    def __init__(self, start: datetime) -> None:
+        self.now = start
+
+
+def _fake_datetime(clock: _Clock) -> type[datetime]:
+    class FakeDatetime(datetime):
+        @classmethod
+        def now(cls, tz: Any = None) -> Any:
+            return clock.now if tz is None else clock.now.astimezone(tz)
+
+    return FakeDatetime
+
+
+class _FakeUsageAPI:
+    """Usage rising at a random pace through consecutive 5-hour windows."""
+
+    def __init__(self, clock: _Clock, seed: int) -> None:
+        from backend.core.usage_history import get_usage_history, sample_from_usage
+        from backend.models.usage import FiveHourUsage, UsageResponse
+
+        self._history = get_usage_history()
+        self._sample = sample_from_usage
+        self._clock = clock
+        self._rng = random.Random(seed)
+        self._window_start = clock.now
+        self._utilization = 0.0
+        self._seven_day = 20.0
+        self._response = UsageResponse
+        self._five_hour = FiveHourUsage
+
+    async def get_usage(self) -> Any:
+        now = self._clock.now
+        if now - self._window_start >= WINDOW:
+            self._window_start = now
+            self._utilization = 0.0
+        self._utilization = min(100.0, self._utilization + self._rng.uniform(0, 0.6))
+        self._seven_day = min(100.0, self._seven_day + self._rng.uniform(0, 0.02))
+        resets_at = (self._window_start + WINDOW).isoformat().replace("+00:00", "Z")
+        usage = self._response(
+            five_hour=self._five_hour(utilization=self._utilization, resets_at=resets_at),
+            seven_day={"utilization": self._seven_day},
+        )
+        # What the real API client records for the history panel
+        self._history.append(self._sample(usage, now.timestamp()))
+        return usage
+
+
+class _IdlePoller:
+    """Stands in for UsagePoller; the benchmark polls on simulated time."""
+
+    def __init__(self, *args: Any) -> None:
+        pass
+
+    async def run(self) -> None:
+        await asyncio.Event().wait()
+
+
+async def _run(hours: float, poll_seconds: int, seed: int) -> dict[str, Any]:
+    from backend.core.config_manager import AppConfig, GoalsConfig, ReminderConfig, save_config
+    from backend.tui.app import ClaudiminderApp
+    from backend.tui.widgets import ResetCountdown
+    from backend.tui.widgets.markup_static import MarkupStatic
+
+    save_config(AppConfig(reminder=ReminderConfig(enabled=False), goals=GoalsConfig(enabled=True)))
+    calibration_us = _calibrate()
+
+    # The history panel scrolls on real time, so simulate from now on
+    clock = _Clock(datetime.now(UTC))
+    renders: Counter[str] = Counter()
+    original_update = MarkupStatic.update
+
+    def counted_update(self: MarkupStatic, *args: Any, **kwargs: Any) -> None:
+        renders[self.id or "?"] += 1
+        original_update(self, *args, **kwargs)
+
+    ticks = int(hours * 3600)
+    updates = 0
+    with (
+        patch("backend.tui.app.UsageAPI", lambda: _FakeUsageAPI(clock, seed)),
+        patch("backend.tui.app.UsagePoller", _IdlePoller),
+        patch("backend.tui.widgets.reset_countdown.datetime", _fake_datetime(clock)),
+        patch.object(MarkupStatic, "update", counted_update),
+    ):
+        app = ClaudiminderApp()
+        async with app.run_test(size=(100, 60)) as pilot:
+            await pilot.pause()
+            countdown = app.query_one(ResetCountdown)
+            if countdown._timer:
+                # Ticks are driven on simulated time below
+                countdown._timer.pause()
+            renders.clear()
+
+            cpu_ticks = ticks // 2
+            cpu_ns = 0
+            cpu_start = time.process_time_ns()
+            for tick in range(ticks):
+                if tick == cpu_ticks:
+                    cpu_ns = time.process_time_ns() - cpu_start
+                    tracemalloc.start()
+                clock.now += timedelta(seconds=1)
+                if tick % poll_seconds == 0:
+                    await app._fetch_usage()
+                    updates += 1
+                countdown._update_countdown()
+                await pilot.pause(0)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+    per_update = {
+        widget: round(renders[widget] / updates, 3)
+        for widget in ("usage-content", "goals-content", "history-content")
+    }
+    return {
+        "params": {"hours": hours, "poll_seconds": poll_seconds, "seed": seed},
+        "ticks": ticks,
+        "updates": updates,
+        "renders_per_update": per_update,
+        "countdown_renders_per_tick": round(renders["countdown-text"] / ticks, 3),
+        "cpu_us_per_tick": round(cpu_ns / max(1, cpu_ticks) / 1000, 1),
+        "calibration_us": round(calibration_us, 1),
+        "cpu_per_tick_calibrated": round(cpu_ns / max(1, cpu_ticks) / 1000 / calibration_us, 4),
+        "peak_memory_kib": round(peak / 1024),
+    }
+
+
+def _regressions(result: dict[str, Any], baseline: dict[str, Any]) -> list[str]:
+    """Metrics that grew past their tolerance."""
+    found = []
+
+    def check(name: str, value: float, base: float, tolerance: float) -> None:
+        if value > base * (1 + tolerance) + 1e-9:
+            found.append(f"{name}: {value:g} vs baseline {base:g} (+{tolerance:.0%} allowed)")
+
+    for widget, value in result["renders_per_update"].items():
+        base = baseline["renders_per_update"].get(widget)
+        if base is not None:
+            check(f"renders_per_update[{widget}]", value, base, TOLERANCES["renders_per_update"])
+    for name in ("countdown_renders_per_tick", "cpu_per_tick_calibrated", "peak_memory_kib"):
+        if name in baseline:
+            check(name, result[name], baseline[name], TOLERANCES[name])
+    return found
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hours", type=float, default=1.0, help="Simulated time")
+    parser.add_argument("--poll-seconds", type=int, default=60, help="Simulated poll interval")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--check", action="store_true", help="Exit 1 on regression")
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as home:
+        # Before importing the app: paths under the home directory are
+        # resolved at import time
+        os.environ["HOME"] = home
+        result = asyncio.run(_run(args.hours, args.poll_seconds, args.seed))
+
+    print(f"{result['ticks']:,} ticks, {result['updates']:,} updates")
+    for widget, value in result["renders_per_update"].items():
+        print(f"renders / update  {widget:<16} {value:8.3f}")
+    print(f"renders / tick    {'countdown-text':<16} {result['countdown_renders_per_tick']:8.3f}")
+    print(
+        f"CPU / tick        {'':<16} {result['cpu_us_per_tick']:8.1f} us"
+        f"  ({result['cpu_per_tick_calibrated']:.4f} x calibration loop)"
+    )
+    print(f"peak memory       {'':<16} {result['peak_memory_kib']:8,} KiB")
+
+    if args.update_baseline:
+        BASELINE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        BASELINE_PATH.write_text(json.dumps(result, indent=2) + "\n")
+        print(f"Baseline written to {BASELINE_PATH}")
+        return
+
+    if not BASELINE_PATH.exists():
+        print("No baseline stored; run with --update-baseline")
+        return
+    baseline = json.loads(BASELINE_PATH.read_text())
+    if baseline["params"] != result["params"]:
+        print(f"Baseline was recorded with {baseline['params']}; not comparing")
+        return
+    regressions = _regressions(result, baseline)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    if not regressions:
+        print("No regressions against baseline")
+    if regressions and args.check:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,9 @@ import httpx
 from loguru import logger
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+from ..core.perf_metrics import get_perf_metrics
+from ..core.usage_heatmap import update_heatmap
+from ..core.usage_history import get_usage_history, sample_from_usage
 from ..models.settings import get_settings
 from ..models.usage import UsageResponse
 from ..utils.credentials import clear_credentials_cache, get_access_token
@@ -48,6 +51,20 @@ def _is_cache_valid() -> bool:
     return time.time() - _usage_cache.timestamp < _get_cache_duration()
 
 
+def _record_sample(data: UsageResponse | None) -> None:
+    """Append a freshly fetched response to the usage history."""
+    if data is None:
+        return
+    sample = sample_from_usage(data, time.time())
+    if sample is None:
+        return
+    try:
+        get_usage_history().append(sample)
+        update_heatmap()
+    except OSError as e:
+        logger.warning(f"Failed to record usage sample: {e}")
+
+
 @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=1, max=10))
 async def _fetch_usage_async(client: httpx.AsyncClient, token: str) -> UsageResponse | None:
     """Fetch usage from API with retry."""
@@ -83,8 +100,11 @@ async def get_usage_async() -> UsageResponse | None:
     """Get usage data (async), using cache if valid."""
     global _usage_cache
 
+    metrics = get_perf_metrics()
     if _is_cache_valid() and _usage_cache is not None:
+        metrics.count("usage_cache.hit")
         return _usage_cache.data
+    metrics.count("usage_cache.miss")
 
     token = get_access_token()
     if token is None:
@@ -93,8 +113,10 @@ async def get_usage_async() -> UsageResponse | None:
 
     try:
         async with httpx.AsyncClient() as client:
-            data = await _fetch_usage_async(client, token)
+            with metrics.timed("fetch"):
+                data = await _fetch_usage_async(client, token)
             _usage_cache = UsageCache(data=data, timestamp=time.time(), token_expired=False)
+            _record_sample(data)
             return data
     except TokenExpiredError:
         _usage_cache = UsageCache(data=None, timestamp=time.time(), token_expired=True)
@@ -157,6 +179,7 @@ def get_usage_sync() -> UsageResponse | None:
             response.raise_for_status()
             data = UsageResponse.model_validate(response.json())
             _usage_cache = UsageCache(data=data, timestamp=time.time(), token_expired=False)
+            _record_sample(data)
             return data
 
     except Exception as e:
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import json
 import sys
+import time
+from pathlib import Path
 
 import typer
 from loguru import logger
@@ -64,10 +66,115 @@ def status(
 
 
 @app.command()
-def tui() -> None:
+def top(
+    hours: int = typer.Option(5, "--hours", "-H", help="Look back this many hours (0 = all time)"),
+    by: str = typer.Option("project", "--by", "-b", help="Group by 'project' or 'model'"),
+    limit: int = typer.Option(10, "--limit", "-n", help="Maximum rows"),
+    json_output: bool = typer.Option(False, "--json", "-j", help="Output as JSON"),
+) -> None:
+    """Show which projects or models consumed the most tokens."""
+    from .core.token_index import get_token_index
+    from .core.usage_history import get_usage_history
+
+    if by not in ("project", "model"):
+        typer.echo("❌ --by must be 'project' or 'model'")
+        raise typer.Exit(1)
+
+    since = time.time() - hours * 3600 if hours > 0 else None
+    rows = get_token_index().top(by=by, since=since, limit=limit)
+    # Utilization rise over the same period, to correlate with token burn
+    consumed = get_usage_history().consumed_since(since) if since is not None else None
+
+    if json_output:
+        print(json.dumps({
+            "by": by,
+            "hours": hours,
+            "utilization_consumed": consumed,
+            "top": [row._asdict() | {"total": row.total} for row in rows],
+        }))
+        return
+
+    period = f"last {hours}h" if since is not None else "all time"
+    if consumed is not None:
+        typer.echo(f"📈 5-hour utilization consumed ({period}): {consumed:.1f}%")
+    if not rows:
+        typer.echo("No Claude Code transcript usage found.")
+        return
+    typer.echo(f"{by.capitalize():<40} {'input':>10} {'output':>10} {'cache rd':>12} {'cache wr':>12}")
+    for row in rows:
+        typer.echo(
+            f"{row.name[:40]:<40} {row.input_tokens:>10,} {row.output_tokens:>10,} "
+            f"{row.cache_read_tokens:>12,} {row.cache_write_tokens:>12,}"
+        )
+
+
+@app.command()
+def daemon(
+    debug: bool = typer.Option(False, "--debug", "-d", help="Enable debug logging"),
+) -> None:
+    """Run reminders and scheduled commands in the background, without the TUI."""
+    setup_logging(debug)
+    from .daemon import run_daemon
+    if not run_daemon():
+        typer.echo("Another Claudiminder instance is already running.", err=True)
+        raise typer.Exit(1)
+
+
+queue_app = typer.Typer(help="Defer heavy jobs until the usage window has room")
+app.add_typer(queue_app, name="queue")
+
+
+@queue_app.command("add")
+def queue_add(
+    command: str = typer.Argument(..., help="Shell command to run"),
+    estimated_usage: float = typer.Option(
+        10.0, "--estimated-usage", "-u", help="Expected cost in percent of a 5-hour window"
+    ),
+) -> None:
+    """Queue a command to run when projected usage leaves room for it."""
+    from .scheduler.job_queue import get_job_queue
+    job = get_job_queue().add(command, estimated_usage)
+    typer.echo(f"Queued job {job.id} (~{estimated_usage:g}%)")
+
+
+@queue_app.command("list")
+def queue_list(
+    json_output: bool = typer.Option(False, "--json", "-j", help="Output as JSON"),
+) -> None:
+    """Show queued, running and finished jobs."""
+    from .scheduler.job_queue import get_job_queue
+    jobs = get_job_queue().jobs()
+    if json_output:
+        print(json.dumps({"jobs": [job._asdict() for job in jobs]}))
+        return
+    if not jobs:
+        typer.echo("Queue is empty.")
+        return
+    typer.echo(f"{'id':<10} {'status':<8} {'usage':>6}  command")
+    for job in jobs:
+        typer.echo(f"{job.id:<10} {job.status:<8} {job.estimated_usage:>5g}%  {job.command}")
+
+
+@queue_app.command("remove")
+def queue_remove(job_id: str = typer.Argument(..., help="Job id")) -> None:
+    """Remove a job that is not running."""
+    from .scheduler.job_queue import get_job_queue
+    if not get_job_queue().remove(job_id):
+        typer.echo(f"No removable job {job_id}", err=True)
+        raise typer.Exit(1)
+    typer.echo(f"Removed job {job_id}")
+
+
+@app.command()
+def tui(
+    metrics_json: str | None = typer.Option(
+        None, "--metrics-json", metavar="PATH",
+        help="Write performance metrics as JSON to this file on exit",
+    ),
+) -> None:
     """Launch interactive TUI mode."""
     from .tui import run_tui
-    run_tui()
+    run_tui(metrics_path=Path(metrics_json) if metrics_json else None)
 
 
 @app.command()
@@ -8,6 +8,7 @@ from .config_manager import (
     load_config,
     save_config,
 )
+from .event_bus import EventBus, get_event_bus
 from .goals_tracker import (
     GoalsTracker,
     PaceStatus,
@@ -18,6 +19,12 @@ from .instance_lock import (
     is_another_instance_running,
     release_instance_lock,
 )
+from .state_store import StateStore, get_state_store
+from .usage_history import (
+    UsageHistory,
+    UsageSample,
+    get_usage_history,
+)
 
 __all__ = [
     "acquire_instance_lock",
@@ -30,7 +37,14 @@ __all__ = [
     "load_config",
     "save_config",
     "get_config_path",
+    "EventBus",
+    "get_event_bus",
     "GoalsTracker",
     "PaceStatus",
     "get_goals_tracker",
+    "StateStore",
+    "get_state_store",
+    "UsageHistory",
+    "UsageSample",
+    "get_usage_history",
 ]
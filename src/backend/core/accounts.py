@@ -0,0 +1,107 @@
+"""Per-account usage summaries for the accounts dashboard.
+
+Every account with a sample store in the history directory is listed,
+whichever process recorded it (a TUI, a daemon on a CI runner). A
+refresh only re-reads the stores that grew since the last one, and then
+only their last few samples.
+"""
+import math
+from enum import Enum
+from itertools import pairwise
+from typing import NamedTuple
+
+from . import usage_history
+from .usage_history import UsageHistory, get_usage_history, utilization_delta
+
+# Consumption rate is measured over this much recent history
+SLOPE_WINDOW_SECONDS = 15 * 60
+
+# Accounts with no sample for this long are shown as stale
+STALE_SECONDS = 30 * 60
+
+WARNING_UTILIZATION = 75.0
+CRITICAL_UTILIZATION = 90.0
+
+
+class AccountState(Enum):
+    """Overall state of an account's 5-hour window."""
+    OK = "ok"
+    WARNING = "warning"
+    CRITICAL = "critical"
+    RESET = "reset"  # The window reset since the last sample
+    STALE = "stale"
+
+
+class AccountStatus(NamedTuple):
+    """Latest known usage of one account. Unknown values are NaN."""
+    account: str
+    utilization: float
+    slope: float  # %/hour over SLOPE_WINDOW_SECONDS
+    resets_at: float
+    updated_at: float
+
+    def state(self, now: float) -> AccountState:
+        if self.resets_at <= now:
+            return AccountState.RESET
+        if now - self.updated_at > STALE_SECONDS:
+            return AccountState.STALE
+        if self.utilization >= CRITICAL_UTILIZATION:
+            return AccountState.CRITICAL
+        if self.utilization >= WARNING_UTILIZATION:
+            return AccountState.WARNING
+        return AccountState.OK
+
+
+def list_accounts() -> list[str]:
+    """Accounts that have a sample store."""
+    return sorted(path.stem for path in usage_history.HISTORY_DIR.glob("*.bin"))
+
+
+def summarize(account: str, history: UsageHistory) -> AccountStatus | None:
+    """Summarize an account from its most recent samples, or None if empty."""
+    count = len(history)
+    if count == 0:
+        return None
+    last = history.read(count - 1)[0]
+    start = history.index_at(last.timestamp - SLOPE_WINDOW_SECONDS)
+    # Polling slows down while idle: fall back to the last two samples
+    start = max(0, min(start, count - 2))
+    samples = history.read(start)
+    slope = math.nan
+    elapsed = samples[-1].timestamp - samples[0].timestamp
+    if elapsed > 0:
+        consumed = sum(utilization_delta(a, b) for a, b in pairwise(samples))
+        slope = consumed / (elapsed / 3600)
+    return AccountStatus(account, last.five_hour, slope, last.resets_at, last.timestamp)
+
+
+class AccountMonitor:
+    """Track the summaries of all accounts, re-reading only changed stores."""
+
+    def __init__(self) -> None:
+        self._sizes: dict[str, int] = {}
+        self.statuses: dict[str, AccountStatus] = {}
+
+    def refresh(self) -> set[str]:
+        """Pick up new samples, new accounts and removed accounts.
+
+        Returns:
+            Accounts whose status changed or that are gone
+        """
+        changed: set[str] = set()
+        accounts = list_accounts()
+        for account in accounts:
+            history = get_usage_history(account)
+            size = len(history)
+            if self._sizes.get(account) == size:
+                continue
+            self._sizes[account] = size
+            status = summarize(account, history)
+            if status is not None and status != self.statuses.get(account):
+                self.statuses[account] = status
+                changed.add(account)
+        removed = set(self.statuses) - set(accounts)
+        for account in removed:
+            del self.statuses[account]
+            self._sizes.pop(account, None)
+        return changed | removed
@@ -0,0 +1,174 @@
+"""Detect Claude Code activity from transcript writes under ~/.claude/projects.
+
+Uses inotify on Linux (via libc, no extra dependency) and falls back to
+periodically stat-ing transcript files elsewhere or if inotify fails.
+"""
+import asyncio
+import ctypes
+import ctypes.util
+import os
+import struct
+import sys
+import time
+from pathlib import Path
+
+from loguru import logger
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+_WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+_EVENT_HEADER = struct.Struct("iIII")
+
+# How often the stat fallback rescans transcripts
+STAT_INTERVAL_SECONDS = 5.0
+
+
+class _Inotify:
+    """Minimal inotify binding watching a directory and its subdirectories."""
+
+    def __init__(self, root: Path) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        try:
+            self._root_wd = self._watch(root)
+            for entry in os.scandir(root):
+                if entry.is_dir(follow_symlinks=False):
+                    self._watch(Path(entry.path))
+        except OSError:
+            os.close(self.fd)
+            raise
+        self._root = root
+
+    def _watch(self, path: Path) -> int:
+        wd = int(self._add_watch(self.fd, os.fsencode(path), _WATCH_MASK))
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {path}")
+        return wd
+
+    def drain(self) -> bool:
+        """Consume pending events, watching new project dirs. True if any."""
+        seen = False
+        while True:
+            try:
+                data = os.read(self.fd, 65536)
+            except BlockingIOError:
+                return seen
+            seen = True
+            offset = 0
+            while offset < len(data):
+                wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+                name = data[offset + _EVENT_HEADER.size: offset + _EVENT_HEADER.size + length]
+                offset += _EVENT_HEADER.size + length
+                if wd == self._root_wd and mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                    try:
+                        self._watch(self._root / os.fsdecode(name.rstrip(b"\0")))
+                    except OSError as e:
+                        logger.debug(f"Cannot watch new project dir: {e}")
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def _transcripts_signature(root: Path) -> tuple[int, int]:
+    """(file count, newest mtime) of all transcripts, for the stat fallback."""
+    count = 0
+    newest = 0
+    try:
+        projects = list(os.scandir(root))
+    except FileNotFoundError:
+        return 0, 0
+    for project in projects:
+        if not project.is_dir(follow_symlinks=False):
+            continue
+        try:
+            for entry in os.scandir(project.path):
+                if entry.name.endswith(".jsonl"):
+                    count += 1
+                    newest = max(newest, entry.stat().st_mtime_ns)
+        except OSError:
+            continue
+    return count, newest
+
+
+class ActivityWatcher:
+    """Track when Claude Code last wrote a transcript."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.last_activity = time.monotonic()
+        self._inotify: _Inotify | None = None
+        self._event = asyncio.Event()
+        self._signature: tuple[int, int] | None = None
+
+    @property
+    def uses_inotify(self) -> bool:
+        return self._inotify is not None
+
+    def start(self) -> None:
+        """Start watching. Must be called from the running event loop."""
+        if sys.platform.startswith("linux") and self.root.is_dir():
+            try:
+                self._inotify = _Inotify(self.root)
+                asyncio.get_running_loop().add_reader(self._inotify.fd, self._on_readable)
+                return
+            except (OSError, AttributeError) as e:
+                logger.debug(f"inotify unavailable, using stat fallback: {e}")
+                self._inotify = None
+        self._signature = _transcripts_signature(self.root)
+
+    def stop(self) -> None:
+        """Stop watching."""
+        if self._inotify is not None:
+            asyncio.get_running_loop().remove_reader(self._inotify.fd)
+            self._inotify.close()
+            self._inotify = None
+
+    def _on_readable(self) -> None:
+        if self._inotify is not None and self._inotify.drain():
+            self.mark_active()
+
+    def mark_active(self) -> None:
+        """Record activity now and wake any waiter."""
+        self.last_activity = time.monotonic()
+        self._event.set()
+
+    def idle_seconds(self) -> float:
+        """Seconds since the last observed activity."""
+        return time.monotonic() - self.last_activity
+
+    def _check_stat(self) -> None:
+        signature = _transcripts_signature(self.root)
+        if signature != self._signature:
+            self._signature = signature
+            self.mark_active()
+
+    async def wait_for_activity(self, timeout: float) -> bool:
+        """Sleep until activity is seen or `timeout` elapses.
+
+        Returns:
+            True if woken by activity
+        """
+        self._event.clear()
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            step = remaining if self._inotify is not None else min(remaining, STAT_INTERVAL_SECONDS)
+            try:
+                await asyncio.wait_for(self._event.wait(), step)
+                return True
+            except TimeoutError:
+                if self._inotify is None:
+                    self._check_stat()
+                    if self._event.is_set():
+                        return True
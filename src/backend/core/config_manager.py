@@ -1,6 +1,6 @@
 """TOML configuration manager for Claudiminder."""
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 import tomli
 import tomli_w
@@ -10,6 +10,27 @@ CONFIG_DIR = Path.home() / ".config" / "backend"
 CONFIG_FILE = CONFIG_DIR / "config.toml"
 
 
+class ReminderRule(BaseModel):
+    """Reminder fired when an expression over the latest usage becomes true."""
+    name: str
+    when: str  # e.g. "utilization > 70 and minutes_to_reset > 120"
+    message: str | None = None
+    enabled: bool = True
+
+
+class WebhookConfig(BaseModel):
+    """A webhook reminders are POSTed to as JSON.
+
+    String values in `template` may use $title, $body (all messages of a
+    batch, one per line) and $count; a value of exactly "$events" becomes
+    the list of events. The default suits Slack and Mattermost.
+    """
+    url: str
+    template: dict[str, Any] = Field(default_factory=lambda: {"text": "*$title*\n$body"})
+    headers: dict[str, str] = Field(default_factory=dict)
+    enabled: bool = True
+
+
 class ReminderConfig(BaseModel):
     """Reminder settings."""
     enabled: bool = True
@@ -19,6 +40,32 @@ class ReminderConfig(BaseModel):
     snooze_minutes: list[int] = Field(default_factory=lambda: [5, 15, 30])
     custom_command: str | None = None
     custom_url: str | None = None
+    webhooks: list[WebhookConfig] = Field(default_factory=list)
+    plugin_channels: list[str] = Field(default_factory=list)  # Entry-point channel names
+    channel_options: dict[str, dict[str, Any]] = Field(default_factory=dict)
+    # Minimum seconds between two sends on a channel, across processes
+    channel_min_interval_seconds: dict[str, float] = Field(
+        default_factory=lambda: {"command": 300.0, "url": 900.0},
+    )
+    command_shell: bool = True
+    command_timeout_seconds: float = 30.0
+    command_max_concurrency: int = 2
+    anomaly_detection: bool = True
+    anomaly_ewma_alpha: float = 0.1
+    anomaly_z_threshold: float = 4.0
+    anomaly_min_rate: float = 1.0  # %/min
+    anomaly_warmup_samples: int = 5
+    rules: list[ReminderRule] = Field(default_factory=list)
+
+
+class QuietHours(BaseModel):
+    """A daily quiet-hours range (HH:MM), on the given weekdays (0 = Monday).
+
+    Ranges ending before they start run overnight into the next day.
+    """
+    start: str
+    end: str
+    days: list[int] = Field(default_factory=lambda: list(range(7)))
 
 
 class FocusModeConfig(BaseModel):
@@ -27,6 +74,7 @@ class FocusModeConfig(BaseModel):
     dnd_threshold: int = 80
     quiet_hours_start: str | None = None
     quiet_hours_end: str | None = None
+    quiet_hours: list[QuietHours] = Field(default_factory=list)
 
 
 class GoalsConfig(BaseModel):
@@ -36,14 +84,49 @@ class GoalsConfig(BaseModel):
     warn_when_pace_exceeded: bool = True
 
 
+class ScheduledCommand(BaseModel):
+    """A command run on a schedule.
+
+    `value` depends on the trigger: a cron expression, a local time
+    (HH:MM), an interval in minutes, or unused for "cycle" (after each
+    usage reset).
+    """
+    id: str
+    name: str
+    command: str
+    trigger: Literal["cron", "fixed", "repeated", "cycle"]
+    value: str = ""
+    enabled: bool = True
+
+
+class SchedulerConfig(BaseModel):
+    """Scheduled commands settings."""
+    commands: list[ScheduledCommand] = Field(default_factory=list)
+    command_shell: bool = True
+    command_timeout_seconds: float | None = None  # Jobs may run for hours
+    command_max_concurrency: int = 2
+
+
+class JobQueueConfig(BaseModel):
+    """Deferred job queue settings."""
+    enabled: bool = True
+    max_concurrency: int = 1
+    margin_percent: float = 5.0
+
+
 class AppConfig(BaseModel):
     """Main application configuration."""
     language: str = "en"
     log_level: str = "INFO"
     poll_interval_seconds: int = 60
+    activity_polling: bool = True
+    idle_after_minutes: int = 10
+    idle_poll_interval_seconds: int = 1800
     reminder: ReminderConfig = Field(default_factory=ReminderConfig)
     focus_mode: FocusModeConfig = Field(default_factory=FocusModeConfig)
     goals: GoalsConfig = Field(default_factory=GoalsConfig)
+    scheduler: SchedulerConfig = Field(default_factory=SchedulerConfig)
+    job_queue: JobQueueConfig = Field(default_factory=JobQueueConfig)
 
 
 def load_config() -> AppConfig:
@@ -57,10 +140,15 @@ def load_config() -> AppConfig:
 
 def _remove_none_values(d: dict[str, Any]) -> dict[str, Any]:
     """Recursively remove None values from dict for TOML serialization."""
-    result = {}
+    result: dict[str, Any] = {}
     for k, v in d.items():
         if isinstance(v, dict):
             result[k] = _remove_none_values(v)
+        elif isinstance(v, list):
+            # e.g. reminder rules without a message
+            result[k] = [
+                _remove_none_values(i) if isinstance(i, dict) else i for i in v if i is not None
+            ]
         elif v is not None:
             result[k] = v
     return result
@@ -74,6 +162,9 @@ def save_config(config: AppConfig) -> None:
     with open(CONFIG_FILE, "wb") as f:
         tomli_w.dump(data, f)
 
+    from .event_bus import CONFIG_CHANGED, ConfigChanged, get_event_bus
+    get_event_bus().publish(CONFIG_CHANGED, ConfigChanged(config))
+
 
 def get_config_path() -> Path:
     """Get the config file path."""
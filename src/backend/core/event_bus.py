@@ -0,0 +1,165 @@
+"""In-process publish/subscribe bus.
+
+Producers publish typed events on a topic; each usage sample is derived
+once (pace, focus state) and fanned out, instead of every consumer
+recomputing it from the raw response.
+
+Handlers registered with `on()` run inline. Async consumers `subscribe()`
+and get a bounded queue with an overflow policy, so a slow consumer
+never blocks producers or other consumers. Publish from the event loop
+thread only.
+"""
+import asyncio
+from collections import deque
+from collections.abc import Callable
+from datetime import datetime
+from enum import Enum
+from typing import Any, NamedTuple
+
+from loguru import logger
+
+from ..models.usage import UsageResponse
+from .config_manager import AppConfig
+from .goals_tracker import PaceStatus
+
+USAGE_SAMPLE = "usage.sample"
+REMINDER_FIRED = "reminder.fired"
+CONFIG_CHANGED = "config.changed"
+
+# Default queue length for subscriptions
+DEFAULT_MAXSIZE = 64
+
+
+class UsageUpdate(NamedTuple):
+    """A fresh usage response with the state derived from it."""
+    usage: UsageResponse
+    utilization: float
+    reset_time: datetime | None
+    pace: PaceStatus | None
+    budget: tuple[float, float, bool] | None  # (used, budget, exceeded)
+    suppression: str | None  # Why notifications are suppressed, if they are
+
+
+class ReminderFired(NamedTuple):
+    """A reminder was triggered."""
+    kind: str  # ReminderType value
+    message: str
+
+
+class ConfigChanged(NamedTuple):
+    """The configuration was saved."""
+    config: AppConfig
+
+
+class OverflowPolicy(Enum):
+    """What a full subscription queue does with a new event."""
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+    LATEST = "latest"  # Keep only the newest event (merge)
+
+
+class Subscription:
+    """Bounded queue of events for one async consumer."""
+
+    def __init__(self, bus: "EventBus", topic: str, maxsize: int, policy: OverflowPolicy) -> None:
+        self.topic = topic
+        self.policy = policy
+        self.dropped = 0
+        self._bus = bus
+        self._maxsize = 1 if policy == OverflowPolicy.LATEST else maxsize
+        self._events: deque[Any] = deque()
+        self._ready = asyncio.Event()
+        self._closed = False
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def put(self, event: Any) -> None:
+        """Queue an event, applying the overflow policy when full."""
+        if len(self._events) >= self._maxsize:
+            self.dropped += 1
+            if self.policy == OverflowPolicy.DROP_NEWEST:
+                return
+            self._events.popleft()
+        self._events.append(event)
+        self._ready.set()
+
+    async def get(self) -> Any:
+        """Wait for the next event.
+
+        Raises:
+            StopAsyncIteration: Once closed and drained
+        """
+        while not self._events:
+            if self._closed:
+                raise StopAsyncIteration
+            self._ready.clear()
+            await self._ready.wait()
+        return self._events.popleft()
+
+    def __aiter__(self) -> "Subscription":
+        return self
+
+    async def __anext__(self) -> Any:
+        return await self.get()
+
+    def close(self) -> None:
+        """Stop receiving events; pending ones can still be read."""
+        self._closed = True
+        self._bus._unsubscribe(self)
+        self._ready.set()
+
+
+class EventBus:
+    """Topic-based fan-out to inline handlers and async subscriptions."""
+
+    def __init__(self) -> None:
+        self._handlers: dict[str, list[Callable[[Any], None]]] = {}
+        self._subscriptions: dict[str, list[Subscription]] = {}
+
+    def on(self, topic: str, handler: Callable[[Any], None]) -> None:
+        """Call `handler` inline for every event on `topic`."""
+        self._handlers.setdefault(topic, []).append(handler)
+
+    def off(self, topic: str, handler: Callable[[Any], None]) -> None:
+        """Remove a handler added with on()."""
+        handlers = self._handlers.get(topic, [])
+        if handler in handlers:
+            handlers.remove(handler)
+
+    def subscribe(
+        self,
+        topic: str,
+        maxsize: int = DEFAULT_MAXSIZE,
+        policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ) -> Subscription:
+        """Queue events on `topic` for an async consumer."""
+        subscription = Subscription(self, topic, maxsize, policy)
+        self._subscriptions.setdefault(topic, []).append(subscription)
+        return subscription
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        subscriptions = self._subscriptions.get(subscription.topic, [])
+        if subscription in subscriptions:
+            subscriptions.remove(subscription)
+
+    def publish(self, topic: str, event: Any) -> None:
+        """Deliver an event to everyone listening on `topic`. Never blocks."""
+        for handler in list(self._handlers.get(topic, ())):
+            try:
+                handler(event)
+            except Exception as e:
+                logger.error(f"Event handler error on {topic}: {e}")
+        for subscription in self._subscriptions.get(topic, ()):
+            subscription.put(event)
+
+
+_bus: EventBus | None = None
+
+
+def get_event_bus() -> EventBus:
+    """Get singleton event bus instance."""
+    global _bus
+    if _bus is None:
+        _bus = EventBus()
+    return _bus
@@ -1,8 +1,22 @@
 """Daily usage goals and pace tracking."""
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from typing import NamedTuple
 
 from .config_manager import load_config
+from .usage_history import (
+    WINDOW_TOLERANCE_SECONDS,
+    UsageHistory,
+    UsageSample,
+    get_usage_history,
+    utilization_delta,
+)
+
+# Past days used to build the hour-of-day pace profile
+PROFILE_DAYS = 14
+
+# Share of the flat 24h line mixed into the profile, so hours that were
+# idle in the past still accrue some expected usage
+PROFILE_FLAT_WEIGHT = 0.1
 
 
 class PaceStatus(NamedTuple):
@@ -14,24 +28,112 @@ class PaceStatus(NamedTuple):
 
 
 class GoalsTracker:
-    """Track daily usage goals and pace."""
+    """Track daily usage goals and pace.
 
-    def __init__(self) -> None:
-        self._session_start = datetime.now()
+    Consumption is integrated across every 5-hour window of the calendar
+    day from the usage history. The running total is advanced only by
+    samples appended since the last call.
+    """
+
+    def __init__(self, history: UsageHistory | None = None) -> None:
+        self._history = history
         self._last_reset_time: datetime | None = None
+        self._day: date | None = None
+        self._daily_total = 0.0
+        self._last_sample: UsageSample | None = None
+        self._next_index = 0
+        self._profile_day: date | None = None
+        self._profile: list[float] | None = None
+
+    @property
+    def history(self) -> UsageHistory:
+        """History store backing the daily total."""
+        return self._history if self._history is not None else get_usage_history()
 
     def set_reset_time(self, reset_time: datetime) -> None:
         """Set the next reset time for accurate pace calculation."""
         self._last_reset_time = reset_time
 
+    def _sync(self, now: datetime) -> None:
+        """Advance the running daily total with newly recorded samples."""
+        history = self.history
+        today = now.date()
+        if self._day != today:
+            day_start = datetime.combine(today, datetime.min.time()).timestamp()
+            start = history.index_at(day_start)
+            # The last sample before midnight is the baseline for the first delta
+            baseline = history.read(start - 1, start) if start > 0 else []
+            self._day = today
+            self._daily_total = 0.0
+            self._last_sample = baseline[0] if baseline else None
+            self._next_index = start
+
+        for sample in history.read(self._next_index):
+            if self._last_sample is None:
+                self._daily_total += sample.five_hour
+            else:
+                self._daily_total += utilization_delta(self._last_sample, sample)
+            self._last_sample = sample
+            self._next_index += 1
+
+    def _daily_usage(self, current_usage: float, now: datetime) -> float:
+        """Total consumed today, including a not-yet-recorded live reading."""
+        self._sync(now)
+        last = self._last_sample
+        if last is None:
+            return self._daily_total + current_usage
+        window_changed = (
+            self._last_reset_time is not None
+            and abs(self._last_reset_time.timestamp() - last.resets_at) > WINDOW_TOLERANCE_SECONDS
+        )
+        if window_changed or current_usage < last.five_hour:
+            return self._daily_total + current_usage
+        return self._daily_total + current_usage - last.five_hour
+
+    def _hourly_profile(self, today: date) -> list[float] | None:
+        """Share of daily consumption per hour of day over past days."""
+        if self._profile_day == today:
+            return self._profile
+
+        history = self.history
+        day_start = datetime.combine(today, datetime.min.time())
+        start = history.index_at((day_start - timedelta(days=PROFILE_DAYS)).timestamp())
+        stop = history.index_at(day_start.timestamp())
+
+        buckets = [0.0] * 24
+        prev: UsageSample | None = None
+        for sample in history.read(start, stop):
+            if prev is not None:
+                buckets[datetime.fromtimestamp(sample.timestamp).hour] += utilization_delta(prev, sample)
+            prev = sample
+
+        total = sum(buckets)
+        profile = None
+        if total > 0:
+            flat = PROFILE_FLAT_WEIGHT / 24
+            profile = [(1 - PROFILE_FLAT_WEIGHT) * b / total + flat for b in buckets]
+
+        self._profile_day = today
+        self._profile = profile
+        return profile
+
+    def _expected_fraction(self, now: datetime) -> float:
+        """Fraction of the daily budget expected to be used by `now`."""
+        hour_fraction = (now.minute * 60 + now.second) / 3600
+        profile = self._hourly_profile(now.date())
+        if profile is None:
+            # No history yet: assume even distribution across 24 hours
+            return (now.hour + hour_fraction) / 24
+        return sum(profile[:now.hour]) + profile[now.hour] * hour_fraction
+
     def calculate_pace(self, current_usage: float) -> PaceStatus:
         """Calculate if usage is on track for daily budget.
 
         Args:
-            current_usage: Current usage percentage (0-100)
+            current_usage: Current 5-hour usage percentage (0-100)
 
         Returns:
-            PaceStatus with is_on_track, current/expected usage, and message
+            PaceStatus with is_on_track, consumed/expected usage today, and message
         """
         config = load_config().goals
 
@@ -43,27 +145,22 @@ class GoalsTracker:
                 message=""
             )
 
-        # Calculate hours elapsed today
         now = datetime.now()
-        day_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        hours_elapsed = (now - day_start).total_seconds() / 3600
-
-        # Calculate expected usage at this time
-        # Assumes even distribution across 24 hours
-        expected_usage = (hours_elapsed / 24) * config.daily_budget_percent
+        daily_usage = self._daily_usage(current_usage, now)
+        expected_usage = self._expected_fraction(now) * config.daily_budget_percent
 
         # 10% buffer for "on track"
-        is_on_track = current_usage <= expected_usage * 1.1
+        is_on_track = daily_usage <= expected_usage * 1.1
 
         if is_on_track:
-            message = f"On track: {current_usage:.1f}% / {expected_usage:.1f}% expected"
+            message = f"On track: {daily_usage:.1f}% / {expected_usage:.1f}% expected"
         else:
-            overage = current_usage - expected_usage
+            overage = daily_usage - expected_usage
             message = f"Pace exceeded by {overage:.1f}%"
 
         return PaceStatus(
             is_on_track=is_on_track,
-            current_usage=current_usage,
+            current_usage=daily_usage,
             expected_usage=expected_usage,
             message=message
         )
@@ -72,12 +169,14 @@ class GoalsTracker:
         """Get budget status: (used%, budget%, exceeded).
 
         Returns:
-            Tuple of (current_usage, daily_budget, is_exceeded)
+            Tuple of (usage consumed today, daily_budget, is_exceeded)
         """
         config = load_config().goals
-        budget = config.daily_budget_percent if config.enabled else 100
-        exceeded = current_usage > budget
-        return current_usage, budget, exceeded
+        if not config.enabled:
+            return current_usage, 100, current_usage > 100
+        used = self._daily_usage(current_usage, datetime.now())
+        budget = config.daily_budget_percent
+        return used, budget, used > budget
 
     def should_warn(self, current_usage: float) -> bool:
         """Check if pace warning should be shown."""
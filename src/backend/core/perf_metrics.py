@@ -0,0 +1,122 @@
+"""Cheap runtime metrics for the debug panel.
+
+Durations are taken with `time.perf_counter_ns()` and kept in fixed-size
+ring buffers, so recording is a couple of integer stores and memory does
+not grow. Counters are plain integers. Names are dotted, e.g.
+``render.usage-content`` or ``notify.system``.
+"""
+import asyncio
+import json
+import time
+from array import array
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+# Durations kept per metric
+RING_SIZE = 128
+
+# How often event-loop lag is sampled
+LAG_SAMPLE_SECONDS = 0.5
+
+
+class RingBuffer:
+    """The last RING_SIZE durations of one metric, in nanoseconds."""
+
+    __slots__ = ("_values", "_next", "count")
+
+    def __init__(self, size: int = RING_SIZE) -> None:
+        self._values = array("q", bytes(8 * size))
+        self._next = 0
+        self.count = 0  # Total recorded, including overwritten values
+
+    def add(self, ns: int) -> None:
+        self._values[self._next] = ns
+        self._next = (self._next + 1) % len(self._values)
+        self.count += 1
+
+    def values(self) -> list[int]:
+        """Kept durations, oldest first."""
+        if self.count < len(self._values):
+            return self._values[:self._next].tolist()
+        return (self._values[self._next:] + self._values[:self._next]).tolist()
+
+    def summary(self) -> dict[str, float]:
+        """Count, and last/mean/p95/max duration in milliseconds."""
+        values = self.values()
+        if not values:
+            return {"count": 0}
+        ordered = sorted(values)
+        return {
+            "count": self.count,
+            "last_ms": values[-1] / 1e6,
+            "mean_ms": sum(values) / len(values) / 1e6,
+            "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] / 1e6,
+            "max_ms": ordered[-1] / 1e6,
+        }
+
+
+class PerfMetrics:
+    """Named duration rings and counters."""
+
+    def __init__(self) -> None:
+        self.durations: dict[str, RingBuffer] = {}
+        self.counters: dict[str, int] = {}
+
+    def record(self, name: str, ns: int) -> None:
+        """Record one duration."""
+        ring = self.durations.get(name)
+        if ring is None:
+            ring = self.durations[name] = RingBuffer()
+        ring.add(ns)
+
+    def count(self, name: str, n: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    @contextmanager
+    def timed(self, name: str) -> Iterator[None]:
+        """Record how long the block takes."""
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter_ns() - start)
+
+    def hit_rate(self, name: str) -> float | None:
+        """Share of ``<name>.hit`` among hits and misses, or None if neither."""
+        hits = self.counters.get(f"{name}.hit", 0)
+        total = hits + self.counters.get(f"{name}.miss", 0)
+        return hits / total if total else None
+
+    def snapshot(self) -> dict[str, Any]:
+        """All metrics as JSON-serializable data."""
+        return {
+            "durations": {name: ring.summary() for name, ring in sorted(self.durations.items())},
+            "counters": dict(sorted(self.counters.items())),
+        }
+
+    def dump(self, path: Path) -> None:
+        """Write snapshot() as JSON."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.snapshot(), indent=2))
+
+
+async def sample_loop_lag(metrics: PerfMetrics, interval: float = LAG_SAMPLE_SECONDS) -> None:
+    """Record as ``loop_lag`` how late each sleep wakes up, until cancelled."""
+    interval_ns = int(interval * 1e9)
+    while True:
+        start = time.perf_counter_ns()
+        await asyncio.sleep(interval)
+        metrics.record("loop_lag", max(0, time.perf_counter_ns() - start - interval_ns))
+
+
+_metrics: PerfMetrics | None = None
+
+
+def get_perf_metrics() -> PerfMetrics:
+    """Get singleton metrics instance."""
+    global _metrics
+    if _metrics is None:
+        _metrics = PerfMetrics()
+    return _metrics
@@ -0,0 +1,125 @@
+"""Small durable state shared between Claudiminder processes.
+
+Reminder triggers and the snooze deadline live in one versioned JSON
+file so short-lived sidecar processes neither repeat notifications nor
+forget a snooze. The file is read once per process, re-read only when
+another process has changed it, and written only when a value changes.
+Writes happen under an inter-process file lock, so concurrent writers
+never lose each other's updates.
+"""
+import json
+import os
+import tempfile
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from filelock import FileLock
+from loguru import logger
+
+from .config_manager import CONFIG_DIR
+
+STATE_VERSION = 1
+STATE_FILE = CONFIG_DIR / "state.json"
+
+
+class StateStore:
+    """Sectioned key/value state persisted to a JSON file."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._data: dict[str, dict[str, Any]] = {}
+        self._version: tuple[int, int] | None = (-1, -1)
+        self._lock = FileLock(str(path.with_suffix(".lock")))
+        self._reload()
+
+    def _stat(self) -> tuple[int, int] | None:
+        # Every write renames a new file into place, so the inode changes
+        # even where mtime resolution is coarse
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_ino)
+
+    def _reload(self) -> None:
+        """Re-read the file if it changed since the last read or write."""
+        version = self._stat()
+        if version == self._version:
+            return
+        self._version = version
+        self._data = {}
+        if version is None:
+            return
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable state file {self.path}: {e}")
+            return
+        if data.get("version") == STATE_VERSION:
+            self._data = data["sections"]
+
+    def get(self, section: str, key: str, default: Any = None) -> Any:
+        """Get a value."""
+        self._reload()
+        return self._data.get(section, {}).get(key, default)
+
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        """Hold the inter-process lock, e.g. across a read-modify-write."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            yield
+
+    def set(self, section: str, key: str, value: Any) -> None:
+        """Set a JSON-serializable value, writing only if it changed."""
+        with self.locked():
+            self._reload()
+            values = self._data.setdefault(section, {})
+            if key in values and values[key] == value:
+                return
+            values[key] = value
+            self._write()
+
+    def update(
+        self, section: str, key: str, change: Callable[[Any], Any], default: Any = None
+    ) -> Any:
+        """Replace a value with change(current value) atomically across processes.
+
+        Returns:
+            The new value
+        """
+        with self.locked():
+            value = change(self.get(section, key, default))
+            self.set(section, key, value)
+        return value
+
+    def _write(self) -> None:
+        # A unique temp file, so a writer can never rename another's partial file
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=f"{self.path.stem}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({"version": STATE_VERSION, "sections": self._data}, f)
+            os.replace(tmp, self.path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        self._version = self._stat()
+
+
+_store: StateStore | None = None
+
+
+def get_state_store() -> StateStore:
+    """Get singleton state store instance."""
+    global _store
+    if _store is None or _store.path != STATE_FILE:
+        _store = StateStore(STATE_FILE)
+    return _store
+
+
+def clear_state_store_cache() -> None:
+    """Drop the cached store instance."""
+    global _store
+    _store = None
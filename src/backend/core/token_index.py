@@ -0,0 +1,182 @@
+"""Per-project and per-model token attribution index.
+
+Aggregates transcript events into hourly buckets plus running totals and
+persists them, together with the tailer checkpoints, next to the usage
+history. Queries never touch transcript files.
+"""
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+from loguru import logger
+
+from ..models.settings import get_settings
+from . import usage_history
+from .transcript_tailer import (
+    FileCheckpoint,
+    TranscriptEvent,
+    TranscriptTailer,
+    dump_checkpoints,
+    load_checkpoints,
+)
+
+TOKEN_INDEX_VERSION = 1
+
+# Hourly buckets older than this are pruned; running totals are kept
+RETENTION_SECONDS = 90 * 24 * 3600
+
+# Counter layout: input, output, cache read, cache write
+Counts = list[int]
+
+
+class TokenUsage(NamedTuple):
+    """Aggregated tokens for one project or model."""
+    name: str
+    input_tokens: int
+    output_tokens: int
+    cache_read_tokens: int
+    cache_write_tokens: int
+
+    @property
+    def total(self) -> int:
+        return self.input_tokens + self.output_tokens + self.cache_read_tokens + self.cache_write_tokens
+
+
+def _add(target: dict[str, Counts], key: str, event: TranscriptEvent) -> None:
+    counts = target.get(key)
+    if counts is None:
+        counts = target[key] = [0, 0, 0, 0]
+    counts[0] += event.input_tokens
+    counts[1] += event.output_tokens
+    counts[2] += event.cache_read_tokens
+    counts[3] += event.cache_write_tokens
+
+
+class TokenIndex:
+    """Token usage per project, per model and per hour."""
+
+    def __init__(self, path: Path, projects_root: Path) -> None:
+        self.path = path
+        # hour start -> "project\tmodel" -> counts
+        self._hourly: dict[int, dict[str, Counts]] = {}
+        self._by_project: dict[str, Counts] = {}
+        self._by_model: dict[str, Counts] = {}
+        checkpoints = self._load()
+        self._tailer = TranscriptTailer(projects_root, checkpoints)
+
+    def _load(self) -> dict[str, FileCheckpoint] | None:
+        try:
+            data = json.loads(self.path.read_text())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Rebuilding unreadable token index {self.path}: {e}")
+            return None
+        if data.get("version") != TOKEN_INDEX_VERSION:
+            return None
+        self._hourly = {int(hour): keys for hour, keys in data["hourly"].items()}
+        self._by_project = data["by_project"]
+        self._by_model = data["by_model"]
+        return load_checkpoints(data["checkpoints"])
+
+    def _save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=f"{self.path.stem}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({
+                    "version": TOKEN_INDEX_VERSION,
+                    "checkpoints": dump_checkpoints(self._tailer.checkpoints),
+                    "hourly": self._hourly,
+                    "by_project": self._by_project,
+                    "by_model": self._by_model,
+                }, f)
+            os.replace(tmp, self.path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def add(self, event: TranscriptEvent) -> None:
+        """Fold one transcript event into the index."""
+        hour = int(event.timestamp // 3600 * 3600)
+        bucket = self._hourly.get(hour)
+        if bucket is None:
+            bucket = self._hourly[hour] = {}
+        _add(bucket, f"{event.project}\t{event.model}", event)
+        _add(self._by_project, event.project, event)
+        _add(self._by_model, event.model, event)
+
+    def refresh(self) -> int:
+        """Ingest newly appended transcript lines and persist.
+
+        Returns:
+            Number of events added
+        """
+        events = self._tailer.poll()
+        for event in events:
+            self.add(event)
+
+        cutoff = time.time() - RETENTION_SECONDS
+        stale = [hour for hour in self._hourly if hour < cutoff]
+        for hour in stale:
+            del self._hourly[hour]
+
+        if events or stale:
+            self._save()
+        return len(events)
+
+    def top(self, by: str = "project", since: float | None = None, limit: int = 10) -> list[TokenUsage]:
+        """Largest consumers by total tokens.
+
+        Args:
+            by: "project" or "model"
+            since: Only count hours starting at or after this timestamp
+                (rounded down to the hour); None for all-time totals
+            limit: Maximum rows
+
+        Returns:
+            Rows sorted by total tokens, descending
+        """
+        if by not in ("project", "model"):
+            raise ValueError(f"Unknown grouping: {by}")
+
+        if since is None:
+            totals = self._by_project if by == "project" else self._by_model
+        else:
+            totals = {}
+            part = 0 if by == "project" else 1
+            # Walk only the requested hours, not the whole index
+            for hour in range(int(since // 3600 * 3600), int(time.time()) + 1, 3600):
+                for key, counts in self._hourly.get(hour, {}).items():
+                    name = key.split("\t")[part]
+                    acc = totals.setdefault(name, [0, 0, 0, 0])
+                    for i in range(4):
+                        acc[i] += counts[i]
+
+        rows = [TokenUsage(name, *counts) for name, counts in totals.items()]
+        rows.sort(key=lambda row: row.total, reverse=True)
+        return rows[:limit]
+
+
+_index: TokenIndex | None = None
+
+
+def get_token_index() -> TokenIndex:
+    """Get the token index, refreshed with new transcript lines."""
+    global _index
+    if _index is None:
+        _index = TokenIndex(
+            usage_history.HISTORY_DIR / "token_index.json",
+            get_settings().claude_projects_path,
+        )
+    _index.refresh()
+    return _index
+
+
+def clear_token_index_cache() -> None:
+    """Drop the cached index instance."""
+    global _index
+    _index = None
@@ -0,0 +1,172 @@
+"""Incremental tailer for Claude Code transcripts under ~/.claude/projects.
+
+Each `<project>/<session>.jsonl` file is tracked by an (inode, size,
+mtime, offset) checkpoint. Unchanged files cost a single stat; changed
+files are read from their last offset and only complete lines are parsed.
+"""
+import json
+import os
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from loguru import logger
+
+# Recently seen (message id, request id) pairs. Claude Code writes one line
+# per content block, each repeating the message's usage.
+DEDUP_CAPACITY = 10_000
+
+_USAGE_MARKER = b'"usage"'
+
+
+class FileCheckpoint(NamedTuple):
+    """Read position of one transcript file."""
+    inode: int
+    size: int
+    mtime_ns: int
+    offset: int
+
+
+class TranscriptEvent(NamedTuple):
+    """Token usage of one assistant message."""
+    project: str
+    model: str
+    timestamp: float
+    input_tokens: int
+    output_tokens: int
+    cache_read_tokens: int
+    cache_write_tokens: int
+
+
+def parse_line(line: bytes, project: str) -> tuple[TranscriptEvent, str | None] | None:
+    """Parse one transcript line into an event and its dedup key."""
+    # Cheap substring test before paying for a JSON decode
+    if _USAGE_MARKER not in line:
+        return None
+    try:
+        entry = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(entry, dict) or entry.get("type") != "assistant":
+        return None
+    message = entry.get("message")
+    if not isinstance(message, dict) or not isinstance(message.get("usage"), dict):
+        return None
+    usage: dict[str, Any] = message["usage"]
+
+    try:
+        timestamp = datetime.fromisoformat(entry["timestamp"].replace("Z", "+00:00")).timestamp()
+    except (KeyError, AttributeError, ValueError):
+        return None
+
+    try:
+        event = TranscriptEvent(
+            project=project,
+            model=str(message.get("model") or "unknown"),
+            timestamp=timestamp,
+            input_tokens=int(usage.get("input_tokens") or 0),
+            output_tokens=int(usage.get("output_tokens") or 0),
+            cache_read_tokens=int(usage.get("cache_read_input_tokens") or 0),
+            cache_write_tokens=int(usage.get("cache_creation_input_tokens") or 0),
+        )
+    except (TypeError, ValueError):
+        return None
+    key = None
+    if message.get("id"):
+        key = f"{message['id']}:{entry.get('requestId', '')}"
+    return event, key
+
+
+class TranscriptTailer:
+    """Tail every transcript under a projects directory."""
+
+    def __init__(self, root: Path, checkpoints: dict[str, FileCheckpoint] | None = None) -> None:
+        self.root = root
+        self.checkpoints: dict[str, FileCheckpoint] = dict(checkpoints or {})
+        self._seen: OrderedDict[str, None] = OrderedDict()
+
+    def _is_duplicate(self, key: str | None) -> bool:
+        if key is None:
+            return False
+        if key in self._seen:
+            return True
+        self._seen[key] = None
+        if len(self._seen) > DEDUP_CAPACITY:
+            self._seen.popitem(last=False)
+        return False
+
+    def poll(self) -> list[TranscriptEvent]:
+        """Read events appended since the previous poll."""
+        events: list[TranscriptEvent] = []
+        seen_paths: set[str] = set()
+        try:
+            projects = list(os.scandir(self.root))
+        except FileNotFoundError:
+            projects = []
+
+        for project in projects:
+            if not project.is_dir(follow_symlinks=False):
+                continue
+            try:
+                files = list(os.scandir(project.path))
+            except OSError:
+                continue
+            for entry in files:
+                if not entry.name.endswith(".jsonl"):
+                    continue
+                seen_paths.add(entry.path)
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                previous = self.checkpoints.get(entry.path)
+                if previous is not None and previous[:3] == (st.st_ino, st.st_size, st.st_mtime_ns):
+                    continue
+                self._read_file(entry.path, project.name, st, previous, events)
+
+        # Forget files that were deleted
+        for path in self.checkpoints.keys() - seen_paths:
+            del self.checkpoints[path]
+        return events
+
+    def _read_file(
+        self,
+        path: str,
+        project: str,
+        st: os.stat_result,
+        previous: FileCheckpoint | None,
+        events: list[TranscriptEvent],
+    ) -> None:
+        """Parse complete lines after the checkpoint offset of one file."""
+        offset = 0
+        if previous is not None and previous.inode == st.st_ino and st.st_size >= previous.offset:
+            offset = previous.offset
+        # Otherwise the file was rotated (new inode) or truncated: start over
+
+        try:
+            with open(path, "rb") as f:
+                f.seek(offset)
+                data = f.read(st.st_size - offset)
+        except OSError as e:
+            logger.debug(f"Skipping transcript {path}: {e}")
+            return
+
+        # Leave a trailing partial line for the next poll
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            parsed = parse_line(line, project)
+            if parsed is not None and not self._is_duplicate(parsed[1]):
+                events.append(parsed[0])
+
+        self.checkpoints[path] = FileCheckpoint(st.st_ino, st.st_size, st.st_mtime_ns, offset + end)
+
+
+def load_checkpoints(data: dict[str, list[int]]) -> dict[str, FileCheckpoint]:
+    """Restore checkpoints from their JSON form."""
+    return {path: FileCheckpoint(*values) for path, values in data.items()}
+
+
+def dump_checkpoints(checkpoints: dict[str, FileCheckpoint]) -> dict[str, list[int]]:
+    """Convert checkpoints to a JSON-serializable form."""
+    return {path: list(cp) for path, cp in checkpoints.items()}
@@ -0,0 +1,185 @@
+"""Local socket pushing usage updates from the running backend to clients.
+
+The instance that holds the instance lock polls the API and serves every
+update it publishes on a Unix socket, one JSON object per line. Other
+TUIs attach as clients and render those updates, so any number of them
+(tmux panes, SSH sessions) cost no extra API calls.
+
+Each connection first receives a hello carrying the UI language, then
+the latest update, then every new one. A slow client only ever has the
+newest update queued.
+"""
+import asyncio
+import json
+import socket
+from collections.abc import AsyncIterator
+from datetime import datetime
+from pathlib import Path
+from typing import Any, cast
+
+from loguru import logger
+
+from ..models.usage import UsageResponse
+from .config_manager import load_config
+from .event_bus import USAGE_SAMPLE, OverflowPolicy, Subscription, UsageUpdate, get_event_bus
+from .goals_tracker import PaceStatus
+
+SOCKET_PATH = Path.home() / ".config" / "backend" / "daemon.sock"
+
+# How long a client waits between attempts to reach the backend
+RECONNECT_SECONDS = 5.0
+
+CONNECT_TIMEOUT_SECONDS = 1.0
+
+
+def encode_update(update: UsageUpdate) -> dict[str, Any]:
+    """JSON-serializable form of an update."""
+    return {
+        "type": "update",
+        "usage": update.usage.model_dump(mode="json"),
+        "utilization": update.utilization,
+        "reset_time": update.reset_time.isoformat() if update.reset_time else None,
+        "pace": list(update.pace) if update.pace else None,
+        "budget": list(update.budget) if update.budget else None,
+        "suppression": update.suppression,
+    }
+
+
+def decode_update(data: dict[str, Any]) -> UsageUpdate:
+    """Rebuild an update from encode_update() output."""
+    reset_time = data["reset_time"]
+    pace = data["pace"]
+    budget = data["budget"]
+    return UsageUpdate(
+        UsageResponse.model_validate(data["usage"]),
+        data["utilization"],
+        datetime.fromisoformat(reset_time) if reset_time else None,
+        PaceStatus(*pace) if pace else None,
+        (budget[0], budget[1], budget[2]) if budget else None,
+        data["suppression"],
+    )
+
+
+def _line(message: dict[str, Any]) -> bytes:
+    return json.dumps(message).encode() + b"\n"
+
+
+def backend_available(path: Path | None = None) -> bool:
+    """Check whether a backend is serving updates."""
+    path = SOCKET_PATH if path is None else path
+    if not hasattr(socket, "AF_UNIX") or not path.exists():
+        return False
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(CONNECT_TIMEOUT_SECONDS)
+        try:
+            sock.connect(str(path))
+        except OSError:
+            return False
+    return True
+
+
+class UpdateServer:
+    """Push published usage updates to connected clients."""
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = SOCKET_PATH if path is None else path
+        self._latest: UsageUpdate | None = None
+        self._subscriptions: set[Subscription] = set()
+
+    @property
+    def client_count(self) -> int:
+        return len(self._subscriptions)
+
+    def _remember(self, update: UsageUpdate) -> None:
+        self._latest = update
+
+    async def run(self) -> None:
+        """Serve until cancelled. Call only while holding the instance lock."""
+        if not hasattr(asyncio, "start_unix_server"):
+            logger.debug("Unix sockets unavailable, not serving updates")
+            return
+        bus = get_event_bus()
+        bus.on(USAGE_SAMPLE, self._remember)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Left behind by a backend that died; we hold the lock so it is stale
+        self.path.unlink(missing_ok=True)
+        try:
+            server = await asyncio.start_unix_server(self._serve, path=str(self.path))
+            async with server:
+                logger.debug(f"Serving usage updates on {self.path}")
+                await server.serve_forever()
+        finally:
+            bus.off(USAGE_SAMPLE, self._remember)
+            for subscription in list(self._subscriptions):
+                subscription.close()
+            self.path.unlink(missing_ok=True)
+
+    async def _serve(self, _reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        subscription = get_event_bus().subscribe(USAGE_SAMPLE, policy=OverflowPolicy.LATEST)
+        self._subscriptions.add(subscription)
+        try:
+            writer.write(_line({"type": "hello", "language": load_config().language}))
+            if self._latest is not None:
+                writer.write(_line(encode_update(self._latest)))
+            await writer.drain()
+            async for update in subscription:
+                writer.write(_line(encode_update(update)))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self._subscriptions.discard(subscription)
+            subscription.close()
+            writer.close()
+
+
+class UpdateClient:
+    """Connection to a backend's update socket."""
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = SOCKET_PATH if path is None else path
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+
+    async def connect(self) -> dict[str, Any]:
+        """Connect and read the hello.
+
+        Raises:
+            OSError: If no backend is serving, or what answered is not one
+        """
+        self._reader, self._writer = await asyncio.open_unix_connection(str(self.path))
+        line = await self._reader.readline()
+        if not line:
+            await self.close()
+            raise ConnectionResetError("Backend closed the connection")
+        try:
+            hello = json.loads(line)
+        except ValueError:
+            hello = None
+        if not isinstance(hello, dict) or hello.get("type") != "hello":
+            await self.close()
+            raise ConnectionError(f"Expected a hello from the backend, got {line[:80]!r}")
+        return cast(dict[str, Any], hello)
+
+    async def updates(self) -> AsyncIterator[UsageUpdate]:
+        """Yield updates until the backend goes away."""
+        if self._reader is None:
+            return
+        try:
+            while line := await self._reader.readline():
+                try:
+                    message = json.loads(line)
+                    if message.get("type") == "update":
+                        yield decode_update(message)
+                except (ValueError, KeyError, TypeError) as e:
+                    logger.warning(f"Ignoring malformed update from backend: {e}")
+        except ConnectionError:
+            pass
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            self._reader = None
@@ -0,0 +1,234 @@
+"""Analytics over usage history: rollups, percentiles, windows, forecasts.
+
+History columns are loaded as NumPy views straight over the mapped history
+file when NumPy is installed (``pip install claudeminder[analytics]``), and
+as plain ``array('d')`` columns otherwise. Every function accepts either.
+"""
+from __future__ import annotations
+
+import math
+from array import array
+from dataclasses import dataclass
+from typing import Any, NamedTuple
+
+from .usage_history import RECORD, WINDOW_TOLERANCE_SECONDS, UsageHistory
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None  # type: ignore[assignment]
+
+HAS_NUMPY = np is not None
+
+_RECORD_DTYPE = (
+    np.dtype([("timestamp", "<f8"), ("five_hour", "<f8"), ("resets_at", "<f8"), ("seven_day", "<f8")])
+    if np is not None
+    else None
+)
+
+
+@dataclass(frozen=True, slots=True)
+class HistoryColumns:
+    """Column view of a history range.
+
+    Each column is a NumPy array or an ``array('d')``.
+    """
+    timestamp: Any  # ndarray | array[float]
+    five_hour: Any
+    resets_at: Any
+    seven_day: Any
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    @property
+    def is_numpy(self) -> bool:
+        return np is not None and isinstance(self.timestamp, np.ndarray)
+
+
+class WindowStats(NamedTuple):
+    """Statistics for one 5-hour window."""
+    resets_at: float
+    start: float
+    end: float
+    peak: float
+    consumed: float
+    samples: int
+
+
+class Forecast(NamedTuple):
+    """Linear projection of the current window."""
+    slope_per_hour: float
+    projected_at_reset: float
+    hours_to_full: float | None
+
+
+def load_columns(
+    history: UsageHistory,
+    start: int = 0,
+    stop: int | None = None,
+    use_numpy: bool | None = None,
+) -> HistoryColumns:
+    """Load history records [start, stop) as columns.
+
+    With NumPy the columns are strided views over the memory-mapped file,
+    so no record is copied or parsed.
+    """
+    if use_numpy is None:
+        use_numpy = HAS_NUMPY
+    count = len(history)
+    stop = count if stop is None else min(stop, count)
+    n = max(0, stop - start)
+
+    if use_numpy and np is not None:
+        mm = history.map() if n else None
+        if mm is None:
+            records = np.empty(0, dtype=_RECORD_DTYPE)
+        else:
+            records = np.frombuffer(mm, dtype=_RECORD_DTYPE, count=n, offset=start * RECORD.size)
+        return HistoryColumns(
+            records["timestamp"], records["five_hour"], records["resets_at"], records["seven_day"]
+        )
+
+    values = array("d", history.read_bytes(start, stop))
+    return HistoryColumns(values[0::4], values[1::4], values[2::4], values[3::4])
+
+
+def consumption(cols: HistoryColumns) -> Any:
+    """Utilization consumed by each sample since the previous one.
+
+    The first sample has no baseline and consumes 0.
+    """
+    n = len(cols)
+    util, resets = cols.five_hour, cols.resets_at
+    if cols.is_numpy:
+        out = np.zeros(n)
+        if n > 1:
+            delta = np.diff(util)
+            new_window = (delta < 0) | (np.abs(np.diff(resets)) > WINDOW_TOLERANCE_SECONDS)
+            out[1:] = np.where(new_window, util[1:], delta)
+        return out
+
+    result = [0.0] * n
+    for i in range(1, n):
+        delta = util[i] - util[i - 1]
+        if delta < 0 or abs(resets[i] - resets[i - 1]) > WINDOW_TOLERANCE_SECONDS:
+            result[i] = util[i]
+        else:
+            result[i] = delta
+    return result
+
+
+def _window_starts(cols: HistoryColumns) -> list[int]:
+    """Indices where a new window begins."""
+    n = len(cols)
+    if n == 0:
+        return []
+    util, resets = cols.five_hour, cols.resets_at
+    if cols.is_numpy:
+        flags = np.ones(n, dtype=bool)
+        flags[1:] = (np.diff(util) < 0) | (np.abs(np.diff(resets)) > WINDOW_TOLERANCE_SECONDS)
+        return list(np.flatnonzero(flags).tolist())
+    return [0] + [
+        i for i in range(1, n)
+        if util[i] < util[i - 1] or abs(resets[i] - resets[i - 1]) > WINDOW_TOLERANCE_SECONDS
+    ]
+
+
+def rollup(cols: HistoryColumns, bucket_seconds: float = 3600) -> list[tuple[float, float]]:
+    """Consumption summed per time bucket, as sorted (bucket_start, consumed)."""
+    if len(cols) == 0:
+        return []
+    consumed = consumption(cols)
+    if cols.is_numpy:
+        keys = np.floor(cols.timestamp / bucket_seconds)
+        buckets, inverse = np.unique(keys, return_inverse=True)
+        sums = np.bincount(inverse, weights=consumed)
+        return list(zip((buckets * bucket_seconds).tolist(), sums.tolist(), strict=True))
+
+    totals: dict[float, float] = {}
+    for ts, value in zip(cols.timestamp, consumed, strict=True):
+        key = math.floor(ts / bucket_seconds) * bucket_seconds
+        totals[key] = totals.get(key, 0.0) + value
+    return sorted(totals.items())
+
+
+def percentiles(values: Any, qs: list[float]) -> list[float]:
+    """Linear-interpolated percentiles (0-100) of a column, ignoring NaN."""
+    if np is not None and isinstance(values, np.ndarray):
+        finite = values[~np.isnan(values)]
+        if finite.size == 0:
+            return [math.nan] * len(qs)
+        return list(np.percentile(finite, qs).tolist())
+
+    ordered = sorted(v for v in values if not math.isnan(v))
+    if not ordered:
+        return [math.nan] * len(qs)
+    result = []
+    last = len(ordered) - 1
+    for q in qs:
+        pos = last * q / 100
+        lo = math.floor(pos)
+        hi = min(lo + 1, last)
+        result.append(ordered[lo] + (ordered[hi] - ordered[lo]) * (pos - lo))
+    return result
+
+
+def window_stats(cols: HistoryColumns) -> list[WindowStats]:
+    """Segment the history into 5-hour windows and summarize each."""
+    n = len(cols)
+    starts = _window_starts(cols)
+    if not starts:
+        return []
+    consumed = consumption(cols)
+    ts, util, resets = cols.timestamp, cols.five_hour, cols.resets_at
+
+    if cols.is_numpy:
+        idx = np.asarray(starts)
+        ends = np.append(idx[1:], n)
+        peaks = np.maximum.reduceat(util, idx)
+        sums = np.add.reduceat(consumed, idx)
+        return [
+            WindowStats(*row)
+            for row in zip(
+                resets[idx].tolist(), ts[idx].tolist(), ts[ends - 1].tolist(),
+                peaks.tolist(), sums.tolist(), (ends - idx).tolist(),
+                strict=True,
+            )
+        ]
+
+    stats = []
+    for start, end in zip(starts, starts[1:] + [n], strict=True):
+        stats.append(WindowStats(
+            resets[start], ts[start], ts[end - 1],
+            max(util[start:end]), sum(consumed[start:end]), end - start,
+        ))
+    return stats
+
+
+def forecast(cols: HistoryColumns) -> Forecast | None:
+    """Least-squares projection of the latest window, or None if too short."""
+    starts = _window_starts(cols)
+    if not starts or len(cols) - starts[-1] < 2:
+        return None
+    start = starts[-1]
+    ts, util = cols.timestamp[start:], cols.five_hour[start:]
+
+    if cols.is_numpy:
+        t = ts - ts.mean()
+        denom = float(np.dot(t, t))
+        slope = float(np.dot(t, util - util.mean())) / denom if denom else 0.0
+    else:
+        n = len(ts)
+        t_mean = sum(ts) / n
+        u_mean = sum(util) / n
+        denom = sum((t - t_mean) ** 2 for t in ts)
+        numer = sum((t - t_mean) * (u - u_mean) for t, u in zip(ts, util, strict=True))
+        slope = numer / denom if denom else 0.0
+
+    slope_per_hour = slope * 3600
+    last_ts, last_util = float(ts[-1]), float(util[-1])
+    resets_at = float(cols.resets_at[-1])
+    projected = last_util + slope_per_hour * max(0.0, resets_at - last_ts) / 3600
+    hours_to_full = (100 - last_util) / slope_per_hour if slope_per_hour > 0 else None
+    return Forecast(slope_per_hour, projected, hours_to_full)
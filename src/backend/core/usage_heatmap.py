@@ -0,0 +1,148 @@
+"""Hour-of-week consumption heatmap, maintained incrementally from history."""
+import json
+import os
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+from loguru import logger
+
+from . import usage_history
+from .usage_history import UsageHistory, UsageSample, get_usage_history, utilization_delta
+
+HEATMAP_VERSION = 1
+DAYS = 7
+HOURS = 24
+
+# Gaps longer than this are offline time whose consumption can't be placed
+MAX_OBSERVED_GAP_SECONDS = 15 * 60
+
+
+class UsageHeatmap:
+    """Average consumption rate (%/hour) per weekday x hour-of-day slot.
+
+    Only sums are stored, so each new sample updates one slot and reading
+    the grid never touches history.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._clear()
+        self._load()
+
+    def _clear(self) -> None:
+        self._consumed = [0.0] * (DAYS * HOURS)
+        self._seconds = [0.0] * (DAYS * HOURS)
+        self._next_index = 0
+        self._last_sample: UsageSample | None = None
+        self._dirty = False
+
+    def _load(self) -> None:
+        """Load persisted sums, keeping defaults if missing or stale."""
+        try:
+            data = json.loads(self.path.read_text())
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable heatmap {self.path}: {e}")
+            return
+        if data.get("version") != HEATMAP_VERSION:
+            return
+        self._consumed = data["consumed"]
+        self._seconds = data["seconds"]
+        self._next_index = data["next_index"]
+        last = data.get("last_sample")
+        self._last_sample = UsageSample(*last) if last else None
+
+    def save(self) -> None:
+        """Persist sums folded in since the last save."""
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # A unique temp file, so concurrent savers never rename each other's
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=f"{self.path.stem}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({
+                    "version": HEATMAP_VERSION,
+                    "next_index": self._next_index,
+                    "last_sample": list(self._last_sample) if self._last_sample else None,
+                    "consumed": self._consumed,
+                    "seconds": self._seconds,
+                }, f)
+            os.replace(tmp, self.path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        self._dirty = False
+
+    def add_sample(self, sample: UsageSample) -> None:
+        """Fold one sample into its hour-of-week slot."""
+        prev = self._last_sample
+        self._last_sample = sample
+        if prev is None:
+            return
+        gap = sample.timestamp - prev.timestamp
+        if not 0 < gap <= MAX_OBSERVED_GAP_SECONDS:
+            return
+        when = datetime.fromtimestamp(sample.timestamp)
+        slot = when.weekday() * HOURS + when.hour
+        self._consumed[slot] += utilization_delta(prev, sample)
+        self._seconds[slot] += gap
+
+    def sync(self, history: UsageHistory) -> bool:
+        """Fold in samples appended since the last sync, in memory only.
+
+        Returns:
+            True if any new sample was processed
+        """
+        if len(history) < self._next_index:
+            # History was truncated or replaced: rebuild from scratch
+            self._clear()
+        samples = history.read(self._next_index)
+        if not samples:
+            return False
+        for sample in samples:
+            self.add_sample(sample)
+        self._next_index += len(samples)
+        self._dirty = True
+        return True
+
+    def rate(self, weekday: int, hour: int) -> float | None:
+        """Average consumption rate in %/hour, or None if never observed."""
+        slot = weekday * HOURS + hour
+        seconds = self._seconds[slot]
+        if seconds <= 0:
+            return None
+        return self._consumed[slot] / (seconds / 3600)
+
+    def grid(self) -> list[list[float | None]]:
+        """7x24 grid of rates, Monday first."""
+        return [[self.rate(day, hour) for hour in range(HOURS)] for day in range(DAYS)]
+
+
+_heatmaps: dict[str, UsageHeatmap] = {}
+
+
+def get_usage_heatmap(account: str = "default") -> UsageHeatmap:
+    """Get the heatmap for an account, synced with its history.
+
+    Never writes: only the process recording samples persists the heatmap,
+    through update_heatmap().
+    """
+    heatmap = _heatmaps.get(account)
+    if heatmap is None:
+        path = usage_history.HISTORY_DIR / f"{account}.heatmap.json"
+        heatmap = _heatmaps[account] = UsageHeatmap(path)
+    heatmap.sync(get_usage_history(account))
+    return heatmap
+
+
+def update_heatmap(account: str = "default") -> None:
+    """Fold newly recorded samples into an account's heatmap and persist it."""
+    get_usage_heatmap(account).save()
+
+
+def clear_heatmap_cache() -> None:
+    """Drop cached heatmap instances."""
+    _heatmaps.clear()
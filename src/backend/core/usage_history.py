@@ -0,0 +1,145 @@
+"""Append-only per-account store of usage samples.
+
+Samples are fixed-size little-endian records so the file can be appended
+to cheaply, binary-searched by timestamp and mapped without parsing.
+"""
+import math
+import mmap
+import struct
+from datetime import datetime
+from itertools import pairwise
+from pathlib import Path
+from typing import NamedTuple
+
+from ..models.usage import UsageResponse
+
+HISTORY_DIR = Path.home() / ".config" / "backend" / "history"
+
+# timestamp, five_hour utilization, five_hour resets_at, seven_day utilization
+RECORD = struct.Struct("<dddd")
+
+# Resets_at values closer than this are the same window (API jitter)
+WINDOW_TOLERANCE_SECONDS = 60.0
+
+
+class UsageSample(NamedTuple):
+    """One usage observation. Unknown values are NaN."""
+    timestamp: float
+    five_hour: float
+    resets_at: float
+    seven_day: float
+
+
+def sample_from_usage(usage: UsageResponse, timestamp: float) -> UsageSample | None:
+    """Build a sample from an API response, or None without 5-hour data."""
+    if usage.five_hour is None:
+        return None
+    resets_at = math.nan
+    if usage.five_hour.resets_at:
+        resets_at = datetime.fromisoformat(
+            usage.five_hour.resets_at.replace("Z", "+00:00")
+        ).timestamp()
+    seven_day = math.nan
+    if usage.seven_day and usage.seven_day.get("utilization") is not None:
+        seven_day = float(usage.seven_day["utilization"])
+    return UsageSample(timestamp, usage.five_hour.utilization, resets_at, seven_day)
+
+
+def is_new_window(prev: UsageSample, cur: UsageSample) -> bool:
+    """Check whether two consecutive samples belong to different windows."""
+    if abs(cur.resets_at - prev.resets_at) > WINDOW_TOLERANCE_SECONDS:
+        return True
+    return cur.five_hour < prev.five_hour
+
+
+def utilization_delta(prev: UsageSample, cur: UsageSample) -> float:
+    """Utilization consumed between two consecutive samples."""
+    if is_new_window(prev, cur):
+        return cur.five_hour
+    return cur.five_hour - prev.five_hour
+
+
+class UsageHistory:
+    """Sample history for one account, stored as `<account>.bin`."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def __len__(self) -> int:
+        try:
+            return self.path.stat().st_size // RECORD.size
+        except FileNotFoundError:
+            return 0
+
+    def append(self, sample: UsageSample) -> None:
+        """Append one sample."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "ab") as f:
+            # Drop a torn record left by an interrupted write
+            size = f.seek(0, 2)
+            if size % RECORD.size:
+                f.truncate(size - size % RECORD.size)
+            f.write(RECORD.pack(*sample))
+
+    def read(self, start: int = 0, stop: int | None = None) -> list[UsageSample]:
+        """Read samples in index range [start, stop)."""
+        data = self.read_bytes(start, stop)
+        return [UsageSample._make(r) for r in RECORD.iter_unpack(data)]
+
+    def read_bytes(self, start: int = 0, stop: int | None = None) -> bytes:
+        """Read raw records in index range [start, stop)."""
+        count = len(self)
+        stop = count if stop is None else min(stop, count)
+        if start >= stop:
+            return b""
+        with open(self.path, "rb") as f:
+            f.seek(start * RECORD.size)
+            return f.read((stop - start) * RECORD.size)
+
+    def map(self) -> mmap.mmap | None:
+        """Map the whole file read-only, or None when empty.
+
+        The mapping stays valid while any buffer exported from it is alive.
+        """
+        if len(self) == 0:
+            return None
+        with open(self.path, "rb") as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def index_at(self, timestamp: float) -> int:
+        """Index of the first sample at or after `timestamp` (binary search)."""
+        count = len(self)
+        if count == 0:
+            return 0
+        with open(self.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            lo, hi = 0, count
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if struct.unpack_from("<d", mm, mid * RECORD.size)[0] < timestamp:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            return lo
+
+    def consumed_since(self, timestamp: float) -> float:
+        """Utilization consumed from `timestamp` up to the latest sample."""
+        start = self.index_at(timestamp)
+        # Include the sample just before `timestamp` as the baseline
+        samples = self.read(max(0, start - 1))
+        return sum(utilization_delta(a, b) for a, b in pairwise(samples))
+
+
+_histories: dict[str, UsageHistory] = {}
+
+
+def get_usage_history(account: str = "default") -> UsageHistory:
+    """Get the history store for an account."""
+    history = _histories.get(account)
+    if history is None:
+        history = _histories[account] = UsageHistory(HISTORY_DIR / f"{account}.bin")
+    return history
+
+
+def clear_history_cache() -> None:
+    """Drop cached history instances (used when HISTORY_DIR changes)."""
+    _histories.clear()
@@ -0,0 +1,43 @@
+"""Usage polling loop that slows down while Claude is idle."""
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from loguru import logger
+
+from .activity_watcher import ActivityWatcher
+from .config_manager import load_config
+
+
+class UsagePoller:
+    """Call `fetch` at the configured cadence, backing off when idle.
+
+    Usage can only change while Claude is being used, so after
+    `idle_after_minutes` without transcript activity the poller waits up
+    to `idle_poll_interval_seconds`, and fetches at once when activity
+    resumes.
+    """
+
+    def __init__(self, fetch: Callable[[], Awaitable[None]], watcher: ActivityWatcher) -> None:
+        self._fetch = fetch
+        self._watcher = watcher
+
+    async def wait_next(self) -> None:
+        """Sleep until the next poll is due."""
+        config = load_config()
+        idle_after = config.idle_after_minutes * 60
+        if not config.activity_polling or self._watcher.idle_seconds() < idle_after:
+            await asyncio.sleep(config.poll_interval_seconds)
+            return
+
+        if await self._watcher.wait_for_activity(config.idle_poll_interval_seconds):
+            logger.debug("Claude activity detected, polling now")
+
+    async def run(self) -> None:
+        """Poll forever; the first fetch happens after one interval."""
+        self._watcher.start()
+        try:
+            while True:
+                await self.wait_next()
+                await self._fetch()
+        finally:
+            self._watcher.stop()
@@ -0,0 +1,116 @@
+"""Time-bucketed usage series for sparklines and charts, maintained incrementally.
+
+Each series is a fixed number of buckets covering a fixed span. New
+samples only touch the newest bucket, and older buckets scroll out of
+the ring, so updating and drawing cost the same however long the
+history is.
+"""
+import math
+import time
+from collections import deque
+from enum import Enum
+
+from .usage_history import UsageHistory, get_usage_history
+
+# Points per series, which is also the width of a sparkline or chart
+BUCKETS = 60
+
+
+class Zoom(Enum):
+    """Time range shown by the history chart."""
+    WINDOW = "window"
+    DAY = "day"
+    WEEK = "week"
+
+
+ZOOM_SPANS = {
+    Zoom.WINDOW: 5 * 3600.0,
+    Zoom.DAY: 24 * 3600.0,
+    Zoom.WEEK: 7 * 24 * 3600.0,
+}
+
+
+class BucketedSeries:
+    """Peak value seen in each of the last `buckets` time buckets."""
+
+    def __init__(self, span_seconds: float, buckets: int = BUCKETS) -> None:
+        self.bucket_seconds = span_seconds / buckets
+        self._values: deque[float] = deque([math.nan] * buckets, maxlen=buckets)
+        self._last_bucket: int | None = None
+
+    def advance(self, timestamp: float) -> None:
+        """Scroll so the newest bucket is the one holding `timestamp`."""
+        bucket = int(timestamp // self.bucket_seconds)
+        if self._last_bucket is not None and bucket <= self._last_bucket:
+            return
+        steps = len(self._values) if self._last_bucket is None else bucket - self._last_bucket
+        self._values.extend([math.nan] * min(steps, len(self._values)))
+        self._last_bucket = bucket
+
+    def add(self, timestamp: float, value: float) -> None:
+        """Fold one value in; values older than the newest bucket are ignored."""
+        if math.isnan(value):
+            return
+        self.advance(timestamp)
+        if int(timestamp // self.bucket_seconds) != self._last_bucket:
+            return
+        last = self._values[-1]
+        if math.isnan(last) or value > last:
+            self._values[-1] = value
+
+    def values(self) -> list[float]:
+        """Bucket values, oldest first. Empty buckets are NaN."""
+        return list(self._values)
+
+
+class UsageSeries:
+    """5-hour utilization at every zoom level, and 7-day utilization over a week."""
+
+    def __init__(self) -> None:
+        self._clear()
+
+    def _clear(self) -> None:
+        self.five_hour = {zoom: BucketedSeries(span) for zoom, span in ZOOM_SPANS.items()}
+        self.seven_day = BucketedSeries(ZOOM_SPANS[Zoom.WEEK])
+        self._next_index: int | None = None
+
+    def sync(self, history: UsageHistory, now: float | None = None) -> bool:
+        """Fold in samples appended since the last sync and scroll to `now`.
+
+        The first sync only reads the samples inside the longest span.
+
+        Returns:
+            True if any new sample was processed
+        """
+        now = time.time() if now is None else now
+        if self._next_index is not None and len(history) < self._next_index:
+            # History was truncated or replaced: rebuild from scratch
+            self._clear()
+        if self._next_index is None:
+            self._next_index = history.index_at(now - max(ZOOM_SPANS.values()))
+        samples = history.read(self._next_index)
+        for sample in samples:
+            for series in self.five_hour.values():
+                series.add(sample.timestamp, sample.five_hour)
+            self.seven_day.add(sample.timestamp, sample.seven_day)
+        self._next_index += len(samples)
+        for series in (*self.five_hour.values(), self.seven_day):
+            series.advance(now)
+        return bool(samples)
+
+
+_series: dict[str, UsageSeries] = {}
+
+
+def get_usage_series(account: str = "default") -> UsageSeries:
+    """Get the usage series for an account, synced with its history."""
+    series = _series.get(account)
+    if series is None:
+        series = _series[account] = UsageSeries()
+    series.sync(get_usage_history(account))
+    return series
+
+
+def clear_series_cache() -> None:
+    """Drop cached series instances."""
+    _series.clear()
@@ -0,0 +1,154 @@
+"""Headless background service.
+
+Polls usage (backing off while Claude Code is idle), fires reminders at
+their exact times, runs scheduled commands, drains the job queue and
+delivers webhook notifications, and pushes each usage update to attached
+TUI clients over a local socket. The TUI hosts the same services while it
+is open; `claudeminder daemon` runs them without it.
+"""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+
+from loguru import logger
+
+from .api.usage import UsageAPI
+from .core.activity_watcher import ActivityWatcher
+from .core.config_manager import AppConfig, load_config
+from .core.event_bus import CONFIG_CHANGED, USAGE_SAMPLE, ConfigChanged, UsageUpdate, get_event_bus
+from .core.goals_tracker import get_goals_tracker
+from .core.instance_lock import acquire_instance_lock, release_instance_lock
+from .core.update_socket import UpdateServer
+from .core.usage_poller import UsagePoller
+from .models.settings import get_settings
+from .models.usage import UsageResponse
+from .scheduler import (
+    ReminderTimer,
+    get_focus_mode_service,
+    get_notification_dispatcher,
+    get_reminder_service,
+)
+from .scheduler.command_scheduler import CommandScheduler
+from .scheduler.job_queue import get_job_queue
+from .scheduler.webhook import get_webhook_sender
+
+
+def parse_reset_time(usage: UsageResponse) -> datetime | None:
+    """The five-hour window's reset time, if known."""
+    if usage.five_hour and usage.five_hour.resets_at:
+        return datetime.fromisoformat(usage.five_hour.resets_at.replace("Z", "+00:00"))
+    return None
+
+
+def derive_update(usage: UsageResponse, config: AppConfig) -> UsageUpdate:
+    """Compute the state derived from a usage response, once for all consumers."""
+    reset_time = parse_reset_time(usage)
+    utilization = usage.five_hour.utilization if usage.five_hour else 0
+    pace = budget = None
+    if usage.five_hour:
+        tracker = get_goals_tracker()
+        if reset_time is not None:
+            tracker.set_reset_time(reset_time)
+        pace = tracker.calculate_pace(utilization)
+        budget = tracker.get_budget_status(utilization)
+    suppression = get_focus_mode_service().get_suppression_reason(utilization, config.focus_mode)
+    return UsageUpdate(usage, utilization, reset_time, pace, budget, suppression)
+
+
+class Daemon:
+    """Reminder, notification, scheduled-command and job queue services."""
+
+    def __init__(self) -> None:
+        self.reminder_timer = ReminderTimer()
+        self.command_scheduler = CommandScheduler()
+        self.job_queue = get_job_queue()
+        self.update_server = UpdateServer()
+        self._usage_api: UsageAPI | None = None
+        self._last_error: str | None = None
+        self._reset_time: datetime | None = None
+
+    def start(self) -> None:
+        """Start notification delivery. Must be called from the running loop."""
+        get_notification_dispatcher().start()
+        get_event_bus().on(CONFIG_CHANGED, self._on_config_changed)
+
+    async def stop(self) -> None:
+        """Stop notification delivery."""
+        get_event_bus().off(CONFIG_CHANGED, self._on_config_changed)
+        await get_notification_dispatcher().stop()
+
+    def _on_config_changed(self, event: ConfigChanged) -> None:
+        self.command_scheduler.update(event.config.scheduler.commands, self._reset_time)
+
+    async def run_services(self) -> None:
+        """Run the timers, job queue, webhook sender and update socket until cancelled."""
+        self.command_scheduler.update(load_config().scheduler.commands)
+        await asyncio.gather(
+            self.reminder_timer.run(),
+            self.command_scheduler.run(),
+            self.job_queue.run(),
+            get_webhook_sender().run(),
+            self.update_server.run(),
+        )
+
+    def apply(self, usage: UsageResponse) -> None:
+        """React to fresh usage data: reschedule timers, check reminders and
+        publish the derived state on the event bus.
+        """
+        config = load_config()
+        update = derive_update(usage, config)
+        reset_time = self._reset_time = update.reset_time
+        utilization = update.utilization
+        self.reminder_timer.schedule(reset_time)
+        self.command_scheduler.update(config.scheduler.commands, reset_time)
+        self.job_queue.observe(utilization, reset_time)
+        # Before-reset and on-reset reminders are fired by the timer
+        get_reminder_service().check_and_trigger(
+            current_usage=utilization, reset_time=None, usage=usage, app_config=config,
+        )
+        get_event_bus().publish(USAGE_SAMPLE, update)
+
+    async def poll_once(self) -> None:
+        """Fetch usage and apply it, logging (once) any failure."""
+        try:
+            if self._usage_api is None:
+                self._usage_api = UsageAPI()
+            self.apply(await self._usage_api.get_usage())
+            self._last_error = None
+        except Exception as e:
+            if str(e) != self._last_error:
+                logger.error(f"Failed to fetch usage: {e}")
+                self._last_error = str(e)
+
+    async def run(self) -> None:
+        """Poll and run all services until cancelled."""
+        self.start()
+        services = asyncio.create_task(self.run_services())
+        try:
+            await self.poll_once()
+            poller = UsagePoller(self.poll_once, ActivityWatcher(get_settings().claude_projects_path))
+            await poller.run()
+        finally:
+            services.cancel()
+            await asyncio.gather(services, return_exceptions=True)
+            await self.stop()
+
+
+def run_daemon() -> bool:
+    """Run the daemon in the foreground.
+
+    Returns:
+        False if another Claudiminder instance holds the lock
+    """
+    if acquire_instance_lock() is None:
+        return False
+    logger.info("Claudiminder daemon started")
+    try:
+        asyncio.run(Daemon().run())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        release_instance_lock()
+        logger.info("Claudiminder daemon stopped")
+    return True
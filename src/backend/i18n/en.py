@@ -48,4 +48,38 @@ STRINGS: dict[str, str] = {
     "seven_day_usage": "7-Day Usage",
     "extra_usage": "Extra Usage",
     "utilization": "Utilization",
+
+    # Heatmap
+    "heatmap_title": "Usage by Hour of Week",
+    "heatmap_days": "Mon Tue Wed Thu Fri Sat Sun",
+    "heatmap_peak": "Peak: {rate}%/hour",
+
+    # History
+    "history_title": "Usage History",
+    "history_five_hour": "5h",
+    "history_seven_day": "7d",
+    "history_zoom_window": "Last window (5 hours)",
+    "history_zoom_day": "Last day",
+    "history_zoom_week": "Last week",
+
+    # Accounts
+    "accounts_title": "Accounts",
+    "accounts_filter": "Filter by account or status",
+    "accounts_account": "Account",
+    "accounts_utilization": "Usage",
+    "accounts_slope": "Rate",
+    "accounts_reset_in": "Reset in",
+    "accounts_status": "Status",
+    "account_ok": "OK",
+    "account_warning": "Warning",
+    "account_critical": "Critical",
+    "account_reset": "Reset",
+    "account_stale": "Stale",
+
+    # Debug panel
+    "debug_title": "Performance",
+    "debug_loop_lag": "Event loop lag",
+    "debug_fetch": "Last fetch",
+    "debug_cache_hit_rate": "Cache hit rate",
+    "debug_timers": "Timers",
 }
@@ -48,4 +48,38 @@ STRINGS: dict[str, str] = {
     "seven_day_usage": "Sử dụng 7 ngày",
     "extra_usage": "Sử dụng thêm",
     "utilization": "Mức sử dụng",
+
+    # Heatmap
+    "heatmap_title": "Sử dụng theo giờ trong tuần",
+    "heatmap_days": "T2 T3 T4 T5 T6 T7 CN",
+    "heatmap_peak": "Cao nhất: {rate}%/giờ",
+
+    # History
+    "history_title": "Lịch sử sử dụng",
+    "history_five_hour": "5h",
+    "history_seven_day": "7n",
+    "history_zoom_window": "Cửa sổ gần nhất (5 giờ)",
+    "history_zoom_day": "Ngày qua",
+    "history_zoom_week": "Tuần qua",
+
+    # Accounts
+    "accounts_title": "Tài khoản",
+    "accounts_filter": "Lọc theo tài khoản hoặc trạng thái",
+    "accounts_account": "Tài khoản",
+    "accounts_utilization": "Sử dụng",
+    "accounts_slope": "Tốc độ",
+    "accounts_reset_in": "Đặt lại sau",
+    "accounts_status": "Trạng thái",
+    "account_ok": "Ổn",
+    "account_warning": "Cảnh báo",
+    "account_critical": "Nguy cấp",
+    "account_reset": "Đã đặt lại",
+    "account_stale": "Cũ",
+
+    # Debug panel
+    "debug_title": "Hiệu năng",
+    "debug_loop_lag": "Độ trễ vòng lặp",
+    "debug_fetch": "Lần tải gần nhất",
+    "debug_cache_hit_rate": "Tỉ lệ trúng bộ nhớ đệm",
+    "debug_timers": "Bộ hẹn giờ",
 }
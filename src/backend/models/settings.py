@@ -40,6 +40,10 @@ class AppSettings(BaseSettings):
         default=Path.home() / ".claude" / ".credentials.json",
         description="Path to Claude credentials file",
     )
+    claude_projects_path: Path = Field(
+        default=Path.home() / ".claude" / "projects",
+        description="Path to Claude Code per-project transcripts",
+    )
 
     # API
     api_base_url: str = Field(
@@ -1,14 +1,24 @@
 """Scheduler module for reminders, focus mode, and notifications."""
+from .channels import ChannelCapabilities, NotificationPlugin, get_channel_registry
 from .focus_mode import FocusModeService, get_focus_mode_service
-from .notifier import NotificationChannel, send_notification
+from .notification_dispatcher import NotificationDispatcher, get_notification_dispatcher
+from .notifier import NotificationChannel, NotificationCoalescer, send_notification
 from .reminder_service import ReminderService, ReminderType, get_reminder_service
+from .reminder_timer import ReminderTimer
 
 __all__ = [
+    "ChannelCapabilities",
+    "NotificationPlugin",
+    "get_channel_registry",
     "FocusModeService",
     "get_focus_mode_service",
     "send_notification",
     "NotificationChannel",
+    "NotificationCoalescer",
+    "NotificationDispatcher",
+    "get_notification_dispatcher",
     "ReminderService",
     "get_reminder_service",
     "ReminderType",
+    "ReminderTimer",
 ]
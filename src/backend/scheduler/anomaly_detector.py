@@ -0,0 +1,103 @@
+"""Streaming anomaly detection on per-minute utilization deltas."""
+import math
+from dataclasses import dataclass
+
+from ..core.config_manager import ReminderConfig
+
+# Floor for the standard deviation (%/min) so a perfectly flat baseline
+# doesn't turn any small uptick into an infinite z-score.
+MIN_STD_RATE = 0.1
+
+# Samples closer together than this are treated as duplicates (cached reads).
+MIN_SAMPLE_INTERVAL_SECONDS = 1.0
+
+
+@dataclass(slots=True)
+class _EwmaState:
+    """Constant-size detector state for one account."""
+    last_ts: float | None = None
+    last_utilization: float = 0.0
+    mean: float = 0.0
+    var: float = 0.0
+    samples: int = 0
+    in_anomaly: bool = False
+
+
+class AnomalyDetector:
+    """Detect runaway consumption with an EWMA z-score on usage rate.
+
+    Each sample costs O(1) time and each account O(1) memory.
+    """
+
+    def __init__(self) -> None:
+        self._states: dict[str, _EwmaState] = {}
+
+    def update(
+        self,
+        utilization: float,
+        timestamp: float,
+        config: ReminderConfig,
+        account: str = "default",
+    ) -> float | None:
+        """Feed a new sample.
+
+        Args:
+            utilization: Current usage percentage (0-100)
+            timestamp: Sample time as a Unix timestamp
+            config: Reminder config holding the detector tuning
+            account: Account the sample belongs to
+
+        Returns:
+            Detected rate in %/min when an anomaly starts, else None
+        """
+        state = self._states.get(account)
+        if state is None:
+            state = self._states[account] = _EwmaState()
+
+        if state.last_ts is None:
+            state.last_ts = timestamp
+            state.last_utilization = utilization
+            return None
+
+        elapsed = timestamp - state.last_ts
+        if elapsed < MIN_SAMPLE_INTERVAL_SECONDS:
+            return None
+
+        delta = utilization - state.last_utilization
+        state.last_ts = timestamp
+        state.last_utilization = utilization
+
+        # Utilization dropped: the window reset, the delta is meaningless
+        if delta < 0:
+            state.in_anomaly = False
+            return None
+
+        rate = delta / (elapsed / 60)
+        std = max(math.sqrt(state.var), MIN_STD_RATE)
+        z_score = (rate - state.mean) / std
+
+        is_anomaly = (
+            state.samples >= config.anomaly_warmup_samples
+            and rate >= config.anomaly_min_rate
+            and z_score >= config.anomaly_z_threshold
+        )
+
+        # Incremental EWMA mean/variance update
+        alpha = config.anomaly_ewma_alpha
+        diff = rate - state.mean
+        incr = alpha * diff
+        state.mean += incr
+        state.var = (1 - alpha) * (state.var + diff * incr)
+        state.samples += 1
+
+        # Edge-triggered: report only when entering the anomalous state
+        fired = is_anomaly and not state.in_anomaly
+        state.in_anomaly = is_anomaly
+        return rate if fired else None
+
+    def reset(self, account: str | None = None) -> None:
+        """Forget detector state for one account, or all accounts."""
+        if account is None:
+            self._states.clear()
+        else:
+            self._states.pop(account, None)
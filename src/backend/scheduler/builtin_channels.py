@@ -0,0 +1,82 @@
+"""Built-in notification channels, imported on first use."""
+import webbrowser
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from desktop_notifier import DesktopNotifier
+
+from ..core.config_manager import load_config
+from .channels import ChannelCapabilities, NotificationPlugin
+from .command_runner import get_command_runner
+from .webhook import get_webhook_sender
+
+_notifier: "DesktopNotifier | None" = None
+
+
+def _get_notifier() -> "DesktopNotifier":
+    """Get or create desktop notifier instance."""
+    global _notifier
+    if _notifier is None:
+        from desktop_notifier import DesktopNotifier
+        _notifier = DesktopNotifier(app_name="Claudiminder")
+    return _notifier
+
+
+class SystemChannel(NotificationPlugin):
+    """Desktop notification."""
+
+    async def send(self, title: str, body: str) -> bool:
+        await _get_notifier().send(title=title, message=body)
+        logger.debug(f"System notification sent: {title}")
+        return True
+
+
+class BellChannel(NotificationPlugin):
+    """Terminal bell."""
+
+    capabilities = ChannelCapabilities(is_async=False)
+
+    def send(self, _title: str, _body: str) -> bool:
+        print("\a", end="", flush=True)
+        logger.debug("Terminal bell sent")
+        return True
+
+
+class CommandChannel(NotificationPlugin):
+    """The configured custom command."""
+
+    async def send(self, _title: str, _body: str) -> bool:
+        command = load_config().reminder.custom_command
+        if not command:
+            return False
+        run = await get_command_runner().run(command)
+        logger.debug(f"Custom command executed: {run}")
+        return run.error is None
+
+
+class UrlChannel(NotificationPlugin):
+    """Open the configured URL in a browser."""
+
+    capabilities = ChannelCapabilities(is_async=False)
+
+    def send(self, _title: str, _body: str) -> bool:
+        url = load_config().reminder.custom_url
+        if not url:
+            return False
+        webbrowser.open(url)
+        logger.debug(f"URL opened: {url}")
+        return True
+
+
+class WebhookChannel(NotificationPlugin):
+    """POST to the configured webhooks."""
+
+    capabilities = ChannelCapabilities(batching=True, rich_content=True)
+
+    async def send(self, title: str, body: str) -> bool:
+        if not await get_webhook_sender().send(title, body):
+            return False
+        logger.debug("Webhook notification queued")
+        return True
@@ -0,0 +1,145 @@
+"""Notification channel plugins.
+
+Channels are looked up by name. The built-in channels and any installed
+under the ``claudeminder.channels`` entry-point group are registered by
+name only; a channel's module is imported the first time it sends, so
+startup cost does not grow with the number of channels installed.
+
+An entry point names a `NotificationPlugin` subclass (or any callable
+taking no arguments that returns one), e.g. in a plugin's pyproject::
+
+    [project.entry-points."claudeminder.channels"]
+    pagerduty = "claudeminder_pagerduty:PagerDutyChannel"
+
+Plugins read their settings with `get_channel_options(name)`, which
+returns the ``[reminder.channel_options.<name>]`` table of the config.
+"""
+import asyncio
+import inspect
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable
+from importlib.metadata import EntryPoint, entry_points
+from typing import Any, ClassVar, NamedTuple
+
+from loguru import logger
+
+from ..core.config_manager import load_config
+from ..core.perf_metrics import get_perf_metrics
+
+ENTRY_POINT_GROUP = "claudeminder.channels"
+
+_BUILTIN_MODULE = f"{__package__}.builtin_channels"
+
+BUILTIN_CHANNELS = {
+    "system": f"{_BUILTIN_MODULE}:SystemChannel",
+    "bell": f"{_BUILTIN_MODULE}:BellChannel",
+    "command": f"{_BUILTIN_MODULE}:CommandChannel",
+    "url": f"{_BUILTIN_MODULE}:UrlChannel",
+    "webhook": f"{_BUILTIN_MODULE}:WebhookChannel",
+}
+
+
+class ChannelCapabilities(NamedTuple):
+    """What a channel supports."""
+    batching: bool = False  # Queues and batches deliveries itself, so gets each one separately
+    is_async: bool = True  # send() is a coroutine; otherwise it runs in a thread
+    rich_content: bool = False  # Renders Markdown in the body
+
+
+class NotificationPlugin(ABC):
+    """A notification channel."""
+
+    capabilities: ClassVar[ChannelCapabilities] = ChannelCapabilities()
+
+    @abstractmethod
+    def send(self, title: str, body: str) -> Awaitable[bool] | bool:
+        """Deliver one notification.
+
+        Returns:
+            True if delivered (or durably queued by a batching channel),
+            False if the channel is not configured
+        """
+
+
+def get_channel_options(name: str) -> dict[str, Any]:
+    """Settings of a plugin channel from the config."""
+    return load_config().reminder.channel_options.get(name, {})
+
+
+class ChannelRegistry:
+    """Channel names mapped to lazily loaded plugins."""
+
+    def __init__(self) -> None:
+        self._entry_points: dict[str, EntryPoint] | None = None
+        self._plugins: dict[str, NotificationPlugin] = {}
+
+    def _discover(self) -> dict[str, EntryPoint]:
+        if self._entry_points is None:
+            found = {
+                name: EntryPoint(name, value, ENTRY_POINT_GROUP)
+                for name, value in BUILTIN_CHANNELS.items()
+            }
+            for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+                if entry_point.name in BUILTIN_CHANNELS:
+                    logger.warning(
+                        f"Ignoring plugin {entry_point.value}: {entry_point.name} is built in"
+                    )
+                    continue
+                found[entry_point.name] = entry_point
+            self._entry_points = found
+        return self._entry_points
+
+    def names(self) -> list[str]:
+        """Every registered channel, without importing any."""
+        return list(self._discover())
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._plugins
+
+    def get(self, name: str) -> NotificationPlugin:
+        """The channel's plugin, importing it on first use.
+
+        Raises:
+            KeyError: If no channel has this name
+        """
+        plugin = self._plugins.get(name)
+        if plugin is None:
+            entry_point = self._discover()[name]
+            plugin = entry_point.load()()
+            if not isinstance(plugin, NotificationPlugin):
+                raise TypeError(f"{entry_point.value} is not a NotificationPlugin")
+            self._plugins[name] = plugin
+            logger.debug(f"Loaded {name} notification channel")
+        return plugin
+
+    def capabilities(self, name: str) -> ChannelCapabilities:
+        """The channel's capabilities, importing it on first use."""
+        try:
+            return self.get(name).capabilities
+        except Exception as e:
+            # Sending to it fails too, and is reported then
+            logger.debug(f"Cannot load {name} notification channel: {e}")
+            return ChannelCapabilities()
+
+    async def send(self, name: str, title: str, body: str) -> bool:
+        """Send through a channel, running synchronous plugins in a thread."""
+        plugin = self.get(name)
+        with get_perf_metrics().timed(f"notify.{name}"):
+            if not plugin.capabilities.is_async:
+                return bool(await asyncio.to_thread(plugin.send, title, body))
+            result = plugin.send(title, body)
+            # Tolerate a plugin that returns its result directly
+            if inspect.isawaitable(result):
+                result = await result
+            return bool(result)
+
+
+_registry: ChannelRegistry | None = None
+
+
+def get_channel_registry() -> ChannelRegistry:
+    """Get singleton channel registry instance."""
+    global _registry
+    if _registry is None:
+        _registry = ChannelRegistry()
+    return _registry
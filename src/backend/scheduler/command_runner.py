@@ -0,0 +1,154 @@
+"""Bounded execution of user commands (the COMMAND notification channel).
+
+Commands run as asyncio subprocesses behind a concurrency limit, are
+killed with their process group on timeout or cancellation, and are
+always reaped. The latest runs are kept in the state store so other
+processes (the sidecar) can show them.
+"""
+import asyncio
+import os
+import shlex
+import signal
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+from loguru import logger
+
+from ..core.config_manager import load_config
+from ..core.state_store import get_state_store
+
+# Number of recent runs kept
+RECENT_RUNS = 20
+
+
+class CommandRun(NamedTuple):
+    """Outcome of one command execution."""
+    command: str
+    started_at: float
+    duration: float
+    exit_code: int | None
+    timed_out: bool = False
+    error: str | None = None
+
+
+class CommandLimits(NamedTuple):
+    """How a runner executes its commands."""
+    shell: bool
+    timeout: float | None  # None waits for the command however long it takes
+    max_concurrency: int
+
+
+def reminder_command_limits() -> CommandLimits:
+    """Limits for reminder hooks (the COMMAND channel)."""
+    config = load_config().reminder
+    return CommandLimits(
+        config.command_shell, config.command_timeout_seconds, config.command_max_concurrency
+    )
+
+
+def _kill(proc: asyncio.subprocess.Process) -> None:
+    """Kill the process and, on POSIX, everything it spawned."""
+    if proc.returncode is not None:
+        return
+    try:
+        if sys.platform != "win32":
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+    except ProcessLookupError:
+        pass
+
+
+class CommandRunner:
+    """Run commands with a concurrency limit and a timeout.
+
+    Each runner has its own concurrency slots; `limits` is read for every
+    run so config changes apply to the next command.
+    """
+
+    def __init__(self, limits: Callable[[], CommandLimits] = reminder_command_limits) -> None:
+        self._limits = limits
+        self._semaphore: asyncio.Semaphore | None = None
+        self._semaphore_key: tuple[asyncio.AbstractEventLoop, int] | None = None
+
+    def _get_semaphore(self, limit: int) -> asyncio.Semaphore:
+        # Semaphores bind to a loop; sync callers use a fresh loop per send
+        key = (asyncio.get_running_loop(), limit)
+        if self._semaphore is None or self._semaphore_key != key:
+            self._semaphore = asyncio.Semaphore(limit)
+            self._semaphore_key = key
+        return self._semaphore
+
+    async def run(self, command: str) -> CommandRun:
+        """Run a command to completion, timeout or cancellation.
+
+        Uses the shell unless the limits disable it, in which case the
+        command is split into an argv list.
+        """
+        limits = self._limits()
+        async with self._get_semaphore(max(1, limits.max_concurrency)):
+            started_at = time.time()
+            start = time.monotonic()
+            try:
+                run = await self._execute(command, limits.shell, limits.timeout, started_at)
+            except asyncio.CancelledError:
+                self._record(CommandRun(command, started_at, time.monotonic() - start, None, error="cancelled"))
+                raise
+            run = run._replace(duration=time.monotonic() - start)
+        self._record(run)
+        return run
+
+    async def _execute(
+        self, command: str, shell: bool, timeout: float | None, started_at: float
+    ) -> CommandRun:
+        kwargs: dict[str, Any] = {
+            "stdin": subprocess.DEVNULL,
+            "stdout": subprocess.DEVNULL,
+            "stderr": subprocess.DEVNULL,
+        }
+        if sys.platform != "win32":
+            kwargs["start_new_session"] = True
+        try:
+            if shell:
+                proc = await asyncio.create_subprocess_shell(command, **kwargs)
+            else:
+                proc = await asyncio.create_subprocess_exec(*shlex.split(command), **kwargs)
+        except (OSError, ValueError) as e:
+            return CommandRun(command, started_at, 0.0, None, error=str(e))
+
+        try:
+            exit_code = await asyncio.wait_for(proc.wait(), timeout)
+            return CommandRun(command, started_at, 0.0, exit_code)
+        except TimeoutError:
+            logger.warning(f"Command timed out after {timeout}s: {command}")
+            return CommandRun(command, started_at, 0.0, None, timed_out=True)
+        finally:
+            _kill(proc)
+            # Reap so no zombie is left behind
+            await proc.wait()
+
+    def _record(self, run: CommandRun) -> None:
+        logger.debug(f"Command finished: {run}")
+        entry = run._asdict()
+        get_state_store().update(
+            "commands", "recent", lambda runs: (runs + [entry])[-RECENT_RUNS:], [],
+        )
+
+
+def recent_command_runs() -> list[CommandRun]:
+    """Latest command runs from any process, oldest first."""
+    return [CommandRun(**run) for run in get_state_store().get("commands", "recent", [])]
+
+
+_runner: CommandRunner | None = None
+
+
+def get_command_runner() -> CommandRunner:
+    """Get singleton command runner instance."""
+    global _runner
+    if _runner is None:
+        _runner = CommandRunner()
+    return _runner
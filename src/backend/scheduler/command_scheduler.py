@@ -0,0 +1,170 @@
+"""Run the GUI's scheduled commands at their next fire times.
+
+Fire times for every enabled command go into a min-heap and the
+scheduler sleeps until the earliest one. "cycle" commands are scheduled
+at the current window's resets_at, so they run right when usage resets.
+"""
+import asyncio
+import heapq
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
+from loguru import logger
+
+from ..core.config_manager import ScheduledCommand, load_config
+from ..core.usage_history import WINDOW_TOLERANCE_SECONDS
+from .command_runner import CommandLimits, CommandRunner
+from .cron import CronExpression
+
+
+def next_fire_time(command: ScheduledCommand, after: float) -> float | None:
+    """Next fire time strictly after `after`, None for "cycle" commands.
+
+    Raises:
+        ValueError: If the command's value is invalid for its trigger
+    """
+    if command.trigger == "cron":
+        local = datetime.fromtimestamp(after)
+        return CronExpression.parse(command.value).next_after(local).timestamp()
+    if command.trigger == "fixed":
+        hour, minute = (int(part) for part in command.value.split(":"))
+        local = datetime.fromtimestamp(after)
+        fire = local.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if fire.timestamp() <= after:
+            fire += timedelta(days=1)
+        return fire.timestamp()
+    if command.trigger == "repeated":
+        minutes = float(command.value)
+        if minutes <= 0:
+            raise ValueError(f"Interval must be positive: {command.value!r}")
+        return after + minutes * 60
+    return None
+
+
+def scheduler_command_limits() -> CommandLimits:
+    """Limits for scheduled commands, separate from reminder hooks."""
+    config = load_config().scheduler
+    return CommandLimits(
+        config.command_shell, config.command_timeout_seconds, config.command_max_concurrency
+    )
+
+
+class CommandScheduler:
+    """Schedule and run configured commands."""
+
+    def __init__(
+        self,
+        runner: CommandRunner | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        # Not the reminder hooks' runner: their timeout would kill long jobs
+        self._runner = runner or CommandRunner(scheduler_command_limits)
+        self._clock = clock
+        self._commands: dict[str, ScheduledCommand] = {}
+        # (fire_at, sequence, command id, generation); stale generations are skipped
+        self._heap: list[tuple[float, int, str, int]] = []
+        self._sequence = 0
+        self._generation = 0
+        self._reset_at: float | None = None
+        self._changed = asyncio.Event()
+        self._running: set[asyncio.Task[None]] = set()
+
+    def _push(self, fire_at: float, command_id: str) -> None:
+        self._sequence += 1
+        heapq.heappush(self._heap, (fire_at, self._sequence, command_id, self._generation))
+
+    def next_fire_at(self) -> float | None:
+        """Timestamp of the next pending command."""
+        while self._heap and self._heap[0][3] != self._generation:
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    def update(self, commands: list[ScheduledCommand], reset_time: datetime | None = None) -> None:
+        """Apply the current config and usage window; cheap when unchanged."""
+        wanted = {c.id: c for c in commands if c.enabled}
+        reset_at = reset_time.timestamp() if reset_time else self._reset_at
+        window_moved = reset_at is not None and (
+            self._reset_at is None or abs(reset_at - self._reset_at) > WINDOW_TOLERANCE_SECONDS
+        )
+        if wanted == self._commands and not window_moved:
+            return
+
+        # A moved window only reschedules cycle commands; recurring fire times stay
+        if wanted == self._commands:
+            self._reset_at = reset_at
+            self._schedule_cycle()
+            self._changed.set()
+            return
+
+        self._commands = wanted
+        self._reset_at = reset_at
+        self._generation += 1
+        self._heap = []
+        now = self._clock()
+        for command in wanted.values():
+            self._schedule_next(command, now)
+        self._schedule_cycle()
+        self._changed.set()
+        logger.debug(f"Scheduled {len(wanted)} commands")
+
+    def _schedule_next(self, command: ScheduledCommand, after: float) -> None:
+        try:
+            fire_at = next_fire_time(command, after)
+        except ValueError as e:
+            logger.warning(f"Skipping scheduled command {command.name!r}: {e}")
+            return
+        if fire_at is not None:
+            self._push(fire_at, command.id)
+
+    def _schedule_cycle(self) -> None:
+        if self._reset_at is None or self._reset_at <= self._clock():
+            return
+        for command in self._commands.values():
+            if command.trigger == "cycle":
+                self._push(self._reset_at, command.id)
+
+    def fire_due(self) -> list[ScheduledCommand]:
+        """Start every command whose time has come."""
+        fired: list[ScheduledCommand] = []
+        now = self._clock()
+        while self._heap and self._heap[0][0] <= now:
+            fire_at, _, command_id, generation = heapq.heappop(self._heap)
+            command = self._commands.get(command_id)
+            if generation != self._generation or command is None:
+                continue
+            if command.trigger == "cycle":
+                # Superseded by the entry for the window that replaced it
+                if fire_at != self._reset_at:
+                    continue
+            else:
+                self._schedule_next(command, now)
+            fired.append(command)
+            self._start(command)
+        return fired
+
+    def _start(self, command: ScheduledCommand) -> None:
+        logger.info(f"Running scheduled command {command.name!r}")
+        task = asyncio.get_running_loop().create_task(self._execute(command))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _execute(self, command: ScheduledCommand) -> None:
+        run = await self._runner.run(command.command)
+        if run.exit_code != 0:
+            logger.warning(f"Scheduled command {command.name!r} finished: {run}")
+
+    async def run(self) -> None:
+        """Sleep until the next fire time, forever."""
+        try:
+            while True:
+                self._changed.clear()
+                next_at = self.next_fire_at()
+                timeout = None if next_at is None else max(0.0, next_at - self._clock())
+                try:
+                    await asyncio.wait_for(self._changed.wait(), timeout)
+                except TimeoutError:
+                    self.fire_due()
+        finally:
+            for task in self._running:
+                task.cancel()
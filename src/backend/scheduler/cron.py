@@ -0,0 +1,101 @@
+"""Five-field cron expressions (minute hour day-of-month month day-of-week).
+
+Supports `*`, numbers, ranges `a-b`, steps `*/n` and `a-b/n`, and comma
+lists. Day of week is 0-7 with both 0 and 7 meaning Sunday. As in
+classic cron, when both day fields are restricted a day matches if
+either does.
+"""
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+# (low, high) per field
+_BOUNDS = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+
+# Give up if no match is found within this many years (e.g. "0 0 31 2 *")
+_MAX_YEARS = 5
+
+
+def _parse_field(text: str, low: int, high: int) -> frozenset[int]:
+    values: set[int] = set()
+    for part in text.split(","):
+        expr, _, step_text = part.partition("/")
+        step = int(step_text) if step_text else 1
+        if step < 1:
+            raise ValueError(f"Invalid step in {part!r}")
+        if expr == "*":
+            start, end = low, high
+        elif "-" in expr:
+            start_text, end_text = expr.split("-", 1)
+            start, end = int(start_text), int(end_text)
+        else:
+            start = int(expr)
+            end = high if step_text else start
+        if not low <= start <= end <= high:
+            raise ValueError(f"Value out of range {low}-{high} in {part!r}")
+        values.update(range(start, end + 1, step))
+    return frozenset(values)
+
+
+@dataclass(frozen=True, slots=True)
+class CronExpression:
+    """A parsed cron expression."""
+    minutes: frozenset[int]
+    hours: frozenset[int]
+    days: frozenset[int]
+    months: frozenset[int]
+    weekdays: frozenset[int]  # 0 = Sunday
+    any_day: bool
+    any_weekday: bool
+
+    @classmethod
+    def parse(cls, expression: str) -> "CronExpression":
+        """Parse an expression.
+
+        Raises:
+            ValueError: If the expression is malformed
+        """
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"Expected 5 fields, got {len(fields)}: {expression!r}")
+        parsed = [
+            _parse_field(text, low, high)
+            for text, (low, high) in zip(fields, _BOUNDS, strict=True)
+        ]
+        weekdays = frozenset(d % 7 for d in parsed[4])
+        return cls(
+            parsed[0], parsed[1], parsed[2], parsed[3], weekdays,
+            any_day=fields[2] == "*",
+            any_weekday=fields[4] == "*",
+        )
+
+    def _day_matches(self, dt: datetime) -> bool:
+        day_ok = dt.day in self.days
+        weekday_ok = (dt.isoweekday() % 7) in self.weekdays
+        if self.any_day or self.any_weekday:
+            return day_ok and weekday_ok
+        return day_ok or weekday_ok
+
+    def next_after(self, after: datetime) -> datetime:
+        """First matching minute strictly after `after` (same tzinfo).
+
+        Raises:
+            ValueError: If nothing matches within a few years
+        """
+        dt = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = after.year + _MAX_YEARS
+        # Skip whole months, days and hours that cannot match
+        while dt.year <= limit:
+            if dt.month not in self.months:
+                dt = (dt.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+                continue
+            if not self._day_matches(dt):
+                dt = dt.replace(hour=0, minute=0) + timedelta(days=1)
+                continue
+            if dt.hour not in self.hours:
+                dt = dt.replace(minute=0) + timedelta(hours=1)
+                continue
+            if dt.minute not in self.minutes:
+                dt += timedelta(minutes=1)
+                continue
+            return dt
+        raise ValueError("Cron expression never matches")
@@ -1,7 +1,12 @@
 """Focus mode with DND threshold and quiet hours."""
-from datetime import datetime, time, timedelta
+from datetime import datetime, timedelta
 
-from ..core.config_manager import load_config
+from ..core.config_manager import FocusModeConfig, load_config
+from ..core.state_store import get_state_store
+from .focus_policy import get_focus_policy
+
+# Bound on snooze/quiet-hours hand-offs followed by suppressed_until
+_MAX_TRANSITIONS = 16
 
 
 class FocusModeService:
@@ -9,53 +14,65 @@ class FocusModeService:
 
     def __init__(self) -> None:
         self._snoozed_until: datetime | None = None
+        self._load_snooze()
+
+    def _load_snooze(self) -> None:
+        """Pick up the snooze deadline, which other processes may have set."""
+        until = get_state_store().get("focus", "snoozed_until")
+        self._snoozed_until = datetime.fromtimestamp(until) if until is not None else None
+
+    def _save_snooze(self) -> None:
+        until = self._snoozed_until.timestamp() if self._snoozed_until else None
+        get_state_store().set("focus", "snoozed_until", until)
 
     def snooze(self, minutes: int) -> None:
         """Snooze notifications for specified minutes."""
         self._snoozed_until = datetime.now() + timedelta(minutes=minutes)
+        self._save_snooze()
 
     def clear_snooze(self) -> None:
         """Clear any active snooze."""
         self._snoozed_until = None
+        self._save_snooze()
 
     def is_snoozed(self) -> bool:
         """Check if currently snoozed."""
+        self._load_snooze()
         if self._snoozed_until is None:
             return False
         return datetime.now() < self._snoozed_until
 
     def get_snooze_remaining(self) -> int:
         """Get remaining snooze time in seconds, 0 if not snoozed."""
+        self._load_snooze()
         if self._snoozed_until is None:
             return 0
         remaining = (self._snoozed_until - datetime.now()).total_seconds()
         return max(0, int(remaining))
 
-    def is_in_quiet_hours(self) -> bool:
-        """Check if current time is in quiet hours."""
-        config = load_config().focus_mode
-        if not config.enabled:
-            return False
-        if not config.quiet_hours_start or not config.quiet_hours_end:
-            return False
+    def is_in_quiet_hours(self, config: FocusModeConfig | None = None) -> bool:
+        """Check if current time is in quiet hours.
 
-        now = datetime.now().time()
-        start = time.fromisoformat(config.quiet_hours_start)
-        end = time.fromisoformat(config.quiet_hours_end)
+        Quiet hours end at the start of their end minute: 22:00-08:00 is
+        quiet up to 07:59:59.
 
-        # Handle overnight quiet hours (e.g., 22:00 to 08:00)
-        if start > end:
-            return now >= start or now <= end
-        return start <= now <= end
+        Args:
+            config: Focus settings already loaded by the caller, so the
+                config file is not parsed again
+        """
+        config = config or load_config().focus_mode
+        return get_focus_policy(config).is_quiet(datetime.now())
 
-    def is_dnd_by_usage(self, current_usage: float) -> bool:
+    def is_dnd_by_usage(self, current_usage: float, config: FocusModeConfig | None = None) -> bool:
         """Check if DND should be active based on usage threshold."""
-        config = load_config().focus_mode
+        config = config or load_config().focus_mode
         if not config.enabled:
             return False
         return current_usage > config.dnd_threshold
 
-    def should_suppress_notification(self, current_usage: float) -> bool:
+    def should_suppress_notification(
+        self, current_usage: float, config: FocusModeConfig | None = None
+    ) -> bool:
         """Check if notification should be suppressed.
 
         Returns True if any of these conditions are met:
@@ -63,26 +80,47 @@ class FocusModeService:
         - In quiet hours
         - Usage exceeds DND threshold
         """
-        if self.is_snoozed():
-            return True
-        if self.is_in_quiet_hours():
-            return True
-        return bool(self.is_dnd_by_usage(current_usage))
+        return self.get_suppression_reason(current_usage, config) is not None
 
-    def get_suppression_reason(self, current_usage: float) -> str | None:
+    def get_suppression_reason(
+        self, current_usage: float, config: FocusModeConfig | None = None
+    ) -> str | None:
         """Get reason for notification suppression, or None if not suppressed."""
         if self.is_snoozed():
             remaining = self.get_snooze_remaining()
             mins = remaining // 60
             return f"Snoozed for {mins} more minutes"
-        if self.is_in_quiet_hours():
-            config = load_config().focus_mode
-            return f"Quiet hours ({config.quiet_hours_start} - {config.quiet_hours_end})"
-        if self.is_dnd_by_usage(current_usage):
-            config = load_config().focus_mode
+        config = config or load_config().focus_mode
+        if self.is_in_quiet_hours(config):
+            if config.quiet_hours_start and config.quiet_hours_end:
+                return f"Quiet hours ({config.quiet_hours_start} - {config.quiet_hours_end})"
+            return "Quiet hours"
+        if config.enabled and current_usage > config.dnd_threshold:
             return f"DND active (usage > {config.dnd_threshold}%)"
         return None
 
+    def suppressed_until(self, config: FocusModeConfig | None = None) -> datetime | None:
+        """When snooze and quiet hours stop suppressing, None if they don't now.
+
+        Usage-based DND is not included since it depends on future usage.
+        """
+        self._load_snooze()
+        policy = get_focus_policy(config or load_config().focus_mode)
+        now = datetime.now()
+        until = now
+        for _ in range(_MAX_TRANSITIONS):
+            if self._snoozed_until is not None and until < self._snoozed_until:
+                until = self._snoozed_until
+            elif policy.is_quiet(until):
+                next_change = policy.next_transition(until)
+                if next_change is None:
+                    # Quiet around the clock
+                    return datetime.max
+                until = next_change
+            else:
+                break
+        return until if until != now else None
+
 
 # Singleton instance
 _service: FocusModeService | None = None
@@ -0,0 +1,88 @@
+"""Compiled quiet-hours policy.
+
+Quiet-hour ranges are expanded once per config into a minute-of-week
+table, so "quiet now?" is a single lookup and the next change of state
+is a binary search over precomputed transition minutes.
+"""
+from bisect import bisect_right
+from datetime import datetime, time, timedelta
+
+from loguru import logger
+
+from ..core.config_manager import FocusModeConfig
+
+MINUTES_PER_DAY = 24 * 60
+MINUTES_PER_WEEK = 7 * MINUTES_PER_DAY
+
+# (start minute of day, end minute of day, weekdays with Monday = 0)
+QuietRange = tuple[int, int, frozenset[int]]
+
+
+def _minute_of_day(text: str) -> int:
+    parsed = time.fromisoformat(text)
+    return parsed.hour * 60 + parsed.minute
+
+
+def _minute_of_week(now: datetime) -> int:
+    return now.weekday() * MINUTES_PER_DAY + now.hour * 60 + now.minute
+
+
+class FocusPolicy:
+    """Quiet hours over a week, at minute resolution (local time)."""
+
+    def __init__(self, ranges: list[QuietRange]) -> None:
+        self._quiet = bytearray(MINUTES_PER_WEEK)
+        for start, end, days in ranges:
+            length = (end - start) % MINUTES_PER_DAY
+            for day in days:
+                base = day * MINUTES_PER_DAY + start
+                for minute in range(base, base + length):
+                    self._quiet[minute % MINUTES_PER_WEEK] = 1
+        # Minutes whose state differs from the minute before
+        self._transitions = [
+            m for m in range(MINUTES_PER_WEEK) if self._quiet[m] != self._quiet[m - 1]
+        ]
+
+    @classmethod
+    def from_config(cls, config: FocusModeConfig) -> "FocusPolicy":
+        """Compile the enabled quiet-hours ranges; invalid ones are skipped."""
+        ranges: list[QuietRange] = []
+        if config.enabled:
+            specs = [(r.start, r.end, r.days) for r in config.quiet_hours]
+            if config.quiet_hours_start and config.quiet_hours_end:
+                specs.append((config.quiet_hours_start, config.quiet_hours_end, list(range(7))))
+            for start, end, days in specs:
+                try:
+                    ranges.append((
+                        _minute_of_day(start),
+                        _minute_of_day(end),
+                        frozenset(d for d in days if 0 <= d <= 6),
+                    ))
+                except ValueError as e:
+                    logger.warning(f"Ignoring invalid quiet hours {start}-{end}: {e}")
+        return cls(ranges)
+
+    def is_quiet(self, now: datetime) -> bool:
+        """Check whether `now` falls in quiet hours."""
+        return bool(self._quiet[_minute_of_week(now)])
+
+    def next_transition(self, now: datetime) -> datetime | None:
+        """When quiet hours next start or end, or None if they never change."""
+        if not self._transitions:
+            return None
+        minute = _minute_of_week(now)
+        i = bisect_right(self._transitions, minute)
+        target = self._transitions[i % len(self._transitions)]
+        delta = (target - minute) % MINUTES_PER_WEEK or MINUTES_PER_WEEK
+        return now.replace(second=0, microsecond=0) + timedelta(minutes=delta)
+
+
+_compiled: tuple[FocusModeConfig, FocusPolicy] | None = None
+
+
+def get_focus_policy(config: FocusModeConfig) -> FocusPolicy:
+    """Get the compiled policy, recompiling only when the config changed."""
+    global _compiled
+    if _compiled is None or _compiled[0] != config:
+        _compiled = (config.model_copy(deep=True), FocusPolicy.from_config(config))
+    return _compiled[1]
@@ -0,0 +1,321 @@
+"""Quota-aware queue of deferred jobs.
+
+Jobs carry an estimated usage cost (percent of a 5-hour window). The
+daemon starts them, in order, while the projected utilization at reset
+leaves room for them, and re-evaluates as soon as the window resets so
+queued work uses the fresh quota. Queue state lives in the state store,
+so the CLI can add jobs and an interrupted daemon picks up where it
+left off.
+"""
+import asyncio
+import os
+import shlex
+import subprocess
+import sys
+import time
+import uuid
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+from typing import NamedTuple, TypedDict, Unpack
+
+from loguru import logger
+
+from ..core import usage_history
+from ..core.config_manager import JobQueueConfig, load_config
+from ..core.state_store import get_state_store
+from ..core.usage_analytics import forecast, load_columns
+
+# Interrupted jobs are retried this many times in total
+MAX_ATTEMPTS = 3
+
+# How often the queue is re-checked for jobs added by other processes
+# (the CLI) and for inherited jobs finishing; only a stat when unchanged
+CHECK_SECONDS = 10.0
+
+# Length of the usage window used for forecasting
+WINDOW_SECONDS = 5 * 3600
+
+
+class QueuedJob(NamedTuple):
+    """A deferred command and its progress."""
+    id: str
+    command: str
+    estimated_usage: float
+    cwd: str
+    added_at: float
+    status: str = "pending"  # pending, running, done, failed
+    attempts: int = 0
+    pid: int | None = None
+    started_at: float | None = None
+    finished_at: float | None = None
+    exit_code: int | None = None
+
+
+class JobChanges(TypedDict, total=False):
+    """Fields of a QueuedJob that change as it progresses."""
+    status: str
+    attempts: int
+    pid: int | None
+    started_at: float | None
+    finished_at: float | None
+    exit_code: int | None
+
+
+def plan_admissions(
+    pending: list[QueuedJob],
+    running: list[QueuedJob],
+    projected: float,
+    config: JobQueueConfig,
+) -> list[QueuedJob]:
+    """Pick the queued jobs to start now, in queue order.
+
+    Args:
+        pending: Queued jobs, oldest first
+        running: Jobs currently running
+        projected: Utilization expected at reset without new jobs (0-100)
+        config: Queue settings
+
+    Returns:
+        Jobs to start; stops at the first job that does not fit
+    """
+    headroom = 100 - config.margin_percent - projected - sum(j.estimated_usage for j in running)
+    slots = config.max_concurrency - len(running)
+    admitted: list[QueuedJob] = []
+    for job in pending:
+        if slots <= 0:
+            break
+        # A job larger than a whole window can only start on an idle, fresh window
+        fresh = not running and not admitted and projected <= config.margin_percent
+        if job.estimated_usage > headroom and not fresh:
+            break
+        admitted.append(job)
+        headroom -= job.estimated_usage
+        slots -= 1
+    return admitted
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def jobs_dir() -> Path:
+    """Directory holding job output logs and exit codes."""
+    return usage_history.HISTORY_DIR.parent / "jobs"
+
+
+def _read_exit_code(job_id: str) -> int | None:
+    """Exit code recorded by a job's shell wrapper, if it finished."""
+    try:
+        return int((jobs_dir() / f"{job_id}.exit").read_text())
+    except (OSError, ValueError):
+        return None
+
+
+class JobQueue:
+    """Persisted job queue and the loop that drains it."""
+
+    def __init__(self, clock: Callable[[], float] = time.time) -> None:
+        self._clock = clock
+        self._utilization = 0.0
+        self._reset_at: float | None = None
+        self._changed = asyncio.Event()
+        self._tasks: set[asyncio.Task[None]] = set()
+        # Jobs started by this process (the rest are inherited)
+        self._own: set[str] = set()
+
+    def jobs(self) -> list[QueuedJob]:
+        """All jobs, oldest first."""
+        return [QueuedJob(**job) for job in get_state_store().get("job_queue", "jobs", [])]
+
+    def _modify(self, change: Callable[[list[QueuedJob]], list[QueuedJob]]) -> None:
+        """Rewrite the job list under the store's inter-process lock.
+
+        The CLI adds jobs while the daemon updates them, so every change is
+        applied to the list as stored at that moment.
+        """
+        get_state_store().update(
+            "job_queue",
+            "jobs",
+            lambda jobs: [job._asdict() for job in change([QueuedJob(**job) for job in jobs])],
+            [],
+        )
+
+    def _update(self, job_id: str, **changes: Unpack[JobChanges]) -> QueuedJob | None:
+        updated: list[QueuedJob] = []
+
+        def change(jobs: list[QueuedJob]) -> list[QueuedJob]:
+            for i, job in enumerate(jobs):
+                if job.id == job_id:
+                    jobs[i] = job._replace(**changes)
+                    updated.append(jobs[i])
+            return jobs
+
+        self._modify(change)
+        return updated[0] if updated else None
+
+    def add(self, command: str, estimated_usage: float, cwd: str | None = None) -> QueuedJob:
+        """Append a job to the queue."""
+        job = QueuedJob(
+            id=uuid.uuid4().hex[:8],
+            command=command,
+            estimated_usage=estimated_usage,
+            cwd=cwd or os.getcwd(),
+            added_at=self._clock(),
+        )
+        self._modify(lambda jobs: jobs + [job])
+        self._changed.set()
+        return job
+
+    def remove(self, job_id: str) -> bool:
+        """Remove a job that is not running."""
+        removed: list[QueuedJob] = []
+
+        def change(jobs: list[QueuedJob]) -> list[QueuedJob]:
+            removed.extend(j for j in jobs if j.id == job_id and j.status != "running")
+            return [j for j in jobs if j not in removed]
+
+        self._modify(change)
+        return bool(removed)
+
+    def recover(self) -> None:
+        """Settle running jobs inherited from a previous daemon.
+
+        Finished jobs get their recorded exit code, jobs whose process is
+        still alive are left running, and interrupted jobs are requeued.
+        """
+        for job in self.jobs():
+            if job.status != "running" or job.id in self._own:
+                continue
+            exit_code = _read_exit_code(job.id)
+            if exit_code is not None:
+                self._finish(job.id, exit_code)
+            elif job.pid is not None and _pid_alive(job.pid):
+                continue
+            elif job.attempts >= MAX_ATTEMPTS:
+                self._update(job.id, status="failed", pid=None, finished_at=self._clock())
+                logger.warning(f"Job {job.id} interrupted too often, giving up")
+            else:
+                self._update(job.id, status="pending", pid=None)
+                logger.info(f"Requeued interrupted job {job.id}")
+
+    def _finish(self, job_id: str, exit_code: int | None) -> None:
+        self._update(
+            job_id, status="done" if exit_code == 0 else "failed",
+            pid=None, exit_code=exit_code, finished_at=self._clock(),
+        )
+        logger.info(f"Job {job_id} finished with exit code {exit_code}")
+
+    def observe(self, utilization: float, reset_time: datetime | None) -> None:
+        """Record the latest usage reading and wake the drain loop."""
+        self._utilization = utilization
+        if reset_time is not None:
+            self._reset_at = reset_time.timestamp()
+        self._changed.set()
+
+    def projected_utilization(self) -> float:
+        """Utilization expected at reset from current usage and trend."""
+        now = self._clock()
+        if self._reset_at is not None and now >= self._reset_at:
+            # The window has reset and no newer reading has arrived yet
+            return 0.0
+        history = usage_history.get_usage_history()
+        cols = load_columns(history, history.index_at(now - WINDOW_SECONDS))
+        projection = forecast(cols)
+        if projection is None:
+            return self._utilization
+        return min(100.0, max(self._utilization, projection.projected_at_reset))
+
+    def drain(self) -> list[QueuedJob]:
+        """Start the jobs that fit the current window."""
+        config = load_config().job_queue
+        if not config.enabled:
+            return []
+        jobs = self.jobs()
+        pending = [j for j in jobs if j.status == "pending"]
+        if not pending:
+            return []
+        running = [j for j in jobs if j.status == "running"]
+        admitted = plan_admissions(pending, running, self.projected_utilization(), config)
+        for job in admitted:
+            # Claim the job before the process starts so it is not admitted twice
+            self._own.add(job.id)
+            job = self._update(
+                job.id, status="running", attempts=job.attempts + 1, started_at=self._clock(),
+            ) or job
+            task = asyncio.get_running_loop().create_task(self._execute(job))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        return admitted
+
+    async def _execute(self, job: QueuedJob) -> None:
+        log_dir = jobs_dir()
+        log_dir.mkdir(parents=True, exist_ok=True)
+        exit_path = log_dir / f"{job.id}.exit"
+        exit_path.unlink(missing_ok=True)
+        command = job.command
+        if sys.platform != "win32":
+            # Record the exit code so a later daemon can settle the job
+            command = f"{job.command}\necho $? > {shlex.quote(str(exit_path))}"
+
+        with open(log_dir / f"{job.id}.log", "ab") as log:
+            try:
+                proc = await asyncio.create_subprocess_shell(
+                    command,
+                    cwd=job.cwd,
+                    stdin=subprocess.DEVNULL,
+                    stdout=log,
+                    stderr=subprocess.STDOUT,
+                    start_new_session=sys.platform != "win32",
+                )
+            except OSError as e:
+                logger.error(f"Job {job.id} failed to start: {e}")
+                self._update(job.id, status="failed", finished_at=self._clock())
+                self._own.discard(job.id)
+                return
+            self._update(job.id, pid=proc.pid)
+            logger.info(f"Started job {job.id}: {job.command}")
+            # On cancellation the job keeps running and recover() settles it later
+            await proc.wait()
+
+        exit_code = _read_exit_code(job.id)
+        if exit_code is None:
+            exit_code = proc.returncode
+        self._finish(job.id, exit_code)
+        self._own.discard(job.id)
+        self._changed.set()
+
+    def _next_wakeup(self) -> float:
+        """Seconds until the queue should be re-evaluated."""
+        now = self._clock()
+        if self._reset_at is not None and now < self._reset_at:
+            return min(CHECK_SECONDS, self._reset_at - now)
+        return CHECK_SECONDS
+
+    async def run(self) -> None:
+        """Drain the queue whenever usage, the window or the queue changes."""
+        self.recover()
+        while True:
+            self._changed.clear()
+            self.drain()
+            try:
+                await asyncio.wait_for(self._changed.wait(), self._next_wakeup())
+            except TimeoutError:
+                self.recover()
+
+
+_queue: JobQueue | None = None
+
+
+def get_job_queue() -> JobQueue:
+    """Get singleton job queue instance."""
+    global _queue
+    if _queue is None:
+        _queue = JobQueue()
+    return _queue
@@ -0,0 +1,145 @@
+"""Asynchronous notification delivery off the caller's path.
+
+Submitting only enqueues. A dispatcher task fans each notification out to
+one worker per channel, so a slow channel (e.g. a D-Bus call) neither
+blocks the event loop's other work nor delays the remaining channels.
+"""
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from loguru import logger
+
+from .notifier import Channel, NotificationChannel, channel_name, send_notification
+
+# Give up on a channel that has not delivered within this time
+CHANNEL_TIMEOUT_SECONDS = 10.0
+
+DeliveryCallback = Callable[[list[Channel]], None]
+
+
+@dataclass(slots=True)
+class _Job:
+    title: str
+    body: str
+    channels: list[Channel]
+    on_done: DeliveryCallback | None
+    pending: int = 0
+    sent: list[Channel] = field(default_factory=list)
+
+
+class NotificationDispatcher:
+    """Queue notifications and deliver them from background tasks."""
+
+    def __init__(self, channel_timeout: float = CHANNEL_TIMEOUT_SECONDS) -> None:
+        self._channel_timeout = channel_timeout
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue[_Job] | None = None
+        self._channel_queues: dict[Channel, asyncio.Queue[_Job]] = {}
+        self._tasks: list[asyncio.Task[None]] = []
+
+    @property
+    def running(self) -> bool:
+        return self._loop is not None
+
+    def start(self) -> None:
+        """Start the dispatcher task. Must be called from the running loop."""
+        if self._loop is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        self._tasks.append(self._loop.create_task(self._dispatch(self._queue)))
+
+    async def stop(self) -> None:
+        """Cancel all tasks; undelivered notifications are dropped."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+        self._channel_queues.clear()
+        self._queue = None
+        self._loop = None
+
+    def submit(
+        self,
+        title: str,
+        body: str,
+        channels: list[Channel] | None = None,
+        on_done: DeliveryCallback | None = None,
+    ) -> bool:
+        """Enqueue a notification.
+
+        Args:
+            title: Notification title
+            body: Notification body text
+            channels: Channels to use, or None for the system notification
+            on_done: Called with the channels that delivered
+
+        Returns:
+            False if the dispatcher is not running on the current loop
+        """
+        if self._queue is None:
+            return False
+        try:
+            if asyncio.get_running_loop() is not self._loop:
+                return False
+        except RuntimeError:
+            return False
+        self._queue.put_nowait(_Job(title, body, channels or [NotificationChannel.SYSTEM], on_done))
+        return True
+
+    async def join(self) -> None:
+        """Wait until every submitted notification has been handled."""
+        if self._queue is not None:
+            await self._queue.join()
+        for queue in list(self._channel_queues.values()):
+            await queue.join()
+
+    async def _dispatch(self, queue: "asyncio.Queue[_Job]") -> None:
+        while True:
+            job = await queue.get()
+            job.pending = len(job.channels)
+            for channel in job.channels:
+                channel_queue = self._channel_queues.get(channel)
+                if channel_queue is None:
+                    channel_queue = self._channel_queues[channel] = asyncio.Queue()
+                    self._tasks.append(asyncio.create_task(self._deliver(channel, channel_queue)))
+                channel_queue.put_nowait(job)
+            queue.task_done()
+
+    async def _deliver(self, channel: Channel, queue: "asyncio.Queue[_Job]") -> None:
+        while True:
+            job = await queue.get()
+            # The command runner enforces its own timeout and kills the process
+            timeout = None if channel == NotificationChannel.COMMAND else self._channel_timeout
+            try:
+                sent = await asyncio.wait_for(
+                    send_notification(job.title, job.body, [channel]),
+                    timeout,
+                )
+                job.sent.extend(sent)
+            except TimeoutError:
+                logger.warning(
+                    f"{channel_name(channel)} notification timed out after {self._channel_timeout}s"
+                )
+            except Exception as e:
+                logger.warning(f"Failed to send {channel_name(channel)} notification: {e}")
+            finally:
+                job.pending -= 1
+                if job.pending == 0 and job.on_done is not None:
+                    try:
+                        job.on_done(job.sent)
+                    except Exception as e:
+                        logger.error(f"Delivery callback error: {e}")
+                queue.task_done()
+
+
+_dispatcher: NotificationDispatcher | None = None
+
+
+def get_notification_dispatcher() -> NotificationDispatcher:
+    """Get singleton notification dispatcher instance."""
+    global _dispatcher
+    if _dispatcher is None:
+        _dispatcher = NotificationDispatcher()
+    return _dispatcher
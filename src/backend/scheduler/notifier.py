@@ -1,42 +1,40 @@
 """Multi-channel notification system."""
-import subprocess
-import webbrowser
+import asyncio
+import time
+from collections.abc import Callable
 from enum import Enum
-from typing import TYPE_CHECKING
+from typing import NamedTuple
 
 from loguru import logger
 
-if TYPE_CHECKING:
-    from desktop_notifier import DesktopNotifier
-
 from ..core.config_manager import load_config
+from ..core.state_store import get_state_store
+from .channels import get_channel_registry
 
 
 class NotificationChannel(Enum):
-    """Available notification channels."""
+    """Built-in notification channels."""
     SYSTEM = "system"
     BELL = "bell"
     COMMAND = "command"
     URL = "url"
+    WEBHOOK = "webhook"
 
 
-_notifier: "DesktopNotifier | None" = None
+# A built-in channel, or the name of a plugin channel
+Channel = NotificationChannel | str
 
 
-def _get_notifier() -> "DesktopNotifier":
-    """Get or create desktop notifier instance."""
-    global _notifier
-    if _notifier is None:
-        from desktop_notifier import DesktopNotifier
-        _notifier = DesktopNotifier(app_name="Claudiminder")
-    return _notifier
+def channel_name(channel: Channel) -> str:
+    """Registry name of a channel."""
+    return channel.value if isinstance(channel, NotificationChannel) else channel
 
 
 async def send_notification(
     title: str,
     body: str,
-    channels: list[NotificationChannel] | None = None,
-) -> list[NotificationChannel]:
+    channels: list[Channel] | None = None,
+) -> list[Channel]:
     """Send notification through configured channels.
 
     Args:
@@ -47,8 +45,8 @@ async def send_notification(
     Returns:
         List of channels that successfully sent
     """
-    config = load_config()
-    sent_channels: list[NotificationChannel] = []
+    registry = get_channel_registry()
+    sent_channels: list[Channel] = []
 
     # Default to system notification
     if channels is None:
@@ -56,36 +54,11 @@ async def send_notification(
 
     for channel in channels:
         try:
-            if channel == NotificationChannel.SYSTEM:
-                notifier = _get_notifier()
-                await notifier.send(title=title, message=body)
-                sent_channels.append(channel)
-                logger.debug(f"System notification sent: {title}")
-
-            elif channel == NotificationChannel.BELL:
-                print("\a", end="", flush=True)
+            if await registry.send(channel_name(channel), title, body):
                 sent_channels.append(channel)
-                logger.debug("Terminal bell sent")
-
-            elif channel == NotificationChannel.COMMAND:
-                if config.reminder.custom_command:
-                    subprocess.Popen(
-                        config.reminder.custom_command,
-                        shell=True,
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL,
-                    )
-                    sent_channels.append(channel)
-                    logger.debug(f"Custom command executed: {config.reminder.custom_command}")
-
-            elif channel == NotificationChannel.URL:
-                if config.reminder.custom_url:
-                    webbrowser.open(config.reminder.custom_url)
-                    sent_channels.append(channel)
-                    logger.debug(f"URL opened: {config.reminder.custom_url}")
 
         except Exception as e:
-            logger.warning(f"Failed to send {channel.value} notification: {e}")
+            logger.warning(f"Failed to send {channel_name(channel)} notification: {e}")
             # Try fallback to bell on system notification failure
             if channel == NotificationChannel.SYSTEM and NotificationChannel.BELL not in sent_channels:
                 try:
@@ -97,14 +70,185 @@ async def send_notification(
     return sent_channels
 
 
-def send_notification_sync(title: str, body: str) -> None:
+# Keep fire-and-forget tasks referenced until they finish
+_background_tasks: set[asyncio.Task[list[Channel]]] = set()
+
+
+def send_notification_sync(
+    title: str,
+    body: str,
+    channels: list[Channel] | None = None,
+) -> None:
     """Synchronous wrapper for send_notification (system + bell fallback)."""
-    import asyncio
     try:
         loop = asyncio.get_event_loop()
         if loop.is_running():
-            asyncio.create_task(send_notification(title, body))
+            task = asyncio.create_task(send_notification(title, body, channels))
+            _background_tasks.add(task)
+            task.add_done_callback(_background_tasks.discard)
         else:
-            loop.run_until_complete(send_notification(title, body))
+            loop.run_until_complete(send_notification(title, body, channels))
     except RuntimeError:
-        asyncio.run(send_notification(title, body))
+        asyncio.run(send_notification(title, body, channels))
+
+
+# Notifications added within this time are merged into one
+COALESCE_SECONDS = 2.0
+
+# The same (category, key) is not notified again within this time, by any process
+DEDUP_SECONDS = 300.0
+
+
+class PendingNotification(NamedTuple):
+    """A notification waiting to be coalesced."""
+    category: str
+    key: str
+    message: str
+    on_done: Callable[[list[Channel]], None] | None
+
+
+Deliver = Callable[[str, str, list[Channel], Callable[[list[Channel]], None]], None]
+
+
+def configured_channels() -> list[Channel]:
+    """System notification, the command, URL and webhook channels if
+    configured, and enabled plugin channels.
+    """
+    config = load_config().reminder
+    channels: list[Channel] = [NotificationChannel.SYSTEM]
+    if config.custom_command:
+        channels.append(NotificationChannel.COMMAND)
+    if config.custom_url:
+        channels.append(NotificationChannel.URL)
+    if any(hook.enabled for hook in config.webhooks):
+        channels.append(NotificationChannel.WEBHOOK)
+    channels.extend(config.plugin_channels)
+    return channels
+
+
+def summarize(pending: list[PendingNotification], markdown: bool = False) -> str:
+    """One body for several notifications; a later one per category wins.
+
+    With `markdown`, several messages become a bullet list.
+    """
+    latest: dict[str, str] = {}
+    for item in pending:
+        latest.pop(item.category, None)
+        latest[item.category] = item.message
+    if markdown and len(latest) > 1:
+        return "\n".join(f"- {message}" for message in latest.values())
+    return "\n".join(latest.values())
+
+
+class NotificationCoalescer:
+    """Merge, dedup and rate-limit notifications before delivery.
+
+    Inside a running event loop notifications are flushed COALESCE_SECONDS
+    after the first one arrives; synchronous callers call end_batch().
+    """
+
+    def __init__(self, deliver: Deliver, window: float = COALESCE_SECONDS) -> None:
+        self._deliver = deliver
+        self._window = window
+        self._pending: list[PendingNotification] = []
+        self._handle: asyncio.TimerHandle | None = None
+
+    def add(
+        self,
+        category: str,
+        key: str,
+        message: str,
+        on_done: Callable[[list[Channel]], None] | None = None,
+    ) -> bool:
+        """Queue a notification.
+
+        Returns:
+            False if the same (category, key) was notified recently
+        """
+        store = get_state_store()
+        dedup_key = f"{category}:{key}"
+        now = time.time()
+        last = store.get("notified", dedup_key)
+        if last is not None and now - last < DEDUP_SECONDS:
+            logger.debug(f"Skipping duplicate notification {dedup_key}")
+            return False
+        store.set("notified", dedup_key, now)
+
+        self._pending.append(PendingNotification(category, key, message, on_done))
+        if self._handle is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return True
+            self._handle = loop.call_later(self._window, self.flush)
+        return True
+
+    def end_batch(self) -> None:
+        """Flush now unless a timed flush is already scheduled."""
+        if self._handle is None:
+            self.flush()
+
+    def flush(self) -> None:
+        """Deliver everything pending as one notification."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+
+        intervals = load_config().reminder.channel_min_interval_seconds
+        registry = get_channel_registry()
+        plain: list[Channel] = []
+        rich: list[Channel] = []
+        batching: list[Channel] = []
+        for channel in configured_channels():
+            if not _channel_allowed(channel, intervals):
+                continue
+            capabilities = registry.capabilities(channel_name(channel))
+            if capabilities.batching:
+                batching.append(channel)
+            elif capabilities.rich_content:
+                rich.append(channel)
+            else:
+                plain.append(channel)
+
+        # Channels that batch themselves get every notification, unmerged
+        deliveries: list[tuple[str, list[Channel]]] = []
+        if plain:
+            deliveries.append((summarize(pending), plain))
+        if rich:
+            deliveries.append((summarize(pending, markdown=True), rich))
+        if batching:
+            deliveries.extend((item.message, batching) for item in pending)
+
+        callbacks = [item.on_done for item in pending if item.on_done is not None]
+        sent_all: list[Channel] = []
+        remaining = len(deliveries)
+
+        def on_done(sent: list[Channel]) -> None:
+            nonlocal remaining
+            sent_all.extend(channel for channel in sent if channel not in sent_all)
+            remaining -= 1
+            if remaining == 0:
+                for callback in callbacks:
+                    callback(sent_all)
+
+        for body, channels in deliveries:
+            self._deliver("Claudiminder", body, channels, on_done)
+
+
+def _channel_allowed(channel: Channel, intervals: dict[str, float]) -> bool:
+    """Apply the channel's configured minimum interval, recording the send."""
+    name = channel_name(channel)
+    interval = intervals.get(name)
+    if interval is None:
+        return True
+    store = get_state_store()
+    now = time.time()
+    last = store.get("channel_sent", name)
+    if last is not None and now - last < interval:
+        logger.debug(f"Rate limited {name} notification")
+        return False
+    store.set("channel_sent", name, now)
+    return True
@@ -0,0 +1,170 @@
+"""Reminder rules written as small expressions in the config.
+
+A rule is a boolean expression over the latest usage sample, e.g.
+``utilization > 70 and minutes_to_reset > 120``. The language is a safe
+subset of Python expressions: numbers, the variables below, arithmetic,
+comparisons, ``and``/``or``/``not`` and parentheses.
+
+All rules of a config are compiled together into one function returning
+a tuple of results, so evaluating hundreds of rules per sample is a single
+call. Unknown values are NaN, which makes every comparison on them false,
+``!=`` included. ``not`` negates that result: ``not (seven_day_opus < 50)``
+holds while the value is unknown, whereas ``seven_day_opus >= 50`` needs a
+known value.
+"""
+import ast
+import math
+from collections.abc import Callable, Mapping
+from itertools import compress
+
+from loguru import logger
+
+from ..core.config_manager import ReminderRule
+
+VARIABLES = (
+    "utilization",
+    "minutes_to_reset",
+    "seven_day",
+    "seven_day_opus",
+    "seven_day_sonnet",
+    "extra_usage",
+)
+
+_ALLOWED_NODES = (
+    ast.Expression,
+    ast.BoolOp, ast.And, ast.Or,
+    ast.UnaryOp, ast.Not, ast.USub, ast.UAdd,
+    ast.BinOp, ast.Add, ast.Sub, ast.Mult, ast.Div,
+    ast.Compare, ast.Lt, ast.LtE, ast.Gt, ast.GtE, ast.Eq, ast.NotEq,
+    ast.Name, ast.Load,
+    ast.Constant,
+)
+
+
+class RuleError(ValueError):
+    """A rule expression is invalid."""
+
+
+def parse_rule(expression: str) -> ast.expr:
+    """Parse and validate one rule expression.
+
+    Raises:
+        RuleError: If the expression is not valid rule syntax
+    """
+    try:
+        tree = ast.parse(expression, mode="eval")
+    except SyntaxError as e:
+        raise RuleError(f"Invalid rule {expression!r}: {e.msg}") from None
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise RuleError(f"Invalid rule {expression!r}: {type(node).__name__} not allowed")
+        if isinstance(node, ast.Name) and node.id not in VARIABLES:
+            raise RuleError(f"Invalid rule {expression!r}: unknown variable {node.id!r}")
+        if isinstance(node, ast.Constant) and (
+            isinstance(node.value, bool) or not isinstance(node.value, int | float)
+        ):
+            raise RuleError(f"Invalid rule {expression!r}: only numbers are allowed")
+    return tree.body
+
+
+def _div(a: float, b: float) -> float:
+    return a / b if b else math.nan
+
+
+def _known(*values: float) -> bool:
+    return not any(math.isnan(value) for value in values)
+
+
+class _SafeDivision(ast.NodeTransformer):
+    """Rewrite ``a / b`` to ``_div(a, b)`` so dividing by zero yields NaN.
+
+    Also guards comparisons using ``!=``, which unlike the others is true
+    for NaN, so that no comparison holds on an unknown value.
+    """
+
+    def visit_BinOp(self, node: ast.BinOp) -> ast.expr:
+        self.generic_visit(node)
+        if isinstance(node.op, ast.Div):
+            div = ast.Name(id="_div", ctx=ast.Load())
+            return ast.Call(func=div, args=[node.left, node.right], keywords=[])
+        return node
+
+    def visit_Compare(self, node: ast.Compare) -> ast.expr:
+        self.generic_visit(node)
+        if not any(isinstance(op, ast.NotEq) for op in node.ops):
+            return node
+        known = ast.Call(
+            func=ast.Name(id="_known", ctx=ast.Load()),
+            args=[node.left, *node.comparators],
+            keywords=[],
+        )
+        return ast.BoolOp(op=ast.And(), values=[known, node])
+
+
+class RuleSet:
+    """Rules of one config compiled into a single function."""
+
+    def __init__(self, rules: list[ReminderRule]) -> None:
+        self.rules: list[ReminderRule] = []
+        bodies: list[ast.expr] = []
+        for rule in rules:
+            if not rule.enabled:
+                continue
+            try:
+                bodies.append(parse_rule(rule.when))
+            except RuleError as e:
+                logger.warning(f"Skipping reminder rule {rule.name!r}: {e}")
+                continue
+            self.rules.append(rule)
+
+        self._names = [rule.name for rule in self.rules]
+
+        # lambda utilization, ...: (bool(rule0), bool(rule1), ...)
+        args = ast.arguments(
+            posonlyargs=[],
+            args=[ast.arg(arg=name) for name in VARIABLES],
+            kwonlyargs=[], kw_defaults=[], defaults=[],
+        )
+        to_bool = ast.Name(id="bool", ctx=ast.Load())
+        results = ast.Tuple(
+            elts=[
+                ast.Call(func=to_bool, args=[_SafeDivision().visit(body)], keywords=[])
+                for body in bodies
+            ],
+            ctx=ast.Load(),
+        )
+        tree = ast.fix_missing_locations(ast.Expression(body=ast.Lambda(args=args, body=results)))
+        namespace = {"__builtins__": {}, "bool": bool, "_div": _div, "_known": _known}
+        self._evaluate: Callable[..., tuple[bool, ...]] = eval(
+            compile(tree, "<reminder rules>", "eval"), namespace
+        )
+
+    def evaluate(self, values: Mapping[str, float]) -> tuple[bool, ...]:
+        """Evaluate every rule against one sample; missing values are NaN."""
+        return self._evaluate(*[values.get(name, math.nan) for name in VARIABLES])
+
+    def rising(self, values: Mapping[str, float], active: set[str]) -> list[ReminderRule]:
+        """Rules that became true since the previous sample.
+
+        A rule fires once when its condition starts holding and re-arms
+        once it stops holding. `active` holds the names of rules that held
+        at the previous sample and is updated in place.
+        """
+        held = set(compress(self._names, self.evaluate(values)))
+        new = held - active
+        active.clear()
+        active |= held
+        if not new:
+            return []
+        return [rule for rule in self.rules if rule.name in new]
+
+
+_compiled: tuple[list[ReminderRule], RuleSet] | None = None
+
+
+def get_rule_set(rules: list[ReminderRule]) -> RuleSet:
+    """Get the compiled rules, recompiling only when the config changed."""
+    global _compiled
+    if _compiled is None or _compiled[0] != rules:
+        _compiled = ([rule.model_copy() for rule in rules], RuleSet(rules))
+    return _compiled[1]
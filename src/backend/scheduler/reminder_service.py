@@ -1,13 +1,23 @@
 """Reminder service for usage thresholds and reset times."""
+import math
+import time
 from collections.abc import Callable
 from datetime import datetime
 from enum import Enum
+from typing import Any
 
 from loguru import logger
 
-from ..core.config_manager import load_config
+from ..core.config_manager import AppConfig, load_config
+from ..core.event_bus import REMINDER_FIRED, ReminderFired, get_event_bus
+from ..core.state_store import get_state_store
+from ..core.usage_history import WINDOW_TOLERANCE_SECONDS
+from ..models.usage import UsageResponse
+from .anomaly_detector import AnomalyDetector
 from .focus_mode import get_focus_mode_service
-from .notifier import send_notification_sync
+from .notification_dispatcher import get_notification_dispatcher
+from .notifier import Channel, NotificationCoalescer, channel_name, send_notification_sync
+from .reminder_rules import get_rule_set
 
 
 class ReminderType(Enum):
@@ -15,81 +25,212 @@ class ReminderType(Enum):
     BEFORE_RESET = "before_reset"
     ON_RESET = "on_reset"
     PERCENTAGE = "percentage"
+    ANOMALY = "anomaly"
+    RULE = "rule"
+
+
+def _seven_day_utilization(data: dict[str, Any] | None) -> float:
+    if data and data.get("utilization") is not None:
+        return float(data["utilization"])
+    return math.nan
+
+
+def rule_values(
+    current_usage: float,
+    reset_time: datetime | None,
+    usage: UsageResponse | None = None,
+) -> dict[str, float]:
+    """Variables available to reminder rules for one sample."""
+    minutes_to_reset = math.nan
+    if reset_time is not None:
+        minutes_to_reset = (reset_time - datetime.now(reset_time.tzinfo)).total_seconds() / 60
+    values = {"utilization": current_usage, "minutes_to_reset": minutes_to_reset}
+    if usage is not None:
+        values["seven_day"] = _seven_day_utilization(usage.seven_day)
+        values["seven_day_opus"] = _seven_day_utilization(usage.seven_day_opus)
+        values["seven_day_sonnet"] = _seven_day_utilization(usage.seven_day_sonnet)
+        if usage.extra_usage and usage.extra_usage.utilization is not None:
+            values["extra_usage"] = usage.extra_usage.utilization
+    return values
 
 
 class ReminderService:
     """Manage and trigger usage reminders."""
 
-    def __init__(self) -> None:
+    def __init__(self, account: str = "default") -> None:
+        self._account = account
         self._triggered_before_reset: set[int] = set()  # Minutes already triggered
         self._triggered_percentages: set[int] = set()
         self._reset_triggered = False
+        self._active_rules: set[str] = set()
         self._last_reset_time: datetime | None = None
-        self._callbacks: list[Callable[[ReminderType, str], None]] = []
+        self._last_usage = 0.0
+        self._anomaly_detector = AnomalyDetector()
+        self._coalescer = NotificationCoalescer(self._deliver)
+        self._load_state()
+
+    def _load_state(self) -> None:
+        """Restore triggers persisted by this or another process."""
+        state = get_state_store().get("reminders", self._account)
+        if not state:
+            return
+        self._triggered_before_reset = set(state["before_reset"])
+        self._triggered_percentages = set(state["percentages"])
+        self._reset_triggered = state["reset_fired"]
+        self._active_rules = set(state.get("rules", []))
+        if state["window"] is not None:
+            self._last_reset_time = datetime.fromtimestamp(state["window"]).astimezone()
+
+    def _save_state(self) -> None:
+        """Persist triggers; the store skips the write if nothing changed."""
+        get_state_store().set("reminders", self._account, {
+            "window": self._last_reset_time.timestamp() if self._last_reset_time else None,
+            "before_reset": sorted(self._triggered_before_reset),
+            "percentages": sorted(self._triggered_percentages),
+            "reset_fired": self._reset_triggered,
+            "rules": sorted(self._active_rules),
+        })
+
+    def _on_delivered(
+        self,
+        reminder_type: ReminderType,
+        message: str,
+        sent: list[Channel],
+    ) -> None:
+        """Log the dispatcher's delivery result for a reminder."""
+        if not sent:
+            logger.warning(f"{reminder_type.value} reminder reached no channel: {message}")
+            return
+        names = ", ".join(channel_name(channel) for channel in sent)
+        logger.debug(f"Delivered {reminder_type.value} reminder via {names}")
 
-    def add_callback(self, callback: Callable[[ReminderType, str], None]) -> None:
-        """Add callback for when reminder triggers."""
-        self._callbacks.append(callback)
+    def _emit(self, reminder_type: ReminderType, key: str, message: str) -> bool:
+        """Queue a reminder notification and publish it on the event bus.
 
-    def remove_callback(self, callback: Callable[[ReminderType, str], None]) -> None:
-        """Remove a callback."""
-        if callback in self._callbacks:
-            self._callbacks.remove(callback)
+        Returns:
+            False if the reminder was a duplicate and nothing was queued
+        """
+        # Rules are independent of each other, so none replaces another in a batch
+        category = reminder_type.value
+        if reminder_type == ReminderType.RULE:
+            category = f"{category}:{key}"
+        # Accounts are notified independently of each other
+        if not self._coalescer.add(
+            category,
+            f"{self._account}:{key}",
+            message,
+            on_done=lambda sent: self._on_delivered(reminder_type, message, sent),
+        ):
+            return False
+        get_event_bus().publish(REMINDER_FIRED, ReminderFired(reminder_type.value, message))
+        return True
+
+    def _deliver(
+        self,
+        title: str,
+        body: str,
+        channels: list[Channel],
+        on_done: Callable[[list[Channel]], None],
+    ) -> None:
+        """Deliver a coalesced notification.
 
-    def _notify_callbacks(self, reminder_type: ReminderType, message: str) -> None:
-        """Notify all registered callbacks."""
-        for callback in self._callbacks:
-            try:
-                callback(reminder_type, message)
-            except Exception as e:
-                logger.error(f"Callback error: {e}")
+        Inside a loop running the dispatcher this only enqueues; otherwise
+        it falls back to sending synchronously.
+        """
+        if not get_notification_dispatcher().submit(title, body, channels, on_done):
+            send_notification_sync(title, body, channels)
 
     def reset_triggers(self) -> None:
         """Reset all triggers (call after token reset)."""
         self._triggered_before_reset.clear()
         self._triggered_percentages.clear()
         self._reset_triggered = False
+        self._save_state()
         logger.debug("Reminder triggers reset")
 
+    def set_window(self, reset_time: datetime) -> bool:
+        """Record the current reset window, clearing triggers when it moves.
+
+        Returns:
+            True if this replaces a previously seen window
+        """
+        last = self._last_reset_time
+        if last is not None and abs(reset_time.timestamp() - last.timestamp()) <= WINDOW_TOLERANCE_SECONDS:
+            return False
+        self._last_reset_time = reset_time
+        if last is None:
+            self._save_state()
+            return False
+        self.reset_triggers()
+        return True
+
     def check_and_trigger(
         self,
         current_usage: float,
         reset_time: datetime | None,
+        usage: UsageResponse | None = None,
+        app_config: AppConfig | None = None,
     ) -> list[tuple[ReminderType, str]]:
         """Check conditions and trigger appropriate reminders.
 
         Args:
             current_usage: Current usage percentage (0-100)
             reset_time: When the usage will reset
+            usage: Full API response, for rules on the seven-day limits
+            app_config: Configuration already loaded for this sample
 
         Returns:
             List of (ReminderType, message) for triggered reminders
         """
-        config = load_config().reminder
+        if app_config is None:
+            app_config = load_config()
+        config = app_config.reminder
+        self._last_usage = current_usage
+        new_window = reset_time is not None and self.set_window(reset_time)
         if not config.enabled:
             return []
 
+        # Feed the detector even when suppressed so its baseline stays current
+        anomaly_rate = None
+        if config.anomaly_detection:
+            anomaly_rate = self._anomaly_detector.update(current_usage, time.time(), config)
+
         focus_service = get_focus_mode_service()
-        if focus_service.should_suppress_notification(current_usage):
-            reason = focus_service.get_suppression_reason(current_usage)
+        if focus_service.should_suppress_notification(current_usage, app_config.focus_mode):
+            reason = focus_service.get_suppression_reason(current_usage, app_config.focus_mode)
             logger.debug(f"Notifications suppressed: {reason}")
             return []
 
         triggered: list[tuple[ReminderType, str]] = []
 
+        # Check for runaway consumption
+        if anomaly_rate is not None:
+            message = f"Usage spiking at {anomaly_rate:.1f}% per minute"
+            if self._emit(ReminderType.ANOMALY, "", message):
+                triggered.append((ReminderType.ANOMALY, message))
+                logger.info(f"Triggered anomaly reminder: {anomaly_rate:.2f}%/min")
+
         # Check percentage thresholds
         for threshold in config.percentage_thresholds:
             if threshold not in self._triggered_percentages and current_usage >= threshold:
                 self._triggered_percentages.add(threshold)
                 message = f"Usage reached {threshold}%"
-                triggered.append((ReminderType.PERCENTAGE, message))
-                send_notification_sync("Claudiminder", message)
-                self._notify_callbacks(ReminderType.PERCENTAGE, message)
-                logger.info(f"Triggered percentage reminder: {threshold}%")
+                if self._emit(ReminderType.PERCENTAGE, str(threshold), message):
+                    triggered.append((ReminderType.PERCENTAGE, message))
+                    logger.info(f"Triggered percentage reminder: {threshold}%")
+
+        # Check configured rules
+        if config.rules:
+            values = rule_values(current_usage, reset_time or self._last_reset_time, usage)
+            for rule in get_rule_set(config.rules).rising(values, self._active_rules):
+                message = rule.message or f"Rule {rule.name} matched: {rule.when}"
+                if self._emit(ReminderType.RULE, rule.name, message):
+                    triggered.append((ReminderType.RULE, message))
+                    logger.info(f"Triggered rule reminder: {rule.name}")
 
         # Check before-reset reminders
         if reset_time:
-            now = datetime.now()
+            now = datetime.now(reset_time.tzinfo)
             time_until_reset = reset_time - now
             minutes_until = time_until_reset.total_seconds() / 60
 
@@ -97,24 +238,72 @@ class ReminderService:
                 if minutes not in self._triggered_before_reset and 0 < minutes_until <= minutes:
                     self._triggered_before_reset.add(minutes)
                     message = f"Token reset in {int(minutes_until)} minutes!"
-                    triggered.append((ReminderType.BEFORE_RESET, message))
-                    send_notification_sync("Claudiminder", message)
-                    self._notify_callbacks(ReminderType.BEFORE_RESET, message)
-                    logger.info(f"Triggered before-reset reminder: {minutes}m")
+                    if self._emit(ReminderType.BEFORE_RESET, str(minutes), message):
+                        triggered.append((ReminderType.BEFORE_RESET, message))
+                        logger.info(f"Triggered before-reset reminder: {minutes}m")
 
             # Check on-reset
-            if config.on_reset and not self._reset_triggered and self._last_reset_time and reset_time > self._last_reset_time:
+            if config.on_reset and new_window and not self._reset_triggered:
                 self._reset_triggered = True
                 message = "Your token has reset!"
-                triggered.append((ReminderType.ON_RESET, message))
-                send_notification_sync("Claudiminder", message)
-                self._notify_callbacks(ReminderType.ON_RESET, message)
-                logger.info("Triggered on-reset reminder")
-
-            self._last_reset_time = reset_time
+                if self._emit(ReminderType.ON_RESET, "", message):
+                    triggered.append((ReminderType.ON_RESET, message))
+                    logger.info("Triggered on-reset reminder")
 
+        # Without a running loop nothing flushes the batch later
+        self._coalescer.end_batch()
+        self._save_state()
         return triggered
 
+    def fire_scheduled(
+        self,
+        reminder_type: ReminderType,
+        minutes: int = 0,
+    ) -> tuple[ReminderType, str] | None:
+        """Fire a before-reset or on-reset reminder at its scheduled time.
+
+        Shares the triggered sets with check_and_trigger, so a reminder is
+        sent once per window whichever path sees it first.
+
+        Returns:
+            (ReminderType, message), or None if disabled, suppressed or
+            already sent
+        """
+        app_config = load_config()
+        if not app_config.reminder.enabled:
+            return None
+
+        if reminder_type == ReminderType.BEFORE_RESET:
+            if minutes in self._triggered_before_reset:
+                return None
+            key = str(minutes)
+            message = f"Token reset in {minutes} minutes!"
+        else:
+            if self._reset_triggered:
+                return None
+            key = ""
+            message = "Your token has reset!"
+
+        # A suppressed reminder stays pending so a later check can still send it
+        focus_service = get_focus_mode_service()
+        if focus_service.should_suppress_notification(self._last_usage, app_config.focus_mode):
+            reason = focus_service.get_suppression_reason(self._last_usage, app_config.focus_mode)
+            logger.debug(f"Notifications suppressed: {reason}")
+            return None
+
+        emitted = self._emit(reminder_type, key, message)
+        self._coalescer.end_batch()
+        # A duplicate was already sent for this window, possibly by another process
+        if reminder_type == ReminderType.BEFORE_RESET:
+            self._triggered_before_reset.add(minutes)
+        else:
+            self._reset_triggered = True
+        self._save_state()
+        if not emitted:
+            return None
+        logger.info(f"Triggered scheduled reminder: {message}")
+        return reminder_type, message
+
     def snooze(self, minutes: int) -> None:
         """Snooze all reminders for specified minutes."""
         focus_service = get_focus_mode_service()
@@ -0,0 +1,91 @@
+"""Exact-time scheduling of before-reset and on-reset reminders.
+
+Fire times are computed once per reset window and kept in a min-heap, so
+the timer sleeps until the next reminder instead of waking periodically.
+"""
+import asyncio
+import heapq
+import time
+from collections.abc import Callable
+from datetime import datetime
+
+from loguru import logger
+
+from ..core.config_manager import load_config
+from ..core.usage_history import WINDOW_TOLERANCE_SECONDS
+from .reminder_service import ReminderService, ReminderType, get_reminder_service
+
+# Heap entry minutes value for the on-reset reminder
+ON_RESET = 0
+
+
+class ReminderTimer:
+    """Fire time-based reminders for the current reset window."""
+
+    def __init__(
+        self,
+        service: ReminderService | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._service = service or get_reminder_service()
+        self._clock = clock
+        # (fire_at, minutes before reset); ON_RESET fires at the reset itself
+        self._heap: list[tuple[float, int]] = []
+        self._key: tuple[float, tuple[int, ...], bool] | None = None
+        self._changed = asyncio.Event()
+
+    def next_fire_at(self) -> float | None:
+        """Timestamp of the next pending reminder."""
+        return self._heap[0][0] if self._heap else None
+
+    def schedule(self, reset_time: datetime | None) -> None:
+        """Recompute fire times when the reset time or config changes."""
+        if reset_time is None:
+            return
+        reset_at = reset_time.timestamp()
+        config = load_config().reminder
+        minutes = tuple(sorted(set(config.before_reset_minutes)))
+        if (
+            self._key is not None
+            and abs(self._key[0] - reset_at) <= WINDOW_TOLERANCE_SECONDS
+            and self._key[1:] == (minutes, config.on_reset)
+        ):
+            return
+
+        # Anything already due belongs to the old window
+        self.fire_due()
+        self._service.set_window(reset_time)
+        self._key = (reset_at, minutes, config.on_reset)
+
+        now = self._clock()
+        self._heap = [(reset_at - m * 60, m) for m in minutes if m > 0 and reset_at - m * 60 > now]
+        if config.on_reset and reset_at > now:
+            self._heap.append((reset_at, ON_RESET))
+        heapq.heapify(self._heap)
+        self._changed.set()
+        logger.debug(f"Scheduled {len(self._heap)} reminders for reset at {reset_time}")
+
+    def fire_due(self) -> list[tuple[ReminderType, str]]:
+        """Fire every reminder whose time has come."""
+        fired: list[tuple[ReminderType, str]] = []
+        now = self._clock()
+        while self._heap and self._heap[0][0] <= now:
+            _, minutes = heapq.heappop(self._heap)
+            if minutes == ON_RESET:
+                result = self._service.fire_scheduled(ReminderType.ON_RESET)
+            else:
+                result = self._service.fire_scheduled(ReminderType.BEFORE_RESET, minutes)
+            if result is not None:
+                fired.append(result)
+        return fired
+
+    async def run(self) -> None:
+        """Sleep until the next fire time, forever."""
+        while True:
+            self._changed.clear()
+            next_at = self.next_fire_at()
+            timeout = None if next_at is None else max(0.0, next_at - self._clock())
+            try:
+                await asyncio.wait_for(self._changed.wait(), timeout)
+            except TimeoutError:
+                self.fire_due()
@@ -0,0 +1,294 @@
+"""Webhook notification channel.
+
+Events are first appended to a disk outbox, so nothing is lost while
+offline or between restarts. A running sender batches events arriving
+within BATCH_SECONDS into one POST per webhook over a shared keep-alive
+client, retries failures with jittered exponential backoff, and retries
+whatever is left in the outbox every RETRY_SECONDS.
+"""
+import asyncio
+import json
+import random
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from string import Template
+from typing import Any, NamedTuple
+
+import httpx
+from filelock import FileLock, Timeout
+from loguru import logger
+
+from ..core import usage_history
+from ..core.config_manager import WebhookConfig, load_config
+
+# Events arriving within this time are sent as one request
+BATCH_SECONDS = 5.0
+
+# How often undelivered events are retried
+RETRY_SECONDS = 60.0
+
+# Attempts per request before leaving the events for the next retry
+MAX_ATTEMPTS = 4
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 30.0
+
+REQUEST_TIMEOUT_SECONDS = 10.0
+
+# Events per request, and in the outbox (oldest are dropped first)
+MAX_BATCH_EVENTS = 50
+MAX_OUTBOX_EVENTS = 1000
+
+
+class WebhookEvent(NamedTuple):
+    """One notification waiting for a webhook."""
+    id: str
+    url: str
+    title: str
+    body: str
+    timestamp: float
+
+
+def outbox_path() -> Path:
+    """File holding undelivered webhook events, one JSON object per line."""
+    return usage_history.HISTORY_DIR.parent / "webhook_outbox.jsonl"
+
+
+def render_payload(template: Any, events: list[WebhookEvent]) -> Any:
+    """Fill a JSON template with a batch of events."""
+    values = {
+        "title": events[-1].title,
+        "body": "\n".join(event.body for event in events),
+        "count": str(len(events)),
+    }
+
+    def fill(node: Any) -> Any:
+        if node == "$events":
+            return [
+                {"title": event.title, "body": event.body, "timestamp": event.timestamp}
+                for event in events
+            ]
+        if isinstance(node, str):
+            return Template(node).safe_substitute(values)
+        if isinstance(node, dict):
+            return {key: fill(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [fill(value) for value in node]
+        return node
+
+    return fill(template)
+
+
+class Outbox:
+    """Disk-backed event list shared by all processes."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = FileLock(str(path.with_suffix(".lock")))
+        # Held while delivering so two processes don't send the same events
+        self.delivery_lock = FileLock(str(path.with_suffix(".delivery.lock")), timeout=0)
+
+    def _read(self) -> list[WebhookEvent]:
+        events = []
+        try:
+            lines = self.path.read_text().splitlines()
+        except FileNotFoundError:
+            return []
+        for line in lines:
+            try:
+                events.append(WebhookEvent(**json.loads(line)))
+            except (ValueError, TypeError):
+                logger.warning("Dropping unreadable webhook outbox entry")
+        return events
+
+    def _write(self, events: list[WebhookEvent]) -> None:
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text("".join(json.dumps(event._asdict()) + "\n" for event in events))
+        tmp.replace(self.path)
+
+    def append(self, events: list[WebhookEvent]) -> None:
+        """Add events, dropping the oldest beyond MAX_OUTBOX_EVENTS."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            stored = self._read() + events
+            overflow = len(stored) - MAX_OUTBOX_EVENTS
+            if overflow > 0:
+                logger.warning(f"Webhook outbox full, dropping {overflow} events")
+                stored = stored[overflow:]
+            self._write(stored)
+
+    def events(self) -> list[WebhookEvent]:
+        """All undelivered events, oldest first."""
+        with self._lock:
+            return self._read()
+
+    def remove(self, ids: set[str]) -> None:
+        """Drop delivered (or undeliverable) events."""
+        if not ids:
+            return
+        with self._lock:
+            self._write([event for event in self._read() if event.id not in ids])
+
+
+def _retryable(response: httpx.Response) -> bool:
+    return response.status_code == 429 or response.status_code >= 500
+
+
+class WebhookSender:
+    """Deliver notifications to the configured webhooks."""
+
+    def __init__(
+        self,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        self._sleep = sleep
+        self._client: httpx.AsyncClient | None = None
+        self._changed: asyncio.Event | None = None
+        self._outbox: Outbox | None = None
+
+    @property
+    def outbox(self) -> Outbox:
+        path = outbox_path()
+        if self._outbox is None or self._outbox.path != path:
+            self._outbox = Outbox(path)
+        return self._outbox
+
+    @property
+    def running(self) -> bool:
+        """Whether run() is delivering in the background."""
+        return self._client is not None
+
+    def enqueue(self, title: str, body: str) -> bool:
+        """Store a notification for every enabled webhook.
+
+        Returns:
+            False if no webhook is configured
+        """
+        webhooks = [hook for hook in load_config().reminder.webhooks if hook.enabled]
+        if not webhooks:
+            return False
+        now = time.time()
+        self.outbox.append([
+            WebhookEvent(uuid.uuid4().hex, hook.url, title, body, now) for hook in webhooks
+        ])
+        if self._changed is not None:
+            self._changed.set()
+        return True
+
+    async def send(self, title: str, body: str) -> bool:
+        """Queue a notification, delivering it now if no sender is running.
+
+        Returns:
+            True once the notification is stored for delivery
+        """
+        if not self.enqueue(title, body):
+            return False
+        if not self.running:
+            async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT_SECONDS) as client:
+                await self.flush(client, attempts=1)
+        return True
+
+    async def flush(self, client: httpx.AsyncClient, attempts: int = MAX_ATTEMPTS) -> int:
+        """Deliver the outbox, one request per webhook and batch.
+
+        Returns:
+            Number of events delivered
+        """
+        outbox = self.outbox
+        try:
+            outbox.delivery_lock.acquire()
+        except Timeout:
+            return 0  # Another process is delivering
+        try:
+            events = outbox.events()
+            if not events:
+                return 0
+            webhooks = {hook.url: hook for hook in load_config().reminder.webhooks if hook.enabled}
+            by_url: dict[str, list[WebhookEvent]] = {}
+            for event in events:
+                by_url.setdefault(event.url, []).append(event)
+
+            delivered = 0
+            for url, pending in by_url.items():
+                hook = webhooks.get(url)
+                if hook is None:
+                    logger.debug(f"Dropping {len(pending)} events for removed webhook {url}")
+                    outbox.remove({event.id for event in pending})
+                    continue
+                for start in range(0, len(pending), MAX_BATCH_EVENTS):
+                    batch = pending[start:start + MAX_BATCH_EVENTS]
+                    sent = await self._post(client, hook, batch, attempts)
+                    if sent is False:
+                        break  # Keep order; retry this webhook later
+                    outbox.remove({event.id for event in batch})
+                    if sent:
+                        delivered += len(batch)
+            return delivered
+        finally:
+            outbox.delivery_lock.release()
+
+    async def _post(
+        self,
+        client: httpx.AsyncClient,
+        hook: WebhookConfig,
+        batch: list[WebhookEvent],
+        attempts: int,
+    ) -> bool | None:
+        """POST one batch with retries.
+
+        Returns:
+            True if sent, None if rejected for good, False to retry later
+        """
+        payload = render_payload(hook.template, batch)
+        for attempt in range(attempts):
+            if attempt:
+                delay = min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2 ** (attempt - 1))
+                await self._sleep(random.uniform(0, delay))
+            try:
+                response = await client.post(hook.url, json=payload, headers=hook.headers)
+            except httpx.TransportError as e:
+                logger.debug(f"Webhook {hook.url} unreachable: {e}")
+                continue
+            if response.is_success:
+                logger.debug(f"Webhook {hook.url} sent {len(batch)} events")
+                return True
+            if not _retryable(response):
+                logger.warning(f"Webhook {hook.url} rejected events: HTTP {response.status_code}")
+                return None
+            logger.debug(f"Webhook {hook.url} failed: HTTP {response.status_code}")
+        return False
+
+    async def run(self) -> None:
+        """Deliver batches as events arrive, retrying the outbox periodically."""
+        self._changed = asyncio.Event()
+        limits = httpx.Limits(max_keepalive_connections=4, keepalive_expiry=RETRY_SECONDS * 2)
+        async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT_SECONDS, limits=limits) as client:
+            self._client = client
+            try:
+                while True:
+                    try:
+                        await asyncio.wait_for(self._changed.wait(), RETRY_SECONDS)
+                        # Let the rest of the batch arrive
+                        await asyncio.sleep(BATCH_SECONDS)
+                    except TimeoutError:
+                        pass
+                    self._changed.clear()
+                    try:
+                        await self.flush(client)
+                    except OSError as e:
+                        logger.warning(f"Webhook outbox unavailable: {e}")
+            finally:
+                self._client = None
+                self._changed = None
+
+
+_sender: WebhookSender | None = None
+
+
+def get_webhook_sender() -> WebhookSender:
+    """Get singleton webhook sender instance."""
+    global _sender
+    if _sender is None:
+        _sender = WebhookSender()
+    return _sender
@@ -10,6 +10,9 @@ Usage:
     python -m claudeminder.sidecar get_config
     python -m claudeminder.sidecar set_config '{"language": "vi"}'
     python -m claudeminder.sidecar snooze 15
+    python -m claudeminder.sidecar get_heatmap
+    python -m claudeminder.sidecar get_top 5 project
+    python -m claudeminder.sidecar get_command_runs
 """
 
 from __future__ import annotations
@@ -17,6 +20,7 @@ from __future__ import annotations
 import asyncio
 import json
 import sys
+import time
 from datetime import datetime
 from typing import Any
 
@@ -25,7 +29,10 @@ from loguru import logger
 from .api.usage import RateLimitError, TokenExpiredError, clear_usage_cache, get_usage_async
 from .core.config_manager import AppConfig, load_config, save_config
 from .core.goals_tracker import get_goals_tracker
+from .core.token_index import get_token_index
+from .core.usage_heatmap import get_usage_heatmap
 from .scheduler import get_focus_mode_service, get_reminder_service
+from .scheduler.command_runner import recent_command_runs
 from .utils.credentials import is_token_available
 
 
@@ -39,6 +46,13 @@ def _json_response(data: dict[str, Any] | None = None, error: str | None = None)
     return json.dumps(response)
 
 
+def _timestamp(value: datetime | None) -> float | None:
+    """Unix timestamp for JSON, None if unset or unbounded."""
+    if value is None or value == datetime.max:
+        return None
+    return value.timestamp()
+
+
 async def get_usage() -> str:
     """Get current usage data as JSON."""
     try:
@@ -75,13 +89,17 @@ async def get_usage() -> str:
 
         # Add focus mode status
         focus_service = get_focus_mode_service()
+        focus_config = load_config().focus_mode
         current_usage = usage.five_hour.utilization if usage and usage.five_hour else 0
         result["focus_mode"] = {
             "is_snoozed": focus_service.is_snoozed(),
             "snooze_remaining": focus_service.get_snooze_remaining(),
-            "is_quiet_hours": focus_service.is_in_quiet_hours(),
-            "is_dnd": focus_service.is_dnd_by_usage(current_usage),
-            "notifications_suppressed": focus_service.should_suppress_notification(current_usage),
+            "is_quiet_hours": focus_service.is_in_quiet_hours(focus_config),
+            "is_dnd": focus_service.is_dnd_by_usage(current_usage, focus_config),
+            "notifications_suppressed": focus_service.should_suppress_notification(
+                current_usage, focus_config
+            ),
+            "suppressed_until": _timestamp(focus_service.suppressed_until(focus_config)),
         }
 
         return _json_response(result)
@@ -217,6 +235,40 @@ def check_reminders(usage_percent: float, reset_time_iso: str | None) -> str:
         return _json_response(error=str(e))
 
 
+def get_heatmap() -> str:
+    """Get the hour-of-week consumption heatmap (%/hour, Monday first)."""
+    try:
+        return _json_response({"heatmap": get_usage_heatmap().grid()})
+    except Exception as e:
+        logger.error(f"Sidecar get_heatmap error: {e}")
+        return _json_response(error=str(e))
+
+
+def get_top(hours: int = 5, by: str = "project", limit: int = 10) -> str:
+    """Get top token consumers over the last `hours` (0 = all time)."""
+    try:
+        since = time.time() - hours * 3600 if hours > 0 else None
+        rows = get_token_index().top(by=by, since=since, limit=limit)
+        return _json_response({
+            "by": by,
+            "hours": hours,
+            "top": [row._asdict() | {"total": row.total} for row in rows],
+        })
+    except Exception as e:
+        logger.error(f"Sidecar get_top error: {e}")
+        return _json_response(error=str(e))
+
+
+def get_command_runs() -> str:
+    """Get recent custom command runs, newest first."""
+    try:
+        runs = recent_command_runs()
+        return _json_response({"runs": [run._asdict() for run in reversed(runs)]})
+    except Exception as e:
+        logger.error(f"Sidecar get_command_runs error: {e}")
+        return _json_response(error=str(e))
+
+
 def main() -> None:
     """CLI entry point for sidecar."""
     if len(sys.argv) < 2:
@@ -258,6 +310,14 @@ def main() -> None:
                 usage = float(args[0])
                 reset_time = args[1] if len(args) > 1 else None
                 result = check_reminders(usage, reset_time)
+        elif action == "get_heatmap":
+            result = get_heatmap()
+        elif action == "get_top":
+            hours = int(args[0]) if args else 5
+            by = args[1] if len(args) > 1 else "project"
+            result = get_top(hours, by)
+        elif action == "get_command_runs":
+            result = get_command_runs()
         else:
             result = _json_response(error=f"Unknown action: {action}")
 
@@ -1,5 +1,12 @@
-"""Main TUI application using Textual."""
-from datetime import datetime
+"""Main TUI application using Textual.
+
+The first TUI (or daemon) holds the instance lock, polls the API and runs
+the services. A TUI started while a backend is running attaches to it as
+a client: it renders the updates pushed over the backend's socket and
+makes no API calls of its own.
+"""
+import asyncio
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 from filelock import SoftFileLock
@@ -7,17 +14,40 @@ from loguru import logger
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Vertical
-from textual.timer import Timer
-from textual.widgets import Footer, Header
+from textual.widgets import DataTable, Footer, Header
+from textual.worker import Worker
 
 from ..api.usage import UsageAPI
+from ..core.activity_watcher import ActivityWatcher
 from ..core.config_manager import load_config
-from ..core.goals_tracker import get_goals_tracker
+from ..core.event_bus import (
+    REMINDER_FIRED,
+    USAGE_SAMPLE,
+    OverflowPolicy,
+    ReminderFired,
+    Subscription,
+    UsageUpdate,
+    get_event_bus,
+)
 from ..core.instance_lock import acquire_instance_lock, release_instance_lock
-from ..i18n import get_string, set_language
-from ..models.usage import UsageResponse
-from ..scheduler import get_reminder_service
-from .widgets import GoalsIndicator, OfflineBanner, ResetCountdown, UsageDisplay
+from ..core.perf_metrics import get_perf_metrics, sample_loop_lag
+from ..core.update_socket import RECONNECT_SECONDS, UpdateClient, backend_available
+from ..core.usage_heatmap import get_usage_heatmap
+from ..core.usage_poller import UsagePoller
+from ..core.usage_series import get_usage_series
+from ..daemon import Daemon
+from ..i18n import get_language, get_string, set_language
+from ..models.settings import get_settings
+from .widgets import (
+    AccountsPanel,
+    DebugPanel,
+    GoalsIndicator,
+    HeatmapPanel,
+    HistoryPanel,
+    OfflineBanner,
+    ResetCountdown,
+    UsageDisplay,
+)
 
 if TYPE_CHECKING:
     pass
@@ -28,23 +58,38 @@ class ClaudiminderApp(App[None]):
 
     CSS_PATH = "styles.tcss"
 
+    # Focus goes to the accounts table only while it is shown
+    AUTO_FOCUS = None
+
     BINDINGS = [
         Binding("q", "quit", "Quit"),
         Binding("r", "refresh", "Refresh"),
         Binding("h", "help", "Help"),
         Binding("t", "toggle_format", "Toggle time format"),
+        Binding("m", "toggle_heatmap", "Heatmap"),
+        Binding("c", "toggle_chart", "Chart"),
+        Binding("a", "toggle_accounts", "Accounts"),
+        Binding("d", "toggle_debug", "Debug", show=False),
+        Binding("z", "cycle_zoom", "Zoom", show=False),
     ]
 
-    def __init__(self) -> None:
+    def __init__(self, client: bool = False, metrics_path: Path | None = None) -> None:
         super().__init__()
+        self._metrics_path = metrics_path
         self._lock: SoftFileLock | None = None
         self._usage_api: UsageAPI | None = None
-        self._poll_timer: Timer | None = None
+        self._poll_worker: Worker[None] | None = None
+        self._daemon: Daemon | None = None if client else Daemon()
+        self._services_worker: Worker[None] | None = None
+        self._client_worker: Worker[None] | None = None
+        self._lag_worker: Worker[None] | None = None
+        self._updates: Subscription | None = None
         self._last_error: str | None = None
 
-        # Load config and set language
-        config = load_config()
-        set_language(config.language)
+        # A client takes its language from the backend instead
+        if not client:
+            config = load_config()
+            set_language(config.language)
 
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
@@ -54,6 +99,10 @@ class ClaudiminderApp(App[None]):
                 UsageDisplay(id="usage-display"),
                 ResetCountdown(id="reset-countdown"),
                 GoalsIndicator(id="goals-indicator"),
+                HistoryPanel(id="history-panel"),
+                HeatmapPanel(id="heatmap-panel"),
+                AccountsPanel(id="accounts-panel"),
+                DebugPanel(id="debug-panel"),
                 id="main-content",
             ),
             id="app-container",
@@ -62,6 +111,19 @@ class ClaudiminderApp(App[None]):
 
     async def on_mount(self) -> None:
         """Called when app is mounted."""
+        # Loop lag is sampled only while someone looks at it
+        if self._metrics_path:
+            self._sample_loop_lag(True)
+
+        if self._daemon is None:
+            # Client mode
+            self._start_rendering()
+            self._client_worker = self.run_worker(
+                self._follow_backend(), name="backend-client", exclusive=True
+            )
+            logger.info("Claudiminder TUI attached to running backend")
+            return
+
         # Check single instance
         self._lock = acquire_instance_lock()
         if self._lock is None:
@@ -80,48 +142,89 @@ class ClaudiminderApp(App[None]):
             logger.error(f"Failed to initialize API: {e}")
             self._show_offline()
 
+        self._start_rendering()
+
+        # Reminders, notification delivery, scheduled commands and the
+        # update socket for client TUIs
+        self._daemon.start()
+        get_event_bus().on(REMINDER_FIRED, self._show_reminder)
+        self._services_worker = self.run_worker(
+            self._daemon.run_services(), name="services", group="services"
+        )
+
         # Initial fetch
         await self._fetch_usage()
 
-        # Start polling
-        config = load_config()
-        self._poll_timer = self.set_interval(
-            config.poll_interval_seconds,
+        # Start polling, slowing down while Claude Code is idle
+        poller = UsagePoller(
             self._fetch_usage,
+            ActivityWatcher(get_settings().claude_projects_path),
         )
+        self._poll_worker = self.run_worker(poller.run(), name="usage-poller", exclusive=True)
 
         logger.info("Claudiminder TUI started")
 
     async def on_unmount(self) -> None:
         """Called when app is unmounting."""
-        if self._poll_timer:
-            self._poll_timer.stop()
-        release_instance_lock()
+        if self._poll_worker:
+            self._poll_worker.cancel()
+        if self._services_worker:
+            self._services_worker.cancel()
+        if self._client_worker:
+            self._client_worker.cancel()
+        if self._updates:
+            self._updates.close()
+        if self._daemon:
+            get_event_bus().off(REMINDER_FIRED, self._show_reminder)
+            await self._daemon.stop()
+            release_instance_lock()
+        if self._metrics_path:
+            get_perf_metrics().dump(self._metrics_path)
         logger.info("Claudiminder TUI stopped")
 
+    def _start_rendering(self) -> None:
+        """Render derived state published on the event bus; only the latest
+        update matters if rendering falls behind.
+        """
+        self._updates = get_event_bus().subscribe(USAGE_SAMPLE, policy=OverflowPolicy.LATEST)
+        self.run_worker(self._render_updates(self._updates), name="render", group="render")
+
+    def _show_reminder(self, event: ReminderFired) -> None:
+        """Show a reminder fired by the hosted services as a toast."""
+        self.notify(event.message, title="Claudiminder", severity="warning", timeout=10)
+
+    async def _follow_backend(self) -> None:
+        """Republish updates pushed by the running backend, reconnecting as needed."""
+        client = UpdateClient()
+        bus = get_event_bus()
+        while True:
+            try:
+                hello = await client.connect()
+            except OSError:
+                self._show_offline()
+                await asyncio.sleep(RECONNECT_SECONDS)
+                continue
+            self._hide_offline()
+            language = hello.get("language")
+            if language and language != get_language():
+                set_language(language)
+                await self.recompose()
+            async for update in client.updates():
+                bus.publish(USAGE_SAMPLE, update)
+            logger.warning("Lost connection to backend")
+            self._show_offline()
+
     async def _fetch_usage(self) -> None:
         """Fetch usage data from API."""
-        if self._usage_api is None:
+        if self._usage_api is None or self._daemon is None:
             return
 
         try:
             usage_data = await self._usage_api.get_usage()
-            self._update_widgets(usage_data)
             self._hide_offline()
             self._last_error = None
 
-            # Check reminders
-            reminder_service = get_reminder_service()
-            reset_time = None
-            if usage_data.five_hour and usage_data.five_hour.resets_at:
-                reset_time = datetime.fromisoformat(
-                    usage_data.five_hour.resets_at.replace("Z", "+00:00")
-                )
-
-            reminder_service.check_and_trigger(
-                current_usage=usage_data.five_hour.utilization if usage_data.five_hour else 0,
-                reset_time=reset_time,
-            )
+            self._daemon.apply(usage_data)
 
         except Exception as e:
             error_msg = str(e)
@@ -131,15 +234,24 @@ class ClaudiminderApp(App[None]):
                 self._last_error = error_msg
             self._show_offline()
 
-    def _update_widgets(self, usage_data: UsageResponse) -> None:
+    async def _render_updates(self, updates: Subscription) -> None:
+        """Apply usage updates from the event bus to the widgets."""
+        async for update in updates:
+            try:
+                self._update_widgets(update)
+                self._update_history()
+                self._update_heatmap()
+            except Exception as e:
+                logger.error(f"Failed to render usage update: {e}")
+
+    def _update_widgets(self, update: UsageUpdate) -> None:
         """Update all widgets with new data."""
         usage_display = self.query_one("#usage-display", UsageDisplay)
         reset_countdown = self.query_one("#reset-countdown", ResetCountdown)
         goals_indicator = self.query_one("#goals-indicator", GoalsIndicator)
 
+        usage_data = update.usage
         if usage_data.five_hour:
-            five_hour = usage_data.five_hour.utilization
-
             # Get optional data
             seven_day = None
             extra = None
@@ -149,26 +261,28 @@ class ClaudiminderApp(App[None]):
                 extra = getattr(usage_data.extra_usage, 'utilization', None)
 
             usage_display.update_usage(
-                five_hour=five_hour,
+                five_hour=update.utilization,
                 seven_day=seven_day,
                 extra=extra,
             )
 
             # Update reset countdown
-            if usage_data.five_hour.resets_at:
-                reset_time = datetime.fromisoformat(
-                    usage_data.five_hour.resets_at.replace("Z", "+00:00")
-                )
-                reset_countdown.set_reset_time(reset_time)
+            if update.reset_time is not None:
+                reset_countdown.set_reset_time(update.reset_time)
 
             # Update goals
-            goals_indicator.update_usage(five_hour)
-            goals_tracker = get_goals_tracker()
-            if usage_data.five_hour.resets_at:
-                reset_time = datetime.fromisoformat(
-                    usage_data.five_hour.resets_at.replace("Z", "+00:00")
-                )
-                goals_tracker.set_reset_time(reset_time)
+            goals_indicator.update_status(update.utilization, update.pace, update.budget)
+
+    def _update_history(self) -> None:
+        """Refresh the history sparklines from the incrementally bucketed series."""
+        panel = self.query_one("#history-panel", HistoryPanel)
+        panel.update_series(get_usage_series())
+
+    def _update_heatmap(self) -> None:
+        """Refresh the heatmap panel from its precomputed grid, if shown."""
+        panel = self.query_one("#heatmap-panel", HeatmapPanel)
+        if panel.display:
+            panel.update_heatmap(get_usage_heatmap().grid())
 
     def _show_offline(self) -> None:
         """Show offline banner."""
@@ -197,7 +311,12 @@ class ClaudiminderApp(App[None]):
             f"{get_string('press_q_quit')}\n"
             f"{get_string('press_r_refresh')}\n"
             f"{get_string('press_h_help')}\n"
-            "t - Toggle time format"
+            "t - Toggle time format\n"
+            "m - Toggle heatmap\n"
+            "c - Toggle history chart\n"
+            "z - Zoom history chart\n"
+            "a - Toggle accounts (/ to filter, click a header to sort)\n"
+            "d - Toggle performance panel"
         )
         self.notify(help_text, timeout=5)
 
@@ -206,8 +325,56 @@ class ClaudiminderApp(App[None]):
         countdown = self.query_one("#reset-countdown", ResetCountdown)
         countdown.toggle_format()
 
+    def action_toggle_heatmap(self) -> None:
+        """Show or hide the hour-of-week heatmap."""
+        panel = self.query_one("#heatmap-panel", HeatmapPanel)
+        panel.display = not panel.display
+        self._update_heatmap()
+
+    def action_toggle_chart(self) -> None:
+        """Expand or collapse the usage history chart."""
+        self.query_one("#history-panel", HistoryPanel).toggle_chart()
+
+    def action_cycle_zoom(self) -> None:
+        """Cycle the history chart between last window, day and week."""
+        panel = self.query_one("#history-panel", HistoryPanel)
+        if not panel.expanded:
+            panel.toggle_chart()
+        else:
+            panel.cycle_zoom()
+
+    def action_toggle_accounts(self) -> None:
+        """Show or hide the multi-account table."""
+        panel = self.query_one("#accounts-panel", AccountsPanel)
+        panel.display = not panel.display
+        if panel.display:
+            panel.query_one(DataTable).focus()
+        else:
+            self.set_focus(None)
+
+    def action_toggle_debug(self) -> None:
+        """Show or hide the performance debug panel."""
+        panel = self.query_one("#debug-panel", DebugPanel)
+        panel.display = not panel.display
+        if not self._metrics_path:
+            self._sample_loop_lag(panel.display)
+
+    def _sample_loop_lag(self, enabled: bool) -> None:
+        """Start or stop the event-loop lag sampler."""
+        if enabled and self._lag_worker is None:
+            self._lag_worker = self.run_worker(
+                sample_loop_lag(get_perf_metrics()), name="loop-lag", group="metrics"
+            )
+        elif not enabled and self._lag_worker is not None:
+            self._lag_worker.cancel()
+            self._lag_worker = None
+
+
+def run_tui(metrics_path: Path | None = None) -> None:
+    """Run the TUI application, attaching to a running backend if there is one.
 
-def run_tui() -> None:
-    """Run the TUI application."""
-    app = ClaudiminderApp()
+    Args:
+        metrics_path: Write performance metrics as JSON here on exit
+    """
+    app = ClaudiminderApp(client=backend_available(), metrics_path=metrics_path)
     app.run()
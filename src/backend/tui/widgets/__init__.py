@@ -1,11 +1,19 @@
 """TUI widgets for Claudiminder."""
+from .accounts_panel import AccountsPanel
+from .debug_panel import DebugPanel
 from .goals_indicator import GoalsIndicator
+from .heatmap_panel import HeatmapPanel
+from .history_panel import HistoryPanel
 from .offline_banner import OfflineBanner
 from .reset_countdown import ResetCountdown
 from .usage_display import UsageDisplay
 
 __all__ = [
+    "AccountsPanel",
+    "DebugPanel",
     "GoalsIndicator",
+    "HeatmapPanel",
+    "HistoryPanel",
     "OfflineBanner",
     "ResetCountdown",
     "UsageDisplay",
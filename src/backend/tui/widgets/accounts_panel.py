@@ -0,0 +1,197 @@
+"""Multi-account usage table widget."""
+import math
+import time
+from typing import Any
+
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.containers import Vertical
+from textual.timer import Timer
+from textual.widgets import DataTable, Input
+
+from ...core.accounts import AccountMonitor, AccountState, AccountStatus
+from ...i18n import get_string
+
+COLUMNS = ("account", "utilization", "slope", "reset_in", "status")
+
+# How often account stores are checked while the panel is shown
+REFRESH_SECONDS = 10.0
+
+STATE_COLORS = {
+    AccountState.OK: "green",
+    AccountState.WARNING: "yellow",
+    AccountState.CRITICAL: "red bold",
+    AccountState.RESET: "cyan",
+    AccountState.STALE: "dim",
+}
+
+STATE_ORDER = list(STATE_COLORS)
+
+
+def _format_reset(resets_at: float, now: float) -> str:
+    if math.isnan(resets_at):
+        return "—"
+    minutes = max(0, int(resets_at - now) // 60)
+    return f"{minutes // 60}h {minutes % 60:02d}m"
+
+
+def _format_slope(slope: float) -> str:
+    return "—" if math.isnan(slope) else f"{slope:+.1f}%/h"
+
+
+class AccountsPanel(Vertical):
+    """Sortable, filterable table with one row per account.
+
+    Rows are keyed by account and only cells whose text changed are
+    updated, so a change to one account repaints one row. DataTable only
+    renders the visible rows, so hundreds of accounts stay cheap.
+    """
+
+    BINDINGS = [
+        Binding("/", "focus_filter", "Filter", show=False),
+        Binding("escape", "focus_table", "Table", show=False),
+    ]
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.border_title = get_string("accounts_title")
+        self._monitor = AccountMonitor()
+        self._cells: dict[str, tuple[str, ...]] = {}  # Shown rows
+        self._filter = ""
+        self._sort_column = "account"
+        self._sort_reverse = False
+        self._table: DataTable[str] | None = None
+        self._timer: Timer | None = None
+        self._state_labels = {state: get_string(f"account_{state.value}") for state in AccountState}
+
+    def compose(self) -> ComposeResult:
+        yield Input(placeholder=get_string("accounts_filter"), id="accounts-filter")
+        yield DataTable(id="accounts-table", cursor_type="row", zebra_stripes=True)
+
+    def on_mount(self) -> None:
+        table = self._table = self.query_one("#accounts-table", DataTable)
+        for column in COLUMNS:
+            table.add_column(get_string(f"accounts_{column}"), key=column)
+        # Started once the panel is shown
+        self._timer = self.set_interval(REFRESH_SECONDS, self.refresh_accounts, pause=True)
+
+    def on_show(self) -> None:
+        if self._timer:
+            self._timer.resume()
+        self.refresh_accounts()
+
+    def on_hide(self) -> None:
+        if self._timer:
+            self._timer.pause()
+
+    def on_unmount(self) -> None:
+        if self._timer:
+            self._timer.stop()
+
+    def _row(self, status: AccountStatus, now: float) -> tuple[str, ...]:
+        state = status.state(now)
+        return (
+            status.account,
+            "—" if math.isnan(status.utilization) else f"{status.utilization:.1f}%",
+            _format_slope(status.slope),
+            _format_reset(status.resets_at, now),
+            f"[{STATE_COLORS[state]}]{self._state_labels[state]}[/]",
+        )
+
+    def _matches(self, status: AccountStatus, now: float) -> bool:
+        if not self._filter:
+            return True
+        return (
+            self._filter in status.account.lower()
+            or self._filter in self._state_labels[status.state(now)].lower()
+        )
+
+    def refresh_accounts(self, now: float | None = None) -> None:
+        """Pick up account changes and update the rows whose text changed."""
+        self._monitor.refresh()
+        self._sync_rows(time.time() if now is None else now)
+
+    def _sync_rows(self, now: float) -> None:
+        table = self._table
+        if table is None:
+            return
+        statuses = self._monitor.statuses
+        resort = False
+        for account in [a for a in self._cells if a not in statuses]:
+            table.remove_row(account)
+            del self._cells[account]
+        for account, status in statuses.items():
+            shown = self._cells.get(account)
+            if not self._matches(status, now):
+                if shown is not None:
+                    table.remove_row(account)
+                    del self._cells[account]
+                continue
+            cells = self._row(status, now)
+            if shown is None:
+                table.add_row(*cells, key=account)
+                resort = True
+            elif cells != shown:
+                for column, old, new in zip(COLUMNS, shown, cells, strict=True):
+                    if old != new:
+                        table.update_cell(account, column, new)
+                        resort = resort or column == self._sort_column
+            self._cells[account] = cells
+        if resort:
+            self._sort(now)
+
+    def _sort_key(self, account: str, now: float) -> tuple[bool, Any]:
+        """Sort value of an account for the current column; unknowns sort after known.
+
+        The unknown flag is flipped when sorting in reverse, so unknowns stay
+        at the bottom either way.
+        """
+        status = self._monitor.statuses[account]
+        if self._sort_column == "account":
+            return (False, account.lower())
+        if self._sort_column == "status":
+            return (False, STATE_ORDER.index(status.state(now)))
+        value: float = {
+            "utilization": status.utilization,
+            "slope": status.slope,
+            "reset_in": status.resets_at,
+        }[self._sort_column]
+        return (math.isnan(value) != self._sort_reverse, value)
+
+    def _sort(self, now: float | None = None) -> None:
+        if self._table is None:
+            return
+        now = time.time() if now is None else now
+        self._table.sort(
+            "account",
+            key=lambda account: self._sort_key(account, now),
+            reverse=self._sort_reverse,
+        )
+
+    def sort_by(self, column: str) -> None:
+        """Sort by a column, reversing the order if it is already sorted by it."""
+        if column == self._sort_column:
+            self._sort_reverse = not self._sort_reverse
+        else:
+            self._sort_column = column
+            self._sort_reverse = False
+        self._sort()
+
+    def set_filter(self, text: str) -> None:
+        """Show only accounts whose name or state contains `text`."""
+        self._filter = text.strip().lower()
+        self._sync_rows(time.time())
+
+    def action_focus_filter(self) -> None:
+        self.query_one("#accounts-filter", Input).focus()
+
+    def action_focus_table(self) -> None:
+        if self._table is not None:
+            self._table.focus()
+
+    def on_data_table_header_selected(self, event: DataTable.HeaderSelected) -> None:
+        if event.column_key.value is not None:
+            self.sort_by(event.column_key.value)
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        self.set_filter(event.value)
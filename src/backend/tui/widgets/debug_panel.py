@@ -0,0 +1,88 @@
+"""Performance debug panel widget."""
+import asyncio
+from typing import Any
+
+from textual.app import ComposeResult
+from textual.timer import Timer
+from textual.widgets import Static
+
+from ...core.perf_metrics import PerfMetrics, get_perf_metrics
+from ...i18n import get_string
+from .markup_static import MarkupStatic
+
+# How often the panel redraws while shown
+REFRESH_SECONDS = 1.0
+
+
+def _duration_row(label: str, summary: dict[str, float]) -> str:
+    if not summary.get("count"):
+        return f"{label:<24}[dim]—[/]"
+    return (
+        f"{label:<24}{summary['last_ms']:>8.2f} ms  "
+        f"[dim]p95[/] {summary['p95_ms']:.2f}  [dim]max[/] {summary['max_ms']:.2f}  "
+        f"[dim]n={summary['count']:.0f}[/]"
+    )
+
+
+class DebugPanel(Static):
+    """Event-loop lag, fetch latency, render and notification timings,
+    cache hit rate and timer counts.
+    """
+
+    def __init__(self, metrics: PerfMetrics | None = None, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.border_title = get_string("debug_title")
+        self._metrics = metrics or get_perf_metrics()
+        self._timer: Timer | None = None
+        self._content: MarkupStatic | None = None
+
+    def compose(self) -> ComposeResult:
+        yield MarkupStatic(id="debug-content")
+
+    def on_mount(self) -> None:
+        self._content = self.query_one("#debug-content", MarkupStatic)
+        # Started once the panel is shown
+        self._timer = self.set_interval(REFRESH_SECONDS, self._update_display, pause=True)
+
+    def on_show(self) -> None:
+        if self._timer:
+            self._timer.resume()
+        self._update_display()
+
+    def on_hide(self) -> None:
+        if self._timer:
+            self._timer.pause()
+
+    def on_unmount(self) -> None:
+        if self._timer:
+            self._timer.stop()
+
+    def _timer_count(self) -> int:
+        """Refresh timers registered by the app's widgets."""
+        return sum(
+            isinstance(getattr(node, "_timer", None), Timer)
+            for node in self.app.walk_children(with_self=False)
+        )
+
+    def _update_display(self) -> None:
+        if self._content is not None:
+            self._content.set_markup(self._render_metrics())
+
+    def _render_metrics(self) -> str:
+        snapshot = self._metrics.snapshot()
+        durations = snapshot["durations"]
+        lines = [
+            _duration_row(get_string("debug_loop_lag"), durations.get("loop_lag", {})),
+            _duration_row(get_string("debug_fetch"), durations.get("fetch", {})),
+        ]
+        hit_rate = self._metrics.hit_rate("usage_cache")
+        hit_text = "—" if hit_rate is None else f"{hit_rate:.0%}"
+        lines.append(f"{get_string('debug_cache_hit_rate'):<24}{hit_text:>8}")
+        lines.append(
+            f"{get_string('debug_timers'):<24}{self._timer_count():>8}  "
+            f"[dim]tasks[/] {len(asyncio.all_tasks())}"
+        )
+        for name, summary in durations.items():
+            if name.startswith(("render.", "notify.")):
+                lines.append(_duration_row(name, summary))
+        return "\n".join(lines)
@@ -5,8 +5,9 @@ from textual.app import ComposeResult
 from textual.reactive import reactive
 from textual.widgets import Static
 
-from ...core.goals_tracker import get_goals_tracker
+from ...core.goals_tracker import PaceStatus, get_goals_tracker
 from ...i18n import get_string
+from .markup_static import MarkupStatic
 
 
 class GoalsIndicator(Static):
@@ -18,11 +19,15 @@ class GoalsIndicator(Static):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
         self.border_title = get_string("daily_goal")
+        self._pace: PaceStatus | None = None
+        self._budget: tuple[float, float, bool] | None = None
+        self._content: MarkupStatic | None = None
 
     def compose(self) -> ComposeResult:
-        yield Static(id="goals-content")
+        yield MarkupStatic(id="goals-content")
 
     def on_mount(self) -> None:
+        self._content = self.query_one("#goals-content", MarkupStatic)
         self._update_display()
 
     def watch_current_usage(self, _value: float) -> None:
@@ -33,15 +38,16 @@ class GoalsIndicator(Static):
 
     def _update_display(self) -> None:
         """Update the goals display."""
-        try:
-            content = self.query_one("#goals-content", Static)
-        except Exception:
+        content = self._content
+        if content is None:
             return
 
-        tracker = get_goals_tracker()
-
-        pace = tracker.calculate_pace(self.current_usage)
-        used, budget, exceeded = tracker.get_budget_status(self.current_usage)
+        pace, status = self._pace, self._budget
+        if pace is None or status is None:
+            tracker = get_goals_tracker()
+            pace = tracker.calculate_pace(self.current_usage)
+            status = tracker.get_budget_status(self.current_usage)
+        used, budget, exceeded = status
 
         if not pace.message:
             # Goals not enabled
@@ -70,8 +76,22 @@ class GoalsIndicator(Static):
         # Expected vs actual
         lines.append(f"[dim]{pace.message}[/]")
 
-        content.update("\n".join(lines))
+        content.set_markup("\n".join(lines))
 
     def update_usage(self, usage: float) -> None:
         """Update current usage for pace calculation."""
+        self._pace = self._budget = None
         self.current_usage = usage
+
+    def update_status(
+        self,
+        usage: float,
+        pace: PaceStatus | None,
+        budget: tuple[float, float, bool] | None,
+    ) -> None:
+        """Show pace and budget already computed for this usage."""
+        self._pace, self._budget = pace, budget
+        if usage == self.current_usage:
+            self._update_display()
+        else:
+            self.current_usage = usage
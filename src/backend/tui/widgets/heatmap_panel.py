@@ -0,0 +1,56 @@
+"""Hour-of-week usage heatmap widget."""
+from typing import Any
+
+from textual.app import ComposeResult
+from textual.widgets import Static
+
+from ...i18n import get_string
+from .markup_static import MarkupStatic
+
+SHADES = "░▒▓█"
+
+
+class HeatmapPanel(Static):
+    """Display average consumption rate per weekday and hour."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.border_title = get_string("heatmap_title")
+        self._grid: list[list[float | None]] = []
+        self._content: MarkupStatic | None = None
+
+    def compose(self) -> ComposeResult:
+        yield MarkupStatic(get_string("loading"), id="heatmap-content")
+
+    def on_mount(self) -> None:
+        self._content = self.query_one("#heatmap-content", MarkupStatic)
+
+    def update_heatmap(self, grid: list[list[float | None]]) -> None:
+        """Render a precomputed 7x24 grid of %/hour rates."""
+        if grid == self._grid:
+            return
+        self._grid = grid
+        if self._content is not None:
+            self._content.set_markup(self._render_grid())
+
+    def _render_grid(self) -> str:
+        """Render the grid as shaded cells, one row per weekday."""
+        rates = [r for row in self._grid for r in row if r is not None]
+        peak = max(rates, default=0.0)
+        days = get_string("heatmap_days").split()
+
+        lines = ["    " + "".join(f"{h:<6}" for h in range(0, 24, 6))]
+        for label, row in zip(days, self._grid, strict=False):
+            cells = []
+            for rate in row:
+                if rate is None:
+                    cells.append("[dim]·[/]")
+                elif peak <= 0 or rate <= 0:
+                    cells.append("[green] [/]")
+                else:
+                    level = min(len(SHADES) - 1, int(rate / peak * len(SHADES)))
+                    color = "red" if level == len(SHADES) - 1 else "yellow" if level >= 2 else "green"
+                    cells.append(f"[{color}]{SHADES[level]}[/]")
+            lines.append(f"{label:<4}" + "".join(cells))
+        lines.append(f"[dim]{get_string('heatmap_peak', rate=f'{peak:.1f}')}[/]")
+        return "\n".join(lines)
@@ -0,0 +1,107 @@
+"""Usage history sparklines and chart widget."""
+import math
+from typing import Any
+
+from textual.app import ComposeResult
+from textual.widgets import Static
+
+from ...core.usage_series import UsageSeries, Zoom
+from ...i18n import get_string
+from .markup_static import MarkupStatic
+
+BLOCKS = " ▁▂▃▄▅▆▇█"
+
+# Rows of the expanded chart
+CHART_HEIGHT = 8
+
+ZOOM_ORDER = list(Zoom)
+
+
+def _color(percent: float) -> str:
+    if percent >= 90:
+        return "red"
+    if percent >= 75:
+        return "yellow"
+    return "green"
+
+
+def sparkline(values: list[float]) -> str:
+    """One block character per value on a 0-100% scale; gaps are blank."""
+    levels = len(BLOCKS) - 1
+    return "".join(
+        " " if math.isnan(value) else BLOCKS[max(1, round(min(value, 100) / 100 * levels))]
+        for value in values
+    )
+
+
+def chart(values: list[float], height: int = CHART_HEIGHT) -> list[str]:
+    """Bar chart rows on a 0-100% scale, top row first."""
+    eighths = len(BLOCKS) - 1
+    filled = [
+        0 if math.isnan(value) else max(1, round(min(value, 100) / 100 * height * eighths))
+        for value in values
+    ]
+    rows = []
+    for row in range(height - 1, -1, -1):
+        base = row * eighths
+        rows.append("".join(BLOCKS[min(eighths, max(0, fill - base))] for fill in filled))
+    return rows
+
+
+class HistoryPanel(Static):
+    """Sparklines of 5-hour and 7-day usage, with an expandable zoomable chart."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.border_title = get_string("history_title")
+        self.expanded = False
+        self.zoom = Zoom.WINDOW
+        self._series: UsageSeries | None = None
+        self._content: MarkupStatic | None = None
+
+    def compose(self) -> ComposeResult:
+        yield MarkupStatic(get_string("loading"), id="history-content")
+
+    def on_mount(self) -> None:
+        self._content = self.query_one("#history-content", MarkupStatic)
+
+    def update_series(self, series: UsageSeries) -> None:
+        """Redraw from bucketed series; cost depends only on the bucket count."""
+        self._series = series
+        self._update_display()
+
+    def toggle_chart(self) -> None:
+        """Show or hide the chart."""
+        self.expanded = not self.expanded
+        self._update_display()
+
+    def cycle_zoom(self) -> None:
+        """Switch the chart to the next time range."""
+        self.zoom = ZOOM_ORDER[(ZOOM_ORDER.index(self.zoom) + 1) % len(ZOOM_ORDER)]
+        self._update_display()
+
+    def _update_display(self) -> None:
+        if self._content is None or self._series is None:
+            return
+        self._content.set_markup(self._render_series(self._series))
+
+    def _render_series(self, series: UsageSeries) -> str:
+        five_hour = series.five_hour[Zoom.WINDOW].values()
+        lines = [
+            self._sparkline_row(get_string("history_five_hour"), five_hour),
+            self._sparkline_row(get_string("history_seven_day"), series.seven_day.values()),
+        ]
+        if self.expanded:
+            values = series.five_hour[self.zoom].values()
+            latest = next((v for v in reversed(values) if not math.isnan(v)), 0.0)
+            lines.append("")
+            lines.extend(f"[{_color(latest)}]{row}[/]" for row in chart(values))
+            lines.append(f"[dim]{get_string(f'history_zoom_{self.zoom.value}')}[/]")
+        return "\n".join(lines)
+
+    @staticmethod
+    def _sparkline_row(label: str, values: list[float]) -> str:
+        latest = next((v for v in reversed(values) if not math.isnan(v)), None)
+        if latest is None:
+            return f"{label:<4}[dim]{sparkline(values)}[/]"
+        return f"{label:<4}[{_color(latest)}]{sparkline(values)}[/] {latest:.0f}%"
@@ -0,0 +1,41 @@
+"""Static text that only re-renders when its markup changes."""
+import time
+from typing import Any
+
+from textual.geometry import Region
+from textual.strip import Strip
+from textual.widgets import Static
+
+from ...core.perf_metrics import get_perf_metrics
+
+
+class MarkupStatic(Static):
+    """Static whose set_markup() skips the update when nothing changed.
+
+    Every update() re-parses the markup, relayouts and repaints, which is
+    wasted work (and SSH bandwidth) for per-second widgets whose text is
+    often the same as last time.
+    """
+
+    def __init__(self, markup: str = "", **kwargs: Any) -> None:
+        super().__init__(markup, **kwargs)
+        self._last_markup = markup
+
+    def set_markup(self, markup: str) -> bool:
+        """Show `markup`.
+
+        Returns:
+            True if it differed from what was shown
+        """
+        if markup == self._last_markup:
+            return False
+        self._last_markup = markup
+        self.update(markup)
+        return True
+
+    def render_lines(self, crop: Region) -> list[Strip]:
+        """Render, recording the time taken as ``render.<id>``."""
+        start = time.perf_counter_ns()
+        lines = super().render_lines(crop)
+        get_perf_metrics().record(f"render.{self.id}", time.perf_counter_ns() - start)
+        return lines
@@ -10,10 +10,15 @@ from textual.timer import Timer
 from textual.widgets import Static
 
 from ...i18n import get_string
+from .markup_static import MarkupStatic
 
 
 class ResetCountdown(Static):
-    """Display countdown to next reset."""
+    """Display countdown to next reset.
+
+    Ticks once a second while shown; the timer is paused while the widget
+    is hidden, and unchanged text is not re-rendered.
+    """
 
     reset_time: reactive[datetime | None] = reactive(None)
     show_human_readable: reactive[bool] = reactive(True)
@@ -22,17 +27,38 @@ class ResetCountdown(Static):
         super().__init__(**kwargs)
         self.border_title = get_string("reset_in")
         self._timer: Timer | None = None
+        self._content: MarkupStatic | None = None
+        self._labels = {
+            key: get_string(key)
+            for key in ("loading", "reset_complete", "hours", "minutes", "seconds")
+        }
 
     def compose(self) -> ComposeResult:
-        yield Static(get_string("loading"), id="countdown-text")
+        yield MarkupStatic(self._labels["loading"], id="countdown-text")
 
     def on_mount(self) -> None:
         """Start the countdown timer."""
+        self._content = self.query_one("#countdown-text", MarkupStatic)
         self._timer = self.set_interval(1.0, self._update_countdown)
+        self._update_countdown()
+
+    def on_show(self) -> None:
+        """Resume ticking and catch up at once."""
+        if self._timer:
+            self._timer.resume()
+        self._update_countdown()
+
+    def on_hide(self) -> None:
+        """Stop ticking while nothing is shown."""
+        if self._timer:
+            self._timer.pause()
 
     def watch_reset_time(self, _value: datetime | None) -> None:
         self._update_countdown()
 
+    def watch_show_human_readable(self, _value: bool) -> None:
+        self._update_countdown()
+
     def on_unmount(self) -> None:
         """Stop the countdown timer."""
         if self._timer:
@@ -40,19 +66,18 @@ class ResetCountdown(Static):
 
     def _update_countdown(self) -> None:
         """Update countdown display."""
-        try:
-            content = self.query_one("#countdown-text", Static)
-        except Exception:
-            return
+        if self._content is not None:
+            self._content.set_markup(self._markup())
 
+    def _markup(self) -> str:
+        """Countdown text for the current second."""
+        labels = self._labels
         if self.reset_time is None:
-            content.update(get_string("loading"))
-            return
+            return labels["loading"]
 
-        now = datetime.now()
+        now = datetime.now(self.reset_time.tzinfo)
         if now >= self.reset_time:
-            content.update(f"[bold green]{get_string('reset_complete')}[/]")
-            return
+            return f"[bold green]{labels['reset_complete']}[/]"
 
         delta = self.reset_time - now
         total_seconds = int(delta.total_seconds())
@@ -63,10 +88,10 @@ class ResetCountdown(Static):
         if self.show_human_readable:
             parts = []
             if hours > 0:
-                parts.append(f"{hours} {get_string('hours')}")
+                parts.append(f"{hours} {labels['hours']}")
             if minutes > 0:
-                parts.append(f"{minutes} {get_string('minutes')}")
-            parts.append(f"{seconds} {get_string('seconds')}")
+                parts.append(f"{minutes} {labels['minutes']}")
+            parts.append(f"{seconds} {labels['seconds']}")
             time_str = ", ".join(parts)
         else:
             time_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
@@ -79,7 +104,7 @@ class ResetCountdown(Static):
         else:
             color = "cyan"
 
-        content.update(f"[{color}]{time_str}[/]")
+        return f"[{color}]{time_str}[/]"
 
     def toggle_format(self) -> None:
         """Toggle between HH:MM:SS and human readable."""
@@ -6,6 +6,7 @@ from textual.reactive import reactive
 from textual.widgets import Static
 
 from ...i18n import get_string
+from .markup_static import MarkupStatic
 
 
 class UsageDisplay(Static):
@@ -18,48 +19,58 @@ class UsageDisplay(Static):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
         self.border_title = get_string("usage_title")
+        self._labels = {
+            key: get_string(key) for key in ("five_hour_usage", "seven_day_usage", "extra_usage")
+        }
+        self._content: MarkupStatic | None = None
+        self._render_pending = False
 
     def compose(self) -> ComposeResult:
-        yield Static(id="usage-content")
+        yield MarkupStatic(id="usage-content")
 
     def watch_five_hour_usage(self, _value: float) -> None:
-        self._update_display()
+        self._schedule_display()
 
     def watch_seven_day_usage(self, _value: float | None) -> None:
-        self._update_display()
+        self._schedule_display()
 
     def watch_extra_usage(self, _value: float | None) -> None:
-        self._update_display()
+        self._schedule_display()
 
     def on_mount(self) -> None:
+        self._content = self.query_one("#usage-content", MarkupStatic)
         self._update_display()
 
+    def _schedule_display(self) -> None:
+        """Render once after the current batch of reactive changes."""
+        if self._render_pending or self._content is None:
+            return
+        self._render_pending = True
+        self.call_later(self._update_display)
+
     def _update_display(self) -> None:
         """Update the display content."""
-        try:
-            content = self.query_one("#usage-content", Static)
-        except Exception:
+        self._render_pending = False
+        if self._content is None:
             return
 
+        labels = self._labels
         lines = []
 
         # 5-hour usage (main metric)
-        five_h = get_string("five_hour_usage")
-        lines.append(f"[bold cyan]{five_h}:[/] {self.five_hour_usage:.1f}%")
+        lines.append(f"[bold cyan]{labels['five_hour_usage']}:[/] {self.five_hour_usage:.1f}%")
         lines.append(self._progress_bar(self.five_hour_usage))
 
         # 7-day usage
         if self.seven_day_usage is not None:
-            seven_d = get_string("seven_day_usage")
-            lines.append(f"\n[cyan]{seven_d}:[/] {self.seven_day_usage:.1f}%")
+            lines.append(f"\n[cyan]{labels['seven_day_usage']}:[/] {self.seven_day_usage:.1f}%")
             lines.append(self._progress_bar(self.seven_day_usage))
 
         # Extra usage
         if self.extra_usage is not None and self.extra_usage > 0:
-            extra = get_string("extra_usage")
-            lines.append(f"\n[yellow]{extra}:[/] {self.extra_usage:.1f}%")
+            lines.append(f"\n[yellow]{labels['extra_usage']}:[/] {self.extra_usage:.1f}%")
 
-        content.update("\n".join(lines))
+        self._content.set_markup("\n".join(lines))
 
     def _progress_bar(self, percent: float, width: int = 30) -> str:
         """Create ASCII progress bar."""
@@ -88,6 +88,49 @@ def reset_caches():
     clear_credentials_cache()
 
 
+@pytest.fixture(autouse=True)
+def isolated_history(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep usage history, state and transcripts out of the real home directory."""
+    from backend.core import state_store, token_index, usage_heatmap, usage_history, usage_series
+    from backend.models.settings import AppSettings
+
+    history_dir = tmp_path / "history"
+    monkeypatch.setattr(usage_history, "HISTORY_DIR", history_dir)
+    monkeypatch.setattr(state_store, "STATE_FILE", tmp_path / "state.json")
+    monkeypatch.setattr(
+        token_index,
+        "get_settings",
+        lambda: AppSettings(claude_projects_path=tmp_path / "projects"),
+    )
+    usage_history.clear_history_cache()
+    usage_heatmap.clear_heatmap_cache()
+    usage_series.clear_series_cache()
+    token_index.clear_token_index_cache()
+    state_store.clear_state_store_cache()
+    yield history_dir
+    usage_history.clear_history_cache()
+    usage_heatmap.clear_heatmap_cache()
+    usage_series.clear_series_cache()
+    token_index.clear_token_index_cache()
+    state_store.clear_state_store_cache()
+
+
+@pytest.fixture(autouse=True)
+def isolated_event_bus(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Give each test its own event bus."""
+    from backend.core import event_bus
+
+    monkeypatch.setattr(event_bus, "_bus", None)
+
+
+@pytest.fixture(autouse=True)
+def isolated_perf_metrics(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Give each test its own performance metrics."""
+    from backend.core import perf_metrics
+
+    monkeypatch.setattr(perf_metrics, "_metrics", None)
+
+
 @pytest.fixture
 def mock_settings(tmp_path: Path):
     """Mock settings with test values."""
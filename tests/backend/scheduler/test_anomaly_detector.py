@@ -0,0 +1,117 @@
+"""Tests for streaming anomaly detector."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from backend.core.config_manager import AppConfig, ReminderConfig
+from backend.scheduler.anomaly_detector import AnomalyDetector
+from backend.scheduler.reminder_service import ReminderService, ReminderType
+
+
+@pytest.fixture
+def config() -> ReminderConfig:
+    """Detector config with a short warmup."""
+    return ReminderConfig(anomaly_warmup_samples=3, anomaly_min_rate=1.0, anomaly_z_threshold=4.0)
+
+
+def _feed_steady(detector: AnomalyDetector, config: ReminderConfig, minutes: int) -> float:
+    """Feed a steady 0.2%/min baseline, returning the last utilization."""
+    utilization = 0.0
+    for minute in range(minutes):
+        utilization = minute * 0.2
+        assert detector.update(utilization, minute * 60.0, config) is None
+    return utilization
+
+
+class TestAnomalyDetector:
+    """Tests for AnomalyDetector."""
+
+    def test_first_sample_never_fires(self, config: ReminderConfig):
+        """Test the first sample only seeds the state."""
+        detector = AnomalyDetector()
+        assert detector.update(90.0, 0.0, config) is None
+
+    def test_detects_spike(self, config: ReminderConfig):
+        """Test a burst far above the baseline fires with its rate."""
+        detector = AnomalyDetector()
+        last = _feed_steady(detector, config, 10)
+
+        rate = detector.update(last + 10.0, 10 * 60.0, config)
+
+        assert rate == pytest.approx(10.0)
+
+    def test_edge_triggered(self, config: ReminderConfig):
+        """Test a sustained spike fires only once."""
+        detector = AnomalyDetector()
+        last = _feed_steady(detector, config, 10)
+
+        assert detector.update(last + 10.0, 600.0, config) is not None
+        assert detector.update(last + 20.0, 660.0, config) is None
+
+    def test_no_fire_during_warmup(self, config: ReminderConfig):
+        """Test spikes before warmup completes are ignored."""
+        detector = AnomalyDetector()
+        detector.update(0.0, 0.0, config)
+        assert detector.update(30.0, 60.0, config) is None
+
+    def test_below_min_rate_ignored(self, config: ReminderConfig):
+        """Test spikes under the absolute rate floor are ignored."""
+        detector = AnomalyDetector()
+        last = _feed_steady(detector, config, 10)
+        assert detector.update(last + 0.8, 600.0, config) is None
+
+    def test_window_reset_ignored(self, config: ReminderConfig):
+        """Test a utilization drop is treated as a reset, not a spike."""
+        detector = AnomalyDetector()
+        _feed_steady(detector, config, 10)
+        assert detector.update(0.0, 600.0, config) is None
+
+    def test_duplicate_samples_ignored(self, config: ReminderConfig):
+        """Test samples within the minimum interval are skipped."""
+        detector = AnomalyDetector()
+        last = _feed_steady(detector, config, 10)
+        assert detector.update(last + 10.0, 540.5, config) is None
+
+    def test_accounts_are_independent(self, config: ReminderConfig):
+        """Test per-account state isolation."""
+        detector = AnomalyDetector()
+        last = _feed_steady(detector, config, 10)
+        detector.update(0.0, 0.0, config, account="other")
+
+        assert detector.update(last + 10.0, 600.0, config, account="other") is None
+        assert detector.update(last + 10.0, 600.0, config) is not None
+
+    def test_reset(self, config: ReminderConfig):
+        """Test reset clears state."""
+        detector = AnomalyDetector()
+        last = _feed_steady(detector, config, 10)
+        detector.reset()
+        assert detector.update(last + 10.0, 600.0, config) is None
+
+
+class TestReminderServiceAnomaly:
+    """Tests for anomaly reminders through ReminderService."""
+
+    def test_emits_anomaly_reminder(self):
+        """Test ReminderService emits ReminderType.ANOMALY with the rate."""
+        config = AppConfig(
+            reminder=ReminderConfig(percentage_thresholds=[], anomaly_warmup_samples=3)
+        )
+        service = ReminderService()
+        clock = iter(float(minute * 60) for minute in range(20))
+
+        with patch("backend.scheduler.reminder_service.load_config", return_value=config), \
+                patch("backend.scheduler.reminder_service.get_focus_mode_service") as mock_focus, \
+                patch("backend.scheduler.reminder_service.send_notification_sync"), \
+                patch("backend.scheduler.reminder_service.time.time", side_effect=lambda: next(clock)):
+            mock_focus.return_value = MagicMock(should_suppress_notification=MagicMock(return_value=False))
+            for minute in range(10):
+                assert service.check_and_trigger(minute * 0.2, None) == []
+
+            result = service.check_and_trigger(15.0, None)
+
+        assert [t for t, _ in result] == [ReminderType.ANOMALY]
+        assert "per minute" in result[0][1]
@@ -0,0 +1,144 @@
+"""Tests for notification channel plugins."""
+
+import sys
+import threading
+from importlib.metadata import EntryPoint
+from pathlib import Path
+
+import pytest
+
+from backend.core.config_manager import AppConfig, ReminderConfig
+from backend.scheduler import channels
+from backend.scheduler.channels import (
+    BUILTIN_CHANNELS,
+    ENTRY_POINT_GROUP,
+    ChannelCapabilities,
+    ChannelRegistry,
+    get_channel_options,
+)
+
+PLUGIN_SOURCE = '''
+import threading
+
+from backend.scheduler.channels import ChannelCapabilities, NotificationPlugin
+
+sent = []
+
+
+class AsyncChannel(NotificationPlugin):
+    async def send(self, title, body):
+        sent.append((title, body))
+        return True
+
+
+class SyncChannel(NotificationPlugin):
+    capabilities = ChannelCapabilities(is_async=False)
+
+    def send(self, title, body):
+        sent.append(threading.current_thread().name)
+        return True
+
+
+class UndeclaredSyncChannel(NotificationPlugin):
+    def send(self, title, body):
+        sent.append(body)
+        return True
+
+
+class NotAPlugin:
+    pass
+'''
+
+
+@pytest.fixture
+def plugin_module(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> str:
+    """An importable plugin module, registered under the entry-point group."""
+    name = f"fake_channels_{tmp_path.name}"
+    (tmp_path / f"{name}.py").write_text(PLUGIN_SOURCE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    installed = [
+        EntryPoint("fast", f"{name}:AsyncChannel", ENTRY_POINT_GROUP),
+        EntryPoint("slow", f"{name}:SyncChannel", ENTRY_POINT_GROUP),
+        EntryPoint("plain", f"{name}:UndeclaredSyncChannel", ENTRY_POINT_GROUP),
+        EntryPoint("broken", f"{name}:NotAPlugin", ENTRY_POINT_GROUP),
+        EntryPoint("bell", f"{name}:AsyncChannel", ENTRY_POINT_GROUP),
+    ]
+    monkeypatch.setattr(
+        channels, "entry_points", lambda group: installed if group == ENTRY_POINT_GROUP else [],
+    )
+    yield name
+    sys.modules.pop(name, None)
+
+
+class TestChannelRegistry:
+    """Tests for ChannelRegistry."""
+
+    def test_registers_without_importing(self, plugin_module: str):
+        """Test discovery only records names."""
+        registry = ChannelRegistry()
+        names = registry.names()
+
+        assert set(BUILTIN_CHANNELS) | {"fast", "slow", "plain", "broken"} == set(names)
+        assert plugin_module not in sys.modules
+        assert not registry.is_loaded("fast")
+
+    async def test_imports_on_first_use(self, plugin_module: str):
+        """Test a plugin is imported and instantiated once, when used."""
+        registry = ChannelRegistry()
+
+        assert await registry.send("fast", "Title", "Body")
+        plugin = registry.get("fast")
+
+        assert plugin_module in sys.modules
+        assert registry.get("fast") is plugin
+        assert plugin.capabilities.is_async
+        assert sys.modules[plugin_module].sent == [("Title", "Body")]
+
+    async def test_sync_plugin_runs_in_thread(self, plugin_module: str):
+        """Test synchronous plugins don't block the event loop."""
+        registry = ChannelRegistry()
+        assert await registry.send("slow", "Title", "Body")
+        assert sys.modules[plugin_module].sent != [threading.current_thread().name]
+
+    async def test_sync_result_without_declaration(self, plugin_module: str):
+        """Test a plugin returning its result directly still reports it."""
+        assert await ChannelRegistry().send("plain", "Title", "Body")
+        assert sys.modules[plugin_module].sent == ["Body"]
+
+    @pytest.mark.usefixtures("plugin_module")
+    def test_capabilities(self):
+        """Test capabilities come from the plugin, with defaults for broken ones."""
+        registry = ChannelRegistry()
+        webhook = registry.capabilities("webhook")
+        assert webhook.batching and webhook.rich_content
+        assert not registry.capabilities("slow").is_async
+        assert registry.capabilities("broken") == ChannelCapabilities()
+        assert registry.capabilities("missing") == ChannelCapabilities()
+
+    @pytest.mark.usefixtures("plugin_module")
+    def test_builtin_names_cannot_be_replaced(self):
+        """Test a plugin can't take over a built-in channel."""
+        plugin = ChannelRegistry().get("bell")
+        assert type(plugin).__module__ == "backend.scheduler.builtin_channels"
+
+    @pytest.mark.usefixtures("plugin_module")
+    def test_rejects_non_plugins(self):
+        """Test an entry point must produce a NotificationPlugin."""
+        with pytest.raises(TypeError):
+            ChannelRegistry().get("broken")
+
+    @pytest.mark.usefixtures("plugin_module")
+    def test_unknown_channel(self):
+        """Test unknown names raise KeyError."""
+        with pytest.raises(KeyError):
+            ChannelRegistry().get("missing")
+
+
+def test_get_channel_options(monkeypatch: pytest.MonkeyPatch):
+    """Test plugins read their own config table."""
+    options = {"pagerduty": {"routing_key": "abc"}}
+    config = AppConfig(reminder=ReminderConfig(channel_options=options))
+    monkeypatch.setattr(channels, "load_config", lambda: config)
+
+    assert get_channel_options("pagerduty") == {"routing_key": "abc"}
+    assert get_channel_options("email") == {}
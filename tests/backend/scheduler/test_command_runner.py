@@ -0,0 +1,100 @@
+"""Tests for bounded command runner."""
+
+import asyncio
+import sys
+import time
+from unittest.mock import patch
+
+import pytest
+
+from backend.core.config_manager import AppConfig, ReminderConfig
+from backend.scheduler.command_runner import RECENT_RUNS, CommandRunner, recent_command_runs
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="uses POSIX shell commands")
+
+
+def _config(**kwargs) -> AppConfig:
+    return AppConfig(reminder=ReminderConfig(**kwargs))
+
+
+class TestCommandRunner:
+    """Tests for CommandRunner."""
+
+    @pytest.mark.asyncio
+    async def test_captures_exit_code(self):
+        """Test exit code and duration are recorded."""
+        with patch("backend.scheduler.command_runner.load_config", return_value=_config()):
+            run = await CommandRunner().run("exit 3")
+
+        assert run.exit_code == 3
+        assert not run.timed_out
+        assert run.duration >= 0
+        assert recent_command_runs() == [run]
+
+    @pytest.mark.asyncio
+    async def test_argv_mode(self, tmp_path):
+        """Test non-shell mode splits the command without a shell."""
+        target = tmp_path / "out"
+        config = _config(command_shell=False)
+        with patch("backend.scheduler.command_runner.load_config", return_value=config):
+            run = await CommandRunner().run(f"touch '{target}' ; false")
+
+        # "; false" is passed to touch as file names, not run by a shell
+        assert run.exit_code == 0
+        assert target.exists()
+
+    @pytest.mark.asyncio
+    async def test_missing_program(self):
+        """Test a missing program is reported instead of raised."""
+        config = _config(command_shell=False)
+        with patch("backend.scheduler.command_runner.load_config", return_value=config):
+            run = await CommandRunner().run("definitely-not-a-real-program-xyz")
+
+        assert run.exit_code is None
+        assert run.error
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_process_group(self, tmp_path):
+        """Test a hung command and its children are killed on timeout."""
+        marker = tmp_path / "late"
+        config = _config(command_timeout_seconds=0.2)
+        with patch("backend.scheduler.command_runner.load_config", return_value=config):
+            start = time.monotonic()
+            run = await CommandRunner().run(f"(sleep 1; touch '{marker}') & sleep 5")
+
+        assert run.timed_out
+        assert time.monotonic() - start < 2
+        await asyncio.sleep(1.2)
+        assert not marker.exists()
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit(self):
+        """Test at most command_max_concurrency commands run at once."""
+        config = _config(command_max_concurrency=1)
+        runner = CommandRunner()
+        with patch("backend.scheduler.command_runner.load_config", return_value=config):
+            start = time.monotonic()
+            await asyncio.gather(runner.run("sleep 0.2"), runner.run("sleep 0.2"))
+
+        assert time.monotonic() - start >= 0.4
+
+    @pytest.mark.asyncio
+    async def test_cancel_kills_and_records(self):
+        """Test cancellation kills the command and is logged."""
+        with patch("backend.scheduler.command_runner.load_config", return_value=_config()):
+            task = asyncio.create_task(CommandRunner().run("sleep 5"))
+            await asyncio.sleep(0.2)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        assert recent_command_runs()[-1].error == "cancelled"
+
+    def test_recent_runs_bounded(self):
+        """Test only the latest runs are kept."""
+        runner = CommandRunner()
+        with patch("backend.scheduler.command_runner.load_config", return_value=_config()):
+            for _ in range(RECENT_RUNS + 3):
+                asyncio.run(runner.run("true"))
+
+        assert len(recent_command_runs()) == RECENT_RUNS
@@ -0,0 +1,156 @@
+"""Tests for scheduled commands engine."""
+
+import asyncio
+import sys
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.core.config_manager import AppConfig, ReminderConfig, ScheduledCommand
+from backend.scheduler.command_runner import CommandRun
+from backend.scheduler.command_scheduler import CommandScheduler, next_fire_time
+
+NOW = datetime(2026, 1, 17, 12, 7).timestamp()
+
+
+def _command(trigger: str, value: str = "", command_id: str | None = None, enabled: bool = True) -> ScheduledCommand:
+    return ScheduledCommand(
+        id=command_id or f"cmd_{trigger}",
+        name=trigger,
+        command=f"echo {trigger}",
+        trigger=trigger,
+        value=value,
+        enabled=enabled,
+    )
+
+
+class FakeClock:
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def runner() -> MagicMock:
+    runner = MagicMock()
+    runner.run = AsyncMock(return_value=CommandRun("x", 0.0, 0.0, 0))
+    return runner
+
+
+class TestNextFireTime:
+    """Tests for next_fire_time."""
+
+    def test_cron(self):
+        """Test cron uses local time."""
+        fire = next_fire_time(_command("cron", "0 13 * * *"), NOW)
+        assert datetime.fromtimestamp(fire) == datetime(2026, 1, 17, 13, 0)
+
+    def test_fixed_today_and_tomorrow(self):
+        """Test fixed time rolls over to the next day once passed."""
+        assert datetime.fromtimestamp(next_fire_time(_command("fixed", "18:30"), NOW)) == datetime(2026, 1, 17, 18, 30)
+        assert datetime.fromtimestamp(next_fire_time(_command("fixed", "09:00"), NOW)) == datetime(2026, 1, 18, 9, 0)
+
+    def test_repeated(self):
+        """Test interval in minutes."""
+        assert next_fire_time(_command("repeated", "15"), NOW) == NOW + 900
+
+    def test_cycle_has_no_time(self):
+        """Test cycle commands depend on the reset time instead."""
+        assert next_fire_time(_command("cycle"), NOW) is None
+
+    @pytest.mark.parametrize(("trigger", "value"), [("cron", "bad"), ("fixed", "25"), ("repeated", "0")])
+    def test_invalid(self, trigger: str, value: str):
+        """Test invalid values raise ValueError."""
+        with pytest.raises(ValueError):
+            next_fire_time(_command(trigger, value), NOW)
+
+
+class TestCommandScheduler:
+    """Tests for CommandScheduler."""
+
+    def test_invalid_and_disabled_skipped(self, runner: MagicMock):
+        """Test bad or disabled commands are not scheduled."""
+        scheduler = CommandScheduler(runner, FakeClock(NOW))
+        scheduler.update([
+            _command("cron", "nope"),
+            _command("repeated", "10", enabled=False),
+            _command("fixed", "12:30"),
+        ])
+        assert scheduler.next_fire_at() == datetime(2026, 1, 17, 12, 30).timestamp()
+
+    @pytest.mark.asyncio
+    async def test_recurring_fire_and_reschedule(self, runner: MagicMock):
+        """Test a due command runs and is scheduled again."""
+        clock = FakeClock(NOW)
+        scheduler = CommandScheduler(runner, clock)
+        scheduler.update([_command("repeated", "10")])
+
+        clock.now = NOW + 600
+        fired = scheduler.fire_due()
+        await asyncio.sleep(0)
+
+        assert [c.id for c in fired] == ["cmd_repeated"]
+        runner.run.assert_awaited_once_with("echo repeated")
+        assert scheduler.next_fire_at() == NOW + 1200
+
+    def test_cycle_runs_at_reset(self, runner: MagicMock):
+        """Test cycle commands are scheduled at resets_at."""
+        scheduler = CommandScheduler(runner, FakeClock(NOW))
+        reset = datetime.fromtimestamp(NOW + 3600, UTC)
+        scheduler.update([_command("cycle")], reset)
+        assert scheduler.next_fire_at() == NOW + 3600
+
+    @pytest.mark.asyncio
+    async def test_moved_window_supersedes_cycle_entry(self, runner: MagicMock):
+        """Test only the current window's cycle entry fires."""
+        clock = FakeClock(NOW)
+        scheduler = CommandScheduler(runner, clock)
+        commands = [_command("cycle")]
+        scheduler.update(commands, datetime.fromtimestamp(NOW + 3600, UTC))
+        scheduler.update(commands, datetime.fromtimestamp(NOW + 1800, UTC))
+
+        clock.now = NOW + 4000
+        fired = scheduler.fire_due()
+        await asyncio.sleep(0)
+        assert len(fired) == 1
+        assert runner.run.await_count == 1
+
+    def test_unchanged_update_keeps_heap(self, runner: MagicMock):
+        """Test repeated updates with the same config are cheap no-ops."""
+        scheduler = CommandScheduler(runner, FakeClock(NOW))
+        commands = [_command("repeated", "10")]
+        scheduler.update(commands)
+        heap = list(scheduler._heap)
+        scheduler.update([c.model_copy() for c in commands])
+        assert scheduler._heap == heap
+
+    @pytest.mark.asyncio
+    async def test_run_sleeps_until_due(self, runner: MagicMock):
+        """Test run wakes at the fire time."""
+        loop = asyncio.get_running_loop()
+        offset = NOW - loop.time()
+        scheduler = CommandScheduler(runner, lambda: loop.time() + offset)
+        task = asyncio.create_task(scheduler.run())
+        await asyncio.sleep(0)
+
+        scheduler.update([_command("repeated", "0.001")])
+        await asyncio.sleep(0.15)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+        assert runner.run.await_count >= 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(sys.platform == "win32", reason="uses POSIX shell commands")
+    async def test_own_runner_ignores_reminder_timeout(self):
+        """Test scheduled commands are not bound by the reminder hooks' timeout."""
+        config = AppConfig(reminder=ReminderConfig(command_timeout_seconds=0.05))
+        with patch("backend.scheduler.command_runner.load_config", return_value=config), \
+                patch("backend.scheduler.command_scheduler.load_config", return_value=config):
+            run = await CommandScheduler()._runner.run("sleep 0.3")
+
+        assert not run.timed_out
+        assert run.exit_code == 0
@@ -0,0 +1,55 @@
+"""Tests for cron expression parsing."""
+
+from datetime import datetime
+
+import pytest
+
+from backend.scheduler.cron import CronExpression
+
+
+class TestCronParse:
+    """Tests for CronExpression.parse."""
+
+    def test_fields(self):
+        """Test lists, ranges and steps expand correctly."""
+        cron = CronExpression.parse("*/20 9-11 1,15 * 1-5/2")
+        assert cron.minutes == {0, 20, 40}
+        assert cron.hours == {9, 10, 11}
+        assert cron.days == {1, 15}
+        assert cron.weekdays == {1, 3, 5}
+
+    def test_sunday_as_seven(self):
+        """Test 7 is Sunday like 0."""
+        assert CronExpression.parse("0 0 * * 7").weekdays == {0}
+
+    @pytest.mark.parametrize("expression", ["* * * *", "60 * * * *", "* * 0 * *", "*/0 * * * *", "a * * * *"])
+    def test_invalid(self, expression: str):
+        """Test malformed expressions are rejected."""
+        with pytest.raises(ValueError):
+            CronExpression.parse(expression)
+
+
+class TestCronNextAfter:
+    """Tests for CronExpression.next_after."""
+
+    @pytest.mark.parametrize(
+        ("expression", "after", "expected"),
+        [
+            ("* * * * *", datetime(2026, 1, 17, 12, 7, 30), datetime(2026, 1, 17, 12, 8)),
+            ("0 * * * *", datetime(2026, 1, 17, 12, 0), datetime(2026, 1, 17, 13, 0)),
+            # Saturday -> next Monday
+            ("*/15 9-17 * * 1-5", datetime(2026, 1, 17, 12, 7), datetime(2026, 1, 19, 9, 0)),
+            ("30 8 1 * *", datetime(2026, 12, 2), datetime(2027, 1, 1, 8, 30)),
+            ("0 0 29 2 *", datetime(2026, 1, 1), datetime(2028, 2, 29)),
+            # Both day fields restricted: either matches (the 20th or a Monday)
+            ("0 12 20 * 1", datetime(2026, 1, 17, 13, 0), datetime(2026, 1, 19, 12, 0)),
+        ],
+    )
+    def test_next_after(self, expression: str, after: datetime, expected: datetime):
+        """Test the next matching minute."""
+        assert CronExpression.parse(expression).next_after(after) == expected
+
+    def test_never_matches(self):
+        """Test impossible dates raise."""
+        with pytest.raises(ValueError):
+            CronExpression.parse("0 0 31 2 *").next_after(datetime(2026, 1, 1))
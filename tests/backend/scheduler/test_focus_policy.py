@@ -0,0 +1,148 @@
+"""Tests for compiled focus policy."""
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from backend.core.config_manager import AppConfig, FocusModeConfig, QuietHours
+from backend.scheduler import focus_policy
+from backend.scheduler.focus_mode import FocusModeService
+from backend.scheduler.focus_policy import FocusPolicy, get_focus_policy
+
+# 2026-01-19 is a Monday
+MONDAY = datetime(2026, 1, 19)
+
+
+def _policy(*ranges: QuietHours, start: str | None = None, end: str | None = None) -> FocusPolicy:
+    config = FocusModeConfig(
+        enabled=True, quiet_hours=list(ranges), quiet_hours_start=start, quiet_hours_end=end,
+    )
+    return FocusPolicy.from_config(config)
+
+
+class TestFocusPolicy:
+    """Tests for FocusPolicy."""
+
+    def test_legacy_overnight_range(self):
+        """Test the single start/end range runs overnight every day."""
+        policy = _policy(start="22:00", end="08:00")
+        assert policy.is_quiet(MONDAY.replace(hour=23))
+        assert policy.is_quiet(MONDAY.replace(hour=7, minute=59))
+        assert not policy.is_quiet(MONDAY.replace(hour=8))
+        assert not policy.is_quiet(MONDAY.replace(hour=12))
+
+    def test_multiple_ranges_and_weekdays(self):
+        """Test per-weekday ranges combine."""
+        policy = _policy(
+            QuietHours(start="12:00", end="13:00", days=[0, 1, 2, 3, 4]),
+            QuietHours(start="00:00", end="00:00", days=[5]),
+            QuietHours(start="09:00", end="17:00", days=[6]),
+        )
+        assert policy.is_quiet(MONDAY.replace(hour=12, minute=30))
+        assert not policy.is_quiet(MONDAY.replace(hour=14))
+        # Saturday: start == end is an empty range
+        assert not policy.is_quiet((MONDAY + timedelta(days=5)).replace(hour=12, minute=30))
+        assert policy.is_quiet((MONDAY + timedelta(days=6)).replace(hour=10))
+
+    def test_overnight_range_belongs_to_start_day(self):
+        """Test an overnight range continues into the next morning only after its days."""
+        policy = _policy(QuietHours(start="23:00", end="02:00", days=[4]))  # Friday night
+        saturday = MONDAY + timedelta(days=5)
+        assert policy.is_quiet(saturday.replace(hour=1))
+        assert not policy.is_quiet(MONDAY.replace(hour=1))
+
+    def test_sunday_night_wraps_to_monday(self):
+        """Test a Sunday overnight range wraps around the week."""
+        policy = _policy(QuietHours(start="22:00", end="06:00", days=[6]))
+        assert policy.is_quiet(MONDAY.replace(hour=5))
+
+    def test_next_transition(self):
+        """Test the next start and end of quiet hours."""
+        policy = _policy(start="22:00", end="08:00")
+        assert policy.next_transition(MONDAY.replace(hour=12, second=30)) == MONDAY.replace(hour=22)
+        assert policy.next_transition(MONDAY.replace(hour=22)) == MONDAY.replace(hour=8) + timedelta(days=1)
+
+    def test_no_quiet_hours(self):
+        """Test a policy without ranges never changes."""
+        policy = FocusPolicy.from_config(FocusModeConfig(enabled=True))
+        assert not policy.is_quiet(MONDAY)
+        assert policy.next_transition(MONDAY) is None
+
+    def test_disabled_and_invalid(self):
+        """Test disabled focus mode and invalid ranges compile to nothing."""
+        assert not FocusPolicy.from_config(
+            FocusModeConfig(enabled=False, quiet_hours_start="00:00", quiet_hours_end="23:59")
+        ).is_quiet(MONDAY.replace(hour=12))
+        assert not _policy(QuietHours(start="25:00", end="08:00")).is_quiet(MONDAY)
+
+    def test_compiled_once_per_config(self):
+        """Test the policy is reused until the config changes."""
+        config = FocusModeConfig(enabled=True, quiet_hours_start="22:00", quiet_hours_end="08:00")
+        with patch.object(focus_policy.FocusPolicy, "from_config", wraps=FocusPolicy.from_config) as compile_:
+            first = get_focus_policy(config)
+            assert get_focus_policy(config.model_copy()) is first
+            config.quiet_hours_end = "07:00"
+            assert get_focus_policy(config) is not first
+        assert compile_.call_count == 2
+
+
+class TestSuppressedUntil:
+    """Tests for FocusModeService.suppressed_until."""
+
+    @pytest.fixture
+    def service(self, monkeypatch: pytest.MonkeyPatch) -> FocusModeService:
+        config = AppConfig(focus_mode=FocusModeConfig(
+            enabled=True, quiet_hours_start="22:00", quiet_hours_end="08:00",
+        ))
+        monkeypatch.setattr("backend.scheduler.focus_mode.load_config", lambda: config)
+        return FocusModeService()
+
+    def _at(self, now: datetime):
+        fake = type("FakeDatetime", (datetime,), {"now": classmethod(lambda _cls, _tz=None: now)})
+        return patch("backend.scheduler.focus_mode.datetime", fake)
+
+    def test_not_suppressed(self, service: FocusModeService):
+        """Test None outside quiet hours without snooze."""
+        with self._at(MONDAY.replace(hour=12)):
+            assert service.suppressed_until() is None
+
+    def test_quiet_hours_end(self, service: FocusModeService):
+        """Test suppression ends with quiet hours."""
+        with self._at(MONDAY.replace(hour=23)):
+            assert service.suppressed_until() == MONDAY.replace(hour=8) + timedelta(days=1)
+
+    def test_snooze_into_quiet_hours(self, service: FocusModeService):
+        """Test a snooze ending inside quiet hours extends to their end."""
+        with self._at(MONDAY.replace(hour=21, minute=30)):
+            service.snooze(60)
+            assert service.suppressed_until() == MONDAY.replace(hour=8) + timedelta(days=1)
+
+
+class TestIsInQuietHours:
+    """Tests for FocusModeService.is_in_quiet_hours."""
+
+    CONFIG = FocusModeConfig(enabled=True, quiet_hours_start="22:00", quiet_hours_end="08:00")
+
+    def _at(self, now: datetime):
+        fake = type("FakeDatetime", (datetime,), {"now": classmethod(lambda _cls, _tz=None: now)})
+        return patch("backend.scheduler.focus_mode.datetime", fake)
+
+    def test_uses_passed_config(self):
+        """Test a caller's config is used without re-reading the config file."""
+        with self._at(MONDAY.replace(hour=23)), \
+                patch("backend.scheduler.focus_mode.load_config") as load:
+            assert FocusModeService().is_in_quiet_hours(self.CONFIG)
+        load.assert_not_called()
+
+    def test_end_minute_is_not_quiet(self):
+        """Test quiet hours end at the start of their end minute.
+
+        Before the compiled policy the end instant itself (08:00:00.000) still
+        counted as quiet; at minute resolution the whole end minute is not.
+        """
+        service = FocusModeService()
+        with self._at(MONDAY.replace(hour=7, minute=59, second=59)):
+            assert service.is_in_quiet_hours(self.CONFIG)
+        with self._at(MONDAY.replace(hour=8)):
+            assert not service.is_in_quiet_hours(self.CONFIG)
@@ -0,0 +1,156 @@
+"""Tests for quota-aware job queue."""
+
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from backend.core import state_store
+from backend.core.config_manager import AppConfig, JobQueueConfig
+from backend.core.usage_history import UsageSample, get_usage_history
+from backend.scheduler import job_queue
+from backend.scheduler.job_queue import JobQueue, QueuedJob, jobs_dir, plan_admissions
+
+
+def _job(job_id: str, usage: float, status: str = "pending") -> QueuedJob:
+    return QueuedJob(job_id, "true", usage, "/", 0.0, status=status)
+
+
+class TestPlanAdmissions:
+    """Tests for plan_admissions."""
+
+    def test_fills_headroom_in_order(self):
+        """Test jobs are admitted in order until the next one does not fit."""
+        config = JobQueueConfig(max_concurrency=5, margin_percent=5)
+        pending = [_job("a", 30), _job("b", 30), _job("c", 30), _job("d", 5)]
+        admitted = plan_admissions(pending, [], projected=20, config=config)
+        assert [j.id for j in admitted] == ["a", "b"]
+
+    def test_running_jobs_count(self):
+        """Test running estimates and concurrency reduce what fits."""
+        config = JobQueueConfig(max_concurrency=2, margin_percent=0)
+        running = [_job("r", 50, "running")]
+        pending = [_job("a", 10), _job("b", 10)]
+        assert [j.id for j in plan_admissions(pending, running, 30, config)] == ["a"]
+        assert plan_admissions(pending, running, 45, config) == []
+
+    def test_oversized_job_waits_for_fresh_window(self):
+        """Test a job bigger than a window only starts on a fresh window."""
+        config = JobQueueConfig()
+        assert plan_admissions([_job("big", 150)], [], 40, config) == []
+        assert [j.id for j in plan_admissions([_job("big", 150)], [], 0, config)] == ["big"]
+
+
+class TestJobQueue:
+    """Tests for JobQueue."""
+
+    def test_add_list_remove(self):
+        """Test jobs persist across instances and can be removed."""
+        job = JobQueue().add("make all", 30, cwd="/tmp")
+        jobs = JobQueue().jobs()
+        assert [(j.id, j.command, j.status) for j in jobs] == [(job.id, "make all", "pending")]
+        assert JobQueue().remove(job.id)
+        assert JobQueue().jobs() == []
+        assert not JobQueue().remove("missing")
+
+    def test_concurrent_add_and_update(self):
+        """Test jobs added by other processes survive the daemon's updates."""
+        queue = JobQueue()
+        job = queue.add("make all", 30, cwd="/tmp")
+        script = (
+            "import sys\n"
+            "from pathlib import Path\n"
+            "from backend.core import state_store\n"
+            "from backend.scheduler.job_queue import JobQueue\n"
+            "state_store.STATE_FILE = Path(sys.argv[1])\n"
+            "for _ in range(10):\n"
+            "    JobQueue().add('true', 1, cwd='/')\n"
+        )
+        env = {**os.environ, "PYTHONPATH": str(Path(__file__).parents[3] / "src")}
+        adders = [
+            subprocess.Popen([sys.executable, "-c", script, str(state_store.STATE_FILE)], env=env)
+            for _ in range(3)
+        ]
+        attempts = 0
+        while any(adder.poll() is None for adder in adders):
+            attempts += 1
+            queue._update(job.id, attempts=attempts)
+        assert all(adder.wait(timeout=60) == 0 for adder in adders)
+
+        assert len(queue.jobs()) == 31
+
+    def test_projection_uses_forecast(self):
+        """Test projected utilization follows the window's trend."""
+        now = time.time()
+        reset = now + 3600
+        history = get_usage_history()
+        for minutes, util in ((60, 10.0), (40, 20.0), (20, 30.0), (0, 40.0)):
+            history.append(UsageSample(now - minutes * 60, util, reset, 0.0))
+
+        queue = JobQueue(clock=lambda: now)
+        queue.observe(40.0, datetime.fromtimestamp(reset, UTC))
+        assert queue.projected_utilization() == pytest.approx(70.0)
+
+        # Once the window has reset, the fresh quota is assumed
+        queue._clock = lambda: reset + 1
+        assert queue.projected_utilization() == 0.0
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="uses POSIX shell commands")
+    @pytest.mark.asyncio
+    async def test_drain_runs_jobs(self, tmp_path):
+        """Test drained jobs run, record exit codes and logs."""
+        queue = JobQueue()
+        ok = queue.add("echo hello", 10, cwd=str(tmp_path))
+        bad = queue.add("exit 4", 10, cwd=str(tmp_path))
+        config = AppConfig(job_queue=JobQueueConfig(max_concurrency=2))
+
+        with patch.object(job_queue, "load_config", return_value=config):
+            admitted = queue.drain()
+            # Claimed at once so a second drain does not start them again
+            assert queue.drain() == []
+            await asyncio.gather(*queue._tasks)
+
+        assert [j.id for j in admitted] == [ok.id, bad.id]
+        jobs = {j.id: j for j in queue.jobs()}
+        assert (jobs[ok.id].status, jobs[ok.id].exit_code, jobs[ok.id].attempts) == ("done", 0, 1)
+        assert (jobs[bad.id].status, jobs[bad.id].exit_code) == ("failed", 4)
+        assert (jobs_dir() / f"{ok.id}.log").read_text() == "hello\n"
+
+    def test_disabled_queue_does_nothing(self):
+        """Test a disabled queue admits nothing."""
+        queue = JobQueue()
+        queue.add("true", 1)
+        config = AppConfig(job_queue=JobQueueConfig(enabled=False))
+        with patch.object(job_queue, "load_config", return_value=config):
+            assert queue.drain() == []
+
+    def test_recover_inherited_jobs(self):
+        """Test a new daemon settles, keeps or requeues inherited jobs."""
+        queue = JobQueue()
+        finished = queue.add("a", 1)
+        dead = queue.add("b", 1)
+        alive = queue.add("c", 1)
+        exhausted = queue.add("d", 1)
+        queue._update(finished.id, status="running", pid=999999)
+        queue._update(dead.id, status="running", pid=999999, attempts=1)
+        queue._update(alive.id, status="running", pid=12345)
+        queue._update(exhausted.id, status="running", pid=999999, attempts=job_queue.MAX_ATTEMPTS)
+        jobs_dir().mkdir(parents=True)
+        (jobs_dir() / f"{finished.id}.exit").write_text("0\n")
+
+        with patch.object(job_queue, "_pid_alive", side_effect=lambda pid: pid == 12345):
+            JobQueue().recover()
+
+        status = {j.id: j.status for j in queue.jobs()}
+        assert status == {
+            finished.id: "done",
+            dead.id: "pending",
+            alive.id: "running",
+            exhausted.id: "failed",
+        }
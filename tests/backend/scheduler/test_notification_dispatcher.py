@@ -0,0 +1,106 @@
+"""Tests for asynchronous notification dispatcher."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from backend.core.config_manager import AppConfig
+from backend.scheduler import notification_dispatcher
+from backend.scheduler.notification_dispatcher import NotificationDispatcher
+from backend.scheduler.notifier import NotificationChannel
+from backend.scheduler.reminder_service import ReminderService, ReminderType
+
+
+async def _fake_send(_title: str, _body: str, channels: list[NotificationChannel]) -> list[NotificationChannel]:
+    channel = channels[0]
+    if channel == NotificationChannel.SYSTEM:
+        await asyncio.sleep(0.2)
+    if channel == NotificationChannel.URL:
+        raise RuntimeError("no browser")
+    return channels
+
+
+class TestNotificationDispatcher:
+    """Tests for NotificationDispatcher."""
+
+    def test_submit_without_loop(self):
+        """Test submit refuses when not started."""
+        assert NotificationDispatcher().submit("t", "b") is False
+
+    @pytest.mark.asyncio
+    async def test_delivers_per_channel(self):
+        """Test each channel delivers and results are reported."""
+        dispatcher = NotificationDispatcher()
+        dispatcher.start()
+        results = []
+        with patch.object(notification_dispatcher, "send_notification", side_effect=_fake_send):
+            assert dispatcher.submit(
+                "t", "b",
+                [NotificationChannel.BELL, NotificationChannel.URL],
+                on_done=results.append,
+            )
+            await dispatcher.join()
+        await dispatcher.stop()
+
+        assert results == [[NotificationChannel.BELL]]
+
+    @pytest.mark.asyncio
+    async def test_slow_channel_times_out(self):
+        """Test a hung channel is abandoned without delaying others."""
+        dispatcher = NotificationDispatcher(channel_timeout=0.05)
+        dispatcher.start()
+        results = []
+        with patch.object(notification_dispatcher, "send_notification", side_effect=_fake_send):
+            dispatcher.submit("slow", "b", [NotificationChannel.SYSTEM], on_done=results.append)
+            dispatcher.submit("fast", "b", [NotificationChannel.BELL], on_done=results.append)
+            await dispatcher.join()
+        await dispatcher.stop()
+
+        assert results == [[NotificationChannel.BELL], []]
+
+    @pytest.mark.asyncio
+    async def test_stop_allows_restart(self):
+        """Test the dispatcher can be stopped and started again."""
+        dispatcher = NotificationDispatcher()
+        dispatcher.start()
+        await dispatcher.stop()
+        assert not dispatcher.running
+        assert dispatcher.submit("t", "b") is False
+        dispatcher.start()
+        assert dispatcher.running
+        await dispatcher.stop()
+
+
+class TestReminderDispatch:
+    """Tests for reminders routed through the dispatcher."""
+
+    @pytest.mark.asyncio
+    async def test_reminder_enqueues_and_reports_delivery(self, monkeypatch: pytest.MonkeyPatch):
+        """Test triggering only enqueues and the delivery result comes back."""
+        dispatcher = NotificationDispatcher()
+        monkeypatch.setattr(notification_dispatcher, "_dispatcher", dispatcher)
+        dispatcher.start()
+
+        service = ReminderService()
+        delivered = []
+        monkeypatch.setattr(service, "_on_delivered", lambda *result: delivered.append(result))
+        focus = MagicMock()
+        focus.should_suppress_notification.return_value = False
+
+        with patch("backend.scheduler.reminder_service.load_config", return_value=AppConfig()), \
+                patch("backend.scheduler.reminder_service.get_focus_mode_service", return_value=focus), \
+                patch("backend.scheduler.reminder_service.send_notification_sync") as send_sync, \
+                patch.object(notification_dispatcher, "send_notification", side_effect=_fake_send):
+            service.check_and_trigger(55.0, None)
+            # Held back by the coalescing window
+            await dispatcher.join()
+            assert delivered == []
+            service._coalescer.flush()
+            await dispatcher.join()
+        await dispatcher.stop()
+
+        send_sync.assert_not_called()
+        assert delivered == [
+            (ReminderType.PERCENTAGE, "Usage reached 50%", [NotificationChannel.SYSTEM]),
+        ]
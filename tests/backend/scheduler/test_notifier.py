@@ -5,11 +5,17 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from backend.core.config_manager import AppConfig, ReminderConfig, WebhookConfig
+from backend.scheduler.builtin_channels import _get_notifier
+from backend.scheduler.command_runner import CommandRun
 from backend.scheduler.notifier import (
     NotificationChannel,
-    _get_notifier,
+    NotificationCoalescer,
+    PendingNotification,
+    configured_channels,
     send_notification,
     send_notification_sync,
+    summarize,
 )
 
 
@@ -22,6 +28,7 @@ class TestNotificationChannel:
         assert NotificationChannel.BELL.value == "bell"
         assert NotificationChannel.COMMAND.value == "command"
         assert NotificationChannel.URL.value == "url"
+        assert NotificationChannel.WEBHOOK.value == "webhook"
 
 
 class TestGetNotifier:
@@ -41,7 +48,7 @@ class TestSendNotification:
         mock_notifier = MagicMock()
         mock_notifier.send = AsyncMock()
 
-        with patch("backend.scheduler.notifier._get_notifier", return_value=mock_notifier):
+        with patch("backend.scheduler.builtin_channels._get_notifier", return_value=mock_notifier):
             result = await send_notification(
                 "Test Title",
                 "Test Body",
@@ -68,15 +75,18 @@ class TestSendNotification:
         mock_config = MagicMock()
         mock_config.reminder.custom_command = "echo test"
 
-        with patch("backend.scheduler.notifier.load_config", return_value=mock_config):
-            with patch("subprocess.Popen") as mock_popen:
+        mock_runner = MagicMock()
+        mock_runner.run = AsyncMock(return_value=CommandRun("echo test", 0.0, 0.01, 0))
+
+        with patch("backend.scheduler.builtin_channels.load_config", return_value=mock_config):
+            with patch("backend.scheduler.builtin_channels.get_command_runner", return_value=mock_runner):
                 result = await send_notification(
                     "Test",
                     "Body",
                     [NotificationChannel.COMMAND],
                 )
                 assert NotificationChannel.COMMAND in result
-                mock_popen.assert_called_once()
+                mock_runner.run.assert_awaited_once_with("echo test")
 
     @pytest.mark.asyncio
     async def test_send_command_notification_no_command(self):
@@ -84,7 +94,7 @@ class TestSendNotification:
         mock_config = MagicMock()
         mock_config.reminder.custom_command = None
 
-        with patch("backend.scheduler.notifier.load_config", return_value=mock_config):
+        with patch("backend.scheduler.builtin_channels.load_config", return_value=mock_config):
             result = await send_notification(
                 "Test",
                 "Body",
@@ -98,7 +108,7 @@ class TestSendNotification:
         mock_config = MagicMock()
         mock_config.reminder.custom_url = "https://example.com"
 
-        with patch("backend.scheduler.notifier.load_config", return_value=mock_config):
+        with patch("backend.scheduler.builtin_channels.load_config", return_value=mock_config):
             with patch("webbrowser.open") as mock_open:
                 result = await send_notification(
                     "Test",
@@ -114,7 +124,7 @@ class TestSendNotification:
         mock_config = MagicMock()
         mock_config.reminder.custom_url = None
 
-        with patch("backend.scheduler.notifier.load_config", return_value=mock_config):
+        with patch("backend.scheduler.builtin_channels.load_config", return_value=mock_config):
             result = await send_notification(
                 "Test",
                 "Body",
@@ -128,7 +138,7 @@ class TestSendNotification:
         mock_notifier = MagicMock()
         mock_notifier.send = AsyncMock()
 
-        with patch("backend.scheduler.notifier._get_notifier", return_value=mock_notifier):
+        with patch("backend.scheduler.builtin_channels._get_notifier", return_value=mock_notifier):
             result = await send_notification("Test", "Body")
             assert NotificationChannel.SYSTEM in result
 
@@ -138,7 +148,7 @@ class TestSendNotification:
         mock_notifier = MagicMock()
         mock_notifier.send = AsyncMock(side_effect=Exception("Failed"))
 
-        with patch("backend.scheduler.notifier._get_notifier", return_value=mock_notifier):
+        with patch("backend.scheduler.builtin_channels._get_notifier", return_value=mock_notifier):
             with patch("builtins.print"):
                 result = await send_notification(
                     "Test",
@@ -150,6 +160,25 @@ class TestSendNotification:
                 assert NotificationChannel.SYSTEM not in result
 
 
+    @pytest.mark.asyncio
+    async def test_plugin_channel_by_name(self):
+        """Test channels outside the enum are sent by registry name."""
+        registry = MagicMock()
+        registry.send = AsyncMock(return_value=True)
+
+        with patch("backend.scheduler.notifier.get_channel_registry", return_value=registry):
+            result = await send_notification("Test", "Body", ["pagerduty"])
+
+        assert result == ["pagerduty"]
+        registry.send.assert_awaited_once_with("pagerduty", "Test", "Body")
+
+    def test_configured_plugin_channels(self):
+        """Test enabled plugin channels are added to the configured ones."""
+        config = AppConfig(reminder=ReminderConfig(plugin_channels=["pagerduty"]))
+        with patch("backend.scheduler.notifier.load_config", return_value=config):
+            assert configured_channels() == [NotificationChannel.SYSTEM, "pagerduty"]
+
+
 class TestSendNotificationSync:
     """Test synchronous notification wrapper."""
 
@@ -168,3 +197,118 @@ class TestSendNotificationSync:
                 send_notification_sync("Test", "Body")
 
         asyncio.run(test_with_running_loop())
+
+
+class TestNotificationCoalescer:
+    """Test coalescing, dedup and channel rate limits."""
+
+    @pytest.fixture
+    def deliver(self) -> MagicMock:
+        return MagicMock()
+
+    @pytest.fixture(autouse=True)
+    def plain_config(self):
+        with patch("backend.scheduler.notifier.load_config", return_value=AppConfig()):
+            yield
+
+    def test_batch_merges_into_one(self, deliver: MagicMock):
+        """Test a batch is delivered once, keeping the latest per category."""
+        coalescer = NotificationCoalescer(deliver)
+        for threshold in (50, 75, 90):
+            coalescer.add("percentage", str(threshold), f"Usage reached {threshold}%")
+        coalescer.add("before_reset", "15", "Token reset in 15 minutes!")
+        coalescer.end_batch()
+
+        deliver.assert_called_once()
+        title, body, channels, _ = deliver.call_args.args
+        assert body == "Usage reached 90%\nToken reset in 15 minutes!"
+        assert channels == [NotificationChannel.SYSTEM]
+
+    def test_dedup_across_instances(self, deliver: MagicMock):
+        """Test the same key is not notified twice by separate processes."""
+        assert NotificationCoalescer(deliver).add("percentage", "50", "Usage reached 50%")
+        assert not NotificationCoalescer(deliver).add("percentage", "50", "Usage reached 50%")
+
+    def test_on_done_fans_out(self, deliver: MagicMock):
+        """Test every merged notification gets the delivery result."""
+        coalescer = NotificationCoalescer(deliver)
+        results = []
+        coalescer.add("percentage", "50", "a", on_done=lambda sent: results.append(("a", sent)))
+        coalescer.add("anomaly", "", "b", on_done=lambda sent: results.append(("b", sent)))
+        coalescer.end_batch()
+
+        deliver.call_args.args[3]([NotificationChannel.SYSTEM])
+        assert results == [("a", [NotificationChannel.SYSTEM]), ("b", [NotificationChannel.SYSTEM])]
+
+    def test_command_channel_rate_limited(self, deliver: MagicMock):
+        """Test the command channel runs at most once per interval."""
+        config = AppConfig(reminder=ReminderConfig(custom_command="echo hi"))
+        with patch("backend.scheduler.notifier.load_config", return_value=config):
+            coalescer = NotificationCoalescer(deliver)
+            coalescer.add("percentage", "50", "a")
+            coalescer.end_batch()
+            coalescer.add("percentage", "75", "b")
+            coalescer.end_batch()
+
+        first, second = (c.args[2] for c in deliver.call_args_list)
+        assert first == [NotificationChannel.SYSTEM, NotificationChannel.COMMAND]
+        assert second == [NotificationChannel.SYSTEM]
+
+    def test_channel_interval_from_config(self, deliver: MagicMock):
+        """Test configured intervals replace the default channel limits."""
+        config = AppConfig(reminder=ReminderConfig(
+            custom_command="echo hi",
+            channel_min_interval_seconds={"command": 0.0},
+        ))
+        with patch("backend.scheduler.notifier.load_config", return_value=config):
+            coalescer = NotificationCoalescer(deliver)
+            for threshold in ("50", "75"):
+                coalescer.add("percentage", threshold, threshold)
+                coalescer.end_batch()
+
+        assert deliver.call_count == 2
+        for call in deliver.call_args_list:
+            assert call.args[2] == [NotificationChannel.SYSTEM, NotificationChannel.COMMAND]
+
+    def test_batching_channel_gets_each_notification(self, deliver: MagicMock):
+        """Test a batching channel skips the merge and on_done waits for every delivery."""
+        webhook = WebhookConfig(url="http://hooks.test/")
+        config = AppConfig(reminder=ReminderConfig(webhooks=[webhook]))
+        results = []
+        with patch("backend.scheduler.notifier.load_config", return_value=config):
+            coalescer = NotificationCoalescer(deliver)
+            coalescer.add("percentage", "50", "a", on_done=results.append)
+            coalescer.add("percentage", "75", "b")
+            coalescer.end_batch()
+
+        calls = [c.args[1:3] for c in deliver.call_args_list]
+        assert calls == [
+            ("b", [NotificationChannel.SYSTEM]),
+            ("a", [NotificationChannel.WEBHOOK]),
+            ("b", [NotificationChannel.WEBHOOK]),
+        ]
+        for call in deliver.call_args_list:
+            call.args[3]([call.args[2][0]])
+        assert results == [[NotificationChannel.SYSTEM, NotificationChannel.WEBHOOK]]
+
+    def test_summarize_markdown(self):
+        """Test rich-content channels get several messages as a bullet list."""
+        pending = [
+            PendingNotification("percentage", "50", "Usage reached 50%", None),
+            PendingNotification("anomaly", "", "Usage spiking", None),
+        ]
+        assert summarize(pending, markdown=True) == "- Usage reached 50%\n- Usage spiking"
+        assert summarize(pending[:1], markdown=True) == "Usage reached 50%"
+
+    @pytest.mark.asyncio
+    async def test_timed_flush_in_loop(self, deliver: MagicMock):
+        """Test inside a loop notifications wait for the window."""
+        coalescer = NotificationCoalescer(deliver, window=0.05)
+        coalescer.add("percentage", "50", "a")
+        coalescer.end_batch()
+        coalescer.add("before_reset", "15", "b")
+        deliver.assert_not_called()
+
+        await asyncio.sleep(0.1)
+        deliver.assert_called_once()
+        assert deliver.call_args.args[1] == "a\nb"
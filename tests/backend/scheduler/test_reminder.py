@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+import math
 from datetime import datetime, timedelta
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from backend.core.config_manager import AppConfig, ReminderConfig, ReminderRule
+from backend.core.event_bus import REMINDER_FIRED, ReminderFired, get_event_bus
+from backend.models.usage import UsageResponse
 from backend.scheduler.reminder_service import (
     ReminderService,
     ReminderType,
     get_reminder_service,
+    rule_values,
 )
 
 
@@ -28,6 +33,8 @@ def mock_config():
     mock.reminder.percentage_thresholds = [50, 75, 90, 100]
     mock.reminder.before_reset_minutes = [15, 30, 60]
     mock.reminder.on_reset = True
+    mock.reminder.anomaly_detection = False
+    mock.reminder.rules = []
     return mock
 
 
@@ -52,26 +59,6 @@ class TestReminderService:
         assert len(reminder_service._triggered_before_reset) == 0
         assert reminder_service._reset_triggered is False
 
-    def test_add_and_remove_callback(self, reminder_service: ReminderService):
-        """Test adding and removing callbacks."""
-
-        def test_callback(t: ReminderType, m: str) -> None:
-            pass
-
-        reminder_service.add_callback(test_callback)
-        assert test_callback in reminder_service._callbacks
-
-        reminder_service.remove_callback(test_callback)
-        assert test_callback not in reminder_service._callbacks
-
-    def test_remove_nonexistent_callback(self, reminder_service: ReminderService):
-        """Test removing non-existent callback doesn't raise."""
-
-        def test_callback(t: ReminderType, m: str) -> None:
-            pass
-
-        reminder_service.remove_callback(test_callback)  # Should not raise
-
 
 class TestCheckAndTrigger:
     """Tests for check_and_trigger method."""
@@ -131,6 +118,21 @@ class TestCheckAndTrigger:
                     assert 50 in reminder_service._triggered_percentages
                     assert 75 in reminder_service._triggered_percentages
 
+    def test_delivers_without_event_loop(
+        self,
+        reminder_service: ReminderService,
+        mock_config: MagicMock,
+    ):
+        """Test reminders triggered outside a loop (sidecar) are sent right away."""
+        with patch("backend.scheduler.reminder_service.load_config", return_value=mock_config), \
+                patch("backend.scheduler.reminder_service.get_focus_mode_service") as mock_focus, \
+                patch("backend.scheduler.reminder_service.send_notification_sync") as send:
+            mock_focus.return_value.should_suppress_notification.return_value = False
+            reminder_service.check_and_trigger(55.0, None)
+
+        send.assert_called_once()
+        assert "Usage reached 50%" in send.call_args.args[1]
+
     def test_does_not_retrigger_percentage(
         self,
         reminder_service: ReminderService,
@@ -181,18 +183,14 @@ class TestCheckAndTrigger:
                     assert ReminderType.BEFORE_RESET in types
                     assert 15 in reminder_service._triggered_before_reset
 
-    def test_callback_is_called(
+    def test_fired_reminder_published(
         self,
         reminder_service: ReminderService,
         mock_config: MagicMock,
     ):
-        """Test callback is invoked on trigger."""
-        callback_called = []
-
-        def test_callback(t: ReminderType, m: str) -> None:
-            callback_called.append((t, m))
-
-        reminder_service.add_callback(test_callback)
+        """Test triggered reminders are published on the event bus."""
+        fired: list[ReminderFired] = []
+        get_event_bus().on(REMINDER_FIRED, fired.append)
 
         with patch("backend.scheduler.reminder_service.load_config", return_value=mock_config):
             with patch(
@@ -207,20 +205,20 @@ class TestCheckAndTrigger:
                 ):
                     reminder_service.check_and_trigger(50.0, None)
 
-                    assert len(callback_called) > 0
-                    assert callback_called[0][0] == ReminderType.PERCENTAGE
+                    assert len(fired) > 0
+                    assert fired[0].kind == ReminderType.PERCENTAGE.value
 
-    def test_callback_error_handled(
+    def test_subscriber_error_handled(
         self,
         reminder_service: ReminderService,
         mock_config: MagicMock,
     ):
-        """Test callback error is handled gracefully."""
+        """Test a failing bus handler doesn't stop reminders."""
 
-        def bad_callback(t: ReminderType, m: str) -> None:
-            raise Exception("Callback error")
+        def bad_handler(_event: ReminderFired) -> None:
+            raise Exception("Handler error")
 
-        reminder_service.add_callback(bad_callback)
+        get_event_bus().on(REMINDER_FIRED, bad_handler)
 
         with patch("backend.scheduler.reminder_service.load_config", return_value=mock_config):
             with patch(
@@ -269,3 +267,67 @@ class TestGetReminderService:
         assert service1 is service2
 
         module._service = None  # Cleanup
+
+
+class TestRules:
+    """Tests for configured reminder rules."""
+
+    def _check(self, service: ReminderService, config: AppConfig, current_usage: float, **kwargs):
+        with patch("backend.scheduler.reminder_service.load_config", return_value=config), \
+                patch("backend.scheduler.reminder_service.send_notification_sync"):
+            return service.check_and_trigger(current_usage, None, **kwargs)
+
+    @pytest.fixture
+    def config(self) -> AppConfig:
+        return AppConfig(reminder=ReminderConfig(
+            percentage_thresholds=[],
+            anomaly_detection=False,
+            rules=[
+                ReminderRule(name="high", when="utilization > 70", message="Over 70%"),
+                ReminderRule(name="opus", when="seven_day_opus > 80"),
+            ],
+        ))
+
+    def test_rule_is_edge_triggered(self, reminder_service: ReminderService, config: AppConfig):
+        """Test a rule fires when it starts holding and re-arms when it stops."""
+        assert self._check(reminder_service, config, 50.0) == []
+        assert self._check(reminder_service, config, 75.0) == [(ReminderType.RULE, "Over 70%")]
+        assert self._check(reminder_service, config, 80.0) == []
+        assert self._check(reminder_service, config, 10.0) == []
+        with patch("backend.scheduler.notifier.DEDUP_SECONDS", 0.0):
+            assert self._check(reminder_service, config, 75.0) == [(ReminderType.RULE, "Over 70%")]
+
+    def test_rearmed_rule_deduplicated(self, reminder_service: ReminderService, config: AppConfig):
+        """Test a rule re-firing within the dedup period is not reported again."""
+        assert self._check(reminder_service, config, 75.0) == [(ReminderType.RULE, "Over 70%")]
+        assert self._check(reminder_service, config, 10.0) == []
+        assert self._check(reminder_service, config, 75.0) == []
+
+    def test_rule_on_seven_day_usage(self, reminder_service: ReminderService, config: AppConfig):
+        """Test rules see the seven-day limits of the full response."""
+        usage = UsageResponse(seven_day_opus={"utilization": 85.0})
+        result = self._check(reminder_service, config, 0.0, usage=usage)
+        assert result == [(ReminderType.RULE, "Rule opus matched: seven_day_opus > 80")]
+
+    def test_rule_state_persists(self, reminder_service: ReminderService, config: AppConfig):
+        """Test another process does not re-fire an active rule."""
+        self._check(reminder_service, config, 75.0)
+        assert self._check(ReminderService(), config, 75.0) == []
+
+
+class TestRuleValues:
+    """Tests for rule_values."""
+
+    def test_minutes_to_reset(self):
+        """Test minutes to reset follow the reset time."""
+        reset = datetime.now() + timedelta(minutes=90)
+        values = rule_values(40.0, reset)
+        assert values["utilization"] == 40.0
+        assert 89 < values["minutes_to_reset"] <= 90
+
+    def test_missing_values_are_nan(self):
+        """Test unknown values are NaN."""
+        values = rule_values(40.0, None, UsageResponse())
+        assert math.isnan(values["minutes_to_reset"])
+        assert math.isnan(values["seven_day"])
+        assert "extra_usage" not in values
@@ -0,0 +1,106 @@
+"""Tests for the reminder rule language."""
+
+import math
+
+import pytest
+
+from backend.core.config_manager import ReminderRule
+from backend.scheduler.reminder_rules import RuleError, RuleSet, get_rule_set, parse_rule
+
+
+def _rules(*expressions: str) -> list[ReminderRule]:
+    return [ReminderRule(name=f"r{i}", when=expr) for i, expr in enumerate(expressions)]
+
+
+class TestParseRule:
+    """Tests for parse_rule."""
+
+    @pytest.mark.parametrize("expression", [
+        "utilization > 70",
+        "utilization > 70 and minutes_to_reset > 120",
+        "not (seven_day >= 50 or -extra_usage < -10)",
+        "utilization / minutes_to_reset * 60 > 100",
+        "1 < utilization <= 2.5",
+    ])
+    def test_valid(self, expression: str):
+        """Test supported syntax parses."""
+        parse_rule(expression)
+
+    @pytest.mark.parametrize("expression", [
+        "utilization >",
+        "__import__('os')",
+        "utilization.real > 1",
+        "unknown > 1",
+        "utilization > 'a'",
+        "utilization > True",
+        "utilization ** 2 > 1",
+        "[utilization][0] > 1",
+        "(lambda: 1)() > 0",
+    ])
+    def test_invalid(self, expression: str):
+        """Test anything outside the language is rejected."""
+        with pytest.raises(RuleError):
+            parse_rule(expression)
+
+
+class TestRuleSet:
+    """Tests for RuleSet."""
+
+    def test_evaluate(self):
+        """Test all rules evaluate in one call."""
+        rule_set = RuleSet(_rules(
+            "utilization > 70",
+            "utilization > 70 and minutes_to_reset > 120",
+        ))
+        assert rule_set.evaluate({"utilization": 80, "minutes_to_reset": 60}) == (True, False)
+        assert rule_set.evaluate({"utilization": 80, "minutes_to_reset": 180}) == (True, True)
+
+    def test_missing_value_is_false(self):
+        """Test comparisons on unknown values are false, `!=` included."""
+        rule_set = RuleSet(_rules("seven_day > 50", "seven_day != 50", "1 < seven_day != 50"))
+        assert rule_set.evaluate({}) == (False, False, False)
+        assert rule_set.evaluate({"seven_day": 60}) == (True, True, True)
+
+    def test_not_negates_unknown_comparison(self):
+        """Test `not` over a comparison on an unknown value holds, as documented."""
+        rule_set = RuleSet(_rules("not seven_day_opus < 50", "seven_day_opus >= 50"))
+        assert rule_set.evaluate({}) == (True, False)
+        assert rule_set.evaluate({"seven_day_opus": 40}) == (False, False)
+
+    def test_division_by_zero_is_nan(self):
+        """Test dividing by zero does not raise."""
+        rule_set = RuleSet(_rules("utilization / minutes_to_reset > 1"))
+        assert rule_set.evaluate({"utilization": 50, "minutes_to_reset": 0}) == (False,)
+
+    def test_skips_invalid_and_disabled(self):
+        """Test invalid and disabled rules are left out."""
+        rules = _rules("utilization > 1", "bogus > 1", "utilization > 2")
+        rules[2].enabled = False
+        rule_set = RuleSet(rules)
+        assert [rule.name for rule in rule_set.rules] == ["r0"]
+
+    def test_rising(self):
+        """Test rules fire on the rising edge only."""
+        rule_set = RuleSet(_rules("utilization > 70"))
+        active: set[str] = set()
+        assert [r.name for r in rule_set.rising({"utilization": 80}, active)] == ["r0"]
+        assert rule_set.rising({"utilization": 90}, active) == []
+        assert rule_set.rising({"utilization": 10}, active) == []
+        assert active == set()
+        assert len(rule_set.rising({"utilization": 80}, active)) == 1
+
+    def test_nan_input(self):
+        """Test NaN inputs never match comparisons."""
+        rule_set = RuleSet(_rules("utilization > 1"))
+        assert rule_set.evaluate({"utilization": math.nan}) == (False,)
+
+
+class TestGetRuleSet:
+    """Tests for get_rule_set."""
+
+    def test_compiled_once_per_config(self):
+        """Test the rule set is reused until the rules change."""
+        rules = _rules("utilization > 70")
+        first = get_rule_set(rules)
+        assert get_rule_set(_rules("utilization > 70")) is first
+        assert get_rule_set(_rules("utilization > 75")) is not first
@@ -0,0 +1,182 @@
+"""Tests for exact-time reminder timer."""
+
+import asyncio
+from datetime import UTC, datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from backend.core.config_manager import AppConfig, ReminderConfig
+from backend.scheduler.reminder_service import ReminderService, ReminderType
+from backend.scheduler.reminder_timer import ON_RESET, ReminderTimer
+
+RESET_AT = 1_800_000_000.0
+
+
+class FakeClock:
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def config() -> AppConfig:
+    return AppConfig(reminder=ReminderConfig(before_reset_minutes=[15, 30, 60], on_reset=True))
+
+
+@pytest.fixture
+def service() -> MagicMock:
+    service = MagicMock(spec=ReminderService)
+    service.fire_scheduled.side_effect = lambda t, m=0: (t, f"{t.value}:{m}")
+    return service
+
+
+def _reset_time(offset: float = 0.0) -> datetime:
+    return datetime.fromtimestamp(RESET_AT + offset, UTC)
+
+
+class TestReminderTimer:
+    """Tests for ReminderTimer."""
+
+    def test_schedule_builds_heap(self, service: MagicMock, config: AppConfig):
+        """Test fire times are exact and future-only."""
+        clock = FakeClock(RESET_AT - 45 * 60)
+        timer = ReminderTimer(service, clock)
+        with patch("backend.scheduler.reminder_timer.load_config", return_value=config):
+            timer.schedule(_reset_time())
+
+        # The 60-minute reminder is already in the past
+        assert sorted(timer._heap) == [
+            (RESET_AT - 30 * 60, 30),
+            (RESET_AT - 15 * 60, 15),
+            (RESET_AT, ON_RESET),
+        ]
+        assert timer.next_fire_at() == RESET_AT - 30 * 60
+
+    def test_fire_due_in_order(self, service: MagicMock, config: AppConfig):
+        """Test due reminders fire earliest first."""
+        clock = FakeClock(RESET_AT - 90 * 60)
+        timer = ReminderTimer(service, clock)
+        with patch("backend.scheduler.reminder_timer.load_config", return_value=config):
+            timer.schedule(_reset_time())
+
+        clock.now = RESET_AT - 20 * 60
+        fired = timer.fire_due()
+        assert [t for t, _ in fired] == [ReminderType.BEFORE_RESET, ReminderType.BEFORE_RESET]
+        assert [c.args for c in service.fire_scheduled.call_args_list] == [
+            (ReminderType.BEFORE_RESET, 60),
+            (ReminderType.BEFORE_RESET, 30),
+        ]
+
+        clock.now = RESET_AT
+        fired = timer.fire_due()
+        assert [t for t, _ in fired] == [ReminderType.BEFORE_RESET, ReminderType.ON_RESET]
+        assert timer.next_fire_at() is None
+
+    def test_jitter_does_not_reschedule(self, service: MagicMock, config: AppConfig):
+        """Test resets_at jitter keeps the existing heap."""
+        timer = ReminderTimer(service, FakeClock(RESET_AT - 90 * 60))
+        with patch("backend.scheduler.reminder_timer.load_config", return_value=config):
+            timer.schedule(_reset_time())
+            before = list(timer._heap)
+            timer.schedule(_reset_time(5))
+
+        assert timer._heap == before
+        service.set_window.assert_called_once()
+
+    def test_new_window_fires_leftovers(self, service: MagicMock, config: AppConfig):
+        """Test a new reset window fires leftovers and moves the service window."""
+        clock = FakeClock(RESET_AT - 10 * 60)
+        timer = ReminderTimer(service, clock)
+        with patch("backend.scheduler.reminder_timer.load_config", return_value=config):
+            timer.schedule(_reset_time())
+            clock.now = RESET_AT + 1
+            timer.schedule(_reset_time(5 * 3600))
+
+        service.fire_scheduled.assert_called_once_with(ReminderType.ON_RESET)
+        assert service.set_window.call_args.args == (_reset_time(5 * 3600),)
+        assert timer.next_fire_at() == RESET_AT + 4 * 3600
+
+    def test_config_change_reschedules(self, service: MagicMock, config: AppConfig):
+        """Test changed reminder minutes rebuild the heap."""
+        timer = ReminderTimer(service, FakeClock(RESET_AT - 90 * 60))
+        with patch("backend.scheduler.reminder_timer.load_config", return_value=config):
+            timer.schedule(_reset_time())
+        config.reminder.before_reset_minutes = [5]
+        with patch("backend.scheduler.reminder_timer.load_config", return_value=config):
+            timer.schedule(_reset_time())
+
+        assert sorted(m for _, m in timer._heap) == [ON_RESET, 5]
+
+    @pytest.mark.asyncio
+    async def test_run_sleeps_until_fire_time(self, service: MagicMock, config: AppConfig):
+        """Test run wakes at the scheduled time without polling."""
+        loop = asyncio.get_running_loop()
+        clock = FakeClock(0.0)
+        timer = ReminderTimer(service, lambda: loop.time() + clock.now)
+        task = asyncio.create_task(timer.run())
+        await asyncio.sleep(0)
+
+        # Schedule a reset 15 minutes and 0.05 s away
+        clock.now = RESET_AT - 15 * 60 - 0.05 - loop.time()
+        with patch("backend.scheduler.reminder_timer.load_config", return_value=config):
+            timer.schedule(_reset_time())
+        await asyncio.sleep(0.2)
+        task.cancel()
+
+        service.fire_scheduled.assert_called_once_with(ReminderType.BEFORE_RESET, 15)
+
+
+class TestFireScheduled:
+    """Tests for ReminderService.fire_scheduled."""
+
+    def test_fires_once_per_window(self):
+        """Test a scheduled reminder is sent once until triggers reset."""
+        service = ReminderService()
+        focus = MagicMock()
+        focus.should_suppress_notification.return_value = False
+        with patch("backend.scheduler.reminder_service.load_config", return_value=AppConfig()), \
+                patch("backend.scheduler.reminder_service.get_focus_mode_service", return_value=focus), \
+                patch("backend.scheduler.reminder_service.send_notification_sync") as send:
+            assert service.fire_scheduled(ReminderType.BEFORE_RESET, 15) == (
+                ReminderType.BEFORE_RESET, "Token reset in 15 minutes!",
+            )
+            assert service.fire_scheduled(ReminderType.BEFORE_RESET, 15) is None
+            assert service.fire_scheduled(ReminderType.ON_RESET) is not None
+            service.reset_triggers()
+            # The second on-reset is within the cross-process dedup period
+            assert service.fire_scheduled(ReminderType.ON_RESET) is None
+            assert service._reset_triggered
+
+        assert send.call_count == 2
+
+    def test_suppressed(self):
+        """Test focus mode suppresses scheduled reminders."""
+        service = ReminderService()
+        focus = MagicMock()
+        focus.should_suppress_notification.return_value = True
+        with patch("backend.scheduler.reminder_service.load_config", return_value=AppConfig()), \
+                patch("backend.scheduler.reminder_service.get_focus_mode_service", return_value=focus), \
+                patch("backend.scheduler.reminder_service.send_notification_sync") as send:
+            assert service.fire_scheduled(ReminderType.ON_RESET) is None
+
+        send.assert_not_called()
+
+    def test_suppressed_reminder_stays_pending(self):
+        """Test a suppressed reminder is not marked sent, so it fires once focus ends."""
+        service = ReminderService()
+        focus = MagicMock()
+        focus.should_suppress_notification.return_value = True
+        with patch("backend.scheduler.reminder_service.load_config", return_value=AppConfig()), \
+                patch("backend.scheduler.reminder_service.get_focus_mode_service", return_value=focus), \
+                patch("backend.scheduler.reminder_service.send_notification_sync") as send:
+            assert service.fire_scheduled(ReminderType.BEFORE_RESET, 15) is None
+            assert ReminderService()._triggered_before_reset == set()
+
+            focus.should_suppress_notification.return_value = False
+            assert service.fire_scheduled(ReminderType.BEFORE_RESET, 15) is not None
+
+        send.assert_called_once()
+        assert ReminderService()._triggered_before_reset == {15}
@@ -0,0 +1,194 @@
+"""Tests for the webhook notification channel."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from backend.core.config_manager import AppConfig, ReminderConfig, WebhookConfig
+from backend.scheduler import webhook
+from backend.scheduler.webhook import (
+    Outbox,
+    WebhookEvent,
+    WebhookSender,
+    outbox_path,
+    render_payload,
+)
+
+URL = "http://hooks.test/claudeminder"
+
+
+def _event(body: str, url: str = URL) -> WebhookEvent:
+    return WebhookEvent(body, url, "Claudiminder", body, 1000.0)
+
+
+@pytest.fixture
+def config(monkeypatch: pytest.MonkeyPatch) -> AppConfig:
+    """Config with one webhook."""
+    config = AppConfig(reminder=ReminderConfig(webhooks=[
+        WebhookConfig(url=URL, headers={"Authorization": "Bearer secret"}),
+    ]))
+    monkeypatch.setattr("backend.scheduler.webhook.load_config", lambda: config)
+    return config
+
+
+@pytest.fixture
+def sender() -> WebhookSender:
+    """Sender that doesn't actually sleep between retries."""
+    return WebhookSender(sleep=AsyncMock())
+
+
+class TestRenderPayload:
+    """Tests for render_payload."""
+
+    def test_default_template(self):
+        """Test the default template joins a batch into one text."""
+        payload = render_payload(WebhookConfig(url=URL).template, [_event("a"), _event("b")])
+        assert payload == {"text": "*Claudiminder*\na\nb"}
+
+    def test_events_and_nesting(self):
+        """Test $events, $count and nested values."""
+        template = {"summary": {"n": "$count events"}, "items": "$events", "keep": [1, "$$x"]}
+        payload = render_payload(template, [_event("a")])
+        assert payload == {
+            "summary": {"n": "1 events"},
+            "items": [{"title": "Claudiminder", "body": "a", "timestamp": 1000.0}],
+            "keep": [1, "$x"],
+        }
+
+
+class TestOutbox:
+    """Tests for Outbox."""
+
+    def test_append_and_remove(self):
+        """Test events persist until removed."""
+        outbox = Outbox(outbox_path())
+        outbox.append([_event("a"), _event("b")])
+        assert [e.body for e in Outbox(outbox_path()).events()] == ["a", "b"]
+        outbox.remove({"a"})
+        assert [e.body for e in outbox.events()] == ["b"]
+
+    def test_drops_oldest_when_full(self, monkeypatch: pytest.MonkeyPatch):
+        """Test the outbox is capped."""
+        monkeypatch.setattr(webhook, "MAX_OUTBOX_EVENTS", 2)
+        outbox = Outbox(outbox_path())
+        outbox.append([_event("a"), _event("b"), _event("c")])
+        assert [e.body for e in outbox.events()] == ["b", "c"]
+
+    def test_skips_corrupt_lines(self):
+        """Test unreadable lines are dropped."""
+        outbox = Outbox(outbox_path())
+        outbox.append([_event("a")])
+        with open(outbox.path, "a") as f:
+            f.write("{not json\n")
+        assert [e.body for e in outbox.events()] == ["a"]
+
+
+class TestWebhookSender:
+    """Tests for WebhookSender."""
+
+    @pytest.mark.usefixtures("config")
+    async def test_send_posts_when_not_running(self, sender: WebhookSender, httpx_mock: HTTPXMock):
+        """Test a notification is POSTed straight away without a running sender."""
+        httpx_mock.add_response(url=URL, method="POST")
+
+        assert await sender.send("Claudiminder", "Usage reached 75%")
+
+        request = httpx_mock.get_request()
+        assert json.loads(request.content) == {"text": "*Claudiminder*\nUsage reached 75%"}
+        assert request.headers["Authorization"] == "Bearer secret"
+        assert sender.outbox.events() == []
+
+    async def test_no_webhooks(self, monkeypatch: pytest.MonkeyPatch, sender: WebhookSender):
+        """Test nothing is queued without webhooks."""
+        monkeypatch.setattr("backend.scheduler.webhook.load_config", lambda: AppConfig())
+        assert not await sender.send("t", "b")
+        assert sender.outbox.events() == []
+
+    @pytest.mark.usefixtures("config")
+    async def test_batches_outbox(self, sender: WebhookSender, httpx_mock: HTTPXMock):
+        """Test queued events go out in one request."""
+        httpx_mock.add_response(url=URL, method="POST")
+        sender.enqueue("Claudiminder", "a")
+        sender.enqueue("Claudiminder", "b")
+
+        async with httpx.AsyncClient() as client:
+            assert await sender.flush(client) == 2
+
+        assert len(httpx_mock.get_requests()) == 1
+        assert json.loads(httpx_mock.get_request().content)["text"] == "*Claudiminder*\na\nb"
+
+    @pytest.mark.usefixtures("config")
+    async def test_retries_with_backoff(self, sender: WebhookSender, httpx_mock: HTTPXMock):
+        """Test transient failures are retried after a jittered delay."""
+        httpx_mock.add_exception(httpx.ConnectError("offline"), url=URL)
+        httpx_mock.add_response(url=URL, method="POST", status_code=503)
+        httpx_mock.add_response(url=URL, method="POST")
+        sender.enqueue("Claudiminder", "a")
+
+        with patch("backend.scheduler.webhook.random.uniform", side_effect=lambda _a, b: b):
+            async with httpx.AsyncClient() as client:
+                assert await sender.flush(client) == 1
+
+        assert [call.args[0] for call in sender._sleep.await_args_list] == [1.0, 2.0]
+
+    @pytest.mark.usefixtures("config")
+    async def test_keeps_events_while_offline(self, sender: WebhookSender, httpx_mock: HTTPXMock):
+        """Test events stay in the outbox until a later flush succeeds."""
+        httpx_mock.add_exception(httpx.ConnectError("offline"), url=URL)
+        assert await sender.send("Claudiminder", "a")
+        assert [e.body for e in sender.outbox.events()] == ["a"]
+
+        httpx_mock.add_response(url=URL, method="POST")
+        async with httpx.AsyncClient() as client:
+            assert await sender.flush(client) == 1
+        assert sender.outbox.events() == []
+
+    @pytest.mark.usefixtures("config")
+    async def test_drops_rejected_events(self, sender: WebhookSender, httpx_mock: HTTPXMock):
+        """Test a permanent rejection is not retried."""
+        httpx_mock.add_response(url=URL, method="POST", status_code=400)
+        sender.enqueue("Claudiminder", "a")
+
+        async with httpx.AsyncClient() as client:
+            assert await sender.flush(client) == 0
+
+        assert len(httpx_mock.get_requests()) == 1
+        assert sender.outbox.events() == []
+
+    @pytest.mark.usefixtures("config")
+    async def test_drops_events_for_removed_webhook(self, sender: WebhookSender):
+        """Test events for a webhook no longer configured are discarded."""
+        sender.outbox.append([_event("a", url="http://old.test/")])
+        async with httpx.AsyncClient() as client:
+            assert await sender.flush(client) == 0
+        assert sender.outbox.events() == []
+
+    @pytest.mark.usefixtures("config")
+    async def test_run_delivers_batch(
+        self,
+        sender: WebhookSender,
+        httpx_mock: HTTPXMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Test the running sender batches events arriving together."""
+        monkeypatch.setattr(webhook, "BATCH_SECONDS", 0.05)
+        httpx_mock.add_response(url=URL, method="POST")
+        task = asyncio.create_task(sender.run())
+        await asyncio.sleep(0)
+
+        assert await sender.send("Claudiminder", "a")
+        assert await sender.send("Claudiminder", "b")
+        assert sender.running
+        for _ in range(50):
+            if not sender.outbox.events():
+                break
+            await asyncio.sleep(0.01)
+
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        assert len(httpx_mock.get_requests()) == 1
+        assert not sender.running
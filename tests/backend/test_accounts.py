@@ -0,0 +1,100 @@
+"""Tests for per-account usage summaries."""
+
+from __future__ import annotations
+
+import math
+
+from backend.core.accounts import (
+    STALE_SECONDS,
+    AccountMonitor,
+    AccountState,
+    AccountStatus,
+    list_accounts,
+    summarize,
+)
+from backend.core.usage_history import UsageSample, get_usage_history
+
+NOW = 1_800_000_000.0
+RESETS_AT = NOW + 3600
+
+
+def _append(account: str, ts: float, util: float) -> None:
+    get_usage_history(account).append(UsageSample(ts, util, RESETS_AT, math.nan))
+
+
+class TestAccountStatus:
+    """Tests for AccountStatus.state."""
+
+    def _status(self, utilization: float, updated_at: float = NOW, resets_at: float = RESETS_AT):
+        return AccountStatus("a", utilization, math.nan, resets_at, updated_at)
+
+    def test_thresholds(self):
+        """Test utilization maps to ok, warning and critical."""
+        assert self._status(10.0).state(NOW) == AccountState.OK
+        assert self._status(80.0).state(NOW) == AccountState.WARNING
+        assert self._status(95.0).state(NOW) == AccountState.CRITICAL
+
+    def test_reset_and_stale(self):
+        """Test a passed reset time and old samples take precedence."""
+        assert self._status(95.0, resets_at=NOW - 1).state(NOW) == AccountState.RESET
+        old = NOW - STALE_SECONDS - 1
+        assert self._status(95.0, updated_at=old).state(NOW) == AccountState.STALE
+
+
+class TestSummarize:
+    """Tests for summarize."""
+
+    def test_empty_history(self):
+        """Test an account without samples has no summary."""
+        assert summarize("x", get_usage_history("x")) is None
+
+    def test_slope_from_recent_samples(self):
+        """Test the rate only covers the recent window."""
+        _append("x", NOW - 3 * 3600, 0.0)
+        _append("x", NOW - 600, 20.0)
+        _append("x", NOW, 25.0)
+
+        status = summarize("x", get_usage_history("x"))
+        assert status is not None
+        assert status.utilization == 25.0
+        assert status.updated_at == NOW
+        assert status.slope == 5.0 / (600 / 3600)
+
+    def test_single_sample_has_unknown_slope(self):
+        """Test one sample gives no rate."""
+        _append("x", NOW, 25.0)
+        status = summarize("x", get_usage_history("x"))
+        assert status is not None
+        assert math.isnan(status.slope)
+
+
+class TestAccountMonitor:
+    """Tests for AccountMonitor."""
+
+    def test_lists_accounts_from_history_dir(self):
+        """Test every sample store is an account."""
+        _append("team-b", NOW, 1.0)
+        _append("team-a", NOW, 2.0)
+        assert list_accounts() == ["team-a", "team-b"]
+
+    def test_refresh_reports_changes_only(self):
+        """Test only accounts with new samples are re-read and reported."""
+        _append("a", NOW, 10.0)
+        _append("b", NOW, 20.0)
+        monitor = AccountMonitor()
+        assert monitor.refresh() == {"a", "b"}
+        assert monitor.refresh() == set()
+
+        _append("b", NOW + 60, 30.0)
+        assert monitor.refresh() == {"b"}
+        assert monitor.statuses["b"].utilization == 30.0
+
+    def test_refresh_drops_removed_accounts(self):
+        """Test a deleted store removes the account."""
+        _append("a", NOW, 10.0)
+        monitor = AccountMonitor()
+        monitor.refresh()
+
+        get_usage_history("a").path.unlink()
+        assert monitor.refresh() == {"a"}
+        assert monitor.statuses == {}
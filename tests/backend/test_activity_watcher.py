@@ -0,0 +1,101 @@
+"""Tests for Claude Code activity watcher."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from backend.core import activity_watcher
+from backend.core.activity_watcher import ActivityWatcher
+
+
+@pytest.fixture
+def projects(tmp_path: Path) -> Path:
+    root = tmp_path / "projects"
+    (root / "alpha").mkdir(parents=True)
+    return root
+
+
+class TestActivityWatcher:
+    """Tests for ActivityWatcher."""
+
+    def test_idle_seconds_reset_on_activity(self, projects: Path):
+        """Test mark_active resets the idle clock."""
+        watcher = ActivityWatcher(projects)
+        watcher.last_activity -= 100
+        assert watcher.idle_seconds() >= 100
+        watcher.mark_active()
+        assert watcher.idle_seconds() < 1
+
+    @pytest.mark.asyncio
+    async def test_times_out_without_activity(self, projects: Path):
+        """Test wait returns False after the timeout."""
+        watcher = ActivityWatcher(projects)
+        watcher.start()
+        try:
+            assert await watcher.wait_for_activity(0.05) is False
+        finally:
+            watcher.stop()
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+    async def test_inotify_wakes_on_write(self, projects: Path):
+        """Test a transcript write wakes the waiter via inotify."""
+        watcher = ActivityWatcher(projects)
+        watcher.start()
+        try:
+            assert watcher.uses_inotify
+            loop = asyncio.get_running_loop()
+            loop.call_later(0.05, (projects / "alpha" / "s.jsonl").write_text, "{}\n")
+            assert await watcher.wait_for_activity(5) is True
+        finally:
+            watcher.stop()
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+    async def test_inotify_watches_new_projects(self, projects: Path):
+        """Test project directories created later are watched too."""
+        watcher = ActivityWatcher(projects)
+        watcher.start()
+        try:
+            (projects / "beta").mkdir()
+            await watcher.wait_for_activity(1)
+            loop = asyncio.get_running_loop()
+            loop.call_later(0.05, (projects / "beta" / "s.jsonl").write_text, "{}\n")
+            assert await watcher.wait_for_activity(5) is True
+        finally:
+            watcher.stop()
+
+    @pytest.mark.asyncio
+    async def test_stat_fallback(self, projects: Path, monkeypatch: pytest.MonkeyPatch):
+        """Test the stat fallback notices new transcript writes."""
+        monkeypatch.setattr(activity_watcher.sys, "platform", "darwin")
+        monkeypatch.setattr(activity_watcher, "STAT_INTERVAL_SECONDS", 0.02)
+        watcher = ActivityWatcher(projects)
+        watcher.start()
+        assert not watcher.uses_inotify
+
+        (projects / "alpha" / "s.jsonl").write_text("{}\n")
+        assert await watcher.wait_for_activity(1) is True
+        assert await watcher.wait_for_activity(0.1) is False
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+    def test_inotify_closes_fd_when_watch_fails(
+        self, projects: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test the inotify descriptor is closed if adding a watch fails."""
+        fds: list[int] = []
+
+        def failing_watch(self: activity_watcher._Inotify, _path: Path) -> int:
+            fds.append(self.fd)
+            raise OSError(28, "inotify_add_watch failed")
+
+        monkeypatch.setattr(activity_watcher._Inotify, "_watch", failing_watch)
+        with pytest.raises(OSError):
+            activity_watcher._Inotify(projects)
+        with pytest.raises(OSError):
+            os.fstat(fds[0])
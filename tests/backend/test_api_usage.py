@@ -18,6 +18,7 @@ from backend.api.usage import (
     get_usage_sync,
     is_token_expired,
 )
+from backend.core.perf_metrics import get_perf_metrics
 from backend.models.usage import UsageResponse
 
 
@@ -38,6 +39,7 @@ class TestGetUsageAsync:
             with patch("backend.api.usage._is_cache_valid", return_value=True):
                 result = await get_usage_async()
                 assert result == mock_usage_response
+        assert get_perf_metrics().counters == {"usage_cache.hit": 1}
 
     @pytest.mark.asyncio
     async def test_raises_token_expired_when_no_token(self):
@@ -70,6 +72,10 @@ class TestGetUsageAsync:
                 assert result.five_hour is not None
                 assert result.five_hour.utilization == 0.45
 
+        metrics = get_perf_metrics()
+        assert metrics.counters == {"usage_cache.miss": 1}
+        assert metrics.durations["fetch"].count == 1
+
     @pytest.mark.asyncio
     async def test_raises_token_expired_on_401(self):
         """Test TokenExpiredError on 401 response."""
@@ -97,3 +97,66 @@ class TestMain:
         """Test main function can be imported."""
         from backend.cli import main
         assert callable(main)
+
+
+class TestTopCommand:
+    """Test top command."""
+
+    def test_top_empty(self):
+        """Test top without transcripts."""
+        result = runner.invoke(app, ["top"])
+        assert result.exit_code == 0
+        assert "No Claude Code transcript usage found" in result.output
+
+    def test_top_json(self):
+        """Test top JSON output."""
+        from backend.core.token_index import TokenUsage
+
+        mock_index = MagicMock()
+        mock_index.top.return_value = [TokenUsage("alpha", 1, 2, 3, 4)]
+        with patch("backend.core.token_index.get_token_index", return_value=mock_index):
+            result = runner.invoke(app, ["top", "--json", "--by", "model"])
+
+        data = json.loads(result.output)
+        assert data["by"] == "model"
+        assert data["top"][0]["name"] == "alpha"
+        assert data["top"][0]["total"] == 10
+        mock_index.top.assert_called_once()
+
+    def test_top_invalid_grouping(self):
+        """Test top rejects unknown grouping."""
+        result = runner.invoke(app, ["top", "--by", "session"])
+        assert result.exit_code == 1
+
+
+class TestDaemonCommand:
+    """Tests for daemon command."""
+
+    def test_daemon_already_running(self):
+        """Test exits with an error when another instance holds the lock."""
+        with patch("backend.daemon.run_daemon", return_value=False):
+            result = runner.invoke(app, ["daemon"])
+
+        assert result.exit_code == 1
+        assert "already running" in result.output
+
+
+class TestQueueCommand:
+    """Tests for queue commands."""
+
+    def test_add_list_remove(self):
+        """Test queueing, listing and removing a job."""
+        result = runner.invoke(app, ["queue", "add", "make build", "--estimated-usage", "30"])
+        assert result.exit_code == 0
+        job_id = result.output.split()[2]
+
+        result = runner.invoke(app, ["queue", "list", "--json"])
+        jobs = json.loads(result.output)["jobs"]
+        assert [(j["id"], j["estimated_usage"]) for j in jobs] == [(job_id, 30.0)]
+
+        assert runner.invoke(app, ["queue", "remove", job_id]).exit_code == 0
+        assert "Queue is empty" in runner.invoke(app, ["queue", "list"]).output
+
+    def test_remove_unknown(self):
+        """Test removing an unknown job fails."""
+        assert runner.invoke(app, ["queue", "remove", "nope"]).exit_code == 1
@@ -7,6 +7,7 @@ import os
 from backend.core.config_manager import (
     AppConfig,
     ReminderConfig,
+    ReminderRule,
     FocusModeConfig,
     GoalsConfig,
     load_config,
@@ -74,6 +75,17 @@ class TestConfigModels:
         assert config.goals.enabled is True
         assert config.goals.daily_budget_percent == 80
 
+    def test_scheduler_config_from_gui_payload(self):
+        """Test scheduled commands saved by the GUI validate."""
+        config = AppConfig.model_validate({
+            "scheduler": {"commands": [{
+                "id": "cmd_1", "name": "Backup", "command": "echo hi",
+                "trigger": "cron", "value": "0 * * * *", "enabled": True,
+            }]},
+        })
+        assert config.scheduler.commands[0].trigger == "cron"
+        assert AppConfig().scheduler.commands == []
+
 
 class TestConfigIO:
     """Test config file I/O operations."""
@@ -111,3 +123,14 @@ class TestConfigIO:
         assert loaded.language == "vi"
         assert loaded.poll_interval_seconds == 120
         assert loaded.focus_mode.enabled is True
+
+    def test_save_rule_without_message(self, monkeypatch, tmp_path):
+        """Test rules with unset optional fields survive a round-trip."""
+        fake_dir = tmp_path / "backend"
+        monkeypatch.setattr("backend.core.config_manager.CONFIG_DIR", fake_dir)
+        monkeypatch.setattr("backend.core.config_manager.CONFIG_FILE", fake_dir / "config.toml")
+
+        rule = ReminderRule(name="high", when="utilization > 80")
+        save_config(AppConfig(reminder=ReminderConfig(rules=[rule])))
+
+        assert load_config().reminder.rules == [rule]
@@ -0,0 +1,105 @@
+"""Tests for background daemon."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.core.config_manager import AppConfig, ScheduledCommand, SchedulerConfig
+from backend.core.event_bus import CONFIG_CHANGED, USAGE_SAMPLE, ConfigChanged, get_event_bus
+from backend.daemon import Daemon, derive_update, parse_reset_time, run_daemon
+from backend.models.usage import FiveHourUsage, UsageResponse
+
+
+def _usage(resets_at: str = "2026-01-17T12:00:00Z") -> UsageResponse:
+    return UsageResponse(five_hour=FiveHourUsage(utilization=42.0, resets_at=resets_at))
+
+
+class TestDaemon:
+    """Tests for Daemon."""
+
+    def test_parse_reset_time(self):
+        """Test resets_at is parsed as an aware datetime."""
+        reset = parse_reset_time(_usage())
+        assert reset is not None and reset.utcoffset() is not None
+        assert parse_reset_time(UsageResponse(five_hour=None)) is None
+
+    def test_apply_updates_services(self):
+        """Test fresh usage reschedules timers and checks reminders."""
+        command = ScheduledCommand(id="a", name="a", command="true", trigger="cycle")
+        config = AppConfig(scheduler=SchedulerConfig(commands=[command]))
+        daemon = Daemon()
+        daemon.reminder_timer = MagicMock()
+        daemon.command_scheduler = MagicMock()
+        daemon.job_queue = MagicMock()
+        reminders = MagicMock()
+
+        with patch("backend.daemon.load_config", return_value=config), \
+                patch("backend.daemon.get_reminder_service", return_value=reminders):
+            usage = _usage()
+            daemon.apply(usage)
+
+        reset = parse_reset_time(usage)
+        daemon.reminder_timer.schedule.assert_called_once_with(reset)
+        daemon.command_scheduler.update.assert_called_once_with([command], reset)
+        daemon.job_queue.observe.assert_called_once_with(42.0, reset)
+        reminders.check_and_trigger.assert_called_once_with(
+            current_usage=42.0, reset_time=None, usage=usage, app_config=config,
+        )
+
+    def test_apply_publishes_update(self):
+        """Test the derived state is published once per response."""
+        daemon = Daemon()
+        daemon.reminder_timer = MagicMock()
+        daemon.command_scheduler = MagicMock()
+        daemon.job_queue = MagicMock()
+        seen = []
+        get_event_bus().on(USAGE_SAMPLE, seen.append)
+
+        with patch("backend.daemon.get_reminder_service"):
+            daemon.apply(_usage())
+
+        assert len(seen) == 1
+        assert seen[0].utilization == 42.0
+        assert seen[0].reset_time == parse_reset_time(_usage())
+        assert seen[0].pace is not None
+        assert seen[0].suppression is None
+
+    def test_derive_update_without_five_hour(self):
+        """Test responses without 5-hour data derive no pace."""
+        update = derive_update(UsageResponse(five_hour=None), AppConfig())
+        assert update.utilization == 0
+        assert update.pace is None and update.budget is None
+
+    @pytest.mark.asyncio
+    async def test_config_change_updates_schedule(self):
+        """Test saved scheduled commands apply without a restart."""
+        daemon = Daemon()
+        daemon.command_scheduler = MagicMock()
+        command = ScheduledCommand(id="a", name="a", command="true", trigger="cycle")
+        config = AppConfig(scheduler=SchedulerConfig(commands=[command]))
+
+        daemon.start()
+        get_event_bus().publish(CONFIG_CHANGED, ConfigChanged(config))
+        await daemon.stop()
+        get_event_bus().publish(CONFIG_CHANGED, ConfigChanged(config))
+
+        daemon.command_scheduler.update.assert_called_once_with([command], None)
+
+    @pytest.mark.asyncio
+    async def test_poll_once_logs_errors(self):
+        """Test a failing fetch does not raise."""
+        daemon = Daemon()
+        api = MagicMock()
+        api.get_usage = AsyncMock(side_effect=RuntimeError("offline"))
+        daemon._usage_api = api
+
+        await daemon.poll_once()
+        await daemon.poll_once()
+        assert daemon._last_error == "offline"
+
+    def test_run_daemon_respects_lock(self):
+        """Test the daemon refuses to start beside another instance."""
+        with patch("backend.daemon.acquire_instance_lock", return_value=None):
+            assert run_daemon() is False
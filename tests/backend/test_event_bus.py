@@ -0,0 +1,115 @@
+"""Tests for the event bus."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from backend.core.config_manager import AppConfig, save_config
+from backend.core.event_bus import (
+    CONFIG_CHANGED,
+    REMINDER_FIRED,
+    USAGE_SAMPLE,
+    EventBus,
+    OverflowPolicy,
+    ReminderFired,
+    get_event_bus,
+)
+from backend.scheduler.reminder_service import ReminderService
+
+
+class TestEventBus:
+    """Tests for EventBus."""
+
+    def test_inline_handlers(self):
+        """Test handlers run inline and a failing one doesn't stop others."""
+        bus = EventBus()
+        seen = []
+        bus.on(USAGE_SAMPLE, MagicMock(side_effect=RuntimeError("boom")))
+        bus.on(USAGE_SAMPLE, seen.append)
+        bus.on(REMINDER_FIRED, lambda _: seen.append("other topic"))
+
+        bus.publish(USAGE_SAMPLE, 1)
+        bus.off(USAGE_SAMPLE, seen.append)
+        bus.publish(USAGE_SAMPLE, 2)
+
+        assert seen == [1]
+
+    async def test_subscription_fans_out(self):
+        """Test each subscriber gets every event."""
+        bus = EventBus()
+        first = bus.subscribe(USAGE_SAMPLE)
+        second = bus.subscribe(USAGE_SAMPLE)
+        bus.publish(USAGE_SAMPLE, 1)
+        bus.publish(USAGE_SAMPLE, 2)
+
+        assert [await first.get(), await first.get()] == [1, 2]
+        assert await second.get() == 1
+
+    async def test_get_waits_for_publish(self):
+        """Test a consumer blocks until an event arrives."""
+        bus = EventBus()
+        subscription = bus.subscribe(USAGE_SAMPLE)
+        task = asyncio.create_task(subscription.get())
+        await asyncio.sleep(0)
+        assert not task.done()
+
+        bus.publish(USAGE_SAMPLE, "x")
+        assert await asyncio.wait_for(task, 1) == "x"
+
+    @pytest.mark.parametrize("policy, expected", [
+        (OverflowPolicy.DROP_OLDEST, [2, 3]),
+        (OverflowPolicy.DROP_NEWEST, [1, 2]),
+        (OverflowPolicy.LATEST, [3]),
+    ])
+    def test_overflow_policies(self, policy: OverflowPolicy, expected: list[int]):
+        """Test a full queue applies its policy instead of growing."""
+        bus = EventBus()
+        subscription = bus.subscribe(USAGE_SAMPLE, maxsize=2, policy=policy)
+        for event in (1, 2, 3):
+            bus.publish(USAGE_SAMPLE, event)
+
+        assert list(subscription._events) == expected
+        assert subscription.dropped == 3 - len(expected)
+
+    async def test_close_ends_iteration(self):
+        """Test a closed subscription drains, then stops."""
+        bus = EventBus()
+        subscription = bus.subscribe(USAGE_SAMPLE)
+        bus.publish(USAGE_SAMPLE, 1)
+        subscription.close()
+        bus.publish(USAGE_SAMPLE, 2)
+
+        assert [event async for event in subscription] == [1]
+
+
+class TestPublishers:
+    """Tests for events published by backend services."""
+
+    def test_save_config_publishes(self, tmp_path, monkeypatch: pytest.MonkeyPatch):
+        """Test saving the config announces it."""
+        from backend.core import config_manager
+
+        monkeypatch.setattr(config_manager, "CONFIG_DIR", tmp_path)
+        monkeypatch.setattr(config_manager, "CONFIG_FILE", tmp_path / "config.toml")
+        seen = []
+        get_event_bus().on(CONFIG_CHANGED, seen.append)
+        config = AppConfig(language="vi")
+
+        save_config(config)
+
+        assert seen[0].config is config
+
+    def test_reminder_fired_published(self):
+        """Test triggered reminders are announced."""
+        seen = []
+        get_event_bus().on(REMINDER_FIRED, seen.append)
+        config = AppConfig()
+        config.reminder.percentage_thresholds = [50]
+        config.reminder.anomaly_detection = False
+
+        with patch("backend.scheduler.reminder_service.load_config", return_value=config), \
+                patch("backend.scheduler.reminder_service.send_notification_sync"):
+            ReminderService().check_and_trigger(60.0, None)
+
+        assert seen == [ReminderFired("percentage", "Usage reached 50%")]
@@ -1,6 +1,7 @@
 """Tests for goals tracker module."""
+import math
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from backend.core.goals_tracker import (
     GoalsTracker,
@@ -8,6 +9,7 @@ from backend.core.goals_tracker import (
     get_goals_tracker,
 )
 from backend.core.config_manager import AppConfig, GoalsConfig
+from backend.core.usage_history import UsageHistory, UsageSample
 
 
 class TestPaceStatus:
@@ -121,3 +123,82 @@ class TestGoalsTracker:
         tracker1 = get_goals_tracker()
         tracker2 = get_goals_tracker()
         assert tracker1 is tracker2
+
+
+@pytest.mark.usefixtures("enabled")
+class TestDailyAccounting:
+    """Test history-based daily budget accounting."""
+
+    @pytest.fixture
+    def enabled(self, monkeypatch):
+        monkeypatch.setattr(
+            "backend.core.goals_tracker.load_config",
+            lambda: AppConfig(goals=GoalsConfig(enabled=True, daily_budget_percent=200)),
+        )
+
+    @staticmethod
+    def _day_start() -> float:
+        return datetime.combine(datetime.now().date(), datetime.min.time()).timestamp()
+
+    def test_integrates_across_windows(self, tmp_path):
+        """Test consumption sums across several windows of the day."""
+        history = UsageHistory(tmp_path / "h.bin")
+        start = self._day_start()
+        # Baseline before midnight, then two windows today
+        history.append(UsageSample(start - 60, 40.0, start + 100, math.nan))
+        history.append(UsageSample(start + 1, 50.0, start + 100, math.nan))
+        history.append(UsageSample(start + 2, 30.0, start + 18100, math.nan))
+        history.append(UsageSample(start + 3, 45.0, start + 18100, math.nan))
+
+        tracker = GoalsTracker(history)
+        used, budget, _ = tracker.get_budget_status(45.0)
+
+        assert used == 10.0 + 30.0 + 15.0
+        assert budget == 200
+
+    def test_incremental_updates(self, tmp_path):
+        """Test newly appended samples advance the running total."""
+        history = UsageHistory(tmp_path / "h.bin")
+        start = self._day_start()
+        history.append(UsageSample(start + 1, 10.0, start + 100, math.nan))
+
+        tracker = GoalsTracker(history)
+        assert tracker.get_budget_status(10.0)[0] == 10.0
+
+        history.append(UsageSample(start + 2, 25.0, start + 100, math.nan))
+        assert tracker.get_budget_status(25.0)[0] == 25.0
+        assert tracker._next_index == 2
+
+    def test_live_reading_not_yet_recorded(self, tmp_path):
+        """Test a live reading above the last sample is counted provisionally."""
+        history = UsageHistory(tmp_path / "h.bin")
+        start = self._day_start()
+        history.append(UsageSample(start + 1, 10.0, start + 100, math.nan))
+
+        tracker = GoalsTracker(history)
+        assert tracker.get_budget_status(12.0)[0] == 12.0
+
+    def test_profile_from_past_days(self, tmp_path):
+        """Test the pace curve follows the historical hour-of-day profile."""
+        history = UsageHistory(tmp_path / "h.bin")
+        yesterday = datetime.combine(
+            datetime.now().date() - timedelta(days=1), datetime.min.time()
+        )
+        # All past consumption happened between 20:00 and 21:00
+        t0 = (yesterday + timedelta(hours=20)).timestamp()
+        history.append(UsageSample(t0, 0.0, t0 + 18000, math.nan))
+        history.append(UsageSample(t0 + 1800, 50.0, t0 + 18000, math.nan))
+
+        tracker = GoalsTracker(history)
+        profile = tracker._hourly_profile(datetime.now().date())
+
+        assert profile is not None
+        assert sum(profile) == pytest.approx(1.0)
+        assert profile[20] > 0.9
+        assert profile[3] == pytest.approx(0.1 / 24)
+
+    def test_flat_line_without_history(self, tmp_path):
+        """Test the flat 24h line is used before any history exists."""
+        tracker = GoalsTracker(UsageHistory(tmp_path / "h.bin"))
+        noon = datetime.now().replace(hour=12, minute=0, second=0)
+        assert tracker._expected_fraction(noon) == pytest.approx(0.5)
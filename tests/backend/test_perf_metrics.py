@@ -0,0 +1,93 @@
+"""Tests for runtime performance metrics."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from backend.core.perf_metrics import PerfMetrics, RingBuffer, sample_loop_lag
+
+
+class TestRingBuffer:
+    """Tests for RingBuffer."""
+
+    def test_keeps_last_values_in_order(self):
+        """Test old values are overwritten and order is kept."""
+        ring = RingBuffer(size=3)
+        for ns in (1, 2, 3, 4, 5):
+            ring.add(ns)
+        assert ring.values() == [3, 4, 5]
+        assert ring.count == 5
+
+    def test_partial_fill(self):
+        """Test a ring that never wrapped returns only what was added."""
+        ring = RingBuffer(size=3)
+        ring.add(7)
+        assert ring.values() == [7]
+
+    def test_summary(self):
+        """Test the summary is in milliseconds."""
+        ring = RingBuffer()
+        for ms in range(1, 101):
+            ring.add(ms * 1_000_000)
+        summary = ring.summary()
+        assert summary["count"] == 100
+        assert summary["last_ms"] == 100.0
+        assert summary["mean_ms"] == 50.5
+        assert summary["p95_ms"] == 96.0
+        assert summary["max_ms"] == 100.0
+        assert RingBuffer().summary() == {"count": 0}
+
+
+class TestPerfMetrics:
+    """Tests for PerfMetrics."""
+
+    def test_timed_records_duration(self):
+        """Test timed() records even when the block raises."""
+        metrics = PerfMetrics()
+        with metrics.timed("a"):
+            pass
+        with pytest.raises(ValueError), metrics.timed("a"):
+            raise ValueError
+        assert metrics.durations["a"].count == 2
+
+    def test_hit_rate(self):
+        """Test hit rate from hit and miss counters."""
+        metrics = PerfMetrics()
+        assert metrics.hit_rate("cache") is None
+        metrics.count("cache.hit", 3)
+        metrics.count("cache.miss")
+        assert metrics.hit_rate("cache") == 0.75
+
+    def test_dump(self, tmp_path: Path):
+        """Test metrics are written as JSON."""
+        metrics = PerfMetrics()
+        metrics.record("fetch", 2_000_000)
+        metrics.count("cache.hit")
+        path = tmp_path / "out" / "metrics.json"
+        metrics.dump(path)
+
+        data = json.loads(path.read_text())
+        assert data["durations"]["fetch"]["last_ms"] == 2.0
+        assert data["counters"] == {"cache.hit": 1}
+
+
+class TestSampleLoopLag:
+    """Tests for sample_loop_lag."""
+
+    async def test_records_lag(self):
+        """Test a blocked loop shows up as lag."""
+        metrics = PerfMetrics()
+        task = asyncio.create_task(sample_loop_lag(metrics, interval=0.01))
+        await asyncio.sleep(0)
+        # Block the loop past the sampler's wake-up time
+        time.sleep(0.05)
+        await asyncio.sleep(0.02)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+        assert max(metrics.durations["loop_lag"].values()) >= 30_000_000
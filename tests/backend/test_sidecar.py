@@ -14,7 +14,10 @@ from backend.sidecar import (
     check_reminders,
     check_token,
     clear_snooze,
+    get_command_runs,
     get_config,
+    get_heatmap,
+    get_top,
     get_usage,
     refresh_usage,
     set_config,
@@ -123,6 +126,7 @@ class TestGetUsage:
                             mock_focus_instance.should_suppress_notification.return_value = (
                                 False
                             )
+                            mock_focus_instance.suppressed_until.return_value = None
                             mock_focus.return_value = mock_focus_instance
 
                             result = await get_usage()
@@ -130,6 +134,7 @@ class TestGetUsage:
 
                             assert "five_hour" in parsed
                             assert parsed["five_hour"]["utilization"] == 0.45
+                            assert parsed["focus_mode"]["suppressed_until"] is None
 
     @pytest.mark.asyncio
     async def test_handles_token_expired_error(self):
@@ -322,3 +327,44 @@ class TestCheckReminders:
             parsed = json.loads(result)
 
             assert parsed["triggered"] == []
+
+
+class TestGetHeatmap:
+    """Tests for get_heatmap function."""
+
+    def test_returns_grid(self):
+        """Test returns the 7x24 grid."""
+        result = json.loads(get_heatmap())
+        assert len(result["heatmap"]) == 7
+        assert all(len(row) == 24 for row in result["heatmap"])
+
+
+class TestGetTop:
+    """Tests for get_top function."""
+
+    def test_returns_rows(self):
+        """Test returns rows from the token index."""
+        from backend.core.token_index import TokenUsage
+
+        mock_index = MagicMock()
+        mock_index.top.return_value = [TokenUsage("alpha", 1, 2, 3, 4)]
+        with patch("backend.sidecar.get_token_index", return_value=mock_index):
+            result = json.loads(get_top(0, "project"))
+
+        assert result["top"][0]["name"] == "alpha"
+        mock_index.top.assert_called_once_with(by="project", since=None, limit=10)
+
+
+class TestGetCommandRuns:
+    """Tests for get_command_runs function."""
+
+    def test_returns_newest_first(self):
+        """Test runs are listed newest first."""
+        from backend.scheduler.command_runner import CommandRun
+
+        runs = [CommandRun("a", 1.0, 0.1, 0), CommandRun("b", 2.0, 30.0, None, timed_out=True)]
+        with patch("backend.sidecar.recent_command_runs", return_value=runs):
+            result = json.loads(get_command_runs())
+
+        assert [r["command"] for r in result["runs"]] == ["b", "a"]
+        assert result["runs"][0]["timed_out"] is True
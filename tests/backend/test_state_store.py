@@ -0,0 +1,127 @@
+"""Tests for durable state store."""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from backend.core import state_store
+from backend.core.config_manager import AppConfig
+from backend.core.state_store import StateStore, get_state_store
+from backend.scheduler.focus_mode import FocusModeService
+from backend.scheduler.reminder_service import ReminderService, ReminderType
+
+
+class TestStateStore:
+    """Tests for StateStore."""
+
+    def test_roundtrip(self, tmp_path: Path):
+        """Test values survive a new instance."""
+        path = tmp_path / "state.json"
+        StateStore(path).set("focus", "snoozed_until", 123.0)
+        assert StateStore(path).get("focus", "snoozed_until") == 123.0
+        assert json.loads(path.read_text())["version"] == state_store.STATE_VERSION
+
+    def test_unchanged_value_not_written(self, tmp_path: Path):
+        """Test setting an equal value skips the write."""
+        store = StateStore(tmp_path / "state.json")
+        store.set("reminders", "default", {"percentages": [50]})
+        with patch.object(store, "_write") as write:
+            store.set("reminders", "default", {"percentages": [50]})
+        write.assert_not_called()
+
+    def test_concurrent_updates_not_lost(self, tmp_path: Path):
+        """Test read-modify-writes from several processes all land."""
+        path = tmp_path / "state.json"
+        script = (
+            "import sys\n"
+            "from pathlib import Path\n"
+            "from backend.core.state_store import StateStore\n"
+            "store = StateStore(Path(sys.argv[1]))\n"
+            "for _ in range(25):\n"
+            "    store.update('test', 'count', lambda n: n + 1, 0)\n"
+        )
+        env = {**os.environ, "PYTHONPATH": str(Path(__file__).parents[2] / "src")}
+        workers = [
+            subprocess.Popen([sys.executable, "-c", script, str(path)], env=env)
+            for _ in range(4)
+        ]
+        assert all(worker.wait(timeout=60) == 0 for worker in workers)
+
+        assert StateStore(path).get("test", "count") == 100
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_sees_other_process_writes(self, tmp_path: Path):
+        """Test a changed file is re-read."""
+        path = tmp_path / "state.json"
+        ours = StateStore(path)
+        assert ours.get("focus", "snoozed_until") is None
+        StateStore(path).set("focus", "snoozed_until", 5.0)
+        assert ours.get("focus", "snoozed_until") == 5.0
+
+    def test_corrupt_or_old_file_ignored(self, tmp_path: Path):
+        """Test unreadable and old-version files start empty."""
+        path = tmp_path / "state.json"
+        path.write_text("{not json")
+        assert StateStore(path).get("focus", "snoozed_until") is None
+        path.write_text(json.dumps({"version": 0, "sections": {"focus": {"snoozed_until": 1}}}))
+        assert StateStore(path).get("focus", "snoozed_until") is None
+
+    def test_singleton_follows_path(self, tmp_path: Path, monkeypatch):
+        """Test the singleton is rebuilt when STATE_FILE changes."""
+        first = get_state_store()
+        assert get_state_store() is first
+        monkeypatch.setattr(state_store, "STATE_FILE", tmp_path / "other.json")
+        assert get_state_store() is not first
+
+
+class TestPersistedReminders:
+    """Tests for reminder state shared across processes."""
+
+    def _check(self, service: ReminderService, usage: float, reset_time: datetime | None):
+        focus = MagicMock()
+        focus.should_suppress_notification.return_value = False
+        with patch("backend.scheduler.reminder_service.load_config", return_value=AppConfig()), \
+                patch("backend.scheduler.reminder_service.get_focus_mode_service", return_value=focus), \
+                patch("backend.scheduler.reminder_service.send_notification_sync"):
+            return service.check_and_trigger(usage, reset_time)
+
+    def test_thresholds_not_refired_by_new_process(self):
+        """Test a second service instance does not repeat thresholds."""
+        reset_time = datetime.now().astimezone() + timedelta(hours=3)
+        assert len(self._check(ReminderService(), 80.0, reset_time)) == 2
+        assert self._check(ReminderService(), 80.0, reset_time) == []
+
+    def test_new_window_clears_thresholds(self):
+        """Test thresholds fire again in the next window, after on-reset."""
+        reset_time = datetime.now().astimezone() + timedelta(hours=1)
+        self._check(ReminderService(), 60.0, reset_time)
+
+        with patch("backend.scheduler.notifier.DEDUP_SECONDS", 0.0):
+            result = self._check(ReminderService(), 60.0, reset_time + timedelta(hours=5))
+        assert [t for t, _ in result] == [ReminderType.PERCENTAGE, ReminderType.ON_RESET]
+
+    def test_accounts_are_separate(self):
+        """Test triggers are keyed by account."""
+        reset_time = datetime.now().astimezone() + timedelta(hours=3)
+        self._check(ReminderService("work"), 60.0, reset_time)
+        assert len(self._check(ReminderService("personal"), 60.0, reset_time)) == 1
+
+
+class TestPersistedSnooze:
+    """Tests for snooze shared across processes."""
+
+    def test_snooze_survives_new_instance(self):
+        """Test a snooze set by one process is seen by another."""
+        FocusModeService().snooze(15)
+        other = FocusModeService()
+        assert other.is_snoozed()
+        assert 14 * 60 < other.get_snooze_remaining() <= 15 * 60
+
+        other.clear_snooze()
+        assert not FocusModeService().is_snoozed()
@@ -0,0 +1,104 @@
+"""Tests for token attribution index."""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from backend.core.token_index import TokenIndex, get_token_index
+from backend.core.transcript_tailer import TranscriptEvent
+
+
+def _event(project: str, model: str, ts: float, output: int = 10) -> TranscriptEvent:
+    return TranscriptEvent(project, model, ts, 1, output, 100, 5)
+
+
+def _write_line(path: Path, msg_id: str, model: str, ts: float, output: int) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    stamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(ts))
+    with open(path, "a") as f:
+        f.write(json.dumps({
+            "type": "assistant",
+            "timestamp": stamp,
+            "message": {"id": msg_id, "model": model, "usage": {"output_tokens": output}},
+        }) + "\n")
+
+
+class TestTokenIndex:
+    """Tests for TokenIndex."""
+
+    def test_top_all_time(self, tmp_path: Path):
+        """Test running totals per project and model."""
+        index = TokenIndex(tmp_path / "idx.json", tmp_path / "projects")
+        now = time.time()
+        index.add(_event("alpha", "opus", now, output=500))
+        index.add(_event("beta", "sonnet", now, output=10))
+        index.add(_event("alpha", "sonnet", now, output=5))
+
+        projects = index.top("project")
+        assert [r.name for r in projects] == ["alpha", "beta"]
+        assert projects[0].output_tokens == 505
+        assert projects[0].total == 2 + 505 + 200 + 10
+
+        models = index.top("model", limit=1)
+        assert [r.name for r in models] == ["opus"]
+
+    def test_top_since(self, tmp_path: Path):
+        """Test hourly buckets restrict to the requested period."""
+        index = TokenIndex(tmp_path / "idx.json", tmp_path / "projects")
+        now = time.time()
+        index.add(_event("old", "opus", now - 10 * 3600, output=1000))
+        index.add(_event("new", "opus", now, output=10))
+
+        rows = index.top("project", since=now - 2 * 3600)
+        assert [r.name for r in rows] == ["new"]
+
+    def test_invalid_grouping(self, tmp_path: Path):
+        """Test unknown grouping raises."""
+        index = TokenIndex(tmp_path / "idx.json", tmp_path / "projects")
+        with pytest.raises(ValueError):
+            index.top("session")
+
+    def test_refresh_is_incremental_and_persisted(self, tmp_path: Path):
+        """Test refresh ingests new lines once and survives reload."""
+        projects = tmp_path / "projects"
+        transcript = projects / "alpha" / "s1.jsonl"
+        now = time.time()
+        _write_line(transcript, "m1", "opus", now, 10)
+
+        index = TokenIndex(tmp_path / "idx.json", projects)
+        assert index.refresh() == 1
+        assert index.refresh() == 0
+
+        _write_line(transcript, "m2", "opus", now, 5)
+        reloaded = TokenIndex(tmp_path / "idx.json", projects)
+        assert reloaded.refresh() == 1
+        assert reloaded.top("project")[0].output_tokens == 15
+
+    def test_failed_save_keeps_previous_index(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """Test a save that fails midway leaves the old file and no temp files."""
+        projects = tmp_path / "projects"
+        _write_line(projects / "alpha" / "s1.jsonl", "m1", "opus", time.time(), 10)
+        index = TokenIndex(tmp_path / "idx.json", projects)
+        index.refresh()
+        before = (tmp_path / "idx.json").read_text()
+
+        def broken_dump(*_args: object, **_kwargs: object) -> None:
+            raise OSError("disk full")
+
+        monkeypatch.setattr("backend.core.token_index.json.dump", broken_dump)
+        _write_line(projects / "alpha" / "s1.jsonl", "m2", "opus", time.time(), 5)
+        with pytest.raises(OSError):
+            index.refresh()
+
+        assert (tmp_path / "idx.json").read_text() == before
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_get_token_index(self, tmp_path: Path):
+        """Test the accessor reads the configured projects directory."""
+        _write_line(tmp_path / "projects" / "alpha" / "s1.jsonl", "m1", "opus", time.time(), 7)
+        assert get_token_index().top()[0].name == "alpha"
+        assert (tmp_path / "history" / "token_index.json").exists()
@@ -0,0 +1,164 @@
+"""Tests for Claude Code transcript tailer."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from backend.core.transcript_tailer import (
+    TranscriptTailer,
+    dump_checkpoints,
+    load_checkpoints,
+    parse_line,
+)
+
+
+def _line(msg_id: str, model: str = "claude-sonnet", output: int = 10, ts: str = "2026-01-17T10:00:00Z") -> str:
+    return json.dumps({
+        "type": "assistant",
+        "timestamp": ts,
+        "requestId": f"req_{msg_id}",
+        "message": {
+            "id": msg_id,
+            "model": model,
+            "usage": {
+                "input_tokens": 3,
+                "output_tokens": output,
+                "cache_read_input_tokens": 100,
+                "cache_creation_input_tokens": 20,
+            },
+        },
+    }) + "\n"
+
+
+@pytest.fixture
+def projects(tmp_path: Path) -> Path:
+    root = tmp_path / "projects"
+    (root / "-home-me-alpha").mkdir(parents=True)
+    (root / "-home-me-beta").mkdir(parents=True)
+    return root
+
+
+class TestParseLine:
+    """Tests for parse_line."""
+
+    def test_parses_assistant_usage(self):
+        """Test usage fields are extracted."""
+        event, key = parse_line(_line("m1").encode(), "proj")
+        assert event.project == "proj"
+        assert event.model == "claude-sonnet"
+        assert (event.input_tokens, event.output_tokens) == (3, 10)
+        assert (event.cache_read_tokens, event.cache_write_tokens) == (100, 20)
+        assert key == "m1:req_m1"
+
+    def test_skips_other_lines(self):
+        """Test user lines and garbage are ignored."""
+        assert parse_line(b'{"type": "user", "message": {"content": "hi"}}', "p") is None
+        assert parse_line(b'{"usage": broken', "p") is None
+        assert parse_line(b'{"type": "assistant", "message": {"usage": {}}}', "p") is None
+
+    def test_skips_malformed_token_counts(self):
+        """Test lines with non-numeric token counts are skipped, not raised."""
+        for bad in ("many", [1], {"n": 1}):
+            entry = json.loads(_line("m1"))
+            entry["message"]["usage"]["output_tokens"] = bad
+            assert parse_line(json.dumps(entry).encode(), "p") is None
+
+
+class TestTranscriptTailer:
+    """Tests for TranscriptTailer."""
+
+    def test_reads_only_appended_lines(self, projects: Path):
+        """Test a second poll returns only new events."""
+        path = projects / "-home-me-alpha" / "s1.jsonl"
+        path.write_text(_line("m1") + _line("m2"))
+        tailer = TranscriptTailer(projects)
+
+        assert len(tailer.poll()) == 2
+        assert tailer.poll() == []
+
+        with open(path, "a") as f:
+            f.write(_line("m3", output=7))
+        events = tailer.poll()
+        assert [e.output_tokens for e in events] == [7]
+        assert events[0].project == "-home-me-alpha"
+
+    def test_partial_line_deferred(self, projects: Path):
+        """Test an incomplete trailing line is parsed once completed."""
+        path = projects / "-home-me-alpha" / "s1.jsonl"
+        full = _line("m1")
+        path.write_text(full[:20])
+        tailer = TranscriptTailer(projects)
+        assert tailer.poll() == []
+
+        path.write_text(full)
+        assert len(tailer.poll()) == 1
+
+    def test_duplicate_message_lines(self, projects: Path):
+        """Test repeated lines for one message count once."""
+        path = projects / "-home-me-alpha" / "s1.jsonl"
+        path.write_text(_line("m1") + _line("m1"))
+        assert len(TranscriptTailer(projects).poll()) == 1
+
+    def test_truncation_restarts(self, projects: Path):
+        """Test a truncated file is re-read from the start."""
+        path = projects / "-home-me-alpha" / "s1.jsonl"
+        path.write_text(_line("m1") + _line("m2"))
+        tailer = TranscriptTailer(projects)
+        tailer.poll()
+
+        path.write_text(_line("m9"))
+        assert [e.output_tokens for e in tailer.poll()] == [10]
+        assert tailer.checkpoints[str(path)].offset == path.stat().st_size
+
+    def test_rotation_restarts(self, projects: Path):
+        """Test a replaced file (new inode) is re-read from the start."""
+        path = projects / "-home-me-alpha" / "s1.jsonl"
+        path.write_text(_line("m1") + _line("m2"))
+        tailer = TranscriptTailer(projects)
+        tailer.poll()
+
+        replacement = projects / "-home-me-alpha" / "new.tmp"
+        replacement.write_text(_line("m1") + _line("m2") + _line("m3"))
+        os.replace(replacement, path)
+        tailer._seen.clear()
+        assert len(tailer.poll()) == 3
+
+    def test_unchanged_files_not_opened(self, projects: Path):
+        """Test unchanged files cost only a stat."""
+        for i in range(5):
+            (projects / "-home-me-beta" / f"s{i}.jsonl").write_text(_line(f"m{i}"))
+        tailer = TranscriptTailer(projects)
+        tailer.poll()
+
+        with patch("builtins.open", side_effect=AssertionError("file reopened")):
+            assert tailer.poll() == []
+
+    def test_deleted_files_forgotten(self, projects: Path):
+        """Test checkpoints of deleted files are dropped."""
+        path = projects / "-home-me-alpha" / "s1.jsonl"
+        path.write_text(_line("m1"))
+        tailer = TranscriptTailer(projects)
+        tailer.poll()
+        path.unlink()
+        tailer.poll()
+        assert tailer.checkpoints == {}
+
+    def test_missing_root(self, tmp_path: Path):
+        """Test a missing projects directory yields nothing."""
+        assert TranscriptTailer(tmp_path / "nope").poll() == []
+
+    def test_checkpoints_round_trip(self, projects: Path):
+        """Test checkpoints survive serialization into a new tailer."""
+        path = projects / "-home-me-alpha" / "s1.jsonl"
+        path.write_text(_line("m1"))
+        tailer = TranscriptTailer(projects)
+        tailer.poll()
+
+        data = json.loads(json.dumps(dump_checkpoints(tailer.checkpoints)))
+        resumed = TranscriptTailer(projects, load_checkpoints(data))
+        assert resumed.poll() == []
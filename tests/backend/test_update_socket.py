@@ -0,0 +1,141 @@
+"""Tests for the backend update socket."""
+
+from __future__ import annotations
+
+import asyncio
+import tempfile
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from backend.core.event_bus import USAGE_SAMPLE, UsageUpdate, get_event_bus
+from backend.core.goals_tracker import PaceStatus
+from backend.core.update_socket import (
+    UpdateClient,
+    UpdateServer,
+    backend_available,
+    decode_update,
+    encode_update,
+)
+from backend.models.usage import FiveHourUsage, UsageResponse
+
+
+@pytest.fixture
+def socket_path() -> Iterator[Path]:
+    """Socket path short enough for AF_UNIX (tmp_path can exceed 108 bytes)."""
+    with tempfile.TemporaryDirectory(dir="/tmp") as directory:
+        yield Path(directory) / "d.sock"
+
+
+def _update(utilization: float) -> UsageUpdate:
+    usage = UsageResponse(
+        five_hour=FiveHourUsage(utilization=utilization, resets_at="2026-01-17T12:00:00Z")
+    )
+    return UsageUpdate(
+        usage,
+        utilization,
+        datetime(2026, 1, 17, 12, tzinfo=UTC),
+        PaceStatus(True, utilization, 50.0, "On track"),
+        (10.0, 20.0, False),
+        None,
+    )
+
+
+async def _wait_for(condition) -> None:
+    for _ in range(200):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("condition not met")
+
+
+class TestEncoding:
+    """Tests for update (de)serialization."""
+
+    def test_round_trip(self):
+        """Test an update survives encoding."""
+        update = _update(42.0)
+        assert decode_update(encode_update(update)) == update
+
+    def test_round_trip_without_derived_state(self):
+        """Test optional fields survive encoding."""
+        update = UsageUpdate(UsageResponse(), 0, None, None, None, "quiet hours")
+        assert decode_update(encode_update(update)) == update
+
+
+class TestUpdateSocket:
+    """Tests for UpdateServer and UpdateClient."""
+
+    async def test_client_receives_latest_and_new_updates(self, socket_path: Path):
+        """Test a client gets a hello, the latest update, then new ones."""
+        server = UpdateServer(socket_path)
+        task = asyncio.create_task(server.run())
+        try:
+            await _wait_for(socket_path.exists)
+            assert await asyncio.to_thread(backend_available, socket_path)
+
+            get_event_bus().publish(USAGE_SAMPLE, _update(10.0))
+
+            client = UpdateClient(socket_path)
+            hello = await client.connect()
+            assert hello == {"type": "hello", "language": "en"}
+
+            received = []
+
+            async def read() -> None:
+                async for update in client.updates():
+                    received.append(update)
+
+            reader = asyncio.create_task(read())
+            await _wait_for(lambda: len(received) == 1)
+            await _wait_for(lambda: server.client_count == 1)
+            get_event_bus().publish(USAGE_SAMPLE, _update(20.0))
+            await _wait_for(lambda: len(received) == 2)
+            assert [u.utilization for u in received] == [10.0, 20.0]
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        # Stopping the server ends the client's stream and removes the socket
+        await asyncio.wait_for(reader, 1)
+        assert not socket_path.exists()
+        assert server.client_count == 0
+
+    async def test_removes_stale_socket(self, socket_path: Path):
+        """Test a socket file left by a dead backend is replaced."""
+        socket_path.write_text("")
+        assert not backend_available(socket_path)
+
+        server = UpdateServer(socket_path)
+        task = asyncio.create_task(server.run())
+        try:
+            await _wait_for(socket_path.is_socket)
+            client = UpdateClient(socket_path)
+            assert (await client.connect())["type"] == "hello"
+            await client.close()
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def test_connect_without_backend(self, socket_path: Path):
+        """Test connecting fails with OSError when nothing is serving."""
+        with pytest.raises(OSError):
+            await UpdateClient(socket_path).connect()
+        assert not backend_available(socket_path)
+
+    async def test_connect_rejects_foreign_server(self, socket_path: Path):
+        """Test a socket that does not greet with a hello is not a backend."""
+
+        async def serve(_reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            writer.write(b"SSH-2.0-OpenSSH\n")
+            await writer.drain()
+            writer.close()
+
+        server = await asyncio.start_unix_server(serve, path=str(socket_path))
+        async with server:
+            client = UpdateClient(socket_path)
+            with pytest.raises(OSError):
+                await client.connect()
+            assert client._writer is None
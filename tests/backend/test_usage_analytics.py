@@ -0,0 +1,104 @@
+"""Tests for usage analytics kernel."""
+
+from __future__ import annotations
+
+import math
+from pathlib import Path
+
+import pytest
+
+from backend.core import usage_analytics
+from backend.core.usage_analytics import (
+    consumption,
+    forecast,
+    load_columns,
+    percentiles,
+    rollup,
+    window_stats,
+)
+from backend.core.usage_history import UsageHistory, UsageSample
+
+BACKENDS = [
+    False,
+    pytest.param(
+        True,
+        marks=pytest.mark.skipif(not usage_analytics.HAS_NUMPY, reason="numpy not installed"),
+    ),
+]
+
+
+@pytest.fixture
+def history(tmp_path: Path) -> UsageHistory:
+    """Two windows sampled every 30 minutes."""
+    history = UsageHistory(tmp_path / "h.bin")
+    first_reset = 5 * 3600.0
+    for i, util in enumerate([10.0, 20.0, 35.0, 60.0]):
+        history.append(UsageSample(i * 1800.0, util, first_reset, math.nan))
+    second_reset = first_reset + 5 * 3600
+    for i, util in enumerate([5.0, 15.0, 25.0]):
+        history.append(UsageSample(first_reset + i * 1800.0, util, second_reset, 40.0 + i))
+    return history
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+class TestAnalytics:
+    """Run every kernel against both backends."""
+
+    def test_load_columns(self, history: UsageHistory, use_numpy: bool):
+        """Test columns match the stored records."""
+        cols = load_columns(history, use_numpy=use_numpy)
+        assert len(cols) == 7
+        assert cols.is_numpy is use_numpy
+        assert list(cols.five_hour) == [10.0, 20.0, 35.0, 60.0, 5.0, 15.0, 25.0]
+        assert len(load_columns(history, 2, 4, use_numpy=use_numpy)) == 2
+
+    def test_load_empty(self, tmp_path: Path, use_numpy: bool):
+        """Test empty history yields empty results."""
+        cols = load_columns(UsageHistory(tmp_path / "none.bin"), use_numpy=use_numpy)
+        assert len(cols) == 0
+        assert rollup(cols) == []
+        assert window_stats(cols) == []
+        assert forecast(cols) is None
+
+    def test_consumption(self, history: UsageHistory, use_numpy: bool):
+        """Test per-sample consumption handles resets."""
+        cols = load_columns(history, use_numpy=use_numpy)
+        assert list(consumption(cols)) == [0.0, 10.0, 15.0, 25.0, 5.0, 10.0, 10.0]
+
+    def test_rollup(self, history: UsageHistory, use_numpy: bool):
+        """Test hourly rollup sums consumption per bucket."""
+        cols = load_columns(history, use_numpy=use_numpy)
+        result = dict(rollup(cols))
+        assert result[0.0] == 10.0
+        assert result[3600.0] == 40.0
+        assert result[18000.0] == 15.0
+        assert result[21600.0] == 10.0
+        assert sum(result.values()) == 75.0
+
+    def test_percentiles(self, history: UsageHistory, use_numpy: bool):
+        """Test linear-interpolated percentiles ignore NaN."""
+        cols = load_columns(history, use_numpy=use_numpy)
+        assert percentiles(cols.five_hour, [0, 50, 100]) == pytest.approx([5.0, 20.0, 60.0])
+        assert percentiles(cols.seven_day, [50]) == pytest.approx([41.0])
+
+    def test_window_stats(self, history: UsageHistory, use_numpy: bool):
+        """Test segmentation into windows."""
+        cols = load_columns(history, use_numpy=use_numpy)
+        windows = window_stats(cols)
+        assert len(windows) == 2
+        assert windows[0].peak == 60.0
+        assert windows[0].consumed == 50.0
+        assert windows[0].samples == 4
+        assert windows[1].resets_at == 36000.0
+        assert windows[1].consumed == 25.0
+        assert windows[1].end == 18000.0 + 3600.0
+
+    def test_forecast(self, history: UsageHistory, use_numpy: bool):
+        """Test projection of the latest window."""
+        cols = load_columns(history, use_numpy=use_numpy)
+        result = forecast(cols)
+        assert result is not None
+        assert result.slope_per_hour == pytest.approx(20.0)
+        # 4 hours left at 20%/h from 25%
+        assert result.projected_at_reset == pytest.approx(105.0)
+        assert result.hours_to_full == pytest.approx(3.75)
@@ -0,0 +1,117 @@
+"""Tests for hour-of-week usage heatmap."""
+
+from __future__ import annotations
+
+import math
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from backend.core.usage_heatmap import UsageHeatmap, get_usage_heatmap, update_heatmap
+from backend.core.usage_history import UsageHistory, UsageSample, get_usage_history
+
+# Monday 2026-01-05 10:00 local time
+MONDAY_10 = datetime(2026, 1, 5, 10, 0).timestamp()
+
+
+def _append(history: UsageHistory, minutes: float, util: float) -> None:
+    ts = MONDAY_10 + minutes * 60
+    history.append(UsageSample(ts, util, MONDAY_10 + 5 * 3600, math.nan))
+
+
+class TestUsageHeatmap:
+    """Tests for UsageHeatmap."""
+
+    def test_empty_grid(self, tmp_path: Path):
+        """Test an empty heatmap has no observations."""
+        heatmap = UsageHeatmap(tmp_path / "h.json")
+        grid = heatmap.grid()
+        assert len(grid) == 7
+        assert all(len(row) == 24 for row in grid)
+        assert all(rate is None for row in grid for rate in row)
+
+    def test_rate_per_slot(self, tmp_path: Path):
+        """Test consumption is averaged per hour of observation."""
+        history = UsageHistory(tmp_path / "h.bin")
+        for minute in range(0, 35, 5):
+            _append(history, minute, minute * 0.5)
+
+        heatmap = UsageHeatmap(tmp_path / "h.json")
+        assert heatmap.sync(history) is True
+
+        # 15% consumed over 30 observed minutes
+        assert heatmap.rate(0, 10) == pytest.approx(30.0)
+        assert heatmap.rate(1, 10) is None
+
+    def test_incremental_and_persisted(self, tmp_path: Path):
+        """Test sync only folds new samples and survives reloads."""
+        history = UsageHistory(tmp_path / "h.bin")
+        _append(history, 0, 0.0)
+        _append(history, 10, 5.0)
+        heatmap = UsageHeatmap(tmp_path / "h.json")
+        heatmap.sync(history)
+        heatmap.save()
+        assert heatmap.sync(history) is False
+
+        _append(history, 20, 10.0)
+        reloaded = UsageHeatmap(tmp_path / "h.json")
+        assert reloaded.sync(history) is True
+        assert reloaded._next_index == 3
+        assert reloaded.rate(0, 10) == pytest.approx(30.0)
+
+    def test_long_gaps_ignored(self, tmp_path: Path):
+        """Test offline gaps don't count as observed time."""
+        history = UsageHistory(tmp_path / "h.bin")
+        _append(history, 0, 0.0)
+        _append(history, 50, 20.0)
+        heatmap = UsageHeatmap(tmp_path / "h.json")
+        heatmap.sync(history)
+        assert heatmap.rate(0, 10) is None
+
+    def test_rebuilds_when_history_shrinks(self, tmp_path: Path):
+        """Test a replaced history triggers a rebuild."""
+        history = UsageHistory(tmp_path / "h.bin")
+        for minute in range(0, 30, 5):
+            _append(history, minute, float(minute))
+        heatmap = UsageHeatmap(tmp_path / "h.json")
+        heatmap.sync(history)
+
+        history.path.unlink()
+        _append(history, 0, 0.0)
+        heatmap.sync(history)
+        assert heatmap._next_index == 1
+        assert heatmap.rate(0, 10) is None
+
+    def test_get_usage_heatmap_syncs(self, isolated_history: Path):
+        """Test the accessor syncs with the account history."""
+        history = get_usage_history()
+        _append(history, 0, 0.0)
+        _append(history, 10, 5.0)
+        heatmap = get_usage_heatmap()
+        assert heatmap.rate(0, 10) == pytest.approx(30.0)
+        assert not (isolated_history / "default.heatmap.json").exists()
+
+    def test_update_heatmap_persists(self, isolated_history: Path):
+        """Test update_heatmap writes samples folded in by earlier reads."""
+        history = get_usage_history()
+        _append(history, 0, 0.0)
+        _append(history, 10, 5.0)
+        get_usage_heatmap()
+        update_heatmap()
+
+        reloaded = UsageHeatmap(isolated_history / "default.heatmap.json")
+        assert reloaded._next_index == 2
+        assert reloaded.rate(0, 10) == pytest.approx(30.0)
+
+    def test_save_leaves_no_temp_files(self, tmp_path: Path):
+        """Test saving writes through a unique temp file that is renamed away."""
+        history = UsageHistory(tmp_path / "h.bin")
+        _append(history, 0, 0.0)
+        _append(history, 10, 5.0)
+        heatmap = UsageHeatmap(tmp_path / "h.json")
+        heatmap.sync(history)
+        heatmap.save()
+
+        assert UsageHeatmap(tmp_path / "h.json")._next_index == 2
+        assert not list(tmp_path.glob("*.tmp"))
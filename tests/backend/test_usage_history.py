@@ -0,0 +1,101 @@
+"""Tests for usage history store."""
+
+from __future__ import annotations
+
+import math
+from pathlib import Path
+
+from backend.core.usage_history import (
+    RECORD,
+    UsageHistory,
+    UsageSample,
+    get_usage_history,
+    sample_from_usage,
+    utilization_delta,
+)
+from backend.models.usage import FiveHourUsage, UsageResponse
+
+
+def _sample(ts: float, util: float, resets_at: float = 1000.0) -> UsageSample:
+    return UsageSample(ts, util, resets_at, math.nan)
+
+
+class TestUsageHistory:
+    """Tests for UsageHistory."""
+
+    def test_empty(self, tmp_path: Path):
+        """Test missing file reads as empty."""
+        history = UsageHistory(tmp_path / "a.bin")
+        assert len(history) == 0
+        assert history.read() == []
+        assert history.index_at(123.0) == 0
+
+    def test_append_and_read(self, tmp_path: Path):
+        """Test samples round-trip."""
+        history = UsageHistory(tmp_path / "a.bin")
+        history.append(_sample(1.0, 10.0))
+        history.append(_sample(2.0, 20.0))
+
+        assert len(history) == 2
+        samples = history.read()
+        assert samples[1].five_hour == 20.0
+        assert math.isnan(samples[0].seven_day)
+        assert [s.timestamp for s in history.read(1)] == [2.0]
+
+    def test_index_at(self, tmp_path: Path):
+        """Test binary search by timestamp."""
+        history = UsageHistory(tmp_path / "a.bin")
+        for ts in range(10):
+            history.append(_sample(float(ts * 10), 0.0))
+
+        assert history.index_at(-1.0) == 0
+        assert history.index_at(30.0) == 3
+        assert history.index_at(31.0) == 4
+        assert history.index_at(1000.0) == 10
+
+    def test_torn_record_is_dropped(self, tmp_path: Path):
+        """Test a partial trailing record is ignored and overwritten."""
+        path = tmp_path / "a.bin"
+        history = UsageHistory(path)
+        history.append(_sample(1.0, 10.0))
+        with open(path, "ab") as f:
+            f.write(b"\x00" * 5)
+
+        assert len(history) == 1
+        history.append(_sample(2.0, 20.0))
+        assert path.stat().st_size == 2 * RECORD.size
+        assert history.read()[1].five_hour == 20.0
+
+    def test_get_usage_history_uses_history_dir(self, isolated_history: Path):
+        """Test the default store lives in HISTORY_DIR."""
+        assert get_usage_history().path == isolated_history / "default.bin"
+        assert get_usage_history() is get_usage_history()
+
+
+class TestSampleHelpers:
+    """Tests for sample conversion and deltas."""
+
+    def test_sample_from_usage(self):
+        """Test conversion from an API response."""
+        usage = UsageResponse(
+            five_hour=FiveHourUsage(utilization=42.0, resets_at="2026-01-17T12:00:00Z"),
+            seven_day={"utilization": 12.5},
+        )
+        sample = sample_from_usage(usage, 5.0)
+        assert sample is not None
+        assert sample.five_hour == 42.0
+        assert sample.seven_day == 12.5
+        assert sample.resets_at == 1768651200.0
+
+    def test_sample_from_usage_without_five_hour(self):
+        """Test responses without 5-hour data are skipped."""
+        assert sample_from_usage(UsageResponse(), 5.0) is None
+
+    def test_delta_within_window(self):
+        """Test delta inside one window is the difference."""
+        assert utilization_delta(_sample(0, 10.0), _sample(1, 25.0)) == 15.0
+
+    def test_delta_across_reset(self):
+        """Test delta after a reset counts the new window's usage."""
+        assert utilization_delta(_sample(0, 80.0, 1000.0), _sample(1, 5.0, 19000.0)) == 5.0
+        assert utilization_delta(_sample(0, 80.0, 1000.0), _sample(1, 90.0, 19000.0)) == 90.0
@@ -0,0 +1,78 @@
+"""Tests for activity-aware usage poller."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.core.config_manager import AppConfig
+from backend.core.usage_poller import UsagePoller
+
+
+def _watcher(idle_seconds: float, woke: bool = False) -> MagicMock:
+    watcher = MagicMock()
+    watcher.idle_seconds.return_value = idle_seconds
+    watcher.wait_for_activity = AsyncMock(return_value=woke)
+    return watcher
+
+
+class TestUsagePoller:
+    """Tests for UsagePoller.wait_next."""
+
+    @pytest.mark.asyncio
+    async def test_active_uses_poll_interval(self):
+        """Test recent activity keeps the normal cadence."""
+        watcher = _watcher(idle_seconds=30)
+        poller = UsagePoller(AsyncMock(), watcher)
+        config = AppConfig(poll_interval_seconds=60, idle_after_minutes=10)
+
+        with patch("backend.core.usage_poller.load_config", return_value=config), \
+                patch("backend.core.usage_poller.asyncio.sleep", new=AsyncMock()) as sleep:
+            await poller.wait_next()
+
+        sleep.assert_awaited_once_with(60)
+        watcher.wait_for_activity.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_idle_waits_for_activity(self):
+        """Test idle periods wait for activity up to the idle interval."""
+        watcher = _watcher(idle_seconds=3600, woke=True)
+        poller = UsagePoller(AsyncMock(), watcher)
+        config = AppConfig(idle_after_minutes=10, idle_poll_interval_seconds=1800)
+
+        with patch("backend.core.usage_poller.load_config", return_value=config):
+            await poller.wait_next()
+
+        watcher.wait_for_activity.assert_awaited_once_with(1800)
+
+    @pytest.mark.asyncio
+    async def test_disabled_ignores_idleness(self):
+        """Test activity_polling=False always uses the poll interval."""
+        watcher = _watcher(idle_seconds=3600)
+        poller = UsagePoller(AsyncMock(), watcher)
+        config = AppConfig(activity_polling=False, poll_interval_seconds=60)
+
+        with patch("backend.core.usage_poller.load_config", return_value=config), \
+                patch("backend.core.usage_poller.asyncio.sleep", new=AsyncMock()) as sleep:
+            await poller.wait_next()
+
+        sleep.assert_awaited_once_with(60)
+
+    @pytest.mark.asyncio
+    async def test_run_fetches_and_stops_watcher(self):
+        """Test run fetches after each wait and stops the watcher on exit."""
+        watcher = _watcher(idle_seconds=0)
+        fetch = AsyncMock(side_effect=[None, RuntimeError("stop")])
+        poller = UsagePoller(fetch, watcher)
+
+        with (
+            patch("backend.core.usage_poller.load_config", return_value=AppConfig()),
+            patch("backend.core.usage_poller.asyncio.sleep", new=AsyncMock()),
+            pytest.raises(RuntimeError),
+        ):
+            await poller.run()
+
+        assert fetch.await_count == 2
+        watcher.start.assert_called_once()
+        watcher.stop.assert_called_once()
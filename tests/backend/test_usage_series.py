@@ -0,0 +1,125 @@
+"""Tests for bucketed usage series."""
+
+from __future__ import annotations
+
+import math
+from pathlib import Path
+
+from backend.core.usage_history import UsageHistory, UsageSample, get_usage_history
+from backend.core.usage_series import (
+    BUCKETS,
+    ZOOM_SPANS,
+    BucketedSeries,
+    UsageSeries,
+    Zoom,
+    get_usage_series,
+)
+
+NOW = 1_800_000_000.0
+
+
+def _append(
+    history: UsageHistory, ts: float, five_hour: float, seven_day: float = math.nan
+) -> None:
+    history.append(UsageSample(ts, five_hour, ts + 3600, seven_day))
+
+
+class TestBucketedSeries:
+    """Tests for BucketedSeries."""
+
+    def test_empty(self):
+        """Test a new series has BUCKETS empty buckets."""
+        series = BucketedSeries(600.0, buckets=10)
+        values = series.values()
+        assert len(values) == 10
+        assert all(math.isnan(v) for v in values)
+
+    def test_keeps_peak_per_bucket(self):
+        """Test values in the same bucket keep the highest one."""
+        series = BucketedSeries(600.0, buckets=10)
+        series.add(NOW, 10.0)
+        series.add(NOW + 1, 30.0)
+        series.add(NOW + 2, 20.0)
+        assert series.values()[-1] == 30.0
+
+    def test_scrolls_with_gaps(self):
+        """Test skipped buckets are empty and old buckets scroll out."""
+        series = BucketedSeries(600.0, buckets=10)
+        series.add(NOW, 10.0)
+        series.add(NOW + 120, 40.0)
+        values = series.values()
+        assert values[-1] == 40.0
+        assert math.isnan(values[-2])
+        assert values[-3] == 10.0
+
+        series.advance(NOW + 60 * 60)
+        assert all(math.isnan(v) for v in series.values())
+
+    def test_ignores_old_and_unknown_values(self):
+        """Test values before the newest bucket and NaN are ignored."""
+        series = BucketedSeries(600.0, buckets=10)
+        series.add(NOW, 10.0)
+        series.add(NOW - 600, 90.0)
+        series.add(NOW, math.nan)
+        assert series.values()[-1] == 10.0
+        assert sum(not math.isnan(v) for v in series.values()) == 1
+
+
+class TestUsageSeries:
+    """Tests for UsageSeries."""
+
+    def test_sync_buckets_every_zoom(self, tmp_path: Path):
+        """Test samples land in every zoom level and the 7-day series."""
+        history = UsageHistory(tmp_path / "h.bin")
+        _append(history, NOW, 25.0, 40.0)
+
+        series = UsageSeries()
+        assert series.sync(history, now=NOW) is True
+
+        for zoom in Zoom:
+            assert series.five_hour[zoom].values()[-1] == 25.0
+            assert len(series.five_hour[zoom].values()) == BUCKETS
+        assert series.seven_day.values()[-1] == 40.0
+
+    def test_first_sync_skips_old_history(self, tmp_path: Path):
+        """Test samples older than the longest span are never read."""
+        history = UsageHistory(tmp_path / "h.bin")
+        _append(history, NOW - ZOOM_SPANS[Zoom.WEEK] - 3600, 99.0)
+        _append(history, NOW - 60, 5.0)
+
+        series = UsageSeries()
+        series.sync(history, now=NOW)
+        assert series._next_index == 2
+        assert max(v for v in series.five_hour[Zoom.WEEK].values() if not math.isnan(v)) == 5.0
+
+    def test_sync_is_incremental(self, tmp_path: Path):
+        """Test later syncs only fold in new samples."""
+        history = UsageHistory(tmp_path / "h.bin")
+        _append(history, NOW - 60, 5.0)
+        series = UsageSeries()
+        series.sync(history, now=NOW)
+
+        assert series.sync(history, now=NOW) is False
+        _append(history, NOW + 600, 15.0)
+        assert series.sync(history, now=NOW + 600) is True
+        assert series.five_hour[Zoom.WINDOW].values()[-1] == 15.0
+
+    def test_rebuilds_after_truncation(self, tmp_path: Path):
+        """Test a replaced history file is re-read from scratch."""
+        history = UsageHistory(tmp_path / "h.bin")
+        for minute in range(3):
+            _append(history, NOW - 600 + minute * 60, 50.0)
+        series = UsageSeries()
+        series.sync(history, now=NOW)
+
+        history.path.unlink()
+        _append(history, NOW, 7.0)
+        assert series.sync(history, now=NOW) is True
+        assert series.five_hour[Zoom.WINDOW].values()[-1] == 7.0
+
+    def test_get_usage_series_syncs(self):
+        """Test the accessor returns a synced, cached series."""
+        _append(get_usage_history(), NOW, 12.0)
+        series = get_usage_series()
+        assert series is get_usage_series()
+        assert series._next_index == 1
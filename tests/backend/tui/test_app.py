@@ -0,0 +1,151 @@
+"""Tests for the TUI application."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.core.config_manager import AppConfig
+from backend.core.event_bus import REMINDER_FIRED, USAGE_SAMPLE, ReminderFired, get_event_bus
+from backend.core.perf_metrics import get_perf_metrics
+from backend.core.update_socket import UpdateClient, UpdateServer
+from backend.core.usage_heatmap import get_usage_heatmap
+from backend.core.usage_history import UsageSample, get_usage_history
+from backend.daemon import derive_update
+from backend.models.usage import FiveHourUsage, UsageResponse
+from backend.tui.app import ClaudiminderApp
+from backend.tui.widgets import UsageDisplay
+
+
+@pytest.fixture
+def socket_path() -> Iterator[Path]:
+    """Socket path short enough for AF_UNIX."""
+    with tempfile.TemporaryDirectory(dir="/tmp") as directory:
+        yield Path(directory) / "d.sock"
+
+
+class TestClientMode:
+    """Tests for a TUI attached to a running backend."""
+
+    @pytest.mark.asyncio
+    async def test_renders_pushed_updates_without_api(self, socket_path: Path):
+        """Test a client renders the backend's updates and never polls the API."""
+        server = UpdateServer(socket_path)
+        serving = asyncio.create_task(server.run())
+        usage = UsageResponse(
+            five_hour=FiveHourUsage(utilization=40.0, resets_at="2026-01-17T12:00:00Z")
+        )
+        try:
+            while not socket_path.exists():
+                await asyncio.sleep(0.01)
+            # Published before the client attaches; it must get it on connect
+            get_event_bus().publish(USAGE_SAMPLE, derive_update(usage, AppConfig()))
+
+            with (
+                patch("backend.tui.app.UpdateClient", lambda: UpdateClient(socket_path)),
+                patch("backend.tui.app.UsageAPI") as api,
+                patch("backend.tui.app.load_config") as load_config,
+            ):
+                app = ClaudiminderApp(client=True)
+                async with app.run_test() as pilot:
+                    display = app.query_one("#usage-display", UsageDisplay)
+                    for _ in range(100):
+                        if display.five_hour_usage == 40.0:
+                            break
+                        await pilot.pause(0.02)
+                    assert display.five_hour_usage == 40.0
+                api.assert_not_called()
+                load_config.assert_not_called()
+        finally:
+            serving.cancel()
+            await asyncio.gather(serving, return_exceptions=True)
+
+
+    @pytest.mark.asyncio
+    async def test_reads_heatmap_without_writing(self, socket_path: Path, isolated_history: Path):
+        """Test a client shows the heatmap but leaves persisting it to the backend."""
+        history = get_usage_history()
+        for minute in range(0, 30, 5):
+            history.append(UsageSample(1768640400.0 + minute * 60, minute, 1768658400.0, 10.0))
+        server = UpdateServer(socket_path)
+        serving = asyncio.create_task(server.run())
+        try:
+            while not socket_path.exists():
+                await asyncio.sleep(0.01)
+            with patch("backend.tui.app.UpdateClient", lambda: UpdateClient(socket_path)):
+                app = ClaudiminderApp(client=True)
+                async with app.run_test() as pilot:
+                    await pilot.press("m")
+                    await pilot.pause()
+                    assert get_usage_heatmap()._next_index == len(history)
+            assert not (isolated_history / "default.heatmap.json").exists()
+        finally:
+            serving.cancel()
+            await asyncio.gather(serving, return_exceptions=True)
+
+
+class TestMetricsDump:
+    """Tests for dumping performance metrics on exit."""
+
+    @pytest.mark.asyncio
+    async def test_dumps_metrics_json_on_exit(self, socket_path: Path):
+        """Test metrics are written to the given path when the app exits."""
+        path = socket_path.parent / "metrics.json"
+        with patch("backend.tui.app.UpdateClient", lambda: UpdateClient(socket_path)):
+            app = ClaudiminderApp(client=True, metrics_path=path)
+            async with app.run_test() as pilot:
+                get_perf_metrics().count("usage_cache.hit")
+                assert app._lag_worker is not None
+                await pilot.press("d")
+                assert app.query_one("#debug-panel").display
+
+        assert json.loads(path.read_text())["counters"] == {"usage_cache.hit": 1}
+
+    @pytest.mark.asyncio
+    async def test_loop_lag_sampled_while_debug_shown(self, socket_path: Path):
+        """Test loop lag is only sampled while the debug panel is open."""
+        with patch("backend.tui.app.UpdateClient", lambda: UpdateClient(socket_path)):
+            app = ClaudiminderApp(client=True)
+            async with app.run_test() as pilot:
+                assert app._lag_worker is None
+                await pilot.press("d")
+                worker = app._lag_worker
+                assert worker is not None
+                await pilot.press("d")
+                await pilot.pause()
+                assert app._lag_worker is None
+                assert worker.is_cancelled
+
+
+class TestHostMode:
+    """Tests for a TUI hosting the services."""
+
+    @pytest.mark.asyncio
+    async def test_fired_reminders_shown(self):
+        """Test reminders published on the bus appear as toasts until unmount."""
+        daemon = MagicMock()
+        daemon.run_services = AsyncMock()
+        daemon.stop = AsyncMock()
+        with (
+            patch("backend.tui.app.Daemon", return_value=daemon),
+            patch("backend.tui.app.acquire_instance_lock", return_value=MagicMock()),
+            patch("backend.tui.app.release_instance_lock"),
+            patch("backend.tui.app.UsageAPI"),
+            patch("backend.tui.app.UsagePoller", return_value=MagicMock(run=AsyncMock())),
+        ):
+            app = ClaudiminderApp()
+            async with app.run_test():
+                with patch.object(app, "notify") as notify:
+                    get_event_bus().publish(REMINDER_FIRED, ReminderFired("percentage", "50%"))
+                notify.assert_called_once()
+                assert notify.call_args.args == ("50%",)
+
+        with patch.object(app, "notify") as notify:
+            get_event_bus().publish(REMINDER_FIRED, ReminderFired("percentage", "75%"))
+        notify.assert_not_called()
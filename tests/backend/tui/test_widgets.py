@@ -2,9 +2,23 @@
 
 from __future__ import annotations
 
+import math
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
 import pytest
 from textual.app import App, ComposeResult
-
+from textual.widgets import DataTable
+
+from backend.core.perf_metrics import PerfMetrics, get_perf_metrics
+from backend.core.usage_history import UsageSample, get_usage_history
+from backend.core.usage_series import UsageSeries, Zoom
+from backend.tui.widgets.accounts_panel import AccountsPanel
+from backend.tui.widgets.debug_panel import DebugPanel
+from backend.tui.widgets.heatmap_panel import HeatmapPanel
+from backend.tui.widgets.history_panel import HistoryPanel, chart, sparkline
+from backend.tui.widgets.markup_static import MarkupStatic
+from backend.tui.widgets.reset_countdown import ResetCountdown
 from backend.tui.widgets.usage_display import UsageDisplay
 
 
@@ -61,6 +75,25 @@ class TestUsageDisplayWidget:
             assert widget.seven_day_usage == 30.0
             assert widget.extra_usage == 10.0
 
+    @pytest.mark.asyncio
+    async def test_update_usage_renders_once(self):
+        """Test one data update renders once, not once per reactive."""
+
+        class TestApp(App):
+            def compose(self) -> ComposeResult:
+                yield UsageDisplay()
+
+        async with TestApp().run_test() as pilot:
+            widget = pilot.app.query_one(UsageDisplay)
+            with patch.object(MarkupStatic, "update") as update:
+                widget.update_usage(five_hour=45.0, seven_day=30.0, extra=10.0)
+                await pilot.pause()
+                assert update.call_count == 1
+
+                widget.update_usage(five_hour=45.0, seven_day=30.0, extra=10.0)
+                await pilot.pause()
+                assert update.call_count == 1
+
 
 class TestProgressBar:
     """Tests for progress bar rendering."""
@@ -132,3 +165,247 @@ class TestProgressBar:
             bar = widget._progress_bar(150.0, width=10)
             # Should be fully filled
             assert "█" * 10 in bar
+
+
+class TestHeatmapPanel:
+    """Tests for HeatmapPanel widget."""
+
+    @pytest.mark.asyncio
+    async def test_renders_grid(self):
+        """Test renders one row per weekday with shaded cells."""
+
+        class TestApp(App):
+            def compose(self) -> ComposeResult:
+                yield HeatmapPanel()
+
+        grid: list[list[float | None]] = [[None] * 24 for _ in range(7)]
+        grid[0][9] = 10.0
+        grid[0][10] = 2.0
+
+        async with TestApp().run_test() as pilot:
+            widget = pilot.app.query_one(HeatmapPanel)
+            widget.update_heatmap(grid)
+            rendered = widget._render_grid()
+
+            lines = rendered.splitlines()
+            assert len(lines) == 9
+            assert lines[1].startswith("Mon")
+            assert "[red]█[/]" in lines[1]
+            assert "Peak: 10.0%/hour" in rendered
+
+
+class TestMarkupStatic:
+    """Tests for MarkupStatic widget."""
+
+    @pytest.mark.asyncio
+    async def test_skips_unchanged_markup(self):
+        """Test set_markup only updates when the markup changed."""
+
+        class TestApp(App):
+            def compose(self) -> ComposeResult:
+                yield MarkupStatic("a")
+
+        async with TestApp().run_test() as pilot:
+            widget = pilot.app.query_one(MarkupStatic)
+            with patch.object(MarkupStatic, "update") as update:
+                assert widget.set_markup("a") is False
+                assert widget.set_markup("b") is True
+                assert widget.set_markup("b") is False
+                update.assert_called_once_with("b")
+
+
+class TestResetCountdown:
+    """Tests for ResetCountdown widget."""
+
+    @pytest.mark.asyncio
+    async def test_shows_remaining_time(self):
+        """Test countdown renders the time left."""
+
+        class TestApp(App):
+            def compose(self) -> ComposeResult:
+                yield ResetCountdown()
+
+        async with TestApp().run_test() as pilot:
+            widget = pilot.app.query_one(ResetCountdown)
+            widget.reset_time = datetime.now(UTC) + timedelta(hours=2, seconds=30)
+            widget.show_human_readable = False
+            await pilot.pause()
+
+            assert widget._content is not None
+            assert "02:00:" in widget._content._last_markup
+
+    @pytest.mark.asyncio
+    async def test_timer_paused_while_hidden(self):
+        """Test the per-second timer stops ticking while hidden."""
+
+        class TestApp(App):
+            def compose(self) -> ComposeResult:
+                yield ResetCountdown()
+
+        async with TestApp().run_test() as pilot:
+            widget = pilot.app.query_one(ResetCountdown)
+            assert widget._timer is not None
+            with (
+                patch.object(widget._timer, "pause") as pause,
+                patch.object(widget._timer, "resume") as resume,
+            ):
+                widget.display = False
+                await pilot.pause()
+                pause.assert_called_once()
+
+                widget.display = True
+                await pilot.pause()
+                resume.assert_called_once()
+
+
+class TestHistoryPanel:
+    """Tests for HistoryPanel widget."""
+
+    def test_sparkline_scale(self):
+        """Test sparkline maps 0-100% to blocks and leaves gaps blank."""
+        assert sparkline([0.0, 50.0, 100.0, 150.0, math.nan]) == "▁▄██ "
+
+    def test_chart_rows(self):
+        """Test chart fills bottom-up with partial blocks."""
+        rows = chart([100.0, 50.0, math.nan], height=2)
+        assert rows == ["█  ", "██ "]
+
+    @pytest.mark.asyncio
+    async def test_renders_sparklines_and_chart(self):
+        """Test the panel renders sparklines and the zoomable chart."""
+
+        class TestApp(App):
+            def compose(self) -> ComposeResult:
+                yield HistoryPanel()
+
+        series = UsageSeries()
+        now = datetime.now(UTC).timestamp()
+        for zoom in Zoom:
+            series.five_hour[zoom].add(now, 80.0)
+        series.seven_day.add(now, 30.0)
+
+        async with TestApp().run_test() as pilot:
+            widget = pilot.app.query_one(HistoryPanel)
+            widget.update_series(series)
+            rendered = widget._render_series(series)
+            lines = rendered.splitlines()
+            assert len(lines) == 2
+            assert lines[0].endswith("80%")
+            assert "[yellow]" in lines[0]
+            assert lines[1].endswith("30%")
+
+            widget.toggle_chart()
+            assert widget.expanded
+            assert "Last window" in widget._render_series(series)
+
+            widget.cycle_zoom()
+            assert widget.zoom == Zoom.DAY
+            assert "Last day" in widget._render_series(series)
+
+
+class TestAccountsPanel:
+    """Tests for AccountsPanel widget."""
+
+    NOW = 1_800_000_000.0
+
+    def _append(self, account: str, util: float, minutes: float = 0) -> None:
+        ts = self.NOW + minutes * 60
+        get_usage_history(account).append(UsageSample(ts, util, self.NOW + 3600, math.nan))
+
+    @pytest.mark.asyncio
+    async def test_incremental_rows_sort_and_filter(self):
+        """Test one account's change updates only its row; sort and filter work."""
+
+        class TestApp(App):
+            def compose(self) -> ComposeResult:
+                yield AccountsPanel()
+
+        for i in range(300):
+            self._append(f"runner-{i:03d}", float(i % 100))
+
+        async with TestApp().run_test() as pilot:
+            panel = pilot.app.query_one(AccountsPanel)
+            table = pilot.app.query_one(DataTable)
+            # Same minute to reset, so only the new sample changes a row
+            panel.refresh_accounts(now=self.NOW + 10)
+            assert table.row_count == 300
+
+            self._append("runner-007", 50.0, minutes=0.5)
+            with patch.object(DataTable, "update_cell") as update_cell:
+                panel.refresh_accounts(now=self.NOW + 50)
+            assert {call.args[0] for call in update_cell.call_args_list} == {"runner-007"}
+
+            panel.sort_by("utilization")
+            panel.sort_by("utilization")
+            assert table.get_row_at(0)[1] == "99.0%"
+
+            panel.set_filter("Critical")
+            await pilot.pause()
+            assert table.row_count == 30
+            panel.set_filter("runner-00")
+            assert table.row_count == 10
+            panel.set_filter("")
+            assert table.row_count == 300
+
+    @pytest.mark.asyncio
+    async def test_unknowns_sort_last_both_ways(self):
+        """Test accounts with an unknown value stay at the bottom when reversed."""
+
+        class TestApp(App):
+            def compose(self) -> ComposeResult:
+                yield AccountsPanel()
+
+        for account, util in (("fast", 40.0), ("slow", 20.0)):
+            self._append(account, 10.0)
+            self._append(account, util, minutes=5)
+        self._append("new", 5.0)  # A single sample has no slope
+
+        async with TestApp().run_test() as pilot:
+            panel = pilot.app.query_one(AccountsPanel)
+            table = pilot.app.query_one(DataTable)
+            panel.refresh_accounts(now=self.NOW + 600)
+
+            panel.sort_by("slope")
+            assert [table.get_row_at(i)[0] for i in range(3)] == ["slow", "fast", "new"]
+            panel.sort_by("slope")
+            assert [table.get_row_at(i)[0] for i in range(3)] == ["fast", "slow", "new"]
+
+
+class TestDebugPanel:
+    """Tests for DebugPanel widget."""
+
+    @pytest.mark.asyncio
+    async def test_renders_metrics(self):
+        """Test the panel shows lag, fetch, cache, timers and render times."""
+
+        class TestApp(App):
+            def compose(self) -> ComposeResult:
+                yield DebugPanel(metrics)
+
+        metrics = PerfMetrics()
+        metrics.record("loop_lag", 1_500_000)
+        metrics.record("notify.system", 3_000_000)
+        metrics.count("usage_cache.hit", 3)
+        metrics.count("usage_cache.miss")
+
+        async with TestApp().run_test() as pilot:
+            widget = pilot.app.query_one(DebugPanel)
+            rendered = widget._render_metrics()
+            lines = rendered.splitlines()
+            assert "1.50 ms" in lines[0]
+            assert "—" in lines[1]  # No fetch yet
+            assert "75%" in lines[2]
+            assert "notify.system" in rendered
+            assert widget._timer_count() == 1
+
+    @pytest.mark.asyncio
+    async def test_markup_static_records_render_time(self):
+        """Test MarkupStatic renders are timed per widget id."""
+
+        class TestApp(App):
+            def compose(self) -> ComposeResult:
+                yield MarkupStatic("hello", id="probe")
+
+        async with TestApp().run_test() as pilot:
+            await pilot.pause()
+            assert get_perf_metrics().durations["render.probe"].count >= 1